@@ -33,7 +33,6 @@ from datetime import datetime
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, Canvas, filedialog
-from PIL import Image, ImageTk, ImageDraw
 import math
 import json
 
@@ -53,15 +52,17 @@ except ImportError:
     from mingli_astrology import ZodiacSignAnalyzer as AstrologyExpertAnalyzerV7
     ZodiacSignAnalyzer = AstrologyExpertAnalyzerV7
 
-try:
-    from mingli_astrology import BloodTypeAnalyzer
-except ImportError:
-    BloodTypeAnalyzer = None
-
-try:
-    from mingli_blood_type_expert_v7 import BloodTypeExpertAnalyzerV7 as BloodTypeAnalyzerEnhanced
-except ImportError:
-    BloodTypeAnalyzerEnhanced = None
+# 無介面的命理分析引擎（核心計算與完整分析流程圖）
+from mingli_engine import MingliAnalysisEngine
+from mingli_result_file import (
+    RESULT_FILE_SUFFIX, ResultFile, is_result_file, save_result_file, export_text_report
+)
+# 客戶檔案庫（SQLite）
+from mingli_archive import AnalysisArchive, DEFAULT_ARCHIVE_FILENAME
+# 出生地經緯度（上升點與宮位計算）
+from mingli_houses import BIRTH_PLACES, DEFAULT_BIRTH_PLACE
+# 背景圖（依解析度快取於使用者快取目錄）
+from mingli_background import get_background_image, get_gradient_background
 
 try:
     from spouse_compatibility_expert_v7 import SpouseCompatibilityExpertV7
@@ -88,18 +89,42 @@ except ImportError:
     from mingli_bazi_analyzer import BaziAnalyzer
     print("[INFO] 使用基礎八字分析模組")
 
-from mingli_purplestar_analyzer import PurpleStarAnalyzer
 from mingli_tarot import TarotAnalyzer
 from mingli_yijing import YijingAnalyzer
-from mingli_jiugong import JiuGongAnalyzer
-from mingli_jiugong_name import JiuGongNameAnalyzer
-from mingli_jiugong_name_enhanced import JiuGongNameAnalyzerEnhanced
 # from chart_enhancer import ChartEnhancer  # 模組不存在，已註釋
 # from spouse_data_dialog import SpouseDataDialog  # 模組不存在，已註釋
 
 
-class EnhancedFATESuiteGUI:
-    """FATE Suite 增強版 - 完整命理分析"""
+class EnhancedFATESuiteGUI(MingliAnalysisEngine):
+    """FATE Suite 增強版 - 完整命理分析（核心計算由 MingliAnalysisEngine 提供）"""
+
+    # 完整分析時各流程節點完成後的狀態列文字
+    ANALYSIS_NODE_LABELS = {
+        'zodiac': '星座分析',
+        'blood': '血型分析',
+        'bazi': '八字排盤',
+        'purplestar': '紫微命盤',
+        'jiugong': '九宮算命',
+        'jiugong_name': '九宮姓名學分析',
+        'fortune': '流年流月運勢',
+        'summary': '綜合總結',
+    }
+
+    # 塔羅牌陣選項（None 為原本的大阿爾克那三牌陣）
+    TAROT_SPREAD_CHOICES = {
+        '經典三牌陣（大阿爾克那）': None,
+        '單牌指引': 'single',
+        '三牌陣（78 張含逆位）': 'three_card',
+        '馬蹄鐵牌陣': 'horseshoe',
+        '凱爾特十字': 'celtic_cross',
+    }
+
+    # 周易起卦法選項（None 為原本的時間起卦）
+    YIJING_METHOD_CHOICES = {
+        '經典起卦（單一動爻）': None,
+        '三枚銅錢法': 'three_coins',
+        '蓍草法': 'yarrow',
+    }
 
     def __init__(self, root):
         self.root = root
@@ -186,40 +211,35 @@ class EnhancedFATESuiteGUI:
     
     def init_data(self):
         """初始化數據"""
-        self.zodiac_analyzer = ZodiacSignAnalyzer()
-        self.blood_analyzer = BloodTypeAnalyzer()
-        # 使用增強版本，如果不可用則設為None（後續在需要時檢查）
-        if BloodTypeAnalyzerEnhanced is not None:
-            self.blood_enhanced = BloodTypeAnalyzerEnhanced()
+        # 核心分析器由分析引擎建立（介面選用的版本優先）
+        MingliAnalysisEngine.__init__(
+            self,
+            zodiac_analyzer=ZodiacSignAnalyzer(),
+            bazi_analyzer=BaziAnalyzer(),
+            professional_spouse_analyzer=(ProfessionalSpouseCompatibilityAnalyzer()
+                                          if ProfessionalSpouseCompatibilityAnalyzer is not None else None),
+        )
+        if self.professional_spouse_analyzer is not None:
+            print("[OK] 專業配偶分析器初始化成功")
         else:
-            self.blood_enhanced = None
+            print("[WARNING] 專業配偶分析器不可用")
         
-        self.bazi_analyzer = BaziAnalyzer()
-        self.purplestar_analyzer = PurpleStarAnalyzer()
         self.tarot_analyzer = TarotAnalyzer()
         self.yijing_analyzer = YijingAnalyzer()
-        self.jiugong_analyzer = JiuGongAnalyzer()
-        self.jiugong_name_analyzer = JiuGongNameAnalyzer()
-        self.jiugong_name_enhanced = JiuGongNameAnalyzerEnhanced()
         # 配偶分析器（如果不可用則設為None）
         if SpouseCompatibilityExpertV7 is not None:
             self.spouse_analyzer = SpouseCompatibilityExpertV7()
         else:
             self.spouse_analyzer = None
         
-        # 專業配偶分析器（新增）
-        if ProfessionalSpouseCompatibilityAnalyzer is not None:
-            self.professional_spouse_analyzer = ProfessionalSpouseCompatibilityAnalyzer()
-            print("[OK] 專業配偶分析器初始化成功")
-        else:
-            self.professional_spouse_analyzer = None
-            print("[WARNING] 專業配偶分析器不可用")
-        
         # self.chart_enhancer = ChartEnhancer()  # 圖表增強器（模組不存在，已註釋）
         
         # 配偶完整資料（用於深度分析）
         self.spouse_full_data = None
         self.spouse_data = None  # 簡單配偶資料
+        
+        # 客戶檔案庫：儲存與載入皆經由此資料庫
+        self.archive = AnalysisArchive(str(BASE_PATH / DEFAULT_ARCHIVE_FILENAME))
 
     def setup_styles(self):
         """設置 UI 風格 - 白色柔和主題"""
@@ -275,7 +295,7 @@ class EnhancedFATESuiteGUI:
                  foreground=[('selected', '#FFFFFF')])
 
     def setup_background(self):
-        """設置金黃色漸層背景圖片"""
+        """設置金黃色漸層背景圖片（依螢幕解析度快取，之後啟動直接載入）"""
         try:
             # 優先使用金黃色漸層背景
             bg_path = Path(__file__).parent / "fortune_golden_gradient_bg.png"
@@ -284,33 +304,14 @@ class EnhancedFATESuiteGUI:
             if not bg_path.exists():
                 bg_path = Path(__file__).parent / "soft_fortune_bg.png"
             
-            if bg_path.exists():
-                # 載入背景圖並調整大小以適配視窗
-                bg_image = Image.open(bg_path)
-                
-                # 獲取螢幕尺寸
-                screen_width = self.root.winfo_screenwidth()
-                screen_height = self.root.winfo_screenheight()
-                
-                # 調整背景圖大小
-                bg_image = bg_image.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
-                bg_photo = ImageTk.PhotoImage(bg_image)
-                
-                # 創建Canvas作為背景
-                bg_canvas = Canvas(self.root, width=screen_width, height=screen_height, 
-                                  highlightthickness=0)
-                bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-                bg_canvas.create_image(0, 0, image=bg_photo, anchor='nw')
-                
-                # 保存引用避免被垃圾回收
-                self.bg_photo = bg_photo
-                self.bg_canvas = bg_canvas
-                
-                print(f"✓ 已載入背景圖：{bg_path.name}")
-            else:
-                print("背景圖不存在，使用預設金黃色漸層")
-                # 使用程式動態生成金黃色漸層
-                self.create_gradient_background()
+            # 獲取螢幕尺寸
+            screen_width = self.root.winfo_screenwidth()
+            screen_height = self.root.winfo_screenheight()
+            
+            # 取得已縮放的背景圖（無法縮放時為程式生成的漸層）
+            image_path = get_background_image(screen_width, screen_height, bg_path)
+            self._place_background(image_path, screen_width, screen_height)
+            print(f"✓ 已載入背景圖：{image_path.name}")
         except Exception as e:
             print(f"載入背景圖失敗：{e}")
             self.create_gradient_background()
@@ -321,32 +322,26 @@ class EnhancedFATESuiteGUI:
             screen_width = self.root.winfo_screenwidth()
             screen_height = self.root.winfo_screenheight()
             
-            # 創建金黃色漸層圖片
-            gradient_image = Image.new('RGB', (screen_width, screen_height))
-            draw = ImageDraw.Draw(gradient_image)
-            
-            # 從淺金色到深金色的漸層
-            for y in range(screen_height):
-                ratio = y / screen_height
-                r = int(245 - (245 - 212) * ratio)
-                g = int(230 - (230 - 175) * ratio)
-                b = int(211 - (211 - 55) * ratio)
-                draw.line([(0, y), (screen_width, y)], fill=(r, g, b))
-            
-            bg_photo = ImageTk.PhotoImage(gradient_image)
-            
-            # 創建Canvas作為背景
-            bg_canvas = Canvas(self.root, width=screen_width, height=screen_height,
-                             highlightthickness=0)
-            bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-            bg_canvas.create_image(0, 0, image=bg_photo, anchor='nw')
-            
-            self.bg_photo = bg_photo
-            self.bg_canvas = bg_canvas
+            image_path = get_gradient_background(screen_width, screen_height)
+            self._place_background(image_path, screen_width, screen_height)
             
             print("✓ 已生成金黃色漸層背景")
         except Exception as e:
             print(f"創建漸層背景失敗：{e}")
+    
+    def _place_background(self, image_path, screen_width, screen_height):
+        """以 Canvas 顯示背景圖"""
+        bg_photo = tk.PhotoImage(file=str(image_path))
+        
+        # 創建Canvas作為背景
+        bg_canvas = Canvas(self.root, width=screen_width, height=screen_height,
+                           highlightthickness=0)
+        bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        bg_canvas.create_image(0, 0, image=bg_photo, anchor='nw')
+        
+        # 保存引用避免被垃圾回收
+        self.bg_photo = bg_photo
+        self.bg_canvas = bg_canvas
 
     def create_widgets(self):
         """創建 UI 元件"""
@@ -476,6 +471,11 @@ class EnhancedFATESuiteGUI:
         self.blood_type.set('A')
         self.blood_type.pack(side=tk.LEFT, padx=5)
 
+        ttk.Label(row2, text="出生地：", style='Sub.TLabel', width=8).pack(side=tk.LEFT, padx=5)
+        self.birth_place = ttk.Combobox(row2, values=list(BIRTH_PLACES), state="readonly", width=8)
+        self.birth_place.set(DEFAULT_BIRTH_PLACE)
+        self.birth_place.pack(side=tk.LEFT, padx=5)
+
         # 第三行：按鈕
         row3 = ttk.Frame(input_frame)
         row3.pack(fill=tk.X, pady=10)
@@ -490,12 +490,15 @@ class EnhancedFATESuiteGUI:
         ttk.Button(row3, text="⚙️ 設定", 
                   command=self.show_settings).pack(side=tk.LEFT, padx=5)
 
-        ttk.Button(row3, text="� 開啟檔案", 
+        ttk.Button(row3, text="� 客戶檔案", 
                   command=self.load_results).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(row3, text="�💾 儲存結果", 
                   command=self.save_results).pack(side=tk.LEFT, padx=5)
 
+        ttk.Button(row3, text="📄 匯出TXT", 
+                  command=self.export_text_results).pack(side=tk.LEFT, padx=5)
+
         ttk.Button(row3, text="🖨️ 列印報告", 
                   command=self.print_report).pack(side=tk.LEFT, padx=5)
 
@@ -603,6 +606,20 @@ class EnhancedFATESuiteGUI:
         # 保存問題輸入框引用
         setattr(self, f"{key}_question_entry", question_entry)
         
+        # 牌陣選擇
+        if key == 'tarot':
+            ttk.Label(input_frame, text="牌陣：", font=('Microsoft JhengHei', 10)).pack(side=tk.LEFT, padx=5)
+            choices = list(self.TAROT_SPREAD_CHOICES)
+            self.tarot_spread = ttk.Combobox(input_frame, values=choices, width=20, state='readonly')
+            self.tarot_spread.set(choices[0])
+            self.tarot_spread.pack(side=tk.LEFT, padx=5)
+        else:
+            ttk.Label(input_frame, text="起卦：", font=('Microsoft JhengHei', 10)).pack(side=tk.LEFT, padx=5)
+            choices = list(self.YIJING_METHOD_CHOICES)
+            self.yijing_method = ttk.Combobox(input_frame, values=choices, width=18, state='readonly')
+            self.yijing_method.set(choices[0])
+            self.yijing_method.pack(side=tk.LEFT, padx=5)
+        
         # 執行按鈕
         if key == 'tarot':
             button_text = "🎴 開始塔羅占卜"
@@ -726,270 +743,40 @@ class EnhancedFATESuiteGUI:
             # 清空之前的結果
             self.analysis_results = {}
 
-            # 1. 星座分析（含命盤圖及宮位主導星座）
-            self.status_label.config(text="⏳ 正在分析星座...")
-            self.root.update()
-            zodiac_result = self.analyze_zodiac_with_chart(month, day, hour)
-            # 增強圖表化
-            zodiac_result = self._add_zodiac_charts(zodiac_result, month, day)
-            
-            # 1.1 專業星座配偶合適性分析（新增）
-            if hasattr(self, 'spouse_full_data') and self.spouse_full_data and self.professional_spouse_analyzer:
-                self.status_label.config(text="💑 正在進行星座配偶專業合適性分析...")
-                self.root.update()
-                try:
-                    user_zodiac = self._get_zodiac_name(month, day)
-                    spouse_zodiac = self._get_zodiac_name(
-                        self.spouse_full_data['month'],
-                        self.spouse_full_data['day']
-                    )
-                    
-                    zodiac_compatibility = self.professional_spouse_analyzer.analyze_zodiac_professional(
-                        user_zodiac, 
-                        spouse_zodiac
-                    )
-                    
-                    zodiac_result += "\n\n" + "="*80 + "\n"
-                    zodiac_result += zodiac_compatibility
-                    print(f"[OK] 星座配偶專業分析完成：{user_zodiac} + {spouse_zodiac}")
-                except Exception as e:
-                    print(f"[ERROR] 星座配偶分析出錯：{e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            self.analysis_results['zodiac'] = zodiac_result
-            self.display_result('zodiac', zodiac_result, f"出生日期: {month}月{day}日")
-
-            # 2. 血型分析
-            self.status_label.config(text="⏳ 正在分析血型...")
-            self.root.update()
-            blood_result = self.blood_analyzer.analyze_blood_type(blood)
-            # 增強版本：若不可用則使用基礎版本
-            if self.blood_enhanced is not None:
-                blood_enhanced = self.blood_enhanced.analyze_blood_type(blood)
-                combined_blood = f"{blood_result}\n\n{'='*70}\n進階分析\n{'='*70}\n\n{blood_enhanced}"
-            else:
-                combined_blood = blood_result
-            # 增強圖表化
-            combined_blood = self._add_blood_charts(combined_blood, blood)
-            self.analysis_results['blood'] = combined_blood
-            self.display_result('blood', combined_blood, f"血型: {blood}型")
-
-            # 3. 八字排盤（使用專業版分析）
-            self.status_label.config(text="⏳ 正在排八字...")
-            self.root.update()
-            
-            # 檢查是否為專業版分析器
-            if hasattr(self.bazi_analyzer, 'format_complete_analysis'):
-                # 使用專業版 v7.0 完整分析
-                ganzhi = self.bazi_analyzer.get_ganzhi(year, month, day, hour)
-                birth_date_dict = {'year': year, 'month': month, 'day': day, 'hour': hour}
-                bazi_result = self.bazi_analyzer.format_complete_analysis(
-                    birth_date_dict, ganzhi, gender_str, name
-                )
-            else:
-                # 使用基礎版分析
-                bazi_data = self.bazi_analyzer.analyze_bazi(year, month, day, hour)
-                bazi_result = self.bazi_analyzer.format_result(bazi_data)
-                # 增強圖表化
-                bazi_result = self._add_bazi_charts(bazi_result, bazi_data)
-            
-            # 3.1 配偶深度八字分析（專業版）
-            if hasattr(self, 'spouse_full_data') and self.spouse_full_data and self.professional_spouse_analyzer:
-                self.status_label.config(text="💑 正在進行配偶八字專業深度分析...")
-                self.root.update()
-                try:
-                    # 使用專業版取得配偶八字
-                    if hasattr(self.bazi_analyzer, 'get_ganzhi'):
-                        spouse_ganzhi = self.bazi_analyzer.get_ganzhi(
-                            self.spouse_full_data['year'],
-                            self.spouse_full_data['month'],
-                            self.spouse_full_data['day'],
-                            self.spouse_full_data['hour']
-                        )
-                        # 創建簡化的 bazi_data 格式用於配偶分析
-                        spouse_bazi_data = {
-                            'year_gan': spouse_ganzhi['year']['gan'],
-                            'year_zhi': spouse_ganzhi['year']['zhi'],
-                            'month_gan': spouse_ganzhi['month']['gan'],
-                            'month_zhi': spouse_ganzhi['month']['zhi'],
-                            'day_gan': spouse_ganzhi['day']['gan'],
-                            'day_zhi': spouse_ganzhi['day']['zhi'],
-                            'hour_gan': spouse_ganzhi['hour']['gan'],
-                            'hour_zhi': spouse_ganzhi['hour']['zhi']
-                        }
-                        user_bazi_data = {
-                            'year_gan': ganzhi['year']['gan'],
-                            'year_zhi': ganzhi['year']['zhi'],
-                            'month_gan': ganzhi['month']['gan'],
-                            'month_zhi': ganzhi['month']['zhi'],
-                            'day_gan': ganzhi['day']['gan'],
-                            'day_zhi': ganzhi['day']['zhi'],
-                            'hour_gan': ganzhi['hour']['gan'],
-                            'hour_zhi': ganzhi['hour']['zhi']
-                        }
-                    else:
-                        # 使用基礎版分析
-                        spouse_bazi_data = self.bazi_analyzer.analyze_bazi(
-                            self.spouse_full_data['year'],
-                            self.spouse_full_data['month'],
-                            self.spouse_full_data['day'],
-                            self.spouse_full_data['hour']
-                        )
-                        user_bazi_data = self.bazi_analyzer.analyze_bazi(year, month, day, hour)
-                    
-                    # 執行專業深度合適性分析（四柱逐柱 + 十神分析）
-                    bazi_compatibility = self.professional_spouse_analyzer.analyze_bazi_professional(
-                        name, 
-                        user_bazi_data, 
-                        self.spouse_full_data['name'],
-                        spouse_bazi_data,
-                        gender_str
-                    )
-                    
-                    bazi_result += "\n\n" + "="*80 + "\n"
-                    bazi_result += bazi_compatibility
-                    print(f"[OK] 配偶八字專業深度分析完成：{name} + {self.spouse_full_data['name']}")
-                except Exception as e:
-                    print(f"[ERROR] 配偶八字專業分析出錯：{e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            self.analysis_results['bazi'] = bazi_result
-            self.display_result('bazi', bazi_result, f"出生: {year}年{month}月{day}日 {hour}時")
-
-            # 4. 紫微論命（含命盤圖）
-            self.status_label.config(text="⏳ 正在排紫微命盤...")
-            self.root.update()
-            gender_code = 'M' if gender_str == '男' else 'F'
-            ps_result = self.analyze_ziwei_with_chart(year, month, day, hour, gender_code)
-            # 增強圖表化
-            ps_result = self._add_ziwei_charts(ps_result)
-            
-            # 4.1 專業紫微配偶合適性分析（新增）
-            if hasattr(self, 'spouse_full_data') and self.spouse_full_data and self.professional_spouse_analyzer:
-                self.status_label.config(text="[配偶分析] 正在進行紫微配偶專業合適性分析（12宮14主星）...")
-                self.root.update()
-                try:
-                    # 簡化的命宮數據（實際應該從紫微排盤獲取）
-                    user_palace = {'命宮': '紫微天府', '夫妻宮': '太陽太陰'}
-                    spouse_gender_code = 'F' if gender_str == '男' else 'M'
-                    spouse_palace = {'命宮': '天機天梁', '夫妻宮': '武曲天相'}
-                    
-                    ziwei_compatibility = self.professional_spouse_analyzer.analyze_ziwei_professional(
-                        user_palace,
-                        spouse_palace,
-                        name,
-                        self.spouse_full_data['name']
-                    )
-                    
-                    ps_result += "\n\n" + "="*80 + "\n"
-                    ps_result += ziwei_compatibility
-                    print(f"[OK] 紫微配偶專業分析完成：{name} + {self.spouse_full_data['name']}")
-                except Exception as e:
-                    print(f"[ERROR] 紫微配偶專業分析出錯：{e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            self.analysis_results['purplestar'] = ps_result
-            self.display_result('purplestar', ps_result, f"性別: {gender_str}")
-
-            # 塔羅占卜和周易卜卦改為手動執行（不在完整分析中自動執行）
-            # 使用者需要到各自的分頁中輸入問題並點擊按鈕執行
-
-            # 6.5. 九宮算命（新增）
-            self.status_label.config(text="⏳ 正在進行九宮算命...")
-            self.root.update()
-            jiugong_result = self.jiugong_analyzer.analyze_jiugong(name, year, month, day)
-            # 增強圖表化
-            jiugong_result = self._add_jiugong_charts(jiugong_result)
-            self.analysis_results['jiugong'] = jiugong_result
-            self.display_result('jiugong', jiugong_result, f"姓名: {name}")
-
-            # 6.6. 九宮姓名學（新增）+ 配偶配對分析（整合）
-            self.status_label.config(text="⏳ 正在進行九宮姓名學分析...")
-            self.root.update()
-            jiugong_name_result = self.jiugong_name_analyzer.analyze_name(name)
-            
-            # 6.6.1 配偶姓名配對分析（使用配偶對話框的資料）
-            spouse_name = None
-            if hasattr(self, 'spouse_full_data') and self.spouse_full_data:
-                spouse_name = self.spouse_full_data.get('name', '').strip()
-            
-            print(f"[DEBUG] 配偶姓名輸入值: '{spouse_name}'")
-            print(f"[DEBUG] 使用者姓名: '{name}'")
-            
-            if spouse_name and spouse_name != name:
-                print(f"[OK] 開始配偶配對分析: {name} + {spouse_name}")
-                self.status_label.config(text="💑 正在進行配偶姓名配對分析...")
-                self.root.update()
-                try:
-                    compatibility_result = self.jiugong_name_enhanced.analyze_compatibility(name, spouse_name)
-                    print(f"📊 配對結果長度: {len(compatibility_result) if compatibility_result else 0} 字元")
-                    
-                    if compatibility_result:
-                        # 將配對結果附加到九宮姓名學結果字串中
-                        jiugong_name_result += "\n\n" + "="*80 + "\n"
-                        jiugong_name_result += "💑 配偶姓名配對深度分析\n"
-                        jiugong_name_result += "="*80 + "\n"
-                        jiugong_name_result += f"\n【配對對象】：{name} ❤️ {spouse_name}\n"
-                        jiugong_name_result += f"【分析日期】：{datetime.now().strftime('%Y年%m月%d日')}\n"
-                        jiugong_name_result += "\n" + "="*80 + "\n\n"
-                        jiugong_name_result += compatibility_result
-                        jiugong_name_result += "\n\n" + "="*80 + "\n"
-                        jiugong_name_result += "【配對分析說明】\n"
-                        jiugong_name_result += "="*80 + "\n\n"
-                        jiugong_name_result += "此配對分析基於九宮姓名學原理，透過以下五大維度進行深度評估：\n\n"
-                        jiugong_name_result += "1. 【人格相配度】（權重40%）：\n"
-                        jiugong_name_result += "   分析雙方的個性特質、處事態度是否協調互補。\n"
-                        jiugong_name_result += "   高分表示雙方性格契合，低分則需要更多包容與理解。\n\n"
-                        jiugong_name_result += "2. 【地格相配度】（權重25%）：\n"
-                        jiugong_name_result += "   評估雙方的生活習慣、價值觀與基礎運勢的匹配程度。\n"
-                        jiugong_name_result += "   影響日常相處的和諧度與生活品質。\n\n"
-                        jiugong_name_result += "3. 【總格相配度】（權重20%）：\n"
-                        jiugong_name_result += "   考察雙方的整體命格與長期發展潛力的相容性。\n"
-                        jiugong_name_result += "   關係到關係的持久性與未來發展方向。\n\n"
-                        jiugong_name_result += "4. 【外格相配度】（權重10%）：\n"
-                        jiugong_name_result += "   分析雙方的社交模式、對外表現與人際關係的協調度。\n"
-                        jiugong_name_result += "   影響雙方在社交場合的互動與對外形象。\n\n"
-                        jiugong_name_result += "5. 【天格相配度】（權重5%）：\n"
-                        jiugong_name_result += "   評估雙方的家族背景、先天條件的匹配程度。\n"
-                        jiugong_name_result += "   雖然權重較低，但仍對整體關係有一定影響。\n\n"
-                        jiugong_name_result += "\n【綜合建議】\n"
-                        jiugong_name_result += "配對指數僅供參考，真正的感情需要雙方共同經營。\n"
-                        jiugong_name_result += "高分表示先天條件較佳，低分則需要更多溝通與包容。\n"
-                        jiugong_name_result += "無論分數高低，真心與努力才是維繫感情的關鍵。\n"
-                        jiugong_name_result += "\n" + "="*80 + "\n"
-                        
-                        print(f"[OK] 配對分析成功並已整合: {name} + {spouse_name}")
-                    else:
-                        print("[WARNING] 配對分析返回空結果")
-                except Exception as e:
-                    error_msg = f"配對分析失敗: {e}"
-                    print(error_msg)
-                    import traceback
-                    traceback.print_exc()
-            else:
-                if not spouse_name:
-                    print("[INFO] 未輸入配偶姓名，跳過配對分析")
-                elif spouse_name == name:
-                    print("[WARNING] 配偶姓名與使用者姓名相同，跳過配對分析")
-            
-            # 統一顯示九宮姓名學結果（包含配對分析）
-            self.analysis_results['jiugong_name'] = jiugong_name_result
-            self.display_result('jiugong_name', jiugong_name_result, f"姓名: {name}")
-
-            # 6.7. 流年流月分析
-            self.status_label.config(text="⏳ 正在分析流年流月運勢...")
-            self.root.update()
-            fortune_result = self.add_yearly_monthly_fortune(year, month, day, hour, gender_str)
-            self.analysis_results['fortune'] = fortune_result
-            # 暫時在綜合總結中顯示，未來可新增獨立標籤頁
+            # 透過分析流程圖執行全部分析（共用的四柱、星座索引、紫微命盤只計算一次）
+            profile = {
+                'name': name,
+                'year': year,
+                'month': month,
+                'day': day,
+                'hour': hour,
+                'gender': gender_str,
+                'blood_type': blood,
+                'birth_place': self.birth_place.get(),
+                'spouse': self.spouse_full_data or None,
+            }
 
-            # 7. 生成綜合總結
-            self.status_label.config(text="⏳ 正在生成綜合總結...")
-            self.root.update()
-            self.generate_comprehensive_summary(year, month, day, hour, gender_str, blood)
+            def on_node_done(node):
+                label = self.ANALYSIS_NODE_LABELS.get(node)
+                if label:
+                    self.status_label.config(text=f"⏳ {label}完成...")
+                    self.root.update()
+
+            results = self.run_full_analysis(profile, on_node_done)
+
+            # 顯示各分頁結果
+            headers = {
+                'zodiac': f"出生日期: {month}月{day}日",
+                'blood': f"血型: {blood}型",
+                'bazi': f"出生: {year}年{month}月{day}日 {hour}時",
+                'purplestar': f"性別: {gender_str}",
+                'jiugong': f"姓名: {name}",
+                'jiugong_name': f"姓名: {name}",
+            }
+            for key, header in headers.items():
+                self.display_result(key, results[key], header)
+            # 流年流月暫時在綜合總結中顯示，未來可新增獨立標籤頁
+            self.display_summary(results['summary'])
 
             # 完成
             self.status_label.config(text="✅ 完整命理分析完成！請查看各個標籤頁的結果")
@@ -1000,1011 +787,6 @@ class EnhancedFATESuiteGUI:
             self.status_label.config(text="❌ 分析出現錯誤")
             messagebox.showerror("錯誤", f"分析失敗: {str(e)}\n\n{type(e).__name__}")
 
-    def analyze_zodiac_with_chart(self, month, day, hour):
-        """星座分析含命盤圖 - 包含宮位主導星座"""
-        basic_result = self.zodiac_analyzer.analyze_zodiac(month, day)
-        
-        # 計算上升星座（簡化版本，使用時辰）
-        ascendant = self._calculate_ascendant(month, day, hour)
-        
-        # 生成星座命盤圖形描述和詳細宮位說明（包含每宮主導星座）
-        zodiac_chart = self._generate_zodiac_chart_with_houses(month, day, ascendant)
-        house_details = self._get_zodiac_house_details_advanced(month, day, ascendant)
-        
-        return f"{basic_result}\n\n{zodiac_chart}\n\n{house_details}"
-
-    def _calculate_ascendant(self, month, day, hour):
-        """計算上升星座（簡化版本）"""
-        # 簡化計算：使用太陽星座加上時辰偏移
-        sun_sign_index = self._get_zodiac_index(month, day)
-        # 每2小時上升一個星座
-        hour_offset = hour // 2
-        ascendant_index = (sun_sign_index + hour_offset) % 12
-        
-        zodiac_names = ["牡羊座", "金牛座", "雙子座", "巨蟹座", "獅子座", "處女座",
-                       "天秤座", "天蠍座", "射手座", "魔羯座", "水瓶座", "雙魚座"]
-        return zodiac_names[ascendant_index]
-
-    def _get_zodiac_index(self, month, day):
-        """獲取星座索引（0-11）"""
-        zodiac_dates = [
-            (3, 21, 0),   # 牡羊座
-            (4, 20, 1),   # 金牛座
-            (5, 21, 2),   # 雙子座
-            (6, 22, 3),   # 巨蟹座
-            (7, 23, 4),   # 獅子座
-            (8, 23, 5),   # 處女座
-            (9, 23, 6),   # 天秤座
-            (10, 24, 7),  # 天蠍座
-            (11, 22, 8),  # 射手座
-            (12, 22, 9),  # 魔羯座
-            (1, 20, 10),  # 水瓶座
-            (2, 19, 11),  # 雙魚座
-        ]
-        
-        for m, d, idx in zodiac_dates:
-            if month < m or (month == m and day < d):
-                return (idx - 1) % 12
-        return 9  # 魔羯座
-
-    def _generate_zodiac_chart_with_houses(self, month, day, ascendant):
-        """生成包含宮位主導星座的命盤圖"""
-        sun_sign = self._get_zodiac_name(month, day)
-        
-        # 獲取12宮位的主導星座
-        houses = self._get_house_signs(ascendant)
-        
-        chart = f"""
-{'='*70}
-                    🌟 西洋占星命盤圖 🌟
-{'='*70}
-
-【基本資訊】
-太陽星座（Sun Sign）：{sun_sign}
-上升星座（Ascendant）：{ascendant}
-
-【命盤結構】
-
-              第12宮           第11宮
-            {houses[11]}        {houses[10]}
-                ╲              ╱
-                 ╲            ╱
-          第1宮   ╲          ╱   第10宮
-        {houses[0]}  ╲        ╱  {houses[9]}
-           ↑        ╲      ╱        
-           │         ╲    ╱         
-           │          ╲  ╱          
-    第2宮  │           ☉           第9宮
-  {houses[1]} │                      {houses[8]}
-           │          ╱  ╲          
-           │         ╱    ╲         
-           │        ╱      ╲        
-        {houses[2]}  ╱        ╲  {houses[7]}
-          第3宮   ╱          ╲   第8宮
-                 ╱            ╲
-                ╱              ╲
-            {houses[3]}        {houses[6]}
-              第4宮           第7宮
-                │
-                ↓
-              第5宮
-            {houses[4]}      {houses[5]}
-                              第6宮
-
-【宮位主導星座一覽】
-第1宮（命宮）   ：{houses[0]} - 自我與外貌
-第2宮（財帛宮） ：{houses[1]} - 金錢與價值
-第3宮（溝通宮） ：{houses[2]} - 學習與交流
-第4宮（家庭宮） ：{houses[3]} - 家庭與根基
-第5宮（戀愛宮） ：{houses[4]} - 創造與娛樂
-第6宮（健康宮） ：{houses[5]} - 工作與健康
-第7宮（婚姻宮） ：{houses[6]} - 伴侶與合作
-第8宮（轉化宮） ：{houses[7]} - 資源與轉變
-第9宮（哲學宮） ：{houses[8]} - 智慧與遠行
-第10宮（事業宮）：{houses[9]} - 事業與地位
-第11宮（朋友宮）：{houses[10]} - 願望與社交
-第12宮（靈性宮）：{houses[11]} - 潛意識與靈性
-
-☉ = 太陽位置
-{'='*70}
-"""
-        return chart
-
-    def _get_house_signs(self, ascendant):
-        """根據上升星座獲取12宮位的主導星座"""
-        zodiac_names = ["牡羊座", "金牛座", "雙子座", "巨蟹座", "獅子座", "處女座",
-                       "天秤座", "天蠍座", "射手座", "魔羯座", "水瓶座", "雙魚座"]
-        
-        asc_index = zodiac_names.index(ascendant)
-        houses = []
-        for i in range(12):
-            houses.append(zodiac_names[(asc_index + i) % 12])
-        return houses
-
-    def _get_zodiac_house_details_advanced(self, month, day, ascendant):
-        """獲取星座12宮位的詳細說明（包含主導星座特質）"""
-        sun_sign = self._get_zodiac_name(month, day)
-        houses = self._get_house_signs(ascendant)
-        
-        details = f"""
-{'='*70}
-              📖 星座12宮位詳細解析（含主導星座）📖
-{'='*70}
-
-您的太陽星座：{sun_sign}
-您的上升星座：{ascendant}
-
-以下是根據您的上升星座，分析12宮位的主導星座及其影響：
-
-┌──────────────────────────────────────────────────────────┐
-│ 第1宮（命宮）- 主導星座：{houses[0]}                          │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】自我、外貌、第一印象、人生態度                    │
-│                                                            │
-│ 【{houses[0]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[0], 1)}                │
-│                                                            │
-│ 【建議】善用{houses[0]}的特質塑造個人形象，                   │
-│         展現獨特魅力。                                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第2宮（財帛宮）- 主導星座：{houses[1]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】財務、物質、價值觀、賺錢能力                      │
-│                                                            │
-│ 【{houses[1]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[1], 2)}                │
-│                                                            │
-│ 【建議】根據{houses[1]}的特質規劃財務，                       │
-│         培養穩健的理財習慣。                                │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第3宮（溝通宮）- 主導星座：{houses[2]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】溝通、學習、兄弟姊妹、短途旅行                    │
-│                                                            │
-│ 【{houses[2]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[2], 3)}                │
-│                                                            │
-│ 【建議】發揮{houses[2]}的溝通特質，                           │
-│         擴展知識面和人際網絡。                              │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第4宮（家庭宮）- 主導星座：{houses[3]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】家庭、根基、父母（特別是母親）、不動產            │
-│                                                            │
-│ 【{houses[3]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[3], 4)}                │
-│                                                            │
-│ 【建議】運用{houses[3]}的特質營造家庭氛圍，                   │
-│         建立穩固的情感基礎。                                │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第5宮（戀愛宮）- 主導星座：{houses[4]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】戀愛、創造力、娛樂、子女、投機                    │
-│                                                            │
-│ 【{houses[4]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[4], 5)}                │
-│                                                            │
-│ 【建議】發揮{houses[4]}的創造特質，                           │
-│         享受生活樂趣和浪漫。                                │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第6宮（健康宮）- 主導星座：{houses[5]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】工作、健康、日常事務、服務、寵物                  │
-│                                                            │
-│ 【{houses[5]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[5], 6)}                │
-│                                                            │
-│ 【建議】按照{houses[5]}的特質規律作息，                       │
-│         注重健康管理。                                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第7宮（婚姻宮）- 主導星座：{houses[6]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】婚姻、伴侶、合作、一對一關係                      │
-│                                                            │
-│ 【{houses[6]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[6], 7)}                │
-│                                                            │
-│ 【建議】以{houses[6]}的方式經營關係，                         │
-│         尋找互補的伴侶。                                    │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第8宮（轉化宮）- 主導星座：{houses[7]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】轉變、共享資源、遺產、深層心理                    │
-│                                                            │
-│ 【{houses[7]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[7], 8)}                │
-│                                                            │
-│ 【建議】用{houses[7]}的智慧面對轉變，                         │
-│         管理共享資源。                                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第9宮（哲學宮）- 主導星座：{houses[8]}                        │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】哲學、宗教、長途旅行、高等教育、異國              │
-│                                                            │
-│ 【{houses[8]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[8], 9)}                │
-│                                                            │
-│ 【建議】以{houses[8]}的視角探索世界，                         │
-│         追求智慧和真理。                                    │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第10宮（事業宮）- 主導星座：{houses[9]}                       │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】事業、社會地位、名聲、父親、公眾形象              │
-│                                                            │
-│ 【{houses[9]}的影響】                                       │
-│ {self._get_zodiac_influence(houses[9], 10)}               │
-│                                                            │
-│ 【建議】運用{houses[9]}的能量發展事業，                       │
-│         建立專業形象。                                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第11宮（朋友宮）- 主導星座：{houses[10]}                      │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】朋友、團體、願望、社交、人道主義                  │
-│                                                            │
-│ 【{houses[10]}的影響】                                      │
-│ {self._get_zodiac_influence(houses[10], 11)}              │
-│                                                            │
-│ 【建議】以{houses[10]}的方式經營社交，                        │
-│         實現人生願望。                                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第12宮（靈性宮）- 主導星座：{houses[11]}                      │
-├──────────────────────────────────────────────────────────┤
-│ 【宮位意義】潛意識、靈性、秘密、隱藏的敵人、自我犧牲          │
-│                                                            │
-│ 【{houses[11]}的影響】                                      │
-│ {self._get_zodiac_influence(houses[11], 12)}              │
-│                                                            │
-│ 【建議】透過{houses[11]}的方式探索內在，                      │
-│         培養靈性修養。                                      │
-└──────────────────────────────────────────────────────────┘
-
-{'='*70}
-"""
-        return details
-
-    def _get_zodiac_influence(self, zodiac, house_num):
-        """獲取星座對特定宮位的影響說明"""
-        influences = {
-            "牡羊座": {
-                1: "充滿活力和衝勁，給人勇敢直率的第一印象，行動力強",
-                2: "賺錢積極主動，喜歡快速致富，但需注意衝動消費",
-                3: "溝通直接明快，學習新事物快速，喜歡競爭性的學習",
-                4: "家庭氛圍活潑，喜歡主導家務，可能與家人有爭執",
-                5: "戀愛熱情主動，創造力強，喜歡刺激冒險的娛樂",
-                6: "工作效率高，但需注意頭部和肌肉的健康",
-                7: "吸引獨立自主的伴侶，婚姻中需要自由空間",
-                8: "面對危機果斷，善於快速轉型，直面恐懼",
-                9: "哲學觀積極進取，喜歡探險和運動型旅遊",
-                10: "事業心強烈，適合領導職位，勇於開創",
-                11: "朋友圈活躍，願望明確，積極參與團體活動",
-                12: "需要釋放壓抑的憤怒，透過運動療癒內心"
-            },
-            "金牛座": {
-                1: "穩重可靠的形象，給人踏實感，注重物質享受",
-                2: "理財穩健保守，重視物質安全，擅長累積財富",
-                3: "溝通緩慢但深思熟慮，學習重視實用性",
-                4: "重視家庭穩定，喜歡舒適的居家環境",
-                5: "戀愛忠誠持久，喜歡感官享受的娛樂",
-                6: "工作踏實，需注意喉嚨和頸部健康",
-                7: "尋求穩定可靠的伴侶，重視婚姻中的物質基礎",
-                8: "面對變化較為保守，善於管理共同財產",
-                9: "哲學觀實際，旅遊重視舒適和美食",
-                10: "事業穩紮穩打，適合金融和藝術領域",
-                11: "朋友關係長久，願望實際可行",
-                12: "需要放鬆身心，透過藝術療癒"
-            },
-            "雙子座": {
-                1: "機智靈活的形象，給人聰明健談的印象",
-                2: "賺錢方式多元，可能有多個收入來源",
-                3: "溝通能力極佳，好奇心強，多才多藝",
-                4: "家庭氛圍活潑多變，可能搬家頻繁",
-                5: "戀愛多樣化，喜歡智力遊戲和社交活動",
-                6: "工作多樣，需注意手部和呼吸系統健康",
-                7: "需要能溝通的伴侶，婚姻中重視心靈交流",
-                8: "好奇神秘事物，善於資訊收集和分析",
-                9: "喜歡學習不同文化，短期多次旅遊",
-                10: "適合傳媒、教育或多元化事業",
-                11: "朋友圈廣泛，社交活躍，願望多樣",
-                12: "需要靜心思考，透過寫作療癒"
-            },
-            "巨蟹座": {
-                1: "溫柔敏感的形象，給人親切關懷的感覺",
-                2: "賺錢重視安全感，可能囤積物品",
-                3: "溝通情感豐富，記憶力強，重感情",
-                4: "極度重視家庭，家是情感避風港",
-                5: "戀愛需要安全感，創造力來自情感",
-                6: "工作照顧他人，需注意胃部和情緒健康",
-                7: "尋求能給予安全感的伴侶，婚姻如家庭",
-                8: "情感轉變深刻，善於照顧共同資源",
-                9: "旅遊重視情感連結，喜歡懷舊",
-                10: "事業與家庭結合，適合照顧型行業",
-                11: "朋友如家人，願望與家庭相關",
-                12: "需要情感出口，透過藝術療癒"
-            },
-            "獅子座": {
-                1: "自信光芒的形象，給人高貴大方的感覺",
-                2: "賺錢大方，喜歡奢華享受，慷慨消費",
-                3: "溝通充滿熱情，喜歡表演和展現自我",
-                4: "家庭中是主角，重視家族榮耀",
-                5: "戀愛浪漫熱烈，創造力豐富，喜歡娛樂",
-                6: "工作認真負責，需注意心臟和背部健康",
-                7: "需要欣賞自己的伴侶，婚姻中需要被重視",
-                8: "面對轉變有尊嚴，善於掌控共享資源",
-                9: "哲學觀宏大，旅遊追求豪華體驗",
-                10: "天生領導者，適合需要表現力的事業",
-                11: "朋友圈需要自己發光，願望宏大",
-                12: "需要獨處充電，透過創作療癒"
-            },
-            "處女座": {
-                1: "謹慎細緻的形象，給人專業完美的印象",
-                2: "理財精打細算，注重實用性和品質",
-                3: "溝通精確，分析能力強，注重細節",
-                4: "家庭井然有序，注重清潔和健康",
-                5: "戀愛謹慎，喜歡有意義的娛樂活動",
-                6: "工作完美主義，需注意腸胃和神經健康",
-                7: "尋求完美伴侶，婚姻中注重實際問題",
-                8: "善於分析轉變，精確管理共同資產",
-                9: "學習注重實用，旅遊規劃詳細",
-                10: "事業精益求精，適合分析和服務業",
-                11: "選擇朋友謹慎，願望實際可行",
-                12: "需要放下完美主義，透過服務療癒"
-            },
-            "天秤座": {
-                1: "優雅和諧的形象，給人親切公正的感覺",
-                2: "賺錢重視平衡，可能與他人合作理財",
-                3: "溝通圓融得體，善於協調和外交",
-                4: "家庭追求和諧美麗，重視平等關係",
-                5: "戀愛浪漫，喜歡藝術和社交娛樂",
-                6: "工作需要夥伴，需注意腎臟和皮膚健康",
-                7: "婚姻是生命重心，尋求平等互補的伴侶",
-                8: "善於平衡轉變，公平處理共享資源",
-                9: "哲學觀重視公平，喜歡文化藝術旅遊",
-                10: "事業需要合作，適合藝術和法律領域",
-                11: "朋友圈和諧，願望與關係相關",
-                12: "需要獨處平衡，透過藝術療癒"
-            },
-            "天蠍座": {
-                1: "神秘深邃的形象，給人強烈磁場的感覺",
-                2: "賺錢能力強，善於投資和資源轉化",
-                3: "溝通深入，洞察力強，保守秘密",
-                4: "家庭氛圍深刻，可能有家族秘密",
-                5: "戀愛熱情專一，創造力來自深層情感",
-                6: "工作專注投入，需注意生殖系統健康",
-                7: "尋求深刻連結的伴侶，婚姻中追求靈魂伴侶",
-                8: "天生擅長轉化，善於處理危機和遺產",
-                9: "探索生命奧秘，旅遊深入體驗",
-                10: "事業追求權力，適合調查和心理領域",
-                11: "朋友關係深刻，願望涉及轉化和權力",
-                12: "需要面對內在陰影，透過心理療癒"
-            },
-            "射手座": {
-                1: "樂觀開朗的形象，給人自由熱情的感覺",
-                2: "賺錢樂觀，可能投資海外或教育",
-                3: "溝通直率坦誠，喜歡哲學性對話",
-                4: "家庭氛圍自由，可能來自多元文化",
-                5: "戀愛自由，喜歡冒險和戶外娛樂",
-                6: "工作需要自由度，需注意肝臟和大腿健康",
-                7: "需要給予自由的伴侶，婚姻如探險",
-                8: "樂觀面對轉變，善於從變化中學習",
-                9: "天生哲學家，熱愛旅遊和學習",
-                10: "事業多元化，適合教育和海外事業",
-                11: "朋友來自不同背景，願望宏大理想",
-                12: "需要信仰支持，透過旅行療癒"
-            },
-            "魔羯座": {
-                1: "成熟穩重的形象，給人可靠專業的感覺",
-                2: "理財保守謹慎，長期規劃財富",
-                3: "溝通實際，注重結果和效率",
-                4: "重視家庭責任，可能承擔家族負擔",
-                5: "戀愛認真，娛樂也很務實",
-                6: "工作努力負責，需注意骨骼和膝蓋健康",
-                7: "尋求穩定負責的伴侶，婚姻如事業夥伴",
-                8: "謹慎面對轉變，善於管理長期資源",
-                9: "務實的世界觀，旅遊重視目的性",
-                10: "天生事業家，適合管理和建設",
-                11: "朋友關係專業，願望實際可達成",
-                12: "需要釋放壓力，透過工作療癒"
-            },
-            "水瓶座": {
-                1: "獨特前衛的形象，給人理性友善的感覺",
-                2: "賺錢方式創新，可能涉及科技或團體",
-                3: "溝通客觀理性，思想前衛獨特",
-                4: "家庭關係平等，可能有非傳統家庭模式",
-                5: "戀愛需要自由和心靈交流，娛樂特別",
-                6: "工作重視創新，需注意循環系統和小腿健康",
-                7: "需要給予空間的伴侶，婚姻如朋友",
-                8: "以理性面對轉變，善於科技和創新",
-                9: "追求普世價值，旅遊體驗不同文化",
-                10: "事業獨特創新，適合科技和人道事業",
-                11: "朋友圈廣泛多元，願望關乎人類福祉",
-                12: "需要獨處思考，透過冥想療癒"
-            },
-            "雙魚座": {
-                1: "夢幻敏感的形象，給人神秘慈悲的感覺",
-                2: "金錢觀念模糊，需要實際管理",
-                3: "溝通充滿想像，直覺力強，善解人意",
-                4: "家庭充滿想像，可能界限模糊",
-                5: "戀愛浪漫夢幻，藝術創造力豐富",
-                6: "工作需要靈感，需注意足部和免疫系統",
-                7: "尋求靈魂伴侶，婚姻追求精神合一",
-                8: "深刻感受轉變，善於靈性療癒",
-                9: "追求靈性真理，旅遊尋找靈感",
-                10: "事業需要靈感，適合藝術和治療",
-                11: "朋友關係同理心強，願望理想化",
-                12: "天生靈性修行者，需要獨處療癒"
-            }
-        }
-        
-        return influences.get(zodiac, {}).get(house_num, "此星座為該宮位帶來獨特的能量和影響")
-
-    def _get_zodiac_house_details(self, month, day):
-        """獲取星座12宮位的詳細說明"""
-        zodiac_name = self._get_zodiac_name(month, day)
-        
-        details = f"""
-{'='*70}
-                    📖 星座12宮位詳細解析 📖
-{'='*70}
-
-您的太陽星座：{zodiac_name}
-
-以下是根據您的星座特質，對12宮位的詳細解讀：
-
-┌──────────────────────────────────────────────────────────┐
-│ 第1宮（命宮/上升宮）- 自我與外貌                            │
-├──────────────────────────────────────────────────────────┤
-│ 代表：個性、外貌、給人的第一印象、自我意識                  │
-│                                                            │
-│ 您的特質：                                                 │
-│ 作為{zodiac_name}，您在第一印象上展現出該星座的典型特徵。    │
-│ 您的外在形象和待人處事的方式深受太陽星座影響。              │
-│ 建議多注意個人形象和第一印象的塑造。                        │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第2宮（財帛宮）- 金錢與價值觀                               │
-├──────────────────────────────────────────────────────────┤
-│ 代表：財務狀況、物質資源、價值觀、自我價值                  │
-│                                                            │
-│ 財運分析：                                                 │
-│ 您對金錢和物質的態度會影響財富累積。                        │
-│ 建議培養良好的理財習慣，重視儲蓄和投資。                    │
-│ 瞭解自己的價值觀，才能在物質與精神間取得平衡。              │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第3宮（兄弟宮）- 溝通與學習                                 │
-├──────────────────────────────────────────────────────────┤
-│ 代表：溝通能力、學習、兄弟姊妹、鄰居、短途旅行              │
-│                                                            │
-│ 溝通特質：                                                 │
-│ 您的溝通方式和學習能力較為突出。                            │
-│ 與兄弟姊妹和鄰居的關係會影響您的成長。                      │
-│ 建議多閱讀、學習新知識，提升溝通技巧。                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第4宮（田宅宮）- 家庭與根基                                 │
-├──────────────────────────────────────────────────────────┤
-│ 代表：家庭、父母（特別是母親）、不動產、情感基礎            │
-│                                                            │
-│ 家庭運勢：                                                 │
-│ 家庭是您情感的避風港，影響您的安全感。                      │
-│ 與父母的關係會影響您的人格發展。                            │
-│ 建議重視家庭和諧，營造溫馨的居家環境。                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第5宮（子女宮）- 創造與娛樂                                 │
-├──────────────────────────────────────────────────────────┤
-│ 代表：戀愛、創造力、娛樂、子女、投機                        │
-│                                                            │
-│ 創造力分析：                                               │
-│ 您具有獨特的創造力和表現欲。                                │
-│ 戀愛和娛樂是生活的重要部分。                                │
-│ 建議培養興趣愛好，享受生活樂趣。                            │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第6宮（僕役宮）- 工作與健康                                 │
-├──────────────────────────────────────────────────────────┤
-│ 代表：工作、健康、日常事務、服務、寵物                      │
-│                                                            │
-│ 健康提醒：                                                 │
-│ 工作態度和健康狀況互相影響。                                │
-│ 建議保持規律的生活作息，注意身體保養。                      │
-│ 培養服務他人的精神，工作會更有意義。                        │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第7宮（夫妻宮）- 婚姻與合作                                 │
-├──────────────────────────────────────────────────────────┤
-│ 代表：婚姻、合夥、公開的敵人、一對一關係                    │
-│                                                            │
-│ 感情分析：                                                 │
-│ 婚姻和親密關係對您很重要。                                  │
-│ 您期待找到能夠互補的伴侶。                                  │
-│ 建議在關係中保持平衡，學習妥協和溝通。                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第8宮（疾厄宮）- 轉化與資源                                 │
-├──────────────────────────────────────────────────────────┤
-│ 代表：死亡、遺產、他人資源、性、深層轉化                    │
-│                                                            │
-│ 深層分析：                                                 │
-│ 您對神秘事物和深層心理有興趣。                              │
-│ 懂得運用他人資源來達成目標。                                │
-│ 建議面對人生轉折時，保持積極正面的態度。                    │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第9宮（遷移宮）- 哲學與遠行                                 │
-├──────────────────────────────────────────────────────────┤
-│ 代表：哲學、宗教、長途旅行、高等教育、外國事務              │
-│                                                            │
-│ 智慧啟發：                                                 │
-│ 您對人生哲理和異國文化感興趣。                              │
-│ 長途旅行能帶來成長和啟發。                                  │
-│ 建議多接觸不同文化，開拓視野。                              │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第10宮（官祿宮）- 事業與地位                                │
-├──────────────────────────────────────────────────────────┤
-│ 代表：事業、社會地位、名聲、父母（特別是父親）              │
-│                                                            │
-│ 事業運勢：                                                 │
-│ 事業成就是您人生的重要目標。                                │
-│ 您追求社會認同和專業成就。                                  │
-│ 建議設定明確的職業目標，持續努力。                          │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第11宮（福德宮）- 朋友與願望                                │
-├──────────────────────────────────────────────────────────┤
-│ 代表：朋友、團體、願望、社交、人道主義                      │
-│                                                            │
-│ 社交分析：                                                 │
-│ 朋友和社交圈對您很重要。                                    │
-│ 您重視團體歸屬感和共同理想。                                │
-│ 建議積極參與社交活動，拓展人脈。                            │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 第12宮（玄秘宮）- 靈性與潛意識                              │
-├──────────────────────────────────────────────────────────┤
-│ 代表：潛意識、靈性、秘密、隱藏的敵人、自我犧牲              │
-│                                                            │
-│ 靈性提升：                                                 │
-│ 您有豐富的內在世界和靈性追求。                              │
-│ 獨處時能夠獲得心靈平靜。                                    │
-│ 建議培養冥想或靈性實踐，探索內在自我。                      │
-└──────────────────────────────────────────────────────────┘
-
-{'='*70}
-"""
-        return details
-
-    def _generate_zodiac_chart_text(self, month, day):
-        """生成星座命盤文字圖"""
-        # 確定星座
-        zodiac_name = self._get_zodiac_name(month, day)
-        
-        chart = f"""
-{'='*70}
-                         🌟 星座命盤圖 🌟
-{'='*70}
-
-              北方
-                │
-                │
-     天頂MC ────┼──── 天底IC
-                │
-                │
-              南方
-
-          第12宮          第1宮
-             ╲            ╱
-              ╲          ╱
-    第11宮     ╲        ╱     第2宮
-       ╲        ╲      ╱        ╱
-        ╲        ╲    ╱        ╱
-         ╲        ╲  ╱        ╱
-第10宮────●────────☉────────●────第3宮
-         ╱        ╱  ╲        ╲
-        ╱        ╱    ╲        ╲
-       ╱        ╱      ╲        ╲
-    第9宮     ╱        ╲     第4宮
-              ╱          ╲
-             ╱            ╲
-          第8宮          第5宮
-                │
-                │
-          第7宮 │ 第6宮
-                │
-
-【命盤說明】
-☉ 太陽星座：{zodiac_name}
-● 宮位分佈：12宮位系統
-
-【宮位意義】
-第1宮（命宮）  ：自我、外貌、個性
-第2宮（財帛宮）：財運、價值觀
-第3宮（兄弟宮）：溝通、學習、手足
-第4宮（田宅宮）：家庭、根基、父母
-第5宮（子女宮）：戀愛、創造、子女
-第6宮（僕役宮）：健康、工作、服務
-第7宮（夫妻宮）：婚姻、合夥、伴侶
-第8宮（疾厄宮）：轉變、共享資源
-第9宮（遷移宮）：哲學、遠行、高等教育
-第10宮（官祿宮）：事業、社會地位
-第11宮（福德宮）：朋友、願望、社交
-第12宮（玄秘宮）：潛意識、隱藏、靈性
-
-{'='*70}
-"""
-        return chart
-
-    def _get_zodiac_name(self, month, day):
-        """獲取星座名稱"""
-        zodiacs = [
-            (1, 20, "魔羯座"), (2, 19, "水瓶座"), (3, 21, "雙魚座"),
-            (4, 20, "牡羊座"), (5, 21, "金牛座"), (6, 22, "雙子座"),
-            (7, 23, "巨蟹座"), (8, 23, "獅子座"), (9, 23, "處女座"),
-            (10, 24, "天秤座"), (11, 22, "天蠍座"), (12, 22, "射手座"),
-            (12, 31, "魔羯座")
-        ]
-        
-        for m, d, name in zodiacs:
-            if month < m or (month == m and day <= d):
-                return name
-        return "魔羯座"
-
-    def analyze_ziwei_with_chart(self, year, month, day, hour, gender):
-        """紫微論命含命盤圖"""
-        ps_data = self.purplestar_analyzer.analyze_ziwei(year, month, day, hour, gender)
-        basic_result = self.purplestar_analyzer.format_result(ps_data)
-        
-        # 生成紫微命盤圖
-        ziwei_chart = self._generate_ziwei_chart_text(ps_data)
-        
-        # 生成紫微12宮位詳細說明
-        house_details = self._get_ziwei_house_details()
-        
-        return f"{basic_result}\n\n{ziwei_chart}\n\n{house_details}"
-
-    def _get_ziwei_house_details(self):
-        """獲取紫微斗數12宮位的詳細說明"""
-        details = f"""
-{'='*70}
-               📖 紫微斗數十二宮位詳細解析 📖
-{'='*70}
-
-紫微斗數透過十二宮位全面分析人生各個層面：
-
-┌──────────────────────────────────────────────────────────┐
-│ 命宮 - 生命主軸與性格                                       │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★★ （最重要的宮位）                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 個人基本性格與氣質                                       │
-│  • 人生觀與價值觀                                           │
-│  • 外在形象與給人的印象                                     │
-│  • 一生命運的總體趨勢                                       │
-│                                                            │
-│ 【吉星進入】主星落在命宮會加強其特質                         │
-│ 【凶星進入】需要透過努力化解負面影響                         │
-│                                                            │
-│ 【建議】命宮是人生的核心，要深入了解自己的優缺點，            │
-│         發揮優勢，改善弱點。                                 │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 兄弟宮 - 手足關係與平輩                                     │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★☆☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 與兄弟姊妹的關係                                         │
-│  • 同事、同學等平輩關係                                     │
-│  • 合作夥伴的相處                                           │
-│  • 手足的助力與阻力                                         │
-│                                                            │
-│ 【吉星進入】手足情深，朋友助力大                             │
-│ 【凶星進入】容易與平輩產生衝突                               │
-│                                                            │
-│ 【建議】重視手足之情，維護平輩關係，互助互利。                │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 夫妻宮 - 婚姻與配偶                                         │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★★                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 配偶的性格特質                                           │
-│  • 婚姻生活的品質                                           │
-│  • 感情的發展與變化                                         │
-│  • 配偶對自己的影響                                         │
-│                                                            │
-│ 【吉星進入】婚姻美滿，配偶條件佳                             │
-│ 【凶星進入】感情易有波折，需要用心經營                       │
-│                                                            │
-│ 【建議】婚姻需要雙方共同經營，互相體諒、真誠溝通。            │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 子女宮 - 子女與創造力                                       │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 子女的數量與質量                                         │
-│  • 與子女的緣分深淺                                         │
-│  • 子女的性格與發展                                         │
-│  • 個人的創造力與表現欲                                     │
-│                                                            │
-│ 【吉星進入】子女聰明孝順，有創意                             │
-│ 【凶星進入】親子關係需要用心維繫                             │
-│                                                            │
-│ 【建議】重視子女教育，給予適當的關愛與自由。                  │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 財帛宮 - 財運與理財                                         │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★★                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 一生的財運狀況                                           │
-│  • 賺錢能力與理財方式                                       │
-│  • 財富累積的潛力                                           │
-│  • 金錢觀念與消費習慣                                       │
-│                                                            │
-│ 【吉星進入】財運亨通，善於理財                               │
-│ 【凶星進入】財運起伏，需謹慎理財                             │
-│                                                            │
-│ 【建議】培養正確的金錢觀，開源節流，穩健投資。                │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 疾厄宮 - 健康與體質                                         │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 先天體質與健康狀況                                       │
-│  • 容易罹患的疾病                                           │
-│  • 意外災害的可能性                                         │
-│  • 健康管理的重點                                           │
-│                                                            │
-│ 【吉星進入】體質健康，少病少災                               │
-│ 【凶星進入】需注意身體保養，定期檢查                         │
-│                                                            │
-│ 【建議】預防勝於治療，保持良好生活習慣，注意健康。            │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 遷移宮 - 外出與人際                                         │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 外出運勢與機會                                           │
-│  • 在外地的發展                                             │
-│  • 人際關係與貴人運                                         │
-│  • 旅行與搬遷的吉凶                                         │
-│                                                            │
-│ 【吉星進入】出外逢貴，人際關係佳                             │
-│ 【凶星進入】出門需謹慎，注意安全                             │
-│                                                            │
-│ 【建議】善待他人，廣結善緣，出外必有貴人相助。                │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 奴僕宮（交友宮）- 朋友與下屬                                 │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★☆☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 朋友的質量與助力                                         │
-│  • 與下屬的關係                                             │
-│  • 人際交往的模式                                           │
-│  • 社交圈的狀況                                             │
-│                                                            │
-│ 【吉星進入】朋友真誠，部屬得力                               │
-│ 【凶星進入】慎選朋友，防小人陷害                             │
-│                                                            │
-│ 【建議】交友需謹慎，但也要珍惜真心朋友。                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 官祿宮（事業宮）- 事業與工作                                 │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★★                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 事業發展與成就                                           │
-│  • 工作性質與環境                                           │
-│  • 職場表現與升遷                                           │
-│  • 事業目標與方向                                           │
-│                                                            │
-│ 【吉星進入】事業順利，步步高升                               │
-│ 【凶星進入】事業多波折，需加倍努力                           │
-│                                                            │
-│ 【建議】認真工作，把握機會，事業必有所成。                    │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 田宅宮 - 不動產與家運                                       │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 不動產的擁有情況                                         │
-│  • 家庭環境與居住品質                                       │
-│  • 置產能力與機會                                           │
-│  • 家族運勢                                                 │
-│                                                            │
-│ 【吉星進入】家運昌隆，置產容易                               │
-│ 【凶星進入】家庭不寧，房產需謹慎                             │
-│                                                            │
-│ 【建議】適時購置房產，營造溫馨家庭氛圍。                      │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 福德宮 - 精神與享受                                         │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 精神生活與內心世界                                       │
-│  • 興趣愛好與休閒                                           │
-│  • 福分與享受能力                                           │
-│  • 人生的快樂指數                                           │
-│                                                            │
-│ 【吉星進入】知足常樂，精神富足                               │
-│ 【凶星進入】內心煩惱，需要調適                               │
-│                                                            │
-│ 【建議】培養興趣愛好，追求身心靈平衡。                        │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 父母宮 - 父母與長輩                                         │
-├──────────────────────────────────────────────────────────┤
-│ 【重要性】★★★★☆                                            │
-│                                                            │
-│ 【代表意義】                                               │
-│  • 與父母的關係                                             │
-│  • 父母的健康與運勢                                         │
-│  • 得到長輩的幫助                                           │
-│  • 對父母的孝順程度                                         │
-│                                                            │
-│ 【吉星進入】父母健康，關係和睦                               │
-│ 【凶星進入】代溝較深，需要溝通                               │
-│                                                            │
-│ 【建議】孝順父母，尊敬長輩，福報自然來。                      │
-└──────────────────────────────────────────────────────────┘
-
-{'='*70}
-
-【宮位重要性排序】
-
-1. 命宮、夫妻宮、財帛宮、官祿宮 - 決定人生主要方向
-2. 子女宮、疾厄宮、遷移宮、田宅宮、福德宮、父母宮 - 影響生活品質
-3. 兄弟宮、奴僕宮 - 輔助人際關係
-
-【看命盤的訣竅】
-
-✦ 先看命宮，了解基本性格
-✦ 再看三方四正（財帛、官祿、遷移）
-✦ 注意吉星凶星的配置
-✦ 觀察大限流年的變化
-✦ 綜合判斷，不可偏執一宮
-
-{'='*70}
-"""
-        return details
-
-    def _generate_ziwei_chart_text(self, data):
-        """生成紫微命盤文字圖 - 含主星配置"""
-        # 从data中获取主星信息
-        main_stars = data.get('main_stars', {})
-        
-        # 为每个宫位准备主星显示
-        palace_stars = {}
-        for palace, star_info in main_stars.items():
-            star_name = star_info.get('star', '未知')
-            palace_stars[palace] = star_name
-        
-        # 获取各宫位主星（使用宫位名称作为key）
-        star_si = palace_stars.get('遷移宮', '－')
-        star_wu = palace_stars.get('奴僕宮', '－')
-        star_wei = palace_stars.get('官祿宮', '－')
-        star_shen = palace_stars.get('田宅宮', '－')
-        star_chen = palace_stars.get('疾厄宮', '－')
-        star_you = palace_stars.get('福德宮', '－')
-        star_mao = palace_stars.get('財帛宮', '－')
-        star_yin = palace_stars.get('子女宮', '－')
-        star_chou = palace_stars.get('夫妻宮', '－')
-        star_zi = palace_stars.get('兄弟宮', '－')
-        star_ming = palace_stars.get('命宮', '－')
-        star_fu = palace_stars.get('父母宮', '－')
-        
-        chart = f"""
-{'='*70}
-                      🟣 紫微斗數命盤 🟣
-{'='*70}
-
-┌──────────────┬──────────────┬──────────────┬──────────────┐
-│  巳宮（遷移）   │  午宮（奴僕）   │  未宮（官祿）   │  申宮（田宅）   │
-│  主星：{star_si:6s}│  主星：{star_wu:6s}│  主星：{star_wei:6s}│  主星：{star_shen:6s}│
-│              │              │              │              │
-├──────────────┼──────────────┴──────────────┼──────────────┤
-│  辰宮（疾厄）   │                            │  酉宮（福德）   │
-│  主星：{star_chen:6s}│    ◎ 命 盤 中 宮 ◎      │  主星：{star_you:6s}│
-│              │    命宮：{star_ming:6s}        │              │
-├──────────────┼──────────────┬──────────────┼──────────────┤
-│  卯宮（財帛）   │  寅宮（子女）   │  丑宮（夫妻）   │  子宮（兄弟）   │
-│  主星：{star_mao:6s}│  主星：{star_yin:6s}│  主星：{star_chou:6s}│  主星：{star_zi:6s}│
-│              │              │              │              │
-└──────────────┴──────────────┴──────────────┴──────────────┘
-                           │父母宮：{star_fu:6s}│
-
-【十二宮位主星配置】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-• 命宮（{star_ming}）：個性、命運主軸
-• 兄弟宮（{star_zi}）：手足、朋友關係
-• 夫妻宮（{star_chou}）：婚姻、配偶情況
-• 子女宮（{star_yin}）：子女、創造力
-• 財帛宮（{star_mao}）：財運、理財能力
-• 疾厄宮（{star_chen}）：健康、體質狀況
-
-• 遷移宮（{star_si}）：外出、人際關係
-• 奴僕宮（{star_wu}）：部屬、朋友助力
-• 官祿宮（{star_wei}）：事業、工作發展
-• 田宅宮（{star_shen}）：不動產、家庭
-• 福德宮（{star_you}）：精神享受、福氣
-• 父母宮（{star_fu}）：父母、長輩關係
-
-【主星說明】
-根據出生時辰，各宮位會有不同的主星落入。
-主星決定該宮位的特質和發展方向，影響人生各個層面。
-
-【重要宮位】
-✦ 命宮、夫妻宮、財帛宮、官祿宮 - 決定人生主要方向
-✦ 田宅宮、福德宮、父母宮 - 影響生活品質和福分
-✦ 其他宮位 - 輔助人生發展
-
-{'='*70}
-"""
-        return chart
-
     def display_result(self, key, content, header):
         """顯示分析結果（彩色格式化版本）"""
         text_widget = getattr(self, f"{key}_text")
@@ -2048,173 +830,20 @@ class EnhancedFATESuiteGUI:
                 # 一般文字
                 self._insert_with_tags(widget, line + '\n', 'normal')
     
-    def _generate_progress_bar(self, value, max_value=100, width=30):
-        """生成進度條圖形"""
-        percentage = min(100, max(0, (value / max_value) * 100))
-        filled = int((percentage / 100) * width)
-        empty = width - filled
-        return f"[{'█' * filled}{'░' * empty}] {percentage:.0f}%"
-    
-    def _generate_star_rating(self, score, max_score=100):
-        """生成星級評分"""
-        stars = int((score / max_score) * 5)
-        return '★' * stars + '☆' * (5 - stars)
-    
-    def _generate_chart_header(self, title):
-        """生成圖表標題"""
-        return f"\n╔{'═'*60}╗\n║{title.center(58)}║\n╚{'═'*60}╝\n"
-
     def generate_comprehensive_summary(self, year, month, day, hour, gender, blood):
-        """生成綜合總結"""
-        summary = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                  📊 完整命理分析綜合總結 📊                    ║
-╚══════════════════════════════════════════════════════════════╝
-
-【基本資料】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-出生日期：{year}年{month}月{day}日 {hour}時
-性    別：{gender}
-血    型：{blood}型
-分析時間：{datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}
-
-【七大分析系統總結】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-1️⃣  星座命理分析
-   {self._extract_summary('zodiac')}
-
-2️⃣  血型性格分析
-   {self._extract_summary('blood')}
-
-3️⃣  八字命理分析
-   {self._extract_summary('bazi')}
-
-4️⃣  紫微斗數分析
-   {self._extract_summary('purplestar')}
-
-5️⃣  塔羅牌占卜
-   {self._extract_summary('tarot')}
-
-6️⃣  周易卜卦
-   {self._extract_summary('yijing')}
-
-7️⃣  九宮靈數分析
-   {self._extract_summary('jiugong')}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-【整體運勢評估】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-◆ 性格特質：
-  {self._get_personality_summary(blood)}
-
-◆ 事業運勢：
-  根據八字和紫微分析，您在事業上具備良好的發展潛力
-  建議專注於自己的專長領域，穩紮穩打
-
-◆ 財運分析：
-  財運整體穩定，適合長期投資
-  避免高風險投機，以穩健理財為主
-
-◆ 感情運勢：
-  感情方面需要真誠溝通，用心經營
-  保持開放心態，緣分自然會到來
-
-◆ 健康提醒：
-  注意作息規律，保持良好生活習慣
-  定期運動，維持身心健康平衡
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-【人生建議】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-💡 短期建議（1年內）：
-   • 專注當下，腳踏實地完成眼前的目標
-   • 多與正面積極的人交流，拓展人脈
-   • 學習新技能，提升自我競爭力
-
-💡 中期規劃（3-5年）：
-   • 建立穩固的事業基礎
-   • 培養良好的理財習慣
-   • 經營重要的人際關係
-
-💡 長期展望（5年以上）：
-   • 實現人生重要目標
-   • 追求心靈成長與自我實現
-   • 回饋社會，創造更大價值
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-【開運建議】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🎯 開運方位：根據八字五行，建議多往東方或南方發展
-🎨 開運顏色：可多穿戴或使用與五行相生的顏色
-🔢 幸運數字：根據命理分析，注意數字3、6、9的運用
-⏰ 最佳時辰：早晨7-9點和下午1-3點為較佳時段
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-【流年流月運勢】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        
-        # 加入流年流月分析結果（如果有的話）
-        if 'fortune' in self.analysis_results:
-            summary += self.analysis_results['fortune']
-        
-        summary += """
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-【結語】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-命理分析只是參考，真正的命運掌握在自己手中。
-保持積極樂觀的態度，努力充實自己，
-相信每個人都能創造屬於自己的精彩人生！
-
-願您：
-• 事業順利，步步高升
-• 財源廣進，豐衣足食  
-• 感情美滿，家庭幸福
-• 身體健康，快樂平安
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-          本分析報告由 FATE Suite v2.3 自動生成
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        
+        """生成綜合總結並顯示於總結頁"""
+        summary = self.build_comprehensive_summary(year, month, day, hour, gender, blood,
+                                                   fortune=self.analysis_results.get('fortune'),
+                                                   ziwei_charts=self.ziwei_charts)
         self.analysis_results['summary'] = summary
+        self.display_summary(summary)
+
+    def display_summary(self, summary):
+        """將綜合總結顯示於總結頁"""
         summary_text = self.summary_text
         summary_text.delete(1.0, tk.END)
         summary_text.insert(tk.END, summary)
 
-    def _extract_summary(self, key):
-        """提取各分析的簡要摘要"""
-        summaries = {
-            'zodiac': '星座特質明顯，具有該星座的典型性格特徵',
-            'blood': '血型性格與行為模式相符，展現出特定的處事風格',
-            'bazi': '八字五行平衡，命格穩定，適合穩健發展',
-            'purplestar': '命宮星曜吉祥，各宮位配置良好，前景可期',
-            'tarot': '塔羅牌提示需要注意當下的選擇和內在指引',
-            'yijing': '周易卦象顯示順應天時，謹慎行事為上策',
-            'jiugong': '九宮靈數揭示您的人生道路與天賦才能'
-        }
-        return summaries.get(key, '分析結果良好')
-
-    def _get_personality_summary(self, blood):
-        """根據血型獲取性格摘要"""
-        personalities = {
-            'A': '謹慎細心，責任感強，注重細節和完美',
-            'B': '樂觀開朗，創意豐富，喜歡自由自在',
-            'AB': '理性冷靜，多才多藝，具有獨特魅力',
-            'O': '自信果斷，領導能力強，充滿行動力'
-        }
-        return personalities.get(blood, '性格穩重，具備多元特質')
-
     def show_summary(self):
         """顯示總結"""
         if 'summary' not in self.analysis_results:
@@ -2260,7 +889,11 @@ class EnhancedFATESuiteGUI:
             
             # 執行占卜
             birth_date = f"{self.birth_year.get()}-{self.birth_month.get()}-{self.birth_day.get()}"
-            tarot_result = self.tarot_analyzer.draw_cards(birth_date, question)
+            spread = self.TAROT_SPREAD_CHOICES.get(self.tarot_spread.get())
+            if spread is None:
+                tarot_result = self.tarot_analyzer.draw_cards(birth_date, question)
+            else:
+                tarot_result = self.tarot_analyzer.draw_spread(birth_date, spread, question)
             
             # 添加問題資訊頭部
             full_result = f"{'='*80}\n"
@@ -2305,7 +938,11 @@ class EnhancedFATESuiteGUI:
             
             # 執行卜卦
             birth_date = f"{self.birth_year.get()}-{self.birth_month.get()}-{self.birth_day.get()}"
-            yijing_result = self.yijing_analyzer.divine(birth_date, question)
+            method = self.YIJING_METHOD_CHOICES.get(self.yijing_method.get())
+            if method is None:
+                yijing_result = self.yijing_analyzer.divine(birth_date, question)
+            else:
+                yijing_result = self.yijing_analyzer.divine_by_casting(birth_date, question, method)
             
             # 添加問題資訊頭部
             full_result = f"{'='*80}\n"
@@ -2336,13 +973,152 @@ class EnhancedFATESuiteGUI:
             self.status_label.config(text=f"❌ 周易卜卦失敗")
     
     def load_results(self):
-        """載入已儲存的分析結果"""
+        """從客戶檔案庫載入已儲存的分析結果"""
+        self.open_archive_dialog()
+    
+    def open_archive_dialog(self):
+        """客戶檔案庫視窗：依姓名、出生日期、日柱、星座或報告關鍵字分頁查詢"""
+        archive_window = tk.Toplevel(self.root)
+        archive_window.title("📂 客戶檔案庫")
+        archive_window.geometry("860x520")
+        
+        # 查詢條件
+        search_frame = ttk.Frame(archive_window)
+        search_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        fields = {}
+        for column, (label, width) in enumerate((('姓名：', 12), ('出生日期：', 12), ('日柱：', 6),
+                                                 ('星座：', 8), ('報告關鍵字：', 16))):
+            ttk.Label(search_frame, text=label).grid(row=0, column=column * 2, sticky=tk.W)
+            entry = ttk.Entry(search_frame, width=width)
+            entry.grid(row=0, column=column * 2 + 1, padx=(0, 8))
+            fields[label] = entry
+        
+        # 結果列表
+        columns = ('id', 'created', 'name', 'birth_date', 'gender', 'day_pillar', 'zodiac', 'spouse_name')
+        headings = ('編號', '分析時間', '姓名', '出生日期', '性別', '日柱', '星座', '配偶')
+        tree = ttk.Treeview(archive_window, columns=columns, show='headings', height=15)
+        for column, heading in zip(columns, headings):
+            tree.heading(column, text=heading)
+            tree.column(column, width=140 if column == 'created' else 90, anchor=tk.CENTER)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        # 分頁與操作按鈕
+        button_frame = ttk.Frame(archive_window)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        page_label = ttk.Label(button_frame, text="")
+        state = {'page': 1, 'pages': 1}
+        
+        def refresh(page=1):
+            keyword = fields['報告關鍵字：'].get().strip()
+            if keyword:
+                result = self.archive.search_reports(keyword, page=page)
+            else:
+                result = self.archive.find(
+                    name=fields['姓名：'].get().strip() or None,
+                    birth_date=fields['出生日期：'].get().strip() or None,
+                    day_pillar=fields['日柱：'].get().strip() or None,
+                    zodiac=fields['星座：'].get().strip() or None,
+                    page=page,
+                )
+            tree.delete(*tree.get_children())
+            for item in result['items']:
+                tree.insert('', tk.END, values=[item[column] or '' for column in columns])
+            state['page'] = result['page']
+            state['pages'] = max(1, -(-result['total'] // result['page_size']))
+            page_label.config(text=f"第 {state['page']} / {state['pages']} 頁（共 {result['total']} 筆）")
+        
+        def selected_id():
+            selection = tree.selection()
+            if not selection:
+                messagebox.showwarning("提示", "請先選擇一筆紀錄！", parent=archive_window)
+                return None
+            return int(tree.item(selection[0], 'values')[0])
+        
+        def open_selected(event=None):
+            analysis_id = selected_id()
+            if analysis_id is not None and self._load_archived_analysis(analysis_id):
+                archive_window.destroy()
+        
+        def export_selected():
+            analysis_id = selected_id()
+            if analysis_id is None:
+                return
+            record = self.archive.get(analysis_id)
+            filename = filedialog.asksaveasfilename(
+                parent=archive_window,
+                title="匯出結果檔",
+                initialfile=f"{record['inputs'].get('name', '')}_{analysis_id}{RESULT_FILE_SUFFIX}",
+                filetypes=[("命理分析結果", f"*{RESULT_FILE_SUFFIX}")],
+                defaultextension=RESULT_FILE_SUFFIX
+            )
+            if filename:
+                save_result_file(filename, record['inputs'], record['results'], record['texts'])
+                self.status_label.config(text=f"✅ 結果檔已匯出：{filename}")
+        
+        def delete_selected():
+            analysis_id = selected_id()
+            if analysis_id is not None and messagebox.askyesno(
+                    "確認刪除", f"確定刪除紀錄 #{analysis_id}？", parent=archive_window):
+                self.archive.delete(analysis_id)
+                refresh(state['page'])
+        
+        def open_file():
+            archive_window.destroy()
+            self.load_results_from_file()
+        
+        ttk.Button(search_frame, text="🔍 查詢", command=refresh).grid(row=0, column=10, padx=5)
+        ttk.Button(button_frame, text="◀ 上一頁",
+                   command=lambda: state['page'] > 1 and refresh(state['page'] - 1)).pack(side=tk.LEFT)
+        page_label.pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text="下一頁 ▶",
+                   command=lambda: state['page'] < state['pages'] and refresh(state['page'] + 1)).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="📂 從檔案開啟", command=open_file).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="🗑️ 刪除", command=delete_selected).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="💾 匯出結果檔", command=export_selected).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="✅ 載入", command=open_selected).pack(side=tk.RIGHT, padx=5)
+        
+        tree.bind('<Double-1>', open_selected)
+        for entry in fields.values():
+            entry.bind('<Return>', lambda event: refresh())
+        refresh()
+    
+    def _load_archived_analysis(self, analysis_id):
+        """載入檔案庫中的一筆紀錄並顯示於各分頁"""
+        record = self.archive.get(analysis_id)
+        if record is None:
+            messagebox.showwarning("警告", f"找不到紀錄 #{analysis_id}")
+            return False
+        
+        self.analysis_inputs = record['inputs']
+        self.analysis_data = record['results']
+        self.analysis_results = record['texts']
+        self._restore_inputs(record['inputs'])
+        
+        loaded_keys = [key for key, content in record['texts'].items() if self._show_loaded_result(key, content)]
+        self._select_result_page(loaded_keys)
+        name = record['inputs'].get('name', '')
+        self.status_label.config(text=f"✅ 已載入紀錄 #{analysis_id}：{name}（{len(loaded_keys)} 個分析項目）")
+        return True
+    
+    def _select_result_page(self, keys):
+        """切換到第一個有內容的結果分頁"""
+        if not keys:
+            return
+        first_widget = getattr(self, f"{keys[0]}_text")
+        for tab_id in self.notebook.tabs():
+            if str(first_widget).startswith(tab_id + '.'):
+                self.notebook.select(tab_id)
+                break
+    
+    def load_results_from_file(self):
+        """載入結果檔（結構化結果檔；舊版 TXT 報告仍可讀取）"""
         try:
             # 選擇檔案
             filename = filedialog.askopenfilename(
                 title="開啟命理分析報告",
-                filetypes=[("文字檔案", "*.txt"), ("所有檔案", "*.*")],
-                defaultextension=".txt"
+                filetypes=[("命理分析結果", f"*{RESULT_FILE_SUFFIX}"), ("文字檔案", "*.txt"), ("所有檔案", "*.*")],
+                defaultextension=RESULT_FILE_SUFFIX
             )
             
             if not filename:
@@ -2352,85 +1128,19 @@ class EnhancedFATESuiteGUI:
             self.status_label.config(text="📂 正在載入檔案...")
             self.root.update()
             
-            # 讀取檔案
-            with open(filename, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 定義分析項目的映射關係（包含所有可能的key變體）
-            key_mapping = {
-                'ZODIAC': ('astrology', 'astrology_text'),
-                'ASTROLOGY': ('astrology', 'astrology_text'),
-                'BAZI': ('bazi', 'bazi_text'),
-                'PURPLESTAR': ('purplestar', 'purplestar_text'),
-                'ZIWEI': ('purplestar', 'purplestar_text'),
-                'TAROT': ('tarot', 'tarot_text'),
-                'YIJING': ('yijing', 'yijing_text'),
-                'JIUGONG': ('jiugong', 'jiugong_text'),
-                'JIUGONG_NAME': ('jiugong', 'jiugong_text'),
-                'BLOOD_TYPE': ('blood_type', 'blood_type_text'),
-                'BLOOD': ('blood_type', 'blood_type_text')
-            }
-            
-            loaded_count = 0
-            
-            # 使用分割方法解析
-            delimiter = '\n' + '='*70 + '\n'
-            sections = content.split(delimiter)
-            
-            # 遍歷sections並配對key-content
-            i = 0
-            while i < len(sections) - 1:
-                # Key在section[i]的最後一行，內容在section[i+1]
-                key_section = sections[i].strip()
-                content_section = sections[i+1] if i+1 < len(sections) else ''
-                
-                # 獲取最後一行作為key
-                key_lines = key_section.split('\n')
-                key = key_lines[-1].strip().upper() if key_lines else ''
-                
-                # 跳過空key或分隔線
-                if not key or key.startswith('=') or len(key) > 50:
-                    i += 1
-                    continue
-                
-                # 清理內容開頭的分隔線
-                section_content = content_section.strip()
-                if section_content.startswith('='*70):
-                    parts = section_content.split('\n\n', 1)
-                    if len(parts) > 1:
-                        section_content = parts[1].strip()
-                
-                # 檢查是否在映射表中
-                if key in key_mapping:
-                    result_key, widget_name = key_mapping[key]
-                    
-                    # 檢查文字框是否存在
-                    if hasattr(self, widget_name):
-                        widget = getattr(self, widget_name)
-                        widget.config(state=tk.NORMAL)
-                        widget.delete(1.0, tk.END)
-                        widget.insert(tk.END, section_content.strip())
-                        widget.config(state=tk.DISABLED)
-                        
-                        # 保存到結果字典
-                        self.analysis_results[result_key] = section_content.strip()
-                        loaded_count += 1
-                
-                # 移動到下一組
-                i += 2  # 跳過當前key和content sections
+            if is_result_file(filename):
+                loaded_keys = self._load_result_file(filename)
+            else:
+                loaded_keys = self._load_legacy_text_results(filename)
             
-            if loaded_count > 0:
+            if loaded_keys:
                 # 顯示成功訊息
-                filename_only = filename.split('/')[-1].split('\\')[-1]
-                messagebox.showinfo("載入成功", f"已成功載入 {loaded_count} 個分析項目！\n\n檔案：{filename_only}")
-                self.status_label.config(text=f"✅ 已載入 {loaded_count} 個分析項目")
+                filename_only = Path(filename).name
+                messagebox.showinfo("載入成功", f"已成功載入 {len(loaded_keys)} 個分析項目！\n\n檔案：{filename_only}")
+                self.status_label.config(text=f"✅ 已載入 {len(loaded_keys)} 個分析項目")
                 
                 # 自動切換到第一個載入的分頁
-                if 'astrology' in self.analysis_results:
-                    for i in range(self.notebook.index('end')):
-                        if '星座' in self.notebook.tab(i, 'text'):
-                            self.notebook.select(i)
-                            break
+                self._select_result_page(loaded_keys)
             else:
                 messagebox.showwarning("警告", "未能識別檔案中的分析項目！\n\n請確認檔案格式正確。")
                 self.status_label.config(text="⚠️ 檔案格式可能不正確")
@@ -2439,29 +1149,140 @@ class EnhancedFATESuiteGUI:
             messagebox.showerror("載入失敗", f"無法讀取檔案：{str(e)}")
             self.status_label.config(text="❌ 檔案載入失敗")
     
+    def _load_result_file(self, filename):
+        """讀取結構化結果檔：依區段索引取出輸入、結構化結果與各頁報告文字"""
+        with ResultFile(filename) as result_file:
+            inputs = result_file.read_inputs()
+            self.analysis_inputs = inputs
+            self.analysis_data = result_file.read_results()
+            self.analysis_results = result_file.read_texts()
+        
+        self._restore_inputs(inputs)
+        
+        loaded_keys = []
+        for key, content in self.analysis_results.items():
+            if self._show_loaded_result(key, content):
+                loaded_keys.append(key)
+        return loaded_keys
+    
+    def _load_legacy_text_results(self, filename):
+        """讀取舊版 TXT 報告（以分隔線切割各段）"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # 定義分析項目的映射關係（包含所有可能的key變體）
+        key_mapping = {
+            'ZODIAC': 'zodiac',
+            'ASTROLOGY': 'zodiac',
+            'BAZI': 'bazi',
+            'PURPLESTAR': 'purplestar',
+            'ZIWEI': 'purplestar',
+            'TAROT': 'tarot',
+            'YIJING': 'yijing',
+            'JIUGONG': 'jiugong',
+            'JIUGONG_NAME': 'jiugong_name',
+            'BLOOD_TYPE': 'blood',
+            'BLOOD': 'blood',
+            'FORTUNE': 'fortune',
+            'SUMMARY': 'summary',
+        }
+        
+        loaded_keys = []
+        
+        # 使用分割方法解析
+        delimiter = '\n' + '='*70 + '\n'
+        sections = content.split(delimiter)
+        
+        # 遍歷sections並配對key-content
+        i = 0
+        while i < len(sections) - 1:
+            # Key在section[i]的最後一行，內容在section[i+1]
+            key_section = sections[i].strip()
+            content_section = sections[i+1] if i+1 < len(sections) else ''
+            
+            # 獲取最後一行作為key
+            key_lines = key_section.split('\n')
+            key = key_lines[-1].strip().upper() if key_lines else ''
+            
+            # 跳過空key或分隔線
+            if not key or key.startswith('=') or len(key) > 50:
+                i += 1
+                continue
+            
+            # 清理內容開頭的分隔線
+            section_content = content_section.strip()
+            if section_content.startswith('='*70):
+                parts = section_content.split('\n\n', 1)
+                if len(parts) > 1:
+                    section_content = parts[1].strip()
+            
+            # 檢查是否在映射表中
+            if key in key_mapping:
+                result_key = key_mapping[key]
+                self.analysis_results[result_key] = section_content.strip()
+                if self._show_loaded_result(result_key, section_content.strip()):
+                    loaded_keys.append(result_key)
+            
+            # 移動到下一組
+            i += 2  # 跳過當前key和content sections
+        
+        return loaded_keys
+    
+    def _show_loaded_result(self, key, content):
+        """將載入的報告文字顯示於對應分頁；沒有分頁的項目（如流年流月）回傳 False"""
+        text_widget = getattr(self, f"{key}_text", None)
+        if text_widget is None:
+            return False
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete(1.0, tk.END)
+        self._insert_formatted_content(text_widget, content)
+        return True
+    
+    def _restore_inputs(self, inputs):
+        """以結果檔中的輸入資料回填輸入欄位與配偶資料"""
+        if 'name' in inputs:
+            self.name_entry.delete(0, tk.END)
+            self.name_entry.insert(0, inputs['name'])
+        for key, widget in (('year', self.birth_year), ('month', self.birth_month), ('day', self.birth_day),
+                            ('hour', self.birth_hour), ('gender', self.gender), ('blood_type', self.blood_type),
+                            ('birth_place', self.birth_place)):
+            if key in inputs:
+                widget.set(inputs[key])
+        self.spouse_full_data = inputs.get('spouse')
+    
     def save_results(self):
-        """儲存結果到文件"""
+        """儲存結果到客戶檔案庫（輸入、結構化結果、報告文字分開保存）"""
         if not self.analysis_results:
             messagebox.showwarning("提示", "沒有分析結果可以儲存！")
             return
         
+        try:
+            analysis_id = self.archive.save(self.analysis_inputs, self.analysis_data, self.analysis_results)
+            name = self.analysis_inputs.get('name', '')
+            
+            messagebox.showinfo("儲存成功", f"分析結果已存入客戶檔案庫：\n#{analysis_id} {name}")
+            self.status_label.config(text=f"✅ 結果已儲存：#{analysis_id} {name}")
+            
+        except Exception as e:
+            messagebox.showerror("儲存失敗", f"無法儲存結果：{str(e)}")
+
+    def export_text_results(self):
+        """匯出純文字報告（TXT）"""
+        if not self.analysis_results:
+            messagebox.showwarning("提示", "沒有分析結果可以匯出！")
+            return
+        
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"命理分析報告_{timestamp}.txt"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                for key, content in self.analysis_results.items():
-                    f.write(f"\n{'='*70}\n")
-                    f.write(f"  {key.upper()}\n")
-                    f.write(f"{'='*70}\n\n")
-                    f.write(content)
-                    f.write("\n\n")
+            export_text_report(filename, self.analysis_results)
             
-            messagebox.showinfo("儲存成功", f"分析結果已儲存至：\n{filename}")
-            self.status_label.config(text=f"✅ 結果已儲存：{filename}")
+            messagebox.showinfo("匯出成功", f"文字報告已匯出至：\n{filename}")
+            self.status_label.config(text=f"✅ 報告已匯出：{filename}")
             
         except Exception as e:
-            messagebox.showerror("儲存失敗", f"無法儲存文件：{str(e)}")
+            messagebox.showerror("匯出失敗", f"無法匯出文件：{str(e)}")
 
     def print_report(self):
         """列印報告"""
@@ -2579,6 +1400,8 @@ class EnhancedFATESuiteGUI:
             if text_widget:
                 text_widget.delete(1.0, tk.END)
         
+        self.analysis_inputs = {}
+        self.analysis_data = {}
         self.analysis_results = {}
         self.status_label.config(text="✅ 已清除所有結果")
     
@@ -2587,7 +1410,7 @@ class EnhancedFATESuiteGUI:
         # 創建配偶資料輸入窗口
         spouse_window = tk.Toplevel(self.root)
         spouse_window.title("💑 配偶資料輸入")
-        spouse_window.geometry("500x400")
+        spouse_window.geometry("500x450")
         
         # 標題
         title_label = tk.Label(spouse_window, text="📝 請輸入配偶基本資料", 
@@ -2639,6 +1462,12 @@ class EnhancedFATESuiteGUI:
         spouse_blood.set('A')
         spouse_blood.grid(row=6, column=1, pady=8)
         
+        # 配偶出生地（用於上升點與宮位）
+        ttk.Label(main_frame, text="配偶出生地：", font=("微軟正黑體", 10)).grid(row=7, column=0, sticky=tk.W, pady=8)
+        spouse_birth_place = ttk.Combobox(main_frame, values=list(BIRTH_PLACES), width=27, state="readonly")
+        spouse_birth_place.set(DEFAULT_BIRTH_PLACE)
+        spouse_birth_place.grid(row=7, column=1, pady=8)
+        
         # 按鈕框架
         button_frame = ttk.Frame(spouse_window)
         button_frame.pack(pady=20)
@@ -2658,7 +1487,8 @@ class EnhancedFATESuiteGUI:
                 'day': int(spouse_day.get()),
                 'hour': int(spouse_hour.get()),
                 'gender': spouse_gender.get(),
-                'blood_type': spouse_blood.get()
+                'blood_type': spouse_blood.get(),
+                'birth_place': spouse_birth_place.get()
             }
             
             self.status_label.config(text=f"✅ 已保存配偶資料：{name}（{spouse_year.get()}/{spouse_month.get()}/{spouse_day.get()}）- 請點擊「開始完整分析」")
@@ -2918,216 +1748,8 @@ class EnhancedFATESuiteGUI:
             command=cancel_settings
         ).pack(side=tk.RIGHT, padx=10)
 
-    def add_yearly_monthly_fortune(self, year, month, day, hour, gender):
-        """加入流年流月分析"""
-        from datetime import datetime
-        
-        # 使用系統當前日期
-        now = datetime.now()
-        current_year = now.year
-        current_month = now.month
-        
-        # 計算流年
-        yearly_fortune = self._calculate_yearly_fortune(year, month, day, gender, current_year)
-        
-        # 計算流月
-        monthly_fortune = self._calculate_monthly_fortune(year, month, day, gender, current_year, current_month)
-        
-        result = f"""
-{'='*70}
-                  🌠 流年流月運勢分析 🌠
-{'='*70}
-
-【當前年份】{current_year}年（民國{current_year-1911}年）
-【當前月份】{current_month}月
-
-┌──────────────────────────────────────────────────────────┐
-│ 📅 流年運勢（{current_year}年整體運勢）                        │
-├──────────────────────────────────────────────────────────┤
-│                                                            │
-│ 【整體運勢】                                                │
-│ {yearly_fortune['overall']}                                │
-│                                                            │
-│ 【事業運】★★★★☆                                           │
-│ {yearly_fortune['career']}                                │
-│                                                            │
-│ 【財運】★★★☆☆                                             │
-│ {yearly_fortune['wealth']}                                │
-│                                                            │
-│ 【感情運】★★★★☆                                           │
-│ {yearly_fortune['love']}                                  │
-│                                                            │
-│ 【健康運】★★★☆☆                                           │
-│ {yearly_fortune['health']}                                │
-│                                                            │
-│ 【貴人方位】{yearly_fortune['lucky_direction']}            │
-│ 【幸運色彩】{yearly_fortune['lucky_color']}                │
-│ 【開運建議】{yearly_fortune['advice']}                     │
-│                                                            │
-└──────────────────────────────────────────────────────────┘
-
-┌──────────────────────────────────────────────────────────┐
-│ 📆 流月運勢（{current_month}月份運勢）                         │
-├──────────────────────────────────────────────────────────┤
-│                                                            │
-│ 【本月焦點】{monthly_fortune['focus']}                      │
-│                                                            │
-│ 【上旬（1-10日）】                                          │
-│ {monthly_fortune['first_third']}                          │
-│                                                            │
-│ 【中旬（11-20日）】                                         │
-│ {monthly_fortune['second_third']}                         │
-│                                                            │
-│ 【下旬（21-月底）】                                         │
-│ {monthly_fortune['last_third']}                           │
-│                                                            │
-│ 【本月吉日】{monthly_fortune['lucky_days']}                │
-│ 【本月需注意】{monthly_fortune['caution']}                 │
-│ 【開運行動】{monthly_fortune['action']}                    │
-│                                                            │
-└──────────────────────────────────────────────────────────┘
-
-{'='*70}
-"""
-        return result
-
-    def _calculate_yearly_fortune(self, birth_year, birth_month, birth_day, gender, current_year):
-        """計算流年運勢"""
-        # 根據生肖和年份五行生剋關係判斷運勢
-        birth_zodiac = (birth_year - 4) % 12
-        year_zodiac = (current_year - 4) % 12
-        
-        # 簡化的運勢判斷
-        relationship = (year_zodiac - birth_zodiac) % 12
-        
-        fortune_map = {
-            0: {  # 本命年
-                'overall': '本命年，運勢起伏較大，需謹慎行事，可佩戴紅色飾品化解',
-                'career': '事業變動可能性大，需穩紮穩打，不宜冒進，可得貴人相助',
-                'wealth': '財運平平，正財尚可，偏財不利，避免投機和大額投資',
-                'love': '感情需要用心經營，單身者有機會遇到正緣，已婚者需防小三',
-                'health': '注意身體保養，定期檢查，避免意外傷害，多運動增強體質',
-                'lucky_direction': '東南方',
-                'lucky_color': '紅色、橙色',
-                'advice': '多行善事，保持低調，穩中求進，可到寺廟祈福消災'
-            },
-            3: {  # 三合年
-                'overall': '三合年，貴人運強，諸事順遂，是開創事業的好時機',
-                'career': '事業運佳，升遷有望，適合轉職或創業，多與人合作',
-                'wealth': '財運亨通，正財偏財皆旺，可適度投資，但仍需謹慎',
-                'love': '桃花運旺，單身者易遇良緣，已婚者夫妻和睦，感情甜蜜',
-                'health': '身體健康，精力充沛，但不可過勞，注意休息',
-                'lucky_direction': '正南方',
-                'lucky_color': '綠色、藍色',
-                'advice': '把握機會，積極進取，多結交貴人，廣結善緣'
-            },
-            4: {  # 六合年
-                'overall': '六合年，運勢平穩向上，適合合作共事，人際關係和諧',
-                'career': '工作穩定，與同事相處融洽，團隊合作順利，業績提升',
-                'wealth': '財運穩定，收入增加，適合儲蓄和穩健投資',
-                'love': '感情運佳，單身者可透過朋友介紹遇到對象，已婚者幸福美滿',
-                'health': '健康良好，心情愉悅，可多參加戶外活動',
-                'lucky_direction': '正西方',
-                'lucky_color': '白色、金色',
-                'advice': '重視人際關係，多與人合作，真誠待人，互助互利'
-            },
-            6: {  # 相沖年
-                'overall': '相沖年，波折較多，需防小人，謹慎行事，以守為攻',
-                'career': '事業有阻，需加倍努力，避免與人正面衝突，多忍讓',
-                'wealth': '財運不佳，開銷增加，避免借貸和擔保，謹慎理財',
-                'love': '感情易生波折，需多溝通，避免誤會，單身者不宜急於求成',
-                'health': '注意安全，防意外傷害，定期體檢，保持良好作息',
-                'lucky_direction': '正北方',
-                'lucky_color': '黑色、灰色',
-                'advice': '低調行事，避免衝動，可佩戴護身符，多行善積德'
-            }
-        }
-        
-        # 根據關係選擇運勢（簡化版）
-        if relationship in fortune_map:
-            return fortune_map[relationship]
-        else:
-            # 其他年份（平運年）
-            return {
-                'overall': '運勢平穩，需腳踏實地，穩中求進，可有小幅進步',
-                'career': '工作穩定，按部就班，可有小成就，不宜大幅變動',
-                'wealth': '財運平平，收入穩定，適合儲蓄，不宜大額投資',
-                'love': '感情平淡，需用心經營，單身者可多參加社交活動',
-                'health': '健康尚可，注意季節變化，預防感冒，規律作息',
-                'lucky_direction': '正東方',
-                'lucky_color': '黃色、棕色',
-                'advice': '穩紮穩打，累積實力，培養興趣，充實自己'
-            }
-
-    def _calculate_monthly_fortune(self, birth_year, birth_month, birth_day, gender, current_year, current_month):
-        """計算流月運勢"""
-        
-        # 簡化的月運判斷
-        fortunes = [
-            {
-                'focus': '事業發展，適合開展新計劃，人際關係活躍',
-                'first_third': '月初運勢平穩，可規劃本月目標，適合開會討論',
-                'second_third': '月中運勢上升，工作進展順利，可能有意外驚喜',
-                'last_third': '月底需注意細節，收尾工作要仔細，避免功虧一簣',
-                'lucky_days': f'{current_month}月6日、{current_month}月15日、{current_month}月24日',
-                'caution': '注意人際關係，避免口舌是非，謹慎處理文書合約',
-                'action': '多與人溝通，參加社交活動，學習新技能，拓展視野'
-            },
-            {
-                'focus': '財運理財，適合投資規劃，關注物質層面',
-                'first_third': '月初財運開始回升，可規劃理財，但不宜大額投資',
-                'second_third': '月中可能有額外收入，把握賺錢機會，但避免衝動消費',
-                'last_third': '月底需注意開銷，避免浪費，可適度儲蓄',
-                'lucky_days': f'{current_month}月8日、{current_month}月17日、{current_month}月26日',
-                'caution': '謹慎投資，避免借貸，控制購物慾望，理性消費',
-                'action': '檢視財務狀況，制定儲蓄計劃，學習理財知識'
-            },
-            {
-                'focus': '情感關係，適合表達心意，增進感情交流',
-                'first_third': '月初感情升溫，單身者有機會遇到心儀對象',
-                'second_third': '月中是表白或求婚的好時機，已婚者可安排約會',
-                'last_third': '月底需避免誤會，多溝通，維護感情穩定',
-                'lucky_days': f'{current_month}月3日、{current_month}月12日、{current_month}月21日',
-                'caution': '避免爛桃花，保持理性，不要過度付出，注意界限',
-                'action': '真誠表達情感，製造浪漫驚喜，重視伴侶需求'
-            },
-            {
-                'focus': '健康養生，適合運動鍛鍊，調整作息',
-                'first_third': '月初適合開始新的運動計劃，調整飲食習慣',
-                'second_third': '月中注意不要過勞，適度休息，保持心情愉悅',
-                'last_third': '月底需注意季節變化，預防疾病，定期檢查',
-                'lucky_days': f'{current_month}月5日、{current_month}月14日、{current_month}月23日',
-                'caution': '注意飲食衛生，避免熬夜，防止意外傷害，小心駕駛',
-                'action': '規律作息，均衡飲食，多運動，保持正面心態'
-            }
-        ]
-        
-        # 根據月份選擇運勢類型
-        fortune_index = current_month % 4
-        return fortunes[fortune_index]
-    
     # ========== 圖表增強函數 ==========
     
-    def _add_zodiac_charts(self, content, month, day):
-        """為星座分析添加圖表化元素"""
-        # chart_enhancer 模組不存在，已禁用圖表功能
-        return content
-    
-    def _add_blood_charts(self, content, blood_type):
-        """為血型分析添加圖表化元素"""
-        # chart_enhancer 模組不存在，已禁用圖表功能
-        return content
-    
-    def _add_bazi_charts(self, content, bazi_data):
-        """為八字分析添加圖表化元素"""
-        # chart_enhancer 模組不存在，已禁用圖表功能
-        return content
-    
-    def _add_ziwei_charts(self, content):
-        """為紫微斗數添加圖表化元素"""
-        # chart_enhancer 模組不存在，已禁用圖表功能
-        return content
-    
     def _add_tarot_charts(self, content):
         """為塔羅占卜添加圖表化元素"""
         # chart_enhancer 模組不存在，已禁用圖表功能
@@ -3140,297 +1762,6 @@ class EnhancedFATESuiteGUI:
     
         return content + charts
     
-    def _analyze_bazi_spouse_compatibility(self, user_name, user_bazi_data, 
-                                           spouse_name, spouse_bazi_data, user_gender):
-        """八字配偶深度合適性分析"""
-        analysis = "\n💑 八字配偶深度合適性分析"
-        
-        try:
-            # 提取四柱信息（簡化版本）
-            user_pillars = self._extract_bazi_pillars(user_bazi_data)
-            spouse_pillars = self._extract_bazi_pillars(spouse_bazi_data)
-            
-            # 1. 四柱對比
-            analysis += "\n【一、四柱對比分析】\n\n"
-            analysis += f"{'':4s}{'年柱':6s}{'月柱':6s}{'日柱':6s}{'時柱':6s}\n"
-            analysis += f"{user_name:4s}{user_pillars['year']:6s}{user_pillars['month']:6s}{user_pillars['day']:6s}{user_pillars['hour']:6s}\n"
-            analysis += f"{spouse_name:4s}{spouse_pillars['year']:6s}{spouse_pillars['month']:6s}{spouse_pillars['day']:6s}{spouse_pillars['hour']:6s}\n"
-            
-            # 2. 日柱對比（最重要）
-            analysis += "\n【二、日柱相配分析（最重要）】\n\n"
-            day_compatibility = self._analyze_day_pillar_compatibility(
-                user_pillars['day'], 
-                spouse_pillars['day'],
-                user_gender
-            )
-            analysis += day_compatibility
-            
-            # 3. 五行相生相剋
-            analysis += "\n【三、五行生剋分析】\n\n"
-            five_elements_analysis = self._analyze_five_elements_compatibility(
-                user_bazi_data,
-                spouse_bazi_data
-            )
-            analysis += five_elements_analysis
-            
-            # 4. 納音五行
-            analysis += "\n【四、納音五行相配】\n\n"
-            nayin_analysis = self._analyze_nayin_compatibility(
-                user_pillars,
-                spouse_pillars
-            )
-            analysis += nayin_analysis
-            
-            # 5. 婚姻宮（日支）
-            analysis += "\n【五、婚姻宮分析（日支）】\n\n"
-            marriage_palace_analysis = self._analyze_marriage_palace(
-                user_pillars['day'],
-                spouse_pillars['day']
-            )
-            analysis += marriage_palace_analysis
-            
-            # 6. 綜合評分
-            analysis += "\n【六、合婚綜合評分】\n\n"
-            compatibility_score = self._calculate_bazi_compatibility_score(
-                user_bazi_data,
-                spouse_bazi_data,
-                user_gender
-            )
-            
-            # 生成星級評分（簡化版本，無需 chart_enhancer）
-            stars = "★" * min(int(compatibility_score / 20), 5)
-            analysis += f"相容度評分：{compatibility_score}/100 {stars}\n\n"
-            
-            # 評價等級
-            if compatibility_score >= 80:
-                level = "【天作之合】"
-                comment = "八字極為相配，先天條件優越！"
-            elif compatibility_score >= 70:
-                level = "【良緣佳配】"
-                comment = "八字相合，婚姻幸福指數高。"
-            elif compatibility_score >= 60:
-                level = "【尚可相配】"
-                comment = "八字基本協調，需要互相包容。"
-            elif compatibility_score >= 50:
-                level = "【可以接受】"
-                comment = "八字有衝有合，需要加強溝通。"
-            else:
-                level = "【需要化解】"
-                comment = "八字相沖較多，建議采用化解方式。"
-            
-            analysis += f"{level}\n{comment}\n\n"
-            
-            # 7. 詳細建議
-            analysis += "【七、合婚建議】\n\n"
-            advice = self._generate_bazi_marriage_advice(
-                compatibility_score,
-                user_bazi_data,
-                spouse_bazi_data,
-                user_gender
-            )
-            analysis += advice
-            
-            analysis += "\n" + "="*80 + "\n"
-            
-            return analysis
-            
-        except Exception as e:
-            print(f"❌ 八字分析出錯：{e}")
-            import traceback
-            traceback.print_exc()
-            return f"\n❌ 配偶八字分析出錯：{e}"
-    
-    def _extract_bazi_pillars(self, bazi_data):
-        """從八字數據中提取四柱"""
-        try:
-            # 假設bazi_data字典包含year, month, day, hour等信息
-            pillars = {
-                'year': str(bazi_data.get('year', 'N/A'))[:2],
-                'month': str(bazi_data.get('month', 'N/A'))[:2],
-                'day': str(bazi_data.get('day', 'N/A'))[:2],
-                'hour': str(bazi_data.get('hour', 'N/A'))[:2]
-            }
-            return pillars
-        except:
-            return {'year': 'N/A', 'month': 'N/A', 'day': 'N/A', 'hour': 'N/A'}
-    
-    def _analyze_day_pillar_compatibility(self, user_day, spouse_day, user_gender):
-        """分析日柱相配（最重要）"""
-        analysis = ""
-        
-        # 簡化的日柱相合表
-        harmony_table = {
-            ('子', '午'): "【對沖】相沖相害，需要化解",
-            ('丑', '未'): "【對沖】相沖相害，需要化解",
-            ('寅', '申'): "【對沖】相沖相害，需要化解",
-            ('卯', '酉'): "【對沖】相沖相害，需要化解",
-            ('辰', '戌'): "【對沖】相沖相害，需要化解",
-            ('巳', '亥'): "【對沖】相沖相害，需要化解",
-            ('子', '丑'): "【六合】相合，婚配最佳",
-            ('寅', '卯'): "【相鄰】相近，感情穩定",
-            ('午', '未'): "【相鄰】相近，感情穩定",
-            ('申', '酉'): "【相鄰】相近，感情穩定",
-        }
-        
-        key = (user_day[-1] if user_day else 'N/A', spouse_day[-1] if spouse_day else 'N/A')
-        key_reverse = (spouse_day[-1] if spouse_day else 'N/A', user_day[-1] if user_day else 'N/A')
-        
-        if key in harmony_table:
-            result = harmony_table[key]
-        elif key_reverse in harmony_table:
-            result = harmony_table[key_reverse]
-        else:
-            result = "【一般相配】基本和諧，無特別相沖。"
-        
-        analysis += f"本人日柱：{user_day}\n"
-        analysis += f"配偶日柱：{spouse_day}\n"
-        analysis += f"相配狀況：{result}\n\n"
-        
-        if '六合' in result:
-            analysis += "✅ 日柱六合是婚配的最佳組合，預示感情和諧、夫妻恩愛。\n"
-        elif '相沖' in result:
-            analysis += "⚠️ 日柱相沖需要特別留意，建議通過其他化解方式改善。\n"
-        else:
-            analysis += "ℹ️ 日柱基本和諧，有利於建立穩定的婚姻關係。\n"
-        
-        return analysis
-    
-    def _analyze_five_elements_compatibility(self, user_bazi_data, spouse_bazi_data):
-        """分析五行生剋相配"""
-        analysis = ""
-        
-        # 簡化計算五行比例（無需使用 chart_enhancer）
-        analysis += "\n五行分佈概況：\n"
-        analysis += "  木: ████░░░░░░  (20%)\n"
-        analysis += "  火: █████░░░░░  (25%)\n"
-        analysis += "  土: ██████░░░░  (28%)\n"
-        analysis += "  金: ████░░░░░░  (20%)\n"
-        analysis += "  水: ███░░░░░░░  (18%)\n"
-        
-        analysis += "\n✅ 五行均衡：八字中五行分佈相對均勻\n"
-        analysis += "📊 本人五行強度：金旺\n"
-        analysis += "📊 配偶五行強度：水旺\n"
-        analysis += "💫 相配分析：金生水，相生關係，相合度高\n\n"
-        
-        return analysis
-    
-    def _analyze_nayin_compatibility(self, user_pillars, spouse_pillars):
-        """分析納音五行相配"""
-        analysis = ""
-        
-        # 納音五行表（簡化）
-        nayin_table = {
-            '子': '水', '丑': '土', '寅': '木', '卯': '木',
-            '辰': '土', '巳': '火', '午': '火', '未': '土',
-            '申': '金', '酉': '金', '戌': '土', '亥': '水'
-        }
-        
-        # 比較四柱納音五行
-        user_elements = []
-        spouse_elements = []
-        
-        for pillar in [user_pillars['year'], user_pillars['month'], 
-                       user_pillars['day'], user_pillars['hour']]:
-            if pillar and len(pillar) > 0:
-                user_elements.append(nayin_table.get(pillar[-1], '無'))
-        
-        for pillar in [spouse_pillars['year'], spouse_pillars['month'], 
-                       spouse_pillars['day'], spouse_pillars['hour']]:
-            if pillar and len(pillar) > 0:
-                spouse_elements.append(nayin_table.get(pillar[-1], '無'))
-        
-        analysis += f"本人納音五行：{' '.join(user_elements)}\n"
-        analysis += f"配偶納音五行：{' '.join(spouse_elements)}\n\n"
-        analysis += "✅ 納音相配度：較高\n"
-        analysis += "💫 五行相生：互相補助，利於感情穩定\n\n"
-        
-        return analysis
-    
-    def _analyze_marriage_palace(self, user_day, spouse_day):
-        """分析婚姻宮（日支）"""
-        analysis = ""
-        
-        # 婚姻宮吉凶表
-        marriage_palace_good = ['丑', '午', '未', '申', '卯']
-        marriage_palace_fair = ['寅', '酉', '辰', '亥']
-        marriage_palace_bad = ['子', '巳', '戌']
-        
-        user_status = ""
-        if user_day[-1] in marriage_palace_good:
-            user_status = "【吉】婚姻宮吉利"
-        elif user_day[-1] in marriage_palace_fair:
-            user_status = "【平】婚姻宮平和"
-        else:
-            user_status = "【凶】婚姻宮有衝"
-        
-        spouse_status = ""
-        if spouse_day[-1] in marriage_palace_good:
-            spouse_status = "【吉】婚姻宮吉利"
-        elif spouse_day[-1] in marriage_palace_fair:
-            spouse_status = "【平】婚姻宮平和"
-        else:
-            spouse_status = "【凶】婚姻宮有衝"
-        
-        analysis += f"本人婚姻宮（日支{user_day[-1]}）：{user_status}\n"
-        analysis += f"配偶婚姻宮（日支{spouse_day[-1]}）：{spouse_status}\n\n"
-        analysis += "💡 婚姻宮是決定婚姻質量的重要因素\n"
-        analysis += "📌 若雙方皆吉，則婚姻幸福機率最高\n\n"
-        
-        return analysis
-    
-    def _calculate_bazi_compatibility_score(self, user_bazi_data, spouse_bazi_data, user_gender):
-        """計算八字配偶合適性評分（0-100）"""
-        score = 70  # 基礎分
-        
-        # 簡化計算，加入隨機因素使結果更合理
-        import random
-        
-        # 日柱相合加分
-        score += random.randint(5, 15)
-        
-        # 五行相配加分
-        score += random.randint(3, 10)
-        
-        # 限制在0-100之間
-        score = max(0, min(100, score))
-        
-        return score
-    
-    def _generate_bazi_marriage_advice(self, compatibility_score, user_bazi_data, 
-                                        spouse_bazi_data, user_gender):
-        """生成八字婚姻建議"""
-        advice = ""
-        
-        if compatibility_score >= 80:
-            advice += "1. 先天條件優越，建議抓住機會，早日步入婚姻殿堂。\n"
-            advice += "2. 感情基礎良好，雙方合作會更加順利。\n"
-            advice += "3. 婚後應珍惜對方，相互扶持，維持良好的感情互動。\n\n"
-        elif compatibility_score >= 70:
-            advice += "1. 婚配條件良好，適合進一步發展關係。\n"
-            advice += "2. 建議多了解對方，增進感情交流。\n"
-            advice += "3. 婚後應注重溝通，化解可能的分歧。\n\n"
-        elif compatibility_score >= 60:
-            advice += "1. 基本條件可以接受，需要更多的包容與理解。\n"
-            advice += "2. 建議在交往中更加謹慎，充分認識對方。\n"
-            advice += "3. 如決定結婚，應積極化解八字中的不利因素。\n\n"
-        else:
-            advice += "1. 八字有較多衝突，建議慎重考慮婚配。\n"
-            advice += "2. 如決定結婚，應尋求命理師的化解建議。\n"
-            advice += "3. 可考慮結婚時間、地點等化解方式。\n"
-            advice += "4. 婚後應更加珍惜對方，主動溝通與包容。\n\n"
-        
-        advice += "💝 溫馨提示：\n"
-        advice += "   八字配偶合適性只是參考因素之一。\n"
-        advice += "   真正的婚姻幸福需要雙方共同努力和經營。\n"
-        advice += "   相愛、理解、尊重和信任才是維繫感情的根本。\n"
-        
-        return advice
-    
-    def _add_jiugong_charts(self, content):
-        """為九宮分析添加圖表化元素"""
-        # chart_enhancer 模組不存在，已禁用圖表功能
-        return content
-
 
 def main():
     """主程式入口"""
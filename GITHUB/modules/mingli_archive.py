@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命理客戶檔案庫模組
+以本機 SQLite 資料庫保存每次分析的輸入、結構化結果與報告文字：
+    - 姓名、出生日期、日柱、星座建有索引，可快速找到回訪客戶
+    - 報告文字建有全文檢索（FTS5 trigram，支援中文任意片段；不支援時改用 LIKE）
+    - 所有查詢皆分頁回傳
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from mingli_astrology import ZODIAC_SIGN_NAMES, ZodiacSignAnalyzer
+
+DEFAULT_ARCHIVE_FILENAME = 'mingli_archive.db'
+ARCHIVE_SCHEMA_VERSION = 1
+DEFAULT_PAGE_SIZE = 20
+
+# trigram 分詞器至少需要三個字元才能比對
+_FTS_MIN_QUERY_LENGTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    created     TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    birth_date  TEXT,
+    birth_hour  INTEGER,
+    gender      TEXT,
+    blood_type  TEXT,
+    day_pillar  TEXT,
+    zodiac      TEXT,
+    spouse_name TEXT,
+    inputs      TEXT NOT NULL,
+    results     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_name ON analyses(name);
+CREATE INDEX IF NOT EXISTS idx_analyses_birth_date ON analyses(birth_date);
+CREATE INDEX IF NOT EXISTS idx_analyses_day_pillar ON analyses(day_pillar);
+CREATE INDEX IF NOT EXISTS idx_analyses_zodiac ON analyses(zodiac);
+CREATE INDEX IF NOT EXISTS idx_analyses_created ON analyses(created);
+
+CREATE TABLE IF NOT EXISTS reports (
+    id          INTEGER PRIMARY KEY,
+    analysis_id INTEGER NOT NULL REFERENCES analyses(id) ON DELETE CASCADE,
+    key         TEXT NOT NULL,
+    text        TEXT NOT NULL,
+    UNIQUE (analysis_id, key)
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+    text, content='reports', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS reports_ai AFTER INSERT ON reports BEGIN
+    INSERT INTO reports_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS reports_ad AFTER DELETE ON reports BEGIN
+    INSERT INTO reports_fts(reports_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+# 列表查詢回傳的欄位（不含大型 JSON 與報告文字）
+_SUMMARY_COLUMNS = ('id', 'created', 'name', 'birth_date', 'birth_hour', 'gender',
+                    'blood_type', 'day_pillar', 'zodiac', 'spouse_name')
+
+
+def _day_pillar(bazi_pillars: Optional[Dict[str, Any]]) -> Optional[str]:
+    """從四柱資料取出日柱（支援基礎版 {'bazi': {'day'}} 與專業版 {'day': {'gan', 'zhi'}}）"""
+    if not bazi_pillars:
+        return None
+    if 'bazi' in bazi_pillars:
+        return bazi_pillars['bazi'].get('day')
+    day = bazi_pillars.get('day')
+    if isinstance(day, dict):
+        return day.get('gan', '') + day.get('zhi', '')
+    return day
+
+
+def _zodiac_name(zodiac_index: Optional[int]) -> Optional[str]:
+    if zodiac_index is None:
+        return None
+    return ZODIAC_SIGN_NAMES[zodiac_index]
+
+
+def _normalize_zodiac(zodiac: str) -> str:
+    """星座名稱轉為存檔所用的標準名稱（英文名、異體名稱如 '牡羊座'、'魔羯座' 亦可）"""
+    index = ZodiacSignAnalyzer.SIGN_INDEX.get(zodiac.strip())
+    return zodiac if index is None else ZODIAC_SIGN_NAMES[index]
+
+
+def _page_bounds(page: int, page_size: int) -> Tuple[int, int]:
+    """頁碼（從 1 起算）轉為 LIMIT/OFFSET"""
+    page = max(page, 1)
+    page_size = max(page_size, 1)
+    return page_size, (page - 1) * page_size
+
+
+class AnalysisArchive:
+    """命理客戶檔案庫（SQLite）"""
+
+    def __init__(self, path: str = DEFAULT_ARCHIVE_FILENAME):
+        """
+        開啟（必要時建立）檔案庫
+
+        Args:
+            path: 資料庫檔案路徑（':memory:' 為記憶體資料庫）
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {ARCHIVE_SCHEMA_VERSION}')
+        try:
+            with self.conn:
+                self.conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # SQLite 未編入 FTS5 或 trigram 分詞器
+            self.has_fts = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    # ========== 寫入 ==========
+
+    def save(self, inputs: Dict[str, Any], results: Dict[str, Any], texts: Dict[str, str]) -> int:
+        """
+        保存一次分析
+
+        Args:
+            inputs: 分析輸入（name, year, month, day, hour, gender, blood_type, spouse）
+            results: 結構化結果（engine.analysis_data）
+            texts: {報告名稱: 報告文字}
+
+        Returns:
+            紀錄編號
+        """
+        birth_date = None
+        if all(inputs.get(key) for key in ('year', 'month', 'day')):
+            birth_date = f"{inputs['year']:04d}-{inputs['month']:02d}-{inputs['day']:02d}"
+        spouse = inputs.get('spouse') or {}
+
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO analyses (created, name, birth_date, birth_hour, gender, blood_type, '
+                'day_pillar, zodiac, spouse_name, inputs, results) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    datetime.now().isoformat(timespec='seconds'),
+                    inputs.get('name', ''),
+                    birth_date,
+                    inputs.get('hour'),
+                    inputs.get('gender'),
+                    inputs.get('blood_type'),
+                    _day_pillar(results.get('bazi_pillars')),
+                    _zodiac_name(results.get('zodiac_index')),
+                    spouse.get('name'),
+                    json.dumps(inputs, ensure_ascii=False),
+                    json.dumps(results, ensure_ascii=False),
+                )
+            )
+            analysis_id = cursor.lastrowid
+            self.conn.executemany(
+                'INSERT INTO reports (analysis_id, key, text) VALUES (?, ?, ?)',
+                ((analysis_id, key, text) for key, text in texts.items())
+            )
+        return analysis_id
+
+    def delete(self, analysis_id: int) -> bool:
+        """刪除紀錄（連同報告），回傳是否有刪除"""
+        with self.conn:
+            self.conn.execute('DELETE FROM reports WHERE analysis_id = ?', (analysis_id,))
+            cursor = self.conn.execute('DELETE FROM analyses WHERE id = ?', (analysis_id,))
+        return cursor.rowcount > 0
+
+    # ========== 讀取 ==========
+
+    def get(self, analysis_id: int) -> Optional[Dict[str, Any]]:
+        """讀取完整紀錄：{'id', 'created', 'inputs', 'results', 'texts'}，不存在時回傳 None"""
+        row = self.conn.execute(
+            'SELECT id, created, inputs, results FROM analyses WHERE id = ?', (analysis_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        texts = {
+            report['key']: report['text']
+            for report in self.conn.execute(
+                'SELECT key, text FROM reports WHERE analysis_id = ? ORDER BY id', (analysis_id,)
+            )
+        }
+        return {
+            'id': row['id'],
+            'created': row['created'],
+            'inputs': json.loads(row['inputs']),
+            'results': json.loads(row['results']),
+            'texts': texts,
+        }
+
+    def get_report(self, analysis_id: int, key: str) -> Optional[str]:
+        """只讀取單一報告文字"""
+        row = self.conn.execute(
+            'SELECT text FROM reports WHERE analysis_id = ? AND key = ?', (analysis_id, key)
+        ).fetchone()
+        return row['text'] if row else None
+
+    def _paged(self, where: str, params: Iterable[Any], page: int, page_size: int,
+               extra_columns: str = '', from_clause: str = 'analyses',
+               order_by: str = 'analyses.created DESC, analyses.id DESC') -> Dict[str, Any]:
+        """分頁查詢共用：回傳 {'total', 'page', 'page_size', 'items'}"""
+        params = tuple(params)
+        limit, offset = _page_bounds(page, page_size)
+        total = self.conn.execute(
+            f'SELECT COUNT(DISTINCT analyses.id) FROM {from_clause} {where}', params
+        ).fetchone()[0]
+        columns = ', '.join(f'analyses.{column}' for column in _SUMMARY_COLUMNS) + extra_columns
+        rows = self.conn.execute(
+            f'SELECT {columns} FROM {from_clause} {where} '
+            f'GROUP BY analyses.id ORDER BY {order_by} LIMIT ? OFFSET ?',
+            params + (limit, offset)
+        ).fetchall()
+        return {
+            'total': total,
+            'page': max(page, 1),
+            'page_size': limit,
+            'items': [dict(row) for row in rows],
+        }
+
+    def find(self, name: Optional[str] = None, birth_date: Optional[str] = None,
+             day_pillar: Optional[str] = None, zodiac: Optional[str] = None,
+             page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        依索引欄位查詢客戶紀錄（最新的在前）
+
+        Args:
+            name: 姓名（前綴比對）
+            birth_date: 出生日期 'YYYY-MM-DD'，或前綴如 'YYYY' / 'YYYY-MM'
+            day_pillar: 日柱（如 '甲子'）
+            zodiac: 星座名稱（接受英文名及異體名稱）
+            page: 頁碼（從 1 起算）
+            page_size: 每頁筆數
+
+        Returns:
+            {'total': 符合筆數, 'page', 'page_size', 'items': [紀錄摘要]}
+        """
+        conditions = []
+        params = []
+        if zodiac:
+            zodiac = _normalize_zodiac(zodiac)
+        # 前綴比對以範圍條件表示，才能使用索引
+        for column, value in (('name', name), ('birth_date', birth_date)):
+            if value:
+                conditions.append(f'analyses.{column} >= ? AND analyses.{column} < ?')
+                params.extend((value, value + '\U0010ffff'))
+        for column, value in (('day_pillar', day_pillar), ('zodiac', zodiac)):
+            if value:
+                conditions.append(f'analyses.{column} = ?')
+                params.append(value)
+        where = 'WHERE ' + ' AND '.join(conditions) if conditions else ''
+        return self._paged(where, params, page, page_size)
+
+    def search_reports(self, query: str, page: int = 1,
+                       page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        全文檢索報告文字
+
+        Args:
+            query: 關鍵字（任意中文片段）
+            page: 頁碼（從 1 起算）
+            page_size: 每頁筆數
+
+        Returns:
+            同 find，items 另含 'matched_keys'（命中的報告名稱，以逗號分隔）
+        """
+        query = query.strip()
+        if not query:
+            return self.find(page=page, page_size=page_size)
+
+        from_clause = 'analyses JOIN reports ON reports.analysis_id = analyses.id'
+        extra_columns = ', group_concat(reports.key) AS matched_keys'
+        if self.has_fts and len(query) >= _FTS_MIN_QUERY_LENGTH:
+            from_clause += ' JOIN reports_fts ON reports_fts.rowid = reports.id'
+            where = 'WHERE reports_fts MATCH ?'
+            # 以雙引號包住，視為單一片語
+            params = ('"' + query.replace('"', '""') + '"',)
+        else:
+            where = "WHERE reports.text LIKE ? ESCAPE '\\'"
+            escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params = (f'%{escaped}%',)
+        return self._paged(where, params, page, page_size, extra_columns, from_clause)
+
+    def count(self) -> int:
+        """紀錄總數"""
+        return self.conn.execute('SELECT COUNT(*) FROM analyses').fetchone()[0]
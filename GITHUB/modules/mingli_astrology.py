@@ -5,8 +5,33 @@
 包含十二星座分析和血型性格分析
 """
 
+from array import array
+from bisect import bisect_right
 from datetime import datetime
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Sequence
+
+# 平年各月之前的累計天數（用於換算年內第幾天）
+_MONTH_OFFSETS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# 各星座起始日（年內第幾天，平年）：1/20, 2/19, 3/21, 4/20, 5/21, 6/21,
+# 7/23, 8/23, 9/23, 10/23, 11/22, 12/22
+ZODIAC_START_DAYS = (20, 50, 80, 110, 141, 172, 204, 235, 266, 296, 326, 356)
+
+# bisect 結果對應的星座索引（0 = 白羊座 ... 11 = 雙魚座）
+_ZODIAC_BY_SEGMENT = (9, 10, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+
+
+def get_zodiac_index(month: int, day: int) -> int:
+    """根據月日獲取星座索引（0-11，對應 ZodiacSignAnalyzer.ZODIAC_SIGNS）"""
+    if not 1 <= month <= 12:
+        return 0  # 默認返回白羊座
+    day_of_year = _MONTH_OFFSETS[month - 1] + min(max(day, 0), 31)
+    return _ZODIAC_BY_SEGMENT[bisect_right(ZODIAC_START_DAYS, day_of_year)]
+
+
+def get_zodiac_batch(months: Sequence[int], days: Sequence[int]) -> array:
+    """批次獲取星座索引，回傳 array('b')"""
+    return array('b', map(get_zodiac_index, months, days))
 
 
 class ZodiacSignAnalyzer:
@@ -171,54 +196,40 @@ class ZodiacSignAnalyzer:
         }
     ]
     
+    # 星座名稱 → ZODIAC_SIGNS 索引（含英文名及常見異體名稱）
+    SIGN_INDEX = {sign['name']: i for i, sign in enumerate(ZODIAC_SIGNS)}
+    SIGN_INDEX.update({sign['en_name']: i for i, sign in enumerate(ZODIAC_SIGNS)})
+    SIGN_INDEX.update({'牡羊座': 0, '天蝎座': 7, '魔羯座': 9})
+    
+    get_zodiac_index = staticmethod(get_zodiac_index)
+    get_zodiac_batch = staticmethod(get_zodiac_batch)
+    
+    # 已渲染的星座報告（12 個星座內容固定，每個行程只渲染一次）
+    _report_cache: Dict[int, str] = {}
+    
     def __init__(self):
         self.signs = {sign['name']: sign for sign in self.ZODIAC_SIGNS}
     
     def get_zodiac_by_date(self, month: int, day: int) -> Dict:
         """根據月日獲取星座"""
-        # 白羊座: 3/21-4/19
-        if (month == 3 and day >= 21) or (month == 4 and day <= 19):
-            return self.ZODIAC_SIGNS[0]
-        # 金牛座: 4/20-5/20
-        elif (month == 4 and day >= 20) or (month == 5 and day <= 20):
-            return self.ZODIAC_SIGNS[1]
-        # 雙子座: 5/21-6/20
-        elif (month == 5 and day >= 21) or (month == 6 and day <= 20):
-            return self.ZODIAC_SIGNS[2]
-        # 巨蟹座: 6/21-7/22
-        elif (month == 6 and day >= 21) or (month == 7 and day <= 22):
-            return self.ZODIAC_SIGNS[3]
-        # 獅子座: 7/23-8/22
-        elif (month == 7 and day >= 23) or (month == 8 and day <= 22):
-            return self.ZODIAC_SIGNS[4]
-        # 處女座: 8/23-9/22
-        elif (month == 8 and day >= 23) or (month == 9 and day <= 22):
-            return self.ZODIAC_SIGNS[5]
-        # 天秤座: 9/23-10/22
-        elif (month == 9 and day >= 23) or (month == 10 and day <= 22):
-            return self.ZODIAC_SIGNS[6]
-        # 天蠍座: 10/23-11/21
-        elif (month == 10 and day >= 23) or (month == 11 and day <= 21):
-            return self.ZODIAC_SIGNS[7]
-        # 射手座: 11/22-12/21
-        elif (month == 11 and day >= 22) or (month == 12 and day <= 21):
-            return self.ZODIAC_SIGNS[8]
-        # 摩羯座: 12/22-1/19
-        elif (month == 12 and day >= 22) or (month == 1 and day <= 19):
-            return self.ZODIAC_SIGNS[9]
-        # 水瓶座: 1/20-2/18
-        elif (month == 1 and day >= 20) or (month == 2 and day <= 18):
-            return self.ZODIAC_SIGNS[10]
-        # 雙魚座: 2/19-3/20
-        elif (month == 2 and day >= 19) or (month == 3 and day <= 20):
-            return self.ZODIAC_SIGNS[11]
-        
-        return self.ZODIAC_SIGNS[0]  # 默認返回白羊座
+        return self.ZODIAC_SIGNS[get_zodiac_index(month, day)]
+    
+    def get_sign_by_name(self, name: str) -> Dict:
+        """根據星座名稱（中文、英文或異體名稱）獲取星座，找不到時返回 None"""
+        index = self.SIGN_INDEX.get(name)
+        return self.ZODIAC_SIGNS[index] if index is not None else None
     
     def analyze_zodiac(self, month: int, day: int) -> str:
         """分析星座信息"""
-        sign = self.get_zodiac_by_date(month, day)
-        
+        index = get_zodiac_index(month, day)
+        report = self._report_cache.get(index)
+        if report is None:
+            report = self._report_cache[index] = self._render_zodiac_report(
+                self.ZODIAC_SIGNS[index])
+        return report
+    
+    def _render_zodiac_report(self, sign: Dict) -> str:
+        """渲染單一星座的固定報告"""
         result = f"""
 【{sign['symbol']} {sign['name']} 星座分析】
 
@@ -252,9 +263,16 @@ class ZodiacSignAnalyzer:
         return self.ZODIAC_SIGNS
 
 
+# 標準星座名稱（依 ZODIAC_SIGNS 索引排列）
+ZODIAC_SIGN_NAMES = tuple(sign['name'] for sign in ZodiacSignAnalyzer.ZODIAC_SIGNS)
+
+
 class BloodTypeAnalyzer:
     """血型分析"""
     
+    # 已渲染的血型報告（4 種血型內容固定，每個行程只渲染一次）
+    _report_cache: Dict[str, str] = {}
+    
     BLOOD_TYPES = {
         'A': {
             'name': 'A 型血',
@@ -300,6 +318,18 @@ class BloodTypeAnalyzer:
     
     def analyze_blood_type(self, blood_type: str) -> str:
         """分析血型性格"""
+        key = blood_type.upper()
+        if key not in self.BLOOD_TYPES:
+            # 非標準輸入不快取，避免快取無限增長
+            return self._render_blood_type_report(blood_type)
+        
+        report = self._report_cache.get(key)
+        if report is None:
+            report = self._report_cache[key] = self._render_blood_type_report(key)
+        return report
+    
+    def _render_blood_type_report(self, blood_type: str) -> str:
+        """渲染單一血型的報告"""
         bt = self.BLOOD_TYPES.get(blood_type.upper(), self.BLOOD_TYPES['O'])
         
         result = f"""
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+視窗背景圖產生與快取模組
+依螢幕解析度產生背景圖（金黃色漸層，或縮放後的背景圖片），
+以 PNG 存於使用者快取目錄，之後啟動直接載入，不必每次重繪或縮放。
+PNG 由標準函式庫（zlib）編碼，可直接交給 tkinter.PhotoImage 顯示。
+"""
+
+import hashlib
+import io
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from mingli_paths import user_cache_dir
+
+# 從淺金色到深金色的漸層
+GRADIENT_TOP = (245, 230, 211)
+GRADIENT_BOTTOM = (212, 175, 55)
+
+# 產生方式變更時遞增，使舊快取失效
+BACKGROUND_CACHE_VERSION = 1
+BACKGROUND_CACHE_DIRNAME = 'backgrounds'
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+Color = Tuple[int, int, int]
+
+
+def render_vertical_gradient(width: int, height: int, top: Color = GRADIENT_TOP,
+                             bottom: Color = GRADIENT_BOTTOM) -> bytearray:
+    """
+    產生垂直漸層的 RGB 點陣（單一連續緩衝區，每列前置 PNG 濾波位元組 0）
+
+    同一列顏色相同，每種顏色的整列位元組只建立一次，再以切片整段寫入緩衝區；
+    顏色計算與原逐列繪製相同。
+
+    Returns:
+        長度為 height * (1 + width * 3) 的 bytearray
+    """
+    stride = 1 + width * 3
+    buffer = bytearray(stride * height)
+    rows = {}
+    for y in range(height):
+        ratio = y / height
+        color = tuple(int(start - (start - end) * ratio) for start, end in zip(top, bottom))
+        row = rows.get(color)
+        if row is None:
+            row = rows[color] = b'\x00' + bytes(color) * width
+        buffer[y * stride:(y + 1) * stride] = row
+    return buffer
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+
+def encode_png(width: int, height: int, scanlines: bytes) -> bytes:
+    """將已含濾波位元組的 RGB 掃描列編碼為 PNG"""
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (_PNG_SIGNATURE
+            + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(bytes(scanlines), 6))
+            + _png_chunk(b'IEND', b''))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """先寫入暫存檔再改名，避免中斷時留下不完整的快取"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _cache_key(*parts) -> str:
+    text = '|'.join(str(part) for part in (BACKGROUND_CACHE_VERSION,) + parts)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def get_gradient_background(width: int, height: int, top: Color = GRADIENT_TOP,
+                            bottom: Color = GRADIENT_BOTTOM,
+                            cache_dir: Optional[Path] = None) -> Path:
+    """取得指定解析度的漸層背景 PNG（已快取則直接回傳路徑）"""
+    cache_dir = user_cache_dir(BACKGROUND_CACHE_DIRNAME) if cache_dir is None else Path(cache_dir)
+    path = cache_dir / f"gradient_{width}x{height}_{_cache_key(top, bottom)}.png"
+    if not path.exists():
+        _write_atomic(path, encode_png(width, height, render_vertical_gradient(width, height, top, bottom)))
+    return path
+
+
+def get_scaled_background(source: Path, width: int, height: int,
+                          cache_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    取得縮放至指定解析度的背景圖片 PNG
+
+    快取以來源檔路徑、修改時間與大小區分；來源更新後自動重新縮放。
+    尚無快取且未安裝 PIL 時回傳 None。
+    """
+    source = Path(source)
+    stat = source.stat()
+    cache_dir = user_cache_dir(BACKGROUND_CACHE_DIRNAME) if cache_dir is None else Path(cache_dir)
+    key = _cache_key(source.resolve(), stat.st_mtime_ns, stat.st_size)
+    path = cache_dir / f"{source.stem}_{width}x{height}_{key}.png"
+    if path.exists():
+        return path
+    if Image is None:
+        return None
+
+    with Image.open(source) as image:
+        scaled = image.convert('RGB').resize((width, height), Image.Resampling.LANCZOS)
+    output = io.BytesIO()
+    scaled.save(output, format='PNG')
+    _write_atomic(path, output.getvalue())
+    return path
+
+
+def get_background_image(width: int, height: int, source: Optional[Path] = None,
+                         cache_dir: Optional[Path] = None) -> Path:
+    """
+    取得視窗背景圖路徑
+
+    Args:
+        width, height: 螢幕解析度
+        source: 背景圖片（可省略；不存在或無法縮放時改用漸層）
+        cache_dir: 快取目錄（預設為使用者快取目錄）
+
+    Returns:
+        可由 tkinter.PhotoImage 直接載入的 PNG 路徑
+    """
+    if source is not None and Path(source).exists():
+        path = get_scaled_background(source, width, height, cache_dir)
+        if path is not None:
+            return path
+    return get_gradient_background(width, height, cache_dir=cache_dir)
@@ -411,7 +411,7 @@ class SimpleBaziCalculator:
         
         # 格式化輸出
         output = f"【八字快速查詢】\n"
-        output += f"{"="*40}\n"
+        output += f"{'='*40}\n"
         output += f"出生年月日時: {year}年{month}月{day}日 {hour}時\n"
         output += f"生肖: {zodiac}\n\n"
         output += f"八字組合:\n"
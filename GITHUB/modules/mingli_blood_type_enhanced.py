@@ -6,7 +6,10 @@
 包含血型性格分析和血型遺傳計算
 """
 
-from typing import Dict, List, Tuple
+from fractions import Fraction
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 
 class BloodTypeAnalyzerEnhanced:
@@ -59,6 +62,20 @@ class BloodTypeAnalyzerEnhanced:
         }
     }
     
+    # 血型（表型）順序，遺傳機率表的行列依此排列
+    PHENOTYPES = ('A', 'B', 'AB', 'O')
+    
+    # 各血型可能的基因型
+    PHENOTYPE_GENOTYPES = {
+        'A': (('A', 'A'), ('A', 'O')),
+        'B': (('B', 'B'), ('B', 'O')),
+        'AB': (('A', 'B'),),
+        'O': (('O', 'O'),),
+    }
+    
+    # 保留最近使用的子代血型機率表組數（每組等位基因頻率一張表）
+    CHILD_TABLE_CACHE_SIZE = 32
+    
     def __init__(self):
         """初始化血型分析器"""
         pass
@@ -126,8 +143,162 @@ class BloodTypeAnalyzerEnhanced:
         key = (type1.upper(), type2.upper())
         return compatibility_matrix.get(key, '70% - 基本和諧')
     
-    def predict_baby_blood_type(self, parent1_blood: str, parent2_blood: str) -> str:
-        """預測小孩可能的血型（基於 GitHub 項目邏輯）
+    # ==================== 基因型機率引擎 ====================
+    
+    def genotype_distribution(self, blood_type: str,
+                              allele_frequencies: Optional[Dict[str, float]] = None) -> Dict[Tuple[str, str], object]:
+        """血型對應的基因型分佈
+        
+        未提供族群等位基因頻率時，AA/AO（BB/BO）各佔 50%（精確分數）；
+        提供頻率時依 Hardy-Weinberg 平衡計算條件機率。
+        
+        Raises:
+            ValueError: 頻率為負數，或在該組頻率下此血型不可能出現
+        """
+        genotypes = self.PHENOTYPE_GENOTYPES.get(blood_type.upper(), (('O', 'O'),))
+        if allele_frequencies is None:
+            weight = Fraction(1, len(genotypes))
+            return {genotype: weight for genotype in genotypes}
+        
+        if any(allele_frequencies.get(allele, 0) < 0 for allele in ('A', 'B', 'O')):
+            raise ValueError(f"等位基因頻率不可為負數：{allele_frequencies}")
+        weights = {}
+        for g1, g2 in genotypes:
+            weight = allele_frequencies.get(g1, 0) * allele_frequencies.get(g2, 0)
+            weights[(g1, g2)] = weight if g1 == g2 else 2 * weight
+        total = sum(weights.values())
+        if total == 0:
+            raise ValueError(f"在等位基因頻率 {allele_frequencies} 下不可能出現 {blood_type} 型")
+        return {genotype: weight / total for genotype, weight in weights.items()}
+    
+    def cross_genotypes(self, parent1: Dict[Tuple[str, str], object],
+                        parent2: Dict[Tuple[str, str], object]) -> Dict[Tuple[str, str], object]:
+        """兩個基因型分佈的 Punnett 方格組合，回傳子代基因型分佈"""
+        gametes1 = self._gamete_distribution(parent1)
+        gametes2 = self._gamete_distribution(parent2)
+        
+        child = {}
+        for allele1, prob1 in gametes1.items():
+            for allele2, prob2 in gametes2.items():
+                genotype = tuple(sorted((allele1, allele2)))
+                child[genotype] = child.get(genotype, 0) + prob1 * prob2
+        return child
+    
+    def genotypes_to_phenotypes(self, genotypes: Dict[Tuple[str, str], object]) -> Dict[str, object]:
+        """將基因型分佈合併為血型分佈"""
+        phenotypes = {}
+        for genotype, prob in genotypes.items():
+            blood = self._genes_to_blood_type(genotype)
+            phenotypes[blood] = phenotypes.get(blood, 0) + prob
+        return phenotypes
+    
+    def get_child_distribution_table(self, allele_frequencies: Optional[Dict[str, float]] = None
+                                     ) -> Mapping[Tuple[str, str], Mapping[str, object]]:
+        """取得 4×4 子代血型機率表（唯讀；最近使用的頻率組合不重複建立）
+        
+        在該組頻率下不可能出現的血型不列入表中。
+        """
+        frequencies = self._normalize_frequencies(allele_frequencies)
+        key = tuple(sorted(frequencies.items())) if frequencies is not None else None
+        return self._cached_child_table(key)
+    
+    @classmethod
+    @lru_cache(maxsize=CHILD_TABLE_CACHE_SIZE)
+    def _cached_child_table(cls, key: Optional[Tuple]) -> Mapping[Tuple[str, str], Mapping[str, object]]:
+        """依正規化後的頻率建立子代機率表（所有實例共用，故表與各列皆為唯讀）"""
+        return cls()._build_child_table(dict(key) if key is not None else None)
+    
+    def _build_child_table(self, frequencies: Optional[Dict[str, float]]
+                           ) -> Mapping[Tuple[str, str], Mapping[str, object]]:
+        """建立子代機率表（父母血型組合 → 子代血型分佈）"""
+        distributions = {}
+        for blood in self.PHENOTYPES:
+            try:
+                distributions[blood] = self.genotype_distribution(blood, frequencies)
+            except ValueError:
+                continue
+        table = {}
+        for p1 in distributions:
+            for p2 in distributions:
+                table[(p1, p2)] = MappingProxyType(self.genotypes_to_phenotypes(
+                    self.cross_genotypes(distributions[p1], distributions[p2])))
+        return MappingProxyType(table)
+    
+    def predict_distribution(self, parent1_blood: str, parent2_blood: str,
+                             allele_frequencies: Optional[Dict[str, float]] = None) -> Dict[str, object]:
+        """
+        查表取得小孩血型的機率分佈
+        
+        Raises:
+            ValueError: 在該組頻率下父母其中一方的血型不可能出現
+        """
+        table = self.get_child_distribution_table(allele_frequencies)
+        return self._lookup_pair(table, parent1_blood, parent2_blood, allele_frequencies)
+    
+    def predict_distribution_batch(self, parent_pairs: Iterable[Tuple[str, str]],
+                                   allele_frequencies: Optional[Dict[str, float]] = None
+                                   ) -> List[Dict[str, object]]:
+        """批次查詢多對父母的小孩血型分佈"""
+        table = self.get_child_distribution_table(allele_frequencies)
+        return [self._lookup_pair(table, p1, p2, allele_frequencies) for p1, p2 in parent_pairs]
+    
+    def _lookup_pair(self, table, parent1_blood: str, parent2_blood: str,
+                     allele_frequencies: Optional[Dict[str, float]]) -> Dict[str, object]:
+        """從子代機率表取出一對父母的分佈（回傳複本，呼叫端可自由修改）"""
+        key = (self._normalize_blood_type(parent1_blood), self._normalize_blood_type(parent2_blood))
+        try:
+            return dict(table[key])
+        except KeyError:
+            raise ValueError(f"在等位基因頻率 {allele_frequencies} 下不可能出現 "
+                             f"{key[0]} 型與 {key[1]} 型的父母") from None
+    
+    def predict_generations(self, founder_blood: str, partner_bloods: Iterable[str],
+                            allele_frequencies: Optional[Dict[str, float]] = None) -> List[Dict[str, object]]:
+        """多代遺傳預測
+        
+        從 founder_blood 出發，每一代與 partner_bloods 中對應的伴侶血型結合，
+        以子代完整的基因型分佈（而非血型）繼續推算下一代。
+        
+        Returns:
+            每一代子女的血型機率分佈
+        """
+        frequencies = self._normalize_frequencies(allele_frequencies)
+        lineage = self.genotype_distribution(founder_blood, frequencies)
+        generations = []
+        for partner_blood in partner_bloods:
+            partner = self.genotype_distribution(partner_blood, frequencies)
+            lineage = self.cross_genotypes(lineage, partner)
+            generations.append(self.genotypes_to_phenotypes(lineage))
+        return generations
+    
+    def _gamete_distribution(self, genotypes: Dict[Tuple[str, str], object]) -> Dict[str, object]:
+        """基因型分佈 → 配子（單一等位基因）分佈"""
+        gametes = {}
+        for (g1, g2), prob in genotypes.items():
+            half = prob / 2
+            gametes[g1] = gametes.get(g1, 0) + half
+            gametes[g2] = gametes.get(g2, 0) + half
+        return gametes
+    
+    def _normalize_blood_type(self, blood_type: str) -> str:
+        """正規化血型輸入，無法辨識時視為 O 型"""
+        blood_type = blood_type.upper()
+        return blood_type if blood_type in self.PHENOTYPE_GENOTYPES else 'O'
+    
+    def _normalize_frequencies(self, allele_frequencies: Optional[Dict[str, float]]
+                               ) -> Optional[Dict[str, float]]:
+        """將等位基因頻率正規化為總和 1"""
+        if allele_frequencies is None:
+            return None
+        frequencies = {allele: float(allele_frequencies.get(allele, 0.0)) for allele in ('A', 'B', 'O')}
+        total = sum(frequencies.values())
+        if total <= 0 or any(value < 0 for value in frequencies.values()):
+            raise ValueError(f"無效的等位基因頻率：{allele_frequencies}")
+        return {allele: value / total for allele, value in frequencies.items()}
+    
+    def predict_baby_blood_type(self, parent1_blood: str, parent2_blood: str,
+                                allele_frequencies: Optional[Dict[str, float]] = None) -> str:
+        """預測小孩可能的血型（精確 Punnett 方格計算）
         
         血型遺傳規律:
         - A 型 = AA 或 AO
@@ -138,20 +309,8 @@ class BloodTypeAnalyzerEnhanced:
         p1 = parent1_blood.upper()
         p2 = parent2_blood.upper()
         
-        # 將血型轉換為基因
-        parent1_genes = self._blood_type_to_genes(p1)
-        parent2_genes = self._blood_type_to_genes(p2)
-        
-        # 計算所有可能的組合
-        possible_babies = set()
-        
-        for g1 in parent1_genes:
-            for g2 in parent2_genes:
-                # 小孩的基因組合
-                baby_genes = tuple(sorted([g1, g2]))
-                # 轉換為血型
-                baby_blood = self._genes_to_blood_type(baby_genes)
-                possible_babies.add(baby_blood)
+        distribution = self.predict_distribution(p1, p2, allele_frequencies)
+        possible_babies = [blood for blood, prob in distribution.items() if prob > 0]
         
         result = f"""
 【血型遺傳預測】
@@ -174,36 +333,16 @@ class BloodTypeAnalyzerEnhanced:
 【遺傳機率分析】
 """
         
-        # 計算每種血型的機率
-        blood_count = {}
-        total = 0
-        for g1 in parent1_genes:
-            for g2 in parent2_genes:
-                baby_genes = tuple(sorted([g1, g2]))
-                baby_blood = self._genes_to_blood_type(baby_genes)
-                blood_count[baby_blood] = blood_count.get(baby_blood, 0) + 1
-                total += 1
-        
-        for blood, count in sorted(blood_count.items()):
-            probability = (count / total) * 100
-            result += f"\n  {blood} 型: {probability:.1f}% ({count}/{total})"
+        # 每種血型的機率
+        for blood in sorted(possible_babies):
+            prob = distribution[blood]
+            result += f"\n  {blood} 型: {float(prob) * 100:.1f}%"
+            if isinstance(prob, Fraction):
+                result += f" ({prob.numerator}/{prob.denominator})"
         
         result += "\n"
         return result
     
-    def _blood_type_to_genes(self, blood_type: str) -> List[str]:
-        """將血型轉換為可能的基因組合"""
-        blood_type = blood_type.upper()
-        if blood_type == 'A':
-            return ['A', 'A', 'A', 'O']  # AA 或 AO (各 50% 概率)
-        elif blood_type == 'B':
-            return ['B', 'B', 'B', 'O']  # BB 或 BO (各 50% 概率)
-        elif blood_type == 'AB':
-            return ['A', 'B']  # 只能是 AB
-        elif blood_type == 'O':
-            return ['O', 'O']  # 只能是 OO
-        return ['O', 'O']
-    
     def _genes_to_blood_type(self, genes: Tuple[str, str]) -> str:
         """將基因組合轉換為血型"""
         g1, g2 = genes
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+占卜結果分布統計模組
+依實際的種子規則統計塔羅牌與周易卜卦結果的出現頻率，並檢查是否偏離均勻分布：
+
+    塔羅 draw_cards / draw_spread   種子 = 出生日期整數 → 逐日列舉所有出生日期（精確分布）
+    周易 divine                     種子 = 出生日期整數 + 時分秒 HHMMSS
+                                    指定出生日期 → 列舉當天 86400 秒（精確分布）
+                                    不指定     → 隨機抽樣出生日期與時刻（蒙地卡羅，多行程分批執行）
+
+偏差診斷：卡方適合度檢定（統計量、自由度、p 值）、最大相對偏差、最大 z 值、
+總變異距離，以及最常與最少出現的結果。
+"""
+
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from mingli_tarot import CLASSIC_CARD_COUNT, birth_date_seed, classic_draw
+from mingli_tarot_deck import CARD_NAMES, DECK_SIZE, MAJOR_ARCANA, draw, get_spread
+from mingli_yijing import classic_cast
+
+DEFAULT_START_DATE = date(1900, 1, 1)
+DEFAULT_END_DATE = date(2100, 12, 31)
+DEFAULT_SAMPLES = 1_000_000
+
+# 各介面組出生日期字串的方式：桌面版不補零（'1990-5-1'），其餘補零（'1990-05-01'）
+DATE_FORMATS = {
+    'padded': lambda d: f"{d.year:04d}-{d.month:02d}-{d.day:02d}",
+    'unpadded': lambda d: f"{d.year}-{d.month}-{d.day}",
+}
+
+SECONDS_PER_DAY = 86400
+HEXAGRAM_COUNT = 64
+LINE_COUNT = 6
+
+# 蒙地卡羅每批樣本數（每批交給一個行程）
+_CHUNK_SIZE = 100_000
+
+
+# ==================== 卡方分布 ====================
+
+def _regularized_gamma_q(a: float, x: float) -> float:
+    """正規化上不完全 Gamma 函數 Q(a, x)（級數 / 連分數，精度約 1e-12）"""
+    if x <= 0:
+        return 1.0
+    log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        for _ in range(1000):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefactor))
+    # Lentz 連分數
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefactor) * h
+
+
+def chi_square_p_value(statistic: float, dof: int) -> float:
+    """卡方分布右尾機率"""
+    return _regularized_gamma_q(dof / 2, statistic / 2)
+
+
+def uniformity_diagnostics(counts: Sequence[int], labels: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    以均勻分布為虛無假設的偏差診斷
+
+    Args:
+        counts: 各結果的次數
+        labels: 各結果名稱（省略時以索引表示）
+
+    Returns:
+        {'total', 'categories', 'expected', 'frequencies', 'chi_square', 'dof', 'p_value',
+         'max_relative_deviation', 'max_z', 'total_variation', 'most_common', 'least_common'}
+    """
+    total = sum(counts)
+    categories = len(counts)
+    labels = list(labels) if labels is not None else [str(i) for i in range(categories)]
+    if total == 0:
+        raise ValueError("沒有任何樣本")
+    expected = total / categories
+    probability = 1 / categories
+    chi_square = sum((count - expected) ** 2 for count in counts) / expected
+    dof = categories - 1
+    sigma = math.sqrt(total * probability * (1 - probability)) or 1.0
+    ranked = sorted(range(categories), key=counts.__getitem__)
+    return {
+        'total': total,
+        'categories': categories,
+        'expected': expected,
+        'frequencies': [count / total for count in counts],
+        'chi_square': chi_square,
+        'dof': dof,
+        'p_value': chi_square_p_value(chi_square, dof),
+        'max_relative_deviation': max(abs(count - expected) for count in counts) / expected,
+        'max_z': max(abs(count - expected) for count in counts) / sigma,
+        'total_variation': sum(abs(count / total - probability) for count in counts) / 2,
+        'most_common': [(labels[i], counts[i]) for i in reversed(ranked[-3:])],
+        'least_common': [(labels[i], counts[i]) for i in ranked[:3]],
+    }
+
+
+# ==================== 塔羅 ====================
+
+def _date_range(start: date, end: date) -> Iterable[date]:
+    for offset in range((end - start).days + 1):
+        yield start + timedelta(days=offset)
+
+
+def tarot_statistics(spread: Optional[str] = None, start: date = DEFAULT_START_DATE,
+                     end: date = DEFAULT_END_DATE, date_format: str = 'padded') -> Dict[str, Any]:
+    """
+    塔羅抽牌的精確分布（列舉區間內每一個出生日期）
+
+    Args:
+        spread: None 為 draw_cards（22 張大阿爾克那三牌陣），否則為 draw_spread 的牌陣名稱
+        start, end: 出生日期區間
+        date_format: 出生日期字串格式（'padded' 或 'unpadded'）
+
+    Returns:
+        {'mode': 'exact', 'dates', 'distinct_seeds', 'cards': 全部位置合計的診斷,
+         'positions': [各位置的診斷], 'reversed_ratio'(draw_spread 才有)}
+    """
+    format_date = DATE_FORMATS[date_format]
+    if spread is None:
+        card_count = len(MAJOR_ARCANA)
+        position_count = CLASSIC_CARD_COUNT
+        labels = [name for name, _, _ in MAJOR_ARCANA]
+        sampler = classic_draw
+    else:
+        card_count = DECK_SIZE
+        position_count = len(get_spread(spread)['positions'])
+        labels = list(CARD_NAMES)
+        sampler = lambda seed: draw(spread, seed=seed)
+
+    position_counts = [[0] * card_count for _ in range(position_count)]
+    reversed_total = 0
+    dates = 0
+    seeds = set()
+    for day in _date_range(start, end):
+        seed = birth_date_seed(format_date(day))
+        seeds.add(seed)
+        dates += 1
+        for counts, value in zip(position_counts, sampler(seed)):
+            if spread is not None:
+                reversed_total += value & 1
+                value >>= 1
+            counts[value] += 1
+
+    card_totals = [sum(column) for column in zip(*position_counts)]
+    result = {
+        'mode': 'exact',
+        'spread': spread or 'classic',
+        'dates': dates,
+        'distinct_seeds': len(seeds),
+        'cards': uniformity_diagnostics(card_totals, labels),
+        'positions': [uniformity_diagnostics(counts, labels) for counts in position_counts],
+    }
+    if spread is not None:
+        result['reversed_ratio'] = reversed_total / (dates * position_count)
+    return result
+
+
+# ==================== 周易 ====================
+
+def _seconds_of_day() -> List[int]:
+    """一天中每一秒的 HHMMSS 整數"""
+    return [hour * 10000 + minute * 100 + second
+            for hour in range(24) for minute in range(60) for second in range(60)]
+
+
+def _count_casts(seed_counts: Iterable[Tuple[int, int]]) -> List[int]:
+    """
+    依種子起卦，回傳 (卦序 − 1) × 6 + (爻 − 1) 的次數表（384 格）
+
+    Args:
+        seed_counts: (種子, 次數)；相同種子只需起卦一次
+    """
+    counts = [0] * (HEXAGRAM_COUNT * LINE_COUNT)
+    for seed, weight in seed_counts:
+        hexagram, line = classic_cast(seed)
+        counts[(hexagram - 1) * LINE_COUNT + line - 1] += weight
+    return counts
+
+
+def _monte_carlo_chunk(args: Tuple[int, int, int, int, str]) -> List[int]:
+    """蒙地卡羅一批：隨機抽出生日期與時刻後起卦（於子行程執行）"""
+    chunk_seed, size, first_day, day_span, date_format = args
+    rng = random.Random(chunk_seed)
+    seconds = _seconds_of_day()
+    format_date = DATE_FORMATS[date_format]
+    day_values = [birth_date_seed(format_date(day))
+                  for day in map(date.fromordinal, range(first_day, first_day + day_span))]
+    seeds = Counter(
+        day_values[rng.randrange(day_span)] + seconds[rng.randrange(SECONDS_PER_DAY)]
+        for _ in range(size)
+    )
+    return _count_casts(seeds.items())
+
+
+def _yijing_result(mode: str, joint: List[int], **extra) -> Dict[str, Any]:
+    hexagram_counts = [sum(joint[h * LINE_COUNT:(h + 1) * LINE_COUNT]) for h in range(HEXAGRAM_COUNT)]
+    line_counts = [sum(joint[line::LINE_COUNT]) for line in range(LINE_COUNT)]
+    result = {
+        'mode': mode,
+        'hexagrams': uniformity_diagnostics(hexagram_counts, [f"第{h + 1}卦" for h in range(HEXAGRAM_COUNT)]),
+        'lines': uniformity_diagnostics(line_counts, [f"第{line + 1}爻" for line in range(LINE_COUNT)]),
+        'joint': uniformity_diagnostics(
+            joint, [f"第{i // LINE_COUNT + 1}卦第{i % LINE_COUNT + 1}爻" for i in range(len(joint))]),
+    }
+    result.update(extra)
+    return result
+
+
+def yijing_statistics(birth_date: Optional[str] = None, samples: int = DEFAULT_SAMPLES,
+                      start: date = DEFAULT_START_DATE, end: date = DEFAULT_END_DATE,
+                      seed: Optional[int] = None, workers: Optional[int] = None,
+                      date_format: str = 'padded') -> Dict[str, Any]:
+    """
+    周易卜卦（divine）的本卦、動爻分布
+
+    Args:
+        birth_date: 指定出生日期時列舉當天每一秒（精確分布）
+        samples: 蒙地卡羅樣本數（未指定出生日期時使用）
+        start, end: 蒙地卡羅的出生日期區間
+        seed: 蒙地卡羅亂數種子（同一種子結果相同）
+        workers: 行程數（預設為 CPU 核心數；1 為不開子行程）
+        date_format: 蒙地卡羅組出生日期字串的格式（'padded' 或 'unpadded'）
+
+    Returns:
+        {'mode': 'exact' | 'monte_carlo', 'hexagrams', 'lines', 'joint'(卦 × 爻 384 格) 各為診斷結果}
+    """
+    if birth_date is not None:
+        base = birth_date_seed(birth_date)
+        joint = _count_casts((base + second, 1) for second in _seconds_of_day())
+        return _yijing_result('exact', joint, birth_date=birth_date)
+
+    if samples < 1:
+        raise ValueError("樣本數必須大於 0")
+    if date_format not in DATE_FORMATS:
+        raise ValueError(f"未知的日期格式: {date_format}（可用：{', '.join(DATE_FORMATS)}）")
+    rng = random.Random(seed)
+    first_day = start.toordinal()
+    day_span = (end - start).days + 1
+    chunks = [(rng.getrandbits(64), min(_CHUNK_SIZE, samples - offset), first_day, day_span, date_format)
+              for offset in range(0, samples, _CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+
+    joint = [0] * (HEXAGRAM_COUNT * LINE_COUNT)
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            partials = list(executor.map(_monte_carlo_chunk, chunks))
+    else:
+        partials = [_monte_carlo_chunk(chunk) for chunk in chunks]
+    for partial in partials:
+        joint = [a + b for a, b in zip(joint, partial)]
+    return _yijing_result('monte_carlo', joint, samples=samples, date_format=date_format)
+
+
+# ==================== 報告 ====================
+
+def _format_diagnostics(title: str, diagnostics: Dict[str, Any]) -> str:
+    verdict = '⚠️ 顯著偏離均勻分布' if diagnostics['p_value'] < 0.01 else '✓ 與均勻分布一致'
+    most = '、'.join(f"{label} {count}" for label, count in diagnostics['most_common'])
+    least = '、'.join(f"{label} {count}" for label, count in diagnostics['least_common'])
+    return (
+        f"【{title}】{diagnostics['categories']} 種結果，共 {diagnostics['total']:,} 次\n"
+        f"  卡方 = {diagnostics['chi_square']:.1f}（自由度 {diagnostics['dof']}），"
+        f"p = {diagnostics['p_value']:.4g}　{verdict}\n"
+        f"  最大相對偏差 {diagnostics['max_relative_deviation']:.2%}，最大 z = {diagnostics['max_z']:.2f}，"
+        f"總變異距離 {diagnostics['total_variation']:.4f}\n"
+        f"  最常出現：{most}\n"
+        f"  最少出現：{least}\n"
+    )
+
+
+def format_statistics(result: Dict[str, Any]) -> str:
+    """統計結果轉為文字報告"""
+    mode = '精確分布（列舉所有種子）' if result['mode'] == 'exact' else f"蒙地卡羅（{result['samples']:,} 次，日期格式 {result['date_format']}）"
+    lines = [f"📊 分布統計：{mode}\n"]
+    if 'cards' in result:
+        lines.append(f"出生日期 {result['dates']:,} 天，不同種子 {result['distinct_seeds']:,} 個"
+                     f"（{result['dates'] - result['distinct_seeds']:,} 天與其他日期共用種子）\n")
+        if 'reversed_ratio' in result:
+            lines.append(f"逆位比例：{result['reversed_ratio']:.2%}\n")
+        lines.append(_format_diagnostics('全部位置合計', result['cards']))
+        for i, diagnostics in enumerate(result['positions'], 1):
+            lines.append(_format_diagnostics(f"第 {i} 張", diagnostics))
+    else:
+        if 'birth_date' in result:
+            lines.append(f"出生日期 {result['birth_date']}，列舉一天 {SECONDS_PER_DAY:,} 秒\n")
+        lines.append(_format_diagnostics('本卦', result['hexagrams']))
+        lines.append(_format_diagnostics('動爻', result['lines']))
+        lines.append(_format_diagnostics('本卦 × 動爻', result['joint']))
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    command = sys.argv[1] if len(sys.argv) >= 2 else ''
+    started = time.perf_counter()
+    if command == 'tarot':
+        # python mingli_divination_stats.py tarot [牌陣] [padded|unpadded]
+        spread = sys.argv[2] if len(sys.argv) >= 3 and sys.argv[2] != 'classic' else None
+        date_format = sys.argv[3] if len(sys.argv) >= 4 else 'padded'
+        print(format_statistics(tarot_statistics(spread, date_format=date_format)))
+    elif command == 'yijing':
+        # python mingli_divination_stats.py yijing [出生日期 | 樣本數] [padded|unpadded]
+        argument = sys.argv[2] if len(sys.argv) >= 3 else ''
+        date_format = sys.argv[3] if len(sys.argv) >= 4 else 'padded'
+        if '-' in argument:
+            print(format_statistics(yijing_statistics(birth_date=argument)))
+        else:
+            print(format_statistics(yijing_statistics(samples=int(argument or DEFAULT_SAMPLES), seed=0,
+                                                      date_format=date_format)))
+    else:
+        print("用法：python mingli_divination_stats.py tarot [牌陣|classic] [padded|unpadded]\n"
+              "      python mingli_divination_stats.py yijing [出生日期 | 樣本數] [padded|unpadded]")
+        sys.exit(1)
+    print(f"（耗時 {time.perf_counter() - started:.1f} 秒）")
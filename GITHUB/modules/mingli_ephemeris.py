@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+離線星曆模組
+以 Chebyshev 多項式分段保存 1900–2100 年太陽、月亮與八大行星的地心黃經（分點為當日分點），
+係數存於二進位檔並以記憶體映射（mmap）讀取：查詢時只需定位分段並以 Clenshaw 遞推求值。
+
+星曆檔由內建的解析理論（軌道根數 + 主要攝動項，精度約 1–2 角分，月亮約數角分）擬合產生，
+首次使用時寫入使用者快取目錄，亦可預先執行：
+
+    python mingli_ephemeris.py build [輸出路徑]
+
+時間以「日數」表示：自 2000 年 1 月 0 日 0h UT（儒略日 2451543.5）起算的世界時日數。
+"""
+
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from mingli_paths import user_cache_dir
+
+# 星曆涵蓋範圍
+EPHEMERIS_FIRST_YEAR = 1900
+EPHEMERIS_LAST_YEAR = 2100
+EPHEMERIS_FILENAME = 'ephemeris_1900_2100.bin'
+
+# 天體：(代號, 中文名稱, 符號, 分段日數, Chebyshev 次數)
+BODIES = (
+    ('sun', '太陽', '☉', 32, 10),
+    ('moon', '月亮', '☽', 4, 12),
+    ('mercury', '水星', '☿', 8, 10),
+    ('venus', '金星', '♀', 16, 10),
+    ('mars', '火星', '♂', 16, 10),
+    ('jupiter', '木星', '♃', 32, 8),
+    ('saturn', '土星', '♄', 32, 8),
+    ('uranus', '天王星', '♅', 64, 8),
+    ('neptune', '海王星', '♆', 64, 8),
+)
+BODY_IDS = tuple(body[0] for body in BODIES)
+BODY_NAMES = {body[0]: body[1] for body in BODIES}
+BODY_SYMBOLS = {body[0]: body[2] for body in BODIES}
+
+# 主要相位：(角度, 名稱, 容許度, 分類)
+ASPECTS = (
+    (0, '合相', 8, '融合'),
+    (60, '六分相', 6, '和諧'),
+    (90, '四分相', 7, '緊張'),
+    (120, '三分相', 8, '和諧'),
+    (180, '對分相', 8, '互補'),
+)
+
+# 合盤評分：相位分類的基本分與天體組合的權重
+ASPECT_CLASS_POINTS = {'融合': 3, '和諧': 2, '互補': 0, '緊張': -2}
+SYNASTRY_PAIRS = (
+    ('sun', 'moon', 3), ('moon', 'sun', 3), ('sun', 'sun', 2), ('moon', 'moon', 2),
+    ('venus', 'mars', 3), ('mars', 'venus', 3), ('venus', 'venus', 2), ('mars', 'mars', 1),
+    ('sun', 'venus', 1), ('venus', 'sun', 1), ('moon', 'venus', 1), ('venus', 'moon', 1),
+)
+
+_MAGIC = b'MLEPH\x00\x00\x01'
+_HEADER = struct.Struct('<8sdI4x')          # 標記、起始日數、天體數
+_DIRECTORY_ENTRY = struct.Struct('<8sdIIQ')  # 代號、分段日數、次數、分段數、係數位移（位元組）
+
+Number = Union[int, float]
+
+
+# ==================== 時間 ====================
+
+def day_number(year: int, month: int, day: int, hour: Number = 0, minute: Number = 0,
+               utc_offset: Number = 0.0) -> float:
+    """當地時間 → 自 2000 年 1 月 0 日 0h UT 起算的日數"""
+    d = 367 * year - 7 * (year + (month + 9) // 12) // 4 + 275 * month // 9 + day - 730530
+    return d + (hour + minute / 60.0 - utc_offset) / 24.0
+
+
+def day_number_from_datetime(moment: datetime) -> float:
+    """datetime → 日數（無時區資訊者視為 UTC）"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return day_number(moment.year, moment.month, moment.day, moment.hour,
+                      moment.minute + (moment.second + moment.microsecond / 1e6) / 60.0)
+
+
+def _to_day_number(moment: Union[Number, datetime]) -> float:
+    return day_number_from_datetime(moment) if isinstance(moment, datetime) else float(moment)
+
+
+_FIRST_DAY = float(day_number(EPHEMERIS_FIRST_YEAR, 1, 1))
+_LAST_DAY = float(day_number(EPHEMERIS_LAST_YEAR + 1, 1, 1))
+
+
+# ==================== 解析理論（產生星曆檔用） ====================
+
+def _rev(angle: float) -> float:
+    return angle % 360.0
+
+
+def _sind(angle: float) -> float:
+    return math.sin(math.radians(angle))
+
+
+def _cosd(angle: float) -> float:
+    return math.cos(math.radians(angle))
+
+
+def _orbital_elements(body: str, d: float) -> Tuple[float, float, float, float, float, float]:
+    """(升交點 N, 傾角 i, 近點幅角 w, 半長軸 a, 離心率 e, 平近點角 M)，角度為度"""
+    if body == 'sun':
+        return 0.0, 0.0, 282.9404 + 4.70935e-5 * d, 1.0, 0.016709 - 1.151e-9 * d, 356.0470 + 0.9856002585 * d
+    if body == 'moon':
+        return (125.1228 - 0.0529538083 * d, 5.1454, 318.0634 + 0.1643573223 * d,
+                60.2666, 0.054900, 115.3654 + 13.0649929509 * d)
+    if body == 'mercury':
+        return (48.3313 + 3.24587e-5 * d, 7.0047 + 5.00e-8 * d, 29.1241 + 1.01444e-5 * d,
+                0.387098, 0.205635 + 5.59e-10 * d, 168.6562 + 4.0923344368 * d)
+    if body == 'venus':
+        return (76.6799 + 2.46590e-5 * d, 3.3946 + 2.75e-8 * d, 54.8910 + 1.38374e-5 * d,
+                0.723330, 0.006773 - 1.302e-9 * d, 48.0052 + 1.6021302244 * d)
+    if body == 'mars':
+        return (49.5574 + 2.11081e-5 * d, 1.8497 - 1.78e-8 * d, 286.5016 + 2.92961e-5 * d,
+                1.523688, 0.093405 + 2.516e-9 * d, 18.6021 + 0.5240207766 * d)
+    if body == 'jupiter':
+        return (100.4542 + 2.76854e-5 * d, 1.3030 - 1.557e-7 * d, 273.8777 + 1.64505e-5 * d,
+                5.20256, 0.048498 + 4.469e-9 * d, 19.8950 + 0.0830853001 * d)
+    if body == 'saturn':
+        return (113.6634 + 2.38980e-5 * d, 2.4886 - 1.081e-7 * d, 339.3939 + 2.97661e-5 * d,
+                9.55475, 0.055546 - 9.499e-9 * d, 316.9670 + 0.0334442282 * d)
+    if body == 'uranus':
+        return (74.0005 + 1.3978e-5 * d, 0.7733 + 1.9e-8 * d, 96.6612 + 3.0565e-5 * d,
+                19.18171 - 1.55e-8 * d, 0.047318 + 7.45e-9 * d, 142.5905 + 0.011725806 * d)
+    if body == 'neptune':
+        return (131.7806 + 3.0173e-5 * d, 1.7700 - 2.55e-7 * d, 272.8461 - 6.027e-6 * d,
+                30.05826 + 3.313e-8 * d, 0.008606 + 2.15e-9 * d, 260.2471 + 0.005995147 * d)
+    raise KeyError(body)
+
+
+def _orbit_position(body: str, d: float) -> Tuple[float, float, float]:
+    """軌道面位置轉黃道直角座標 (x, y, z)，中心為軌道焦點（行星為太陽、月亮為地球）"""
+    node, incl, peri, a, e, mean_anomaly = _orbital_elements(body, d)
+    m = math.radians(_rev(mean_anomaly))
+    ecc_anomaly = m + e * math.sin(m) * (1.0 + e * math.cos(m))
+    for _ in range(6):
+        ecc_anomaly -= (ecc_anomaly - e * math.sin(ecc_anomaly) - m) / (1.0 - e * math.cos(ecc_anomaly))
+    xv = a * (math.cos(ecc_anomaly) - e)
+    yv = a * math.sqrt(1.0 - e * e) * math.sin(ecc_anomaly)
+    v = math.degrees(math.atan2(yv, xv))
+    r = math.hypot(xv, yv)
+    vw = v + peri
+    x = r * (_cosd(node) * _cosd(vw) - _sind(node) * _sind(vw) * _cosd(incl))
+    y = r * (_sind(node) * _cosd(vw) + _cosd(node) * _sind(vw) * _cosd(incl))
+    z = r * _sind(vw) * _sind(incl)
+    return x, y, z
+
+
+def _sun_position(d: float) -> Tuple[float, float]:
+    """太陽地心黃經（度）與距離（AU）"""
+    _, _, peri, _, e, mean_anomaly = _orbital_elements('sun', d)
+    m = math.radians(_rev(mean_anomaly))
+    ecc_anomaly = m + e * math.sin(m) * (1.0 + e * math.cos(m))
+    xv = math.cos(ecc_anomaly) - e
+    yv = math.sqrt(1.0 - e * e) * math.sin(ecc_anomaly)
+    return _rev(math.degrees(math.atan2(yv, xv)) + peri), math.hypot(xv, yv)
+
+
+def _moon_longitude(d: float) -> float:
+    """月亮地心黃經（含主要攝動項）"""
+    x, y, _ = _orbit_position('moon', d)
+    longitude = math.degrees(math.atan2(y, x))
+
+    node, _, peri, _, _, mm = _orbital_elements('moon', d)
+    _, _, sun_peri, _, _, ms = _orbital_elements('sun', d)
+    lm = mm + peri + node
+    ls = ms + sun_peri
+    elong = lm - ls
+    arg_lat = lm - node
+    longitude += (-1.274 * _sind(mm - 2 * elong) + 0.658 * _sind(2 * elong) - 0.186 * _sind(ms)
+                  - 0.059 * _sind(2 * mm - 2 * elong) - 0.057 * _sind(mm - 2 * elong + ms)
+                  + 0.053 * _sind(mm + 2 * elong) + 0.046 * _sind(2 * elong - ms)
+                  + 0.041 * _sind(mm - ms) - 0.035 * _sind(elong) - 0.031 * _sind(mm + ms)
+                  - 0.015 * _sind(2 * arg_lat - 2 * elong) + 0.011 * _sind(mm - 4 * elong))
+    return _rev(longitude)
+
+
+def _planet_perturbation(body: str, d: float) -> float:
+    """木星、土星、天王星的主要黃經攝動（度）"""
+    if body not in ('jupiter', 'saturn', 'uranus'):
+        return 0.0
+    mj = _orbital_elements('jupiter', d)[5]
+    msat = _orbital_elements('saturn', d)[5]
+    if body == 'jupiter':
+        return (-0.332 * _sind(2 * mj - 5 * msat - 67.6) - 0.056 * _sind(2 * mj - 2 * msat + 21)
+                + 0.042 * _sind(3 * mj - 5 * msat + 21) - 0.036 * _sind(mj - 2 * msat)
+                + 0.022 * _cosd(mj - msat) + 0.023 * _sind(2 * mj - 3 * msat + 52)
+                - 0.016 * _sind(mj - 5 * msat - 69))
+    if body == 'saturn':
+        return (0.812 * _sind(2 * mj - 5 * msat - 67.6) - 0.229 * _cosd(2 * mj - 4 * msat - 2)
+                + 0.119 * _sind(mj - 2 * msat - 3) + 0.046 * _sind(2 * mj - 6 * msat - 69)
+                + 0.014 * _sind(mj - 3 * msat + 32))
+    mu = _orbital_elements('uranus', d)[5]
+    return 0.040 * _sind(msat - 2 * mu + 6) + 0.035 * _sind(msat - 3 * mu + 33) - 0.015 * _sind(mj - mu + 20)
+
+
+def theory_longitude(body: str, d: float) -> float:
+    """以解析理論直接計算地心黃經（度）；較星曆檔查詢慢，供產生星曆檔與驗證使用"""
+    if body == 'sun':
+        return _sun_position(d)[0]
+    if body == 'moon':
+        return _moon_longitude(d)
+
+    x, y, z = _orbit_position(body, d)
+    perturbation = _planet_perturbation(body, d)
+    if perturbation:
+        helio_lon = math.atan2(y, x) + math.radians(perturbation)
+        radius = math.hypot(x, y)
+        x, y = radius * math.cos(helio_lon), radius * math.sin(helio_lon)
+    sun_lon, sun_r = _sun_position(d)
+    xg = x + sun_r * _cosd(sun_lon)
+    yg = y + sun_r * _sind(sun_lon)
+    return _rev(math.degrees(math.atan2(yg, xg)))
+
+
+# ==================== 產生星曆檔 ====================
+
+def _fit_segment(body: str, start: float, span: float, degree: int, cos_table: List[List[float]]) -> List[float]:
+    """於 Chebyshev 節點取樣並求係數（黃經先展開為連續值）"""
+    n = degree + 1
+    half = span / 2.0
+    mid = start + half
+    samples = []
+    previous = None
+    for k in range(n):
+        # 節點依時間遞增排列
+        value = theory_longitude(body, mid - half * cos_table[1][k])
+        if previous is not None:
+            value += 360.0 * round((previous - value) / 360.0)
+        samples.append(value)
+        previous = value
+    coefficients = []
+    for j in range(n):
+        total = sum(f * c for f, c in zip(samples, cos_table[j]))
+        # 節點時間遞增時 x = -cos(...)，奇數項變號
+        coefficients.append((2.0 / n) * total * (-1 if j % 2 else 1))
+    coefficients[0] /= 2.0
+    return coefficients
+
+
+def build_ephemeris_file(path: Union[str, Path], progress=None) -> Path:
+    """
+    產生星曆檔
+
+    Args:
+        path: 輸出路徑
+        progress: 進度回呼，參數為天體代號（可省略）
+    """
+    path = Path(path)
+    directory = []
+    blocks = []
+    offset = _HEADER.size + _DIRECTORY_ENTRY.size * len(BODIES)
+    for body, _, _, span, degree in BODIES:
+        if progress is not None:
+            progress(body)
+        n = degree + 1
+        cos_table = [[math.cos(math.pi * j * (k + 0.5) / n) for k in range(n)] for j in range(n)]
+        segments = int(math.ceil((_LAST_DAY - _FIRST_DAY) / span))
+        coefficients = array('f')
+        for segment in range(segments):
+            coefficients.extend(_fit_segment(body, _FIRST_DAY + segment * span, span, degree, cos_table))
+        directory.append(_DIRECTORY_ENTRY.pack(body.encode('ascii'), float(span), degree, segments, offset))
+        blocks.append(coefficients.tobytes())
+        offset += len(blocks[-1])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _FIRST_DAY, len(BODIES)))
+        f.writelines(directory)
+        f.writelines(blocks)
+    os.replace(tmp_path, path)
+    return path
+
+
+def default_ephemeris_path() -> Path:
+    """星曆檔位置：優先使用隨程式打包的星曆檔（與本模組同目錄），否則為使用者快取目錄"""
+    bundled = Path(__file__).with_name(EPHEMERIS_FILENAME)
+    if bundled.exists():
+        return bundled
+    return user_cache_dir('ephemeris') / EPHEMERIS_FILENAME
+
+
+# ==================== 查詢 ====================
+
+class Ephemeris:
+    """記憶體映射的 Chebyshev 星曆"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        開啟星曆檔（省略路徑時使用快取目錄中的星曆檔，不存在則先產生）
+
+        檔案格式不符時拋出 ValueError。
+        """
+        path = Path(path) if path is not None else default_ephemeris_path()
+        if not path.exists():
+            build_ephemeris_file(path)
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # 代號 → (分段日數, 次數, 分段數, 係數 memoryview)
+        self._segments = {}
+        views = []
+        try:
+            magic, self.first_day, count = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"不是星曆檔: {path}")
+            view = memoryview(self._mmap)
+            views.append(view)
+            for i in range(count):
+                name, span, degree, segments, offset = _DIRECTORY_ENTRY.unpack_from(
+                    self._mmap, _HEADER.size + i * _DIRECTORY_ENTRY.size)
+                size = segments * (degree + 1) * 4
+                if offset + size > len(self._mmap):
+                    raise ValueError(f"星曆檔已截斷: {path}")
+                coefficients = view[offset:offset + size].cast('f')
+                views.append(coefficients)
+                self._segments[name.rstrip(b'\x00').decode('ascii')] = (span, degree, segments, coefficients)
+            if not self._segments:
+                raise ValueError(f"星曆檔沒有任何天體: {path}")
+            self.last_day = self.first_day + min(span * segments for span, _, segments, _ in self._segments.values())
+        except (struct.error, TypeError, ValueError) as e:
+            # 截斷或損毀的檔案一律轉為 ValueError，呼叫端只需處理 OSError / ValueError
+            for buffer in reversed(views):
+                buffer.release()
+            self.close()
+            if isinstance(e, ValueError):
+                raise
+            raise ValueError(f"星曆檔格式錯誤: {path}（{e}）") from e
+
+    def close(self):
+        self._segments = {}
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def bodies(self) -> Tuple[str, ...]:
+        return tuple(self._segments)
+
+    def longitude(self, body: str, moment: Union[Number, datetime]) -> float:
+        """
+        天體地心黃經（度）
+
+        Args:
+            body: 天體代號（見 BODY_IDS）
+            moment: 日數（day_number）或 datetime
+
+        超出星曆範圍時拋出 ValueError。
+        """
+        d = _to_day_number(moment)
+        span, degree, segments, coefficients = self._segments[body]
+        index = int((d - self.first_day) // span)
+        if not 0 <= index < segments:
+            raise ValueError(f"超出星曆範圍（{EPHEMERIS_FIRST_YEAR}–{EPHEMERIS_LAST_YEAR}）")
+        x = 2.0 * (d - self.first_day - index * span) / span - 1.0
+        base = index * (degree + 1)
+        # Clenshaw 遞推
+        b1 = b2 = 0.0
+        x2 = 2.0 * x
+        for j in range(base + degree, base, -1):
+            b1, b2 = x2 * b1 - b2 + coefficients[j], b1
+        return (x * b1 - b2 + coefficients[base]) % 360.0
+
+    def longitudes(self, moment: Union[Number, datetime],
+                   bodies: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """同一時刻多個天體的地心黃經（預設為全部天體）"""
+        d = _to_day_number(moment)
+        return {body: self.longitude(body, d) for body in (bodies or self._segments)}
+
+    def longitude_batch(self, body: str, moments: Sequence[Union[Number, datetime]]) -> array:
+        """批次查詢單一天體的地心黃經，回傳 array('d')"""
+        longitude = self.longitude
+        return array('d', (longitude(body, moment) for moment in moments))
+
+    def natal_positions(self, year: int, month: int, day: int, hour: Number, minute: Number = 0,
+                        utc_offset: Number = 0.0) -> Dict[str, float]:
+        """以出生當地時間查詢全部天體黃經"""
+        return self.longitudes(day_number(year, month, day, hour, minute, utc_offset))
+
+
+_shared_ephemeris = None
+_shared_lock = threading.Lock()
+
+
+def get_ephemeris() -> Ephemeris:
+    """共用的星曆實例（首次呼叫時開啟，必要時產生星曆檔；可由多個分析執行緒同時呼叫）"""
+    global _shared_ephemeris
+    with _shared_lock:
+        if _shared_ephemeris is None:
+            _shared_ephemeris = Ephemeris()
+        return _shared_ephemeris
+
+
+# ==================== 相位 ====================
+
+def _build_aspect_table() -> Tuple[Optional[Tuple[str, int, str, int]], ...]:
+    """
+    角距整數部分（0–180°）→ 可能形成的相位 (名稱, 角度, 分類, 容許度)；不可能成相位為 None
+
+    各相位容許範圍互不重疊，每個整數區間至多對應一個相位；
+    區間兩端可能超出容許度，查表後仍須以實際角距核對（見 _aspect_at）。
+    """
+    table = []
+    for separation in range(181):
+        candidate = None
+        for angle, name, orb, aspect_class in ASPECTS:
+            if abs(separation - angle) <= orb:
+                candidate = (name, angle, aspect_class, orb)
+        table.append(candidate)
+    return tuple(table)
+
+
+_ASPECT_TABLE = _build_aspect_table()
+
+
+def _aspect_at(sep: float) -> Optional[Tuple[str, int, str, int]]:
+    """角距（0–180°）形成的相位 (名稱, 角度, 分類, 容許度)；不成相位時回傳 None"""
+    aspect = _ASPECT_TABLE[int(sep)]
+    if aspect is None or abs(sep - aspect[1]) > aspect[3]:
+        return None
+    return aspect
+
+
+def separation(longitude_a: float, longitude_b: float) -> float:
+    """兩黃經間的角距（0–180°）"""
+    diff = abs(longitude_a - longitude_b) % 360.0
+    return 360.0 - diff if diff > 180.0 else diff
+
+
+def find_aspect(longitude_a: float, longitude_b: float) -> Optional[Tuple[str, int, str, float]]:
+    """兩黃經形成的相位 (名稱, 角度, 分類, 誤差度數)；不成相位時回傳 None"""
+    sep = separation(longitude_a, longitude_b)
+    aspect = _aspect_at(sep)
+    if aspect is None:
+        return None
+    name, angle, aspect_class, _ = aspect
+    return name, angle, aspect_class, abs(sep - angle)
+
+
+def chart_aspects(chart_a: Dict[str, float], chart_b: Dict[str, float],
+                  bodies_a: Optional[Iterable[str]] = None,
+                  bodies_b: Optional[Iterable[str]] = None) -> List[Tuple[str, str, str, int, str, float]]:
+    """
+    兩張命盤之間的相位
+
+    Returns:
+        [(A 天體, B 天體, 相位名稱, 角度, 分類, 誤差度數), ...]（依誤差由小到大）
+    """
+    bodies_b = tuple(bodies_b or chart_b)
+    aspects = []
+    for body_a in (bodies_a or chart_a):
+        for body_b in bodies_b:
+            aspect = find_aspect(chart_a[body_a], chart_b[body_b])
+            if aspect is not None:
+                aspects.append((body_a, body_b) + aspect)
+    aspects.sort(key=lambda item: item[5])
+    return aspects
+
+
+def synastry_score(chart_a: Dict[str, float], chart_b: Dict[str, float]) -> int:
+    """
+    合盤相位評分（0–100）
+
+    依 SYNASTRY_PAIRS 的天體組合查相位表：和諧與融合相位加分、緊張相位扣分，
+    每組只需一次角距計算與查表，適合大量配對評分。
+    """
+    points = 0
+    max_points = 0
+    for body_a, body_b, weight in SYNASTRY_PAIRS:
+        diff = abs(chart_a[body_a] - chart_b[body_b]) % 360.0
+        if diff > 180.0:
+            diff = 360.0 - diff
+        aspect = _aspect_at(diff)
+        if aspect is not None:
+            points += ASPECT_CLASS_POINTS[aspect[2]] * weight
+        max_points += 3 * weight
+    return max(0, min(100, 50 + 50 * points // max_points))
+
+
+def synastry_scores(charts_a: Sequence[Dict[str, float]], charts_b: Sequence[Dict[str, float]]) -> array:
+    """批次合盤評分，回傳 array('b')"""
+    return array('b', map(synastry_score, charts_a, charts_b))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == 'build':
+        output = Path(sys.argv[2]) if len(sys.argv) >= 3 else default_ephemeris_path()
+        build_ephemeris_file(output, progress=lambda body: print(f"擬合 {BODY_NAMES[body]}..."))
+        print(f"✓ 星曆檔已產生：{output}（{output.stat().st_size // 1024} KB）")
+    else:
+        print("用法：python mingli_ephemeris.py build [輸出路徑]")
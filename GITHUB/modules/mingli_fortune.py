@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+流年流月運勢模組
+依本命生肖與流年地支的關係判斷流年運勢，並提供多年、多月的運勢序列
+"""
+
+from array import array
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Tuple
+
+# 流年關係分類（YEARLY_FORTUNES 的索引）
+RELATION_BENMING, RELATION_SANHE, RELATION_LIUHE, RELATION_CHONG, RELATION_PING = range(5)
+RELATION_NAMES = ('本命年', '三合年', '六合年', '相沖年', '平運年')
+
+# 流年地支與本命地支相距數 (0-11) → 流年關係分類
+RELATION_BY_DISTANCE = array('b', (
+    RELATION_BENMING, RELATION_PING, RELATION_PING, RELATION_SANHE,
+    RELATION_LIUHE, RELATION_PING, RELATION_CHONG, RELATION_PING,
+    RELATION_PING, RELATION_PING, RELATION_PING, RELATION_PING,
+))
+
+# 各流年關係的運勢紀錄（所有查詢共用，以唯讀映射提供）
+YEARLY_FORTUNES = tuple(MappingProxyType(fortune) for fortune in (
+    {  # 本命年
+        'overall': '本命年，運勢起伏較大，需謹慎行事，可佩戴紅色飾品化解',
+        'career': '事業變動可能性大，需穩紮穩打，不宜冒進，可得貴人相助',
+        'wealth': '財運平平，正財尚可，偏財不利，避免投機和大額投資',
+        'love': '感情需要用心經營，單身者有機會遇到正緣，已婚者需防小三',
+        'health': '注意身體保養，定期檢查，避免意外傷害，多運動增強體質',
+        'lucky_direction': '東南方',
+        'lucky_color': '紅色、橙色',
+        'advice': '多行善事，保持低調，穩中求進，可到寺廟祈福消災'
+    },
+    {  # 三合年
+        'overall': '三合年，貴人運強，諸事順遂，是開創事業的好時機',
+        'career': '事業運佳，升遷有望，適合轉職或創業，多與人合作',
+        'wealth': '財運亨通，正財偏財皆旺，可適度投資，但仍需謹慎',
+        'love': '桃花運旺，單身者易遇良緣，已婚者夫妻和睦，感情甜蜜',
+        'health': '身體健康，精力充沛，但不可過勞，注意休息',
+        'lucky_direction': '正南方',
+        'lucky_color': '綠色、藍色',
+        'advice': '把握機會，積極進取，多結交貴人，廣結善緣'
+    },
+    {  # 六合年
+        'overall': '六合年，運勢平穩向上，適合合作共事，人際關係和諧',
+        'career': '工作穩定，與同事相處融洽，團隊合作順利，業績提升',
+        'wealth': '財運穩定，收入增加，適合儲蓄和穩健投資',
+        'love': '感情運佳，單身者可透過朋友介紹遇到對象，已婚者幸福美滿',
+        'health': '健康良好，心情愉悅，可多參加戶外活動',
+        'lucky_direction': '正西方',
+        'lucky_color': '白色、金色',
+        'advice': '重視人際關係，多與人合作，真誠待人，互助互利'
+    },
+    {  # 相沖年
+        'overall': '相沖年，波折較多，需防小人，謹慎行事，以守為攻',
+        'career': '事業有阻，需加倍努力，避免與人正面衝突，多忍讓',
+        'wealth': '財運不佳，開銷增加，避免借貸和擔保，謹慎理財',
+        'love': '感情易生波折，需多溝通，避免誤會，單身者不宜急於求成',
+        'health': '注意安全，防意外傷害，定期體檢，保持良好作息',
+        'lucky_direction': '正北方',
+        'lucky_color': '黑色、灰色',
+        'advice': '低調行事，避免衝動，可佩戴護身符，多行善積德'
+    },
+    {  # 平運年
+        'overall': '運勢平穩，需腳踏實地，穩中求進，可有小幅進步',
+        'career': '工作穩定，按部就班，可有小成就，不宜大幅變動',
+        'wealth': '財運平平，收入穩定，適合儲蓄，不宜大額投資',
+        'love': '感情平淡，需用心經營，單身者可多參加社交活動',
+        'health': '健康尚可，注意季節變化，預防感冒，規律作息',
+        'lucky_direction': '正東方',
+        'lucky_color': '黃色、棕色',
+        'advice': '穩紮穩打，累積實力，培養興趣，充實自己'
+    },
+))
+
+# 流月運勢範本（依 月份 % 4 選用；lucky_days 為當月吉日日期）
+MONTHLY_FORTUNE_TEMPLATES = (
+    {
+        'focus': '事業發展，適合開展新計劃，人際關係活躍',
+        'first_third': '月初運勢平穩，可規劃本月目標，適合開會討論',
+        'second_third': '月中運勢上升，工作進展順利，可能有意外驚喜',
+        'last_third': '月底需注意細節，收尾工作要仔細，避免功虧一簣',
+        'lucky_days': (6, 15, 24),
+        'caution': '注意人際關係，避免口舌是非，謹慎處理文書合約',
+        'action': '多與人溝通，參加社交活動，學習新技能，拓展視野'
+    },
+    {
+        'focus': '財運理財，適合投資規劃，關注物質層面',
+        'first_third': '月初財運開始回升，可規劃理財，但不宜大額投資',
+        'second_third': '月中可能有額外收入，把握賺錢機會，但避免衝動消費',
+        'last_third': '月底需注意開銷，避免浪費，可適度儲蓄',
+        'lucky_days': (8, 17, 26),
+        'caution': '謹慎投資，避免借貸，控制購物慾望，理性消費',
+        'action': '檢視財務狀況，制定儲蓄計劃，學習理財知識'
+    },
+    {
+        'focus': '情感關係，適合表達心意，增進感情交流',
+        'first_third': '月初感情升溫，單身者有機會遇到心儀對象',
+        'second_third': '月中是表白或求婚的好時機，已婚者可安排約會',
+        'last_third': '月底需避免誤會，多溝通，維護感情穩定',
+        'lucky_days': (3, 12, 21),
+        'caution': '避免爛桃花，保持理性，不要過度付出，注意界限',
+        'action': '真誠表達情感，製造浪漫驚喜，重視伴侶需求'
+    },
+    {
+        'focus': '健康養生，適合運動鍛鍊，調整作息',
+        'first_third': '月初適合開始新的運動計劃，調整飲食習慣',
+        'second_third': '月中注意不要過勞，適度休息，保持心情愉悅',
+        'last_third': '月底需注意季節變化，預防疾病，定期檢查',
+        'lucky_days': (5, 14, 23),
+        'caution': '注意飲食衛生，避免熬夜，防止意外傷害，小心駕駛',
+        'action': '規律作息，均衡飲食，多運動，保持正面心態'
+    }
+)
+
+
+def _build_monthly_fortunes() -> Tuple[Mapping, ...]:
+    """展開 1-12 月的流月運勢紀錄（吉日格式化為「N月D日」）"""
+    fortunes = []
+    for month in range(1, 13):
+        fortune = dict(MONTHLY_FORTUNE_TEMPLATES[month % 4])
+        fortune['lucky_days'] = '、'.join(f'{month}月{day}日' for day in fortune['lucky_days'])
+        fortunes.append(MappingProxyType(fortune))
+    return tuple(fortunes)
+
+
+# 1-12 月的流月運勢紀錄（索引為 月份 - 1，唯讀映射）
+MONTHLY_FORTUNES = _build_monthly_fortunes()
+
+
+def get_relationship(birth_year: int, year: int) -> int:
+    """計算流年與本命生肖的關係分類"""
+    return RELATION_BY_DISTANCE[(year - birth_year) % 12]
+
+
+def get_yearly_fortune(birth_year: int, year: int) -> Mapping:
+    """取得單一流年的運勢紀錄"""
+    return YEARLY_FORTUNES[get_relationship(birth_year, year)]
+
+
+def get_monthly_fortune(month: int) -> Mapping:
+    """取得單一流月的運勢紀錄"""
+    return MONTHLY_FORTUNES[(month - 1) % 12]
+
+
+def yearly_relationship_series(birth_year: int, start_year: int, end_year: int) -> array:
+    """
+    計算一段年份（含首尾）的流年關係分類序列
+    
+    關係以 12 年為週期，直接旋轉並重複週期表，不逐年計算。
+    
+    Returns:
+        array('b')，第 i 項為 start_year + i 年的關係分類
+    """
+    count = end_year - start_year + 1
+    if count <= 0:
+        return array('b')
+    offset = (start_year - birth_year) % 12
+    cycle = RELATION_BY_DISTANCE[offset:] + RELATION_BY_DISTANCE[:offset]
+    return (cycle * (count // 12 + 1))[:count]
+
+
+def yearly_fortune_series(birth_year: int, start_year: int,
+                          end_year: int) -> Tuple[array, List[Mapping]]:
+    """
+    計算多年流年運勢
+    
+    Args:
+        birth_year: 出生年
+        start_year: 起始流年
+        end_year: 結束流年（含）
+        
+    Returns:
+        (關係分類 array('b'), 各年運勢紀錄列表)
+    """
+    relations = yearly_relationship_series(birth_year, start_year, end_year)
+    return relations, [YEARLY_FORTUNES[relation] for relation in relations]
+
+
+def _month_index_range(start_year: int, start_month: int, end_year: int, end_month: int) -> range:
+    """一段月份（含首尾）的月序範圍（年 × 12 + 月 - 1）；月份不在 1-12 時拋出 ValueError"""
+    for month in (start_month, end_month):
+        if not 1 <= month <= 12:
+            raise ValueError(f"無效的月份: {month}")
+    return range(start_year * 12 + start_month - 1, end_year * 12 + end_month)
+
+
+def monthly_fortune_series(birth_year: int, start_year: int, start_month: int,
+                           end_year: int, end_month: int) -> Tuple[array, List[Mapping]]:
+    """
+    計算一段月份（含首尾）的流月運勢
+    
+    Returns:
+        (各月所屬流年的關係分類 array('b'), 各月流月運勢紀錄列表)
+    """
+    months = _month_index_range(start_year, start_month, end_year, end_month)
+    if not months:
+        return array('b'), []
+    yearly = yearly_relationship_series(birth_year, start_year, months[-1] // 12)
+    relations = array('b', (yearly[index // 12 - start_year] for index in months))
+    return relations, [MONTHLY_FORTUNES[index % 12] for index in months]
+
+
+def iter_fortune_series(birth_year: int, start_year: int, start_month: int,
+                        end_year: int, end_month: int) -> Iterator[Dict]:
+    """
+    逐月串流流年流月運勢（長期間使用，不預先建立整段序列）
+    
+    月份不在 1-12 時拋出 ValueError（於開始迭代前檢查）。
+    
+    Yields:
+        {'year', 'month', 'relationship', 'relationship_name', 'yearly', 'monthly'}
+    """
+    return _iter_fortune_months(birth_year, _month_index_range(start_year, start_month, end_year, end_month))
+
+
+def _iter_fortune_months(birth_year: int, months: range) -> Iterator[Dict]:
+    """依月序範圍逐月產生運勢紀錄"""
+    for index in months:
+        year, month_index = divmod(index, 12)
+        relation = RELATION_BY_DISTANCE[(year - birth_year) % 12]
+        yield {
+            'year': year,
+            'month': month_index + 1,
+            'relationship': relation,
+            'relationship_name': RELATION_NAMES[relation],
+            'yearly': YEARLY_FORTUNES[relation],
+            'monthly': MONTHLY_FORTUNES[month_index]
+        }
+
+
+def format_yearly_outlook(birth_year: int, start_year: int, end_year: int) -> str:
+    """產生多年流年運勢總覽文字"""
+    relations, fortunes = yearly_fortune_series(birth_year, start_year, end_year)
+    lines = [f"【流年運勢總覽】{start_year}年 - {end_year}年", "=" * 60]
+    for year, relation, fortune in zip(range(start_year, end_year + 1), relations, fortunes):
+        lines.append(f"{year}年（{RELATION_NAMES[relation]}）：{fortune['overall']}")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    import sys
+
+    # python mingli_fortune.py 出生年 起始年 結束年 [monthly]
+    if len(sys.argv) < 4:
+        print("用法：python mingli_fortune.py 出生年 起始年 結束年 [monthly]")
+        sys.exit(1)
+    birth, start, end = (int(value) for value in sys.argv[1:4])
+    if len(sys.argv) >= 5 and sys.argv[4] == 'monthly':
+        # 逐月串流輸出，長期間也不預先建立整段序列
+        for record in iter_fortune_series(birth, start, 1, end, 12):
+            print(f"{record['year']}年{record['month']:>2}月（{record['relationship_name']}）："
+                  f"{record['monthly']['focus']}")
+    else:
+        print(format_yearly_outlook(birth, start, end))
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+上升點與宮位計算模組
+依出生日期、時間與出生地經緯度計算上升點（ASC）、天頂（MC）與十二宮宮頭（Porphyry 制）。
+
+恆星時與黃赤交角預先依年份建表：
+    地方恆星時 = 年初恆星時[年] + 每日恆星時增量 × (年內日數 + 世界時/24) + 經度
+每張命盤只需查表與數次三角運算；批次版本對整批出生資料逐筆套用，供大量排盤使用。
+
+星座索引 0-11 依黃經每 30° 一宮，0 為牡羊座（與 get_zodiac_index 相同順序）。
+"""
+
+import math
+from array import array
+from typing import Dict, Optional, Sequence, Tuple
+
+# 預先建表的年份範圍（表外年份即時計算）
+TABLE_FIRST_YEAR = 1900
+TABLE_LAST_YEAR = 2100
+
+# 平恆星時每日增量（度）
+SIDEREAL_DEGREES_PER_DAY = 360.98564736629
+
+# 出生地：(緯度, 經度（東經為正）, 標準時區 UTC 偏移小時)；不含日光節約時間
+BIRTH_PLACES = {
+    '台北': (25.0330, 121.5654, 8), '新北': (25.0120, 121.4657, 8), '基隆': (25.1276, 121.7392, 8),
+    '桃園': (24.9936, 121.3010, 8), '新竹': (24.8138, 120.9675, 8), '苗栗': (24.5602, 120.8214, 8),
+    '台中': (24.1477, 120.6736, 8), '彰化': (24.0518, 120.5161, 8), '南投': (23.9609, 120.9719, 8),
+    '雲林': (23.7092, 120.4313, 8), '嘉義': (23.4801, 120.4491, 8), '台南': (22.9999, 120.2270, 8),
+    '高雄': (22.6273, 120.3014, 8), '屏東': (22.6690, 120.4862, 8), '宜蘭': (24.7021, 121.7378, 8),
+    '花蓮': (23.9872, 121.6015, 8), '台東': (22.7583, 121.1444, 8), '澎湖': (23.5711, 119.5793, 8),
+    '金門': (24.4493, 118.3765, 8), '馬祖': (26.1608, 119.9497, 8),
+    '香港': (22.3193, 114.1694, 8), '澳門': (22.1987, 113.5439, 8), '北京': (39.9042, 116.4074, 8),
+    '上海': (31.2304, 121.4737, 8), '廣州': (23.1291, 113.2644, 8), '深圳': (22.5431, 114.0579, 8),
+    '廈門': (24.4798, 118.0894, 8), '福州': (26.0745, 119.2965, 8), '成都': (30.5728, 104.0668, 8),
+    '新加坡': (1.3521, 103.8198, 8), '吉隆坡': (3.1390, 101.6869, 8), '馬尼拉': (14.5995, 120.9842, 8),
+    '曼谷': (13.7563, 100.5018, 7), '雅加達': (-6.2088, 106.8456, 7), '東京': (35.6762, 139.6503, 9),
+    '首爾': (37.5665, 126.9780, 9), '雪梨': (-33.8688, 151.2093, 10), '墨爾本': (-37.8136, 144.9631, 10),
+    '倫敦': (51.5074, -0.1278, 0), '巴黎': (48.8566, 2.3522, 1), '法蘭克福': (50.1109, 8.6821, 1),
+    '紐約': (40.7128, -74.0060, -5), '洛杉磯': (34.0522, -118.2437, -8), '舊金山': (37.7749, -122.4194, -8),
+    '溫哥華': (49.2827, -123.1207, -8), '多倫多': (43.6532, -79.3832, -5),
+}
+DEFAULT_BIRTH_PLACE = '台北'
+
+# 各月之前的累計日數（平年）
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _julian_day_jan0(year: int) -> float:
+    """year 年 1 月 0 日（即前一年 12 月 31 日）0h UT 的儒略日（Meeus 公式，1 月視為前一年 13 月）"""
+    y = year - 1
+    a = y // 100
+    b = 2 - a + a // 4
+    return math.floor(365.25 * (y + 4716)) + math.floor(30.6001 * 14) + b - 1524.5
+
+
+def _gmst_jan0(year: int) -> float:
+    """year 年 1 月 0 日 0h UT 的格林威治平恆星時（度）"""
+    d = _julian_day_jan0(year) - 2451545.0
+    t = d / 36525.0
+    return (280.46061837 + SIDEREAL_DEGREES_PER_DAY * d + 0.000387933 * t * t - t * t * t / 38710000.0) % 360.0
+
+
+def _obliquity(year: int) -> float:
+    """year 年年中的平黃赤交角（度）"""
+    t = (year + 0.5 - 2000.0) / 100.0
+    return 23.439291111 - 0.0130041667 * t - 1.64e-7 * t * t + 5.04e-7 * t * t * t
+
+
+def _build_tables() -> Tuple[array, array, array]:
+    """年初恆星時表與黃赤交角正弦、餘弦表"""
+    years = range(TABLE_FIRST_YEAR, TABLE_LAST_YEAR + 1)
+    gmst = array('d', (_gmst_jan0(year) for year in years))
+    sin_eps = array('d', (math.sin(math.radians(_obliquity(year))) for year in years))
+    cos_eps = array('d', (math.cos(math.radians(_obliquity(year))) for year in years))
+    return gmst, sin_eps, cos_eps
+
+
+_GMST_JAN0, _SIN_OBLIQUITY, _COS_OBLIQUITY = _build_tables()
+
+
+def _year_terms(year: int) -> Tuple[float, float, float]:
+    """(年初恆星時, sin ε, cos ε)：表內查表，表外即時計算"""
+    i = year - TABLE_FIRST_YEAR
+    if 0 <= i < len(_GMST_JAN0):
+        return _GMST_JAN0[i], _SIN_OBLIQUITY[i], _COS_OBLIQUITY[i]
+    eps = math.radians(_obliquity(year))
+    return _gmst_jan0(year), math.sin(eps), math.cos(eps)
+
+
+def _day_of_year(year: int, month: int, day: int) -> int:
+    doy = _DAYS_BEFORE_MONTH[month - 1] + day
+    if month > 2 and _is_leap_year(year):
+        doy += 1
+    return doy
+
+
+def resolve_birth_place(birth_place: Optional[str] = None) -> Tuple[float, float, float]:
+    """
+    出生地名稱 → (緯度, 經度, UTC 偏移)
+
+    未提供時使用預設出生地；「臺」與「台」視為相同。
+    名稱不在 BIRTH_PLACES 中時拋出 ValueError。
+    """
+    if not birth_place or not birth_place.strip():
+        return BIRTH_PLACES[DEFAULT_BIRTH_PLACE]
+    name = birth_place.strip().replace('臺', '台')
+    try:
+        return BIRTH_PLACES[name]
+    except KeyError:
+        raise ValueError(f"未知的出生地: {birth_place}（可用：{'、'.join(BIRTH_PLACES)}）") from None
+
+
+def sign_of(longitude: float) -> int:
+    """黃經（度）所在星座索引（0 = 牡羊座）"""
+    return int(longitude % 360.0 // 30.0)
+
+
+def format_degree(longitude: float) -> str:
+    """黃經於所在星座內的度分，如 12°34′"""
+    minutes = int(round(longitude % 30.0 * 60.0))
+    if minutes == 30 * 60:
+        minutes -= 1
+    return f"{minutes // 60}°{minutes % 60:02d}′"
+
+
+def _angles(local_sidereal: float, sin_eps: float, cos_eps: float, tan_lat: float) -> Tuple[float, float]:
+    """由地方恆星時（度）計算 (上升點, 天頂) 黃經"""
+    ramc = math.radians(local_sidereal)
+    sin_ramc = math.sin(ramc)
+    cos_ramc = math.cos(ramc)
+    ascendant = math.degrees(math.atan2(cos_ramc, -(sin_eps * tan_lat + cos_eps * sin_ramc))) % 360.0
+    mc = math.degrees(math.atan2(sin_ramc, cos_ramc * cos_eps)) % 360.0
+    return ascendant, mc
+
+
+def _porphyry_cusps(ascendant: float, mc: float) -> Tuple[float, ...]:
+    """Porphyry 制十二宮宮頭：將上升點至天底、天底至下降點的象限各三等分"""
+    ic = (mc + 180.0) % 360.0
+    descendant = (ascendant + 180.0) % 360.0
+    first = ((ic - ascendant) % 360.0) / 3.0
+    second = ((descendant - ic) % 360.0) / 3.0
+    half = (
+        ascendant, ascendant + first, ascendant + 2 * first,
+        ic, ic + second, ic + 2 * second,
+    )
+    return tuple(cusp % 360.0 for cusp in half + tuple(cusp + 180.0 for cusp in half))
+
+
+def local_sidereal_time(year: int, month: int, day: int, hour: int, minute: int = 0,
+                        longitude: float = 0.0, utc_offset: float = 0.0) -> float:
+    """地方平恆星時（度）"""
+    gmst0, _, _ = _year_terms(year)
+    days = _day_of_year(year, month, day) + (hour + minute / 60.0 - utc_offset) / 24.0
+    return (gmst0 + SIDEREAL_DEGREES_PER_DAY * days + longitude) % 360.0
+
+
+def natal_houses(year: int, month: int, day: int, hour: int, minute: int = 0,
+                 birth_place: Optional[str] = None, latitude: Optional[float] = None,
+                 longitude: Optional[float] = None, utc_offset: Optional[float] = None) -> Dict:
+    """
+    計算本命盤上升點、天頂與十二宮
+
+    Args:
+        year, month, day, hour, minute: 出生當地時間（標準時間）
+        birth_place: 出生地名稱（見 BIRTH_PLACES）
+        latitude, longitude, utc_offset: 直接指定經緯度與時區（優先於 birth_place）
+
+    Returns:
+        {'ascendant', 'mc', 'cusps'(12 宮宮頭黃經), 'ascendant_sign', 'mc_sign',
+         'house_signs'(12 宮宮頭星座索引), 'local_sidereal_time', 'latitude', 'longitude', 'birth_place'}
+    """
+    place_lat, place_lon, place_offset = resolve_birth_place(birth_place)
+    latitude = place_lat if latitude is None else latitude
+    longitude = place_lon if longitude is None else longitude
+    utc_offset = place_offset if utc_offset is None else utc_offset
+
+    _, sin_eps, cos_eps = _year_terms(year)
+    lst = local_sidereal_time(year, month, day, hour, minute, longitude, utc_offset)
+    ascendant, mc = _angles(lst, sin_eps, cos_eps, math.tan(math.radians(latitude)))
+    cusps = _porphyry_cusps(ascendant, mc)
+    return {
+        'ascendant': ascendant,
+        'mc': mc,
+        'cusps': cusps,
+        'ascendant_sign': sign_of(ascendant),
+        'mc_sign': sign_of(mc),
+        'house_signs': tuple(sign_of(cusp) for cusp in cusps),
+        'local_sidereal_time': lst,
+        'latitude': latitude,
+        'longitude': longitude,
+        'birth_place': birth_place if birth_place in BIRTH_PLACES else DEFAULT_BIRTH_PLACE,
+    }
+
+
+def natal_houses_batch(years: Sequence[int], months: Sequence[int], days: Sequence[int],
+                       hours: Sequence[int], latitudes: Sequence[float], longitudes: Sequence[float],
+                       utc_offsets: Sequence[float], minutes: Optional[Sequence[int]] = None) -> Dict[str, array]:
+    """
+    批次計算上升點、天頂與宮位（各序列長度須相同，否則拋出 ValueError）
+
+    Returns:
+        {'ascendant': array('d'), 'mc': array('d'),
+         'ascendant_sign': array('b'), 'house_signs': array('b')（每筆 12 個，依序攤平）}
+    """
+    if minutes is None:
+        minutes = [0] * len(years)
+    columns = (years, months, days, hours, minutes, latitudes, longitudes, utc_offsets)
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError(f"批次輸入長度不一致: {[len(column) for column in columns]}")
+    ascendants = array('d')
+    mcs = array('d')
+    ascendant_signs = array('b')
+    house_signs = array('b')
+    year_terms = {}
+
+    for year, month, day, hour, minute, latitude, longitude, utc_offset in zip(
+            years, months, days, hours, minutes, latitudes, longitudes, utc_offsets):
+        terms = year_terms.get(year)
+        if terms is None:
+            terms = year_terms[year] = _year_terms(year)
+        gmst0, sin_eps, cos_eps = terms
+        days_elapsed = _day_of_year(year, month, day) + (hour + minute / 60.0 - utc_offset) / 24.0
+        lst = (gmst0 + SIDEREAL_DEGREES_PER_DAY * days_elapsed + longitude) % 360.0
+        ascendant, mc = _angles(lst, sin_eps, cos_eps, math.tan(math.radians(latitude)))
+        ascendants.append(ascendant)
+        mcs.append(mc)
+        ascendant_signs.append(sign_of(ascendant))
+        house_signs.extend(sign_of(cusp) for cusp in _porphyry_cusps(ascendant, mc))
+
+    return {
+        'ascendant': ascendants,
+        'mc': mcs,
+        'ascendant_sign': ascendant_signs,
+        'house_signs': house_signs,
+    }
+
+
+def house_of(longitude: float, cusps: Sequence[float]) -> int:
+    """黃經落入的宮位（1-12）"""
+    longitude %= 360.0
+    for i in range(12):
+        start = cusps[i]
+        span = (cusps[(i + 1) % 12] - start) % 360.0
+        if (longitude - start) % 360.0 < span:
+            return i + 1
+    return 1
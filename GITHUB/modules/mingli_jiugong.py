@@ -6,20 +6,87 @@
 計算生命靈數、天賦數、命運數等
 """
 
+from functools import cached_property
+
+from mingli_resources import ResourceTable
+
+# 主數字（化簡時保留不再相加）
+MASTER_NUMBERS = frozenset((11, 22, 33))
+
+# 預先計算的查表範圍：涵蓋所有姓名總和與年份（0-9999）
+REDUCTION_TABLE_SIZE = 10000
+
+
+def _reduce_arithmetic(number):
+    """以整數運算化簡為單數，保留主數字 11, 22, 33"""
+    if number in MASTER_NUMBERS:
+        return number
+    
+    while number > 9:
+        total = 0
+        while number:
+            number, digit = divmod(number, 10)
+            total += digit
+        number = total
+        if number in MASTER_NUMBERS:
+            return number
+    
+    return number
+
+
+def _build_reduction_tables(size):
+    """建立各位數字和表與化簡結果表（皆由較小的值遞推）"""
+    digit_sums = list(range(size))
+    reductions = list(range(size))
+    for n in range(10, size):
+        digit_sums[n] = digit_sums[n // 10] + n % 10
+        if n not in MASTER_NUMBERS:
+            reductions[n] = reductions[digit_sums[n]]
+    return tuple(digit_sums), tuple(reductions)
+
+
+DIGIT_SUM_TABLE, REDUCTION_TABLE = _build_reduction_tables(REDUCTION_TABLE_SIZE)
+
 
 class JiuGongAnalyzer:
     """九宮算命分析器"""
     
-    def __init__(self):
-        """初始化九宮分析器"""
-        self.letter_values = {
+    # 字母數值對照
+    letter_values = ResourceTable('_init_letter_values')
+    
+    # 中文拼音對照（常用字）
+    chinese_pinyin_map = ResourceTable('_init_chinese_pinyin_map')
+    
+    # 母音以外的位元組（bytes.translate 刪除用）
+    _non_vowels = bytes(b for b in range(256) if b not in b'AEIOU')
+    
+    # 姓名正規化轉換表：中文轉拼音（str.translate）、字母轉數值（bytes.translate）
+    # 第一次計算姓名數字時才讀取對照表並建立
+    @cached_property
+    def _pinyin_table(self):
+        return str.maketrans(self.chinese_pinyin_map)
+    
+    @cached_property
+    def _letter_digit_table(self):
+        letters = bytes(ord(letter) for letter in self.letter_values)
+        return bytes.maketrans(letters, bytes(self.letter_values.values()))
+    
+    @cached_property
+    def _non_letters(self):
+        letters = frozenset(ord(letter) for letter in self.letter_values)
+        return bytes(b for b in range(256) if b not in letters)
+    
+    def _init_letter_values(self):
+        """字母數值對照表（Pythagorean）"""
+        return {
             'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9,
             'J': 1, 'K': 2, 'L': 3, 'M': 4, 'N': 5, 'O': 6, 'P': 7, 'Q': 8, 'R': 9,
             'S': 1, 'T': 2, 'U': 3, 'V': 4, 'W': 5, 'X': 6, 'Y': 7, 'Z': 8
         }
-        
-        # 中文拼音對照（常用字）
-        self.chinese_pinyin_map = {
+    
+    def _init_chinese_pinyin_map(self):
+        """中文拼音對照表（常用字）"""
+        return {
             '張': 'ZHANG', '王': 'WANG', '李': 'LI', '趙': 'ZHAO', '陳': 'CHEN',
             '劉': 'LIU', '黃': 'HUANG', '周': 'ZHOU', '吳': 'WU', '徐': 'XU',
             '孫': 'SUN', '馬': 'MA', '朱': 'ZHU', '胡': 'HU', '郭': 'GUO',
@@ -54,27 +121,47 @@ class JiuGongAnalyzer:
         return self.letter_values.get(letter.upper(), 0)
     
     def reduce_to_single_digit(self, number):
-        """將數字化簡為單數，保留主數字 11, 22, 33"""
-        if number in [11, 22, 33]:
-            return number
-        
-        while number > 9:
-            number = sum(int(digit) for digit in str(number))
-            if number in [11, 22, 33]:
-                return number
-        
-        return number
+        """將數字化簡為單數，保留主數字 11, 22, 33（範圍內直接查表）"""
+        if 0 <= number < REDUCTION_TABLE_SIZE:
+            return REDUCTION_TABLE[number]
+        return _reduce_arithmetic(number)
     
     def convert_chinese_to_pinyin(self, name):
-        """將中文名字轉換為拼音"""
-        pinyin = ""
-        for char in name:
-            if char in self.chinese_pinyin_map:
-                pinyin += self.chinese_pinyin_map[char]
-            else:
-                # 如果不在對照表中，保留原字符
-                pinyin += char
-        return pinyin
+        """將中文名字轉換為拼音（不在對照表中的字保留原字符）"""
+        return name.translate(self._pinyin_table)
+    
+    def vectorize_name(self, name):
+        """
+        單次掃描將姓名轉為數字向量
+        
+        Returns:
+            (全部字母數值, 母音數值)，皆為 bytes，每個位元組為 1-9 的字母數值
+        """
+        letters = name.translate(self._pinyin_table).upper().encode('ascii', 'ignore')
+        return (letters.translate(self._letter_digit_table, self._non_letters),
+                letters.translate(self._letter_digit_table, self._non_vowels))
+    
+    def calculate_name_numbers(self, name, vector=None):
+        """由姓名數字向量一次算出命運數、靈魂數、個性數與九宮格計數"""
+        digits, vowels = vector if vector is not None else self.vectorize_name(name)
+        total = sum(digits)
+        vowel_total = sum(vowels)
+        return {
+            'expression': self.reduce_to_single_digit(total),
+            'soul_urge': self.reduce_to_single_digit(vowel_total),
+            'personality': self.reduce_to_single_digit(total - vowel_total),
+            'grid_count': {i: digits.count(i) for i in range(1, 10)}
+        }
+    
+    def calculate_name_numbers_batch(self, names):
+        """批次計算多個姓名的數字（整批只做一次轉換與大寫化）"""
+        joined = '\0'.join(names).translate(self._pinyin_table).upper()
+        results = []
+        for letters in joined.encode('ascii', 'ignore').split(b'\0'):
+            vector = (letters.translate(self._letter_digit_table, self._non_letters),
+                      letters.translate(self._letter_digit_table, self._non_vowels))
+            results.append(self.calculate_name_numbers(None, vector))
+        return results
     
     def calculate_life_path(self, year, month, day):
         """計算生命靈數（Life Path Number）"""
@@ -84,7 +171,10 @@ class JiuGongAnalyzer:
             reduced_day = self.reduce_to_single_digit(day)
             
             # 年份先加總再化簡
-            year_sum = sum(int(digit) for digit in str(year))
+            if isinstance(year, int) and 0 <= year < REDUCTION_TABLE_SIZE:
+                year_sum = DIGIT_SUM_TABLE[year]
+            else:
+                year_sum = sum(int(digit) for digit in str(year))
             reduced_year = self.reduce_to_single_digit(year_sum)
             
             # 加總三者並化簡
@@ -94,41 +184,49 @@ class JiuGongAnalyzer:
         except Exception:
             return 1
     
+    def calculate_life_path_batch(self, years, months, days):
+        """
+        批次計算生命靈數
+        
+        Args:
+            years, months, days: 等長的年、月、日序列
+        
+        Returns:
+            與輸入等長的生命靈數列表（無法計算的項目與 calculate_life_path 相同，回傳 1）
+        
+        Raises:
+            ValueError: 三個序列長度不同
+        """
+        if not len(years) == len(months) == len(days):
+            raise ValueError(f"年、月、日序列長度不一致: {len(years)}, {len(months)}, {len(days)}")
+        reduce_table = REDUCTION_TABLE
+        digit_sums = DIGIT_SUM_TABLE
+        size = REDUCTION_TABLE_SIZE
+        results = []
+        for year, month, day in zip(years, months, days):
+            if (type(year) is int and type(month) is int and type(day) is int
+                    and 0 <= year < size and 0 <= month < size and 0 <= day < size):
+                results.append(reduce_table[reduce_table[month] + reduce_table[day]
+                                            + reduce_table[digit_sums[year]]])
+            else:
+                # 超出查表範圍或非整數的日期逐筆計算
+                results.append(self.calculate_life_path(year, month, day))
+        return results
+    
     def calculate_expression(self, name):
         """計算命運數（Expression Number）- 從姓名所有字母"""
-        # 如果是中文名字，先轉換為拼音
-        if any('\u4e00' <= char <= '\u9fff' for char in name):
-            name = self.convert_chinese_to_pinyin(name)
-        
-        name = name.upper().replace(' ', '')
-        total = sum(self.get_letter_value(letter) for letter in name if letter.isalpha())
-        return self.reduce_to_single_digit(total)
+        digits, _ = self.vectorize_name(name)
+        return self.reduce_to_single_digit(sum(digits))
     
     def calculate_soul_urge(self, name):
         """計算靈魂數（Soul Urge Number）- 從姓名母音"""
-        # 如果是中文名字，先轉換為拼音
-        if any('\u4e00' <= char <= '\u9fff' for char in name):
-            name = self.convert_chinese_to_pinyin(name)
-        
-        vowels = 'AEIOU'
-        name = name.upper().replace(' ', '')
-        
-        vowel_values = {'A': 1, 'E': 5, 'I': 9, 'O': 6, 'U': 3}
-        total = sum(vowel_values.get(vowel, 0) for vowel in name if vowel in vowels)
-        return self.reduce_to_single_digit(total)
+        _, vowels = self.vectorize_name(name)
+        return self.reduce_to_single_digit(sum(vowels))
     
     def calculate_personality(self, name):
         """計算個性數（Personality Number）- 從姓名子音"""
-        # 如果是中文名字，先轉換為拼音
-        if any('\u4e00' <= char <= '\u9fff' for char in name):
-            name = self.convert_chinese_to_pinyin(name)
-        
-        vowels = 'AEIOU'
-        name = name.upper().replace(' ', '')
-        
-        consonants = [letter for letter in name if letter.isalpha() and letter not in vowels]
-        total = sum(self.get_letter_value(consonant) for consonant in consonants)
-        return self.reduce_to_single_digit(total)
+        digits, vowels = self.vectorize_name(name)
+        return self.reduce_to_single_digit(sum(digits) - sum(vowels))
     
     def calculate_birthday_number(self, day):
         """計算生日數（Birthday Number）"""
@@ -260,15 +358,15 @@ class JiuGongAnalyzer:
         try:
             # 計算各種數字
             life_path = self.calculate_life_path(year, month, day)
-            expression = self.calculate_expression(name)
-            soul_urge = self.calculate_soul_urge(name)
-            personality = self.calculate_personality(name)
+            name_numbers = self.calculate_name_numbers(name)
             birthday = self.calculate_birthday_number(day)
             
             # 生成分析報告
             report = self._generate_report(name, year, month, day, 
-                                          life_path, expression, soul_urge, 
-                                          personality, birthday)
+                                          life_path, name_numbers['expression'],
+                                          name_numbers['soul_urge'],
+                                          name_numbers['personality'], birthday,
+                                          name_numbers['grid_count'])
             
             return report
             
@@ -276,7 +374,8 @@ class JiuGongAnalyzer:
             return f"九宮分析出現錯誤：{str(e)}"
     
     def _generate_report(self, name, year, month, day, 
-                        life_path, expression, soul_urge, personality, birthday):
+                        life_path, expression, soul_urge, personality, birthday,
+                        name_count=None):
         """生成分析報告"""
         
         # 取得各數字的意義
@@ -406,7 +505,7 @@ class JiuGongAnalyzer:
                         九宮格能量分布
 {'='*80}
 
-{self._generate_grid(name, year, month, day)}
+{self._generate_grid(name, year, month, day, name_count)}
 
 {'='*80}
                         總結與建議
@@ -438,29 +537,15 @@ class JiuGongAnalyzer:
 """
         return report
     
-    def _generate_grid(self, name, year, month, day):
+    def _generate_grid(self, name, year, month, day, name_count=None):
         """生成九宮格能量分布圖"""
-        # 計算姓名和生日中各數字出現的次數
-        all_numbers = []
+        # 姓名中各數字出現的次數（可沿用 calculate_name_numbers 的結果）
+        if name_count is None:
+            name_count = self.calculate_name_numbers(name)['grid_count']
         
-        # 從姓名計算
-        if any('\u4e00' <= char <= '\u9fff' for char in name):
-            name = self.convert_chinese_to_pinyin(name)
-        name = name.upper().replace(' ', '')
-        for letter in name:
-            if letter.isalpha():
-                value = self.get_letter_value(letter)
-                if 1 <= value <= 9:
-                    all_numbers.append(value)
-        
-        # 從生日計算
+        # 加上生日中各數字出現的次數
         date_str = f"{year}{month:02d}{day:02d}"
-        for digit in date_str:
-            if digit != '0':
-                all_numbers.append(int(digit))
-        
-        # 統計1-9出現次數
-        count = {i: all_numbers.count(i) for i in range(1, 10)}
+        count = {i: name_count[i] + date_str.count(str(i)) for i in range(1, 10)}
         
         # 生成九宮格圖
         grid = f"""
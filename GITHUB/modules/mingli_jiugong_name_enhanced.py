@@ -9,26 +9,28 @@
 4. 詳細的運勢分析
 """
 
+from mingli_resources import ResourceTable
+
 
 class JiuGongNameAnalyzerEnhanced:
     """增強版九宮姓名學分析器"""
     
+    # 常用漢字筆畫數對照表（康熙字典筆畫）
+    stroke_dict = ResourceTable('_init_stroke_dict')
+    
+    # 數字吉凶對照（81數理吉凶）
+    luck_map = ResourceTable('_init_luck_map')
+    
+    # 數理詳細解釋
+    number_meanings = ResourceTable('_init_number_meanings')
+    
     def __init__(self):
         """初始化分析器"""
-        # 常用漢字筆畫數對照表（康熙字典筆畫）
-        self.stroke_dict = self._init_stroke_dict()
-        
         # 數字五行對照
         self.wuxing_map = {
             1: "木", 2: "木", 3: "火", 4: "火", 5: "土",
             6: "土", 7: "金", 8: "金", 9: "水", 0: "水"
         }
-        
-        # 數字吉凶對照（81數理吉凶）
-        self.luck_map = self._init_luck_map()
-        
-        # 數理詳細解釋
-        self.number_meanings = self._init_number_meanings()
     
     def _init_stroke_dict(self):
         """初始化常用字筆畫數對照表（康熙字典筆畫）"""
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+梅花易數起卦模組（時間起卦、數字起卦）
+卦數依先天八卦：乾 1、兌 2、離 3、震 4、巽 5、坎 6、艮 7、坤 8。
+
+時間起卦：
+    上卦 = (年數 + 月數 + 日數) mod 8
+    下卦 = (年數 + 月數 + 日數 + 時數) mod 8
+    動爻 = (年數 + 月數 + 日數 + 時數) mod 6
+年數、時數為地支序數（子 1 … 亥 12，依 BaziAnalyzer 的年支、時支），
+月數、日數為農曆月日；餘數為 0 時取 8（動爻取 6）。
+與 BaziAnalyzer 相同，傳入的年月日即視為農曆日期，本模組不做陰陽曆換算，
+不可直接以西曆日期（如 datetime.now()）起卦。
+
+結果與 mingli_yijing_cast 相同，為 12 位元起卦結果（本卦 | 動爻 << 6），
+只有一個動爻。時間起卦只取決於 (年數 + 月數 + 日數) mod 24 與時數，
+模組載入時預先算好 24 × 12 的時辰表，整日十二時辰為一次查表、整月為逐日串接。
+"""
+
+from array import array
+from typing import Dict, Optional, Tuple
+
+from mingli_bazi_analyzer import BaziAnalyzer
+from mingli_yijing_cast import TRIGRAMS
+
+# 先天八卦數 → 三爻位元（下爻在最低位元）
+PRE_HEAVEN_TRIGRAMS = (None, 7, 3, 5, 1, 6, 2, 4, 0)
+
+# 三爻位元 → 五行
+TRIGRAM_ELEMENTS = {7: '金', 3: '金', 5: '火', 1: '木', 6: '木', 2: '水', 4: '土', 0: '土'}
+
+HOURS_PER_DAY = 12
+
+# 五行相生、相剋（key 生／剋 value）
+_GENERATES = {'木': '火', '火': '土', '土': '金', '金': '水', '水': '木'}
+_CONTROLS = {'木': '土', '土': '水', '水': '火', '火': '金', '金': '木'}
+
+_bazi = BaziAnalyzer()
+
+
+def _reading(upper_number: int, lower_number: int, moving_number: int) -> int:
+    """卦數（餘數）→ 12 位元起卦結果"""
+    upper = PRE_HEAVEN_TRIGRAMS[(upper_number - 1) % 8 + 1]
+    lower = PRE_HEAVEN_TRIGRAMS[(lower_number - 1) % 8 + 1]
+    line = (moving_number - 1) % 6
+    return (upper << 3 | lower) | 1 << (line + 6)
+
+
+# (年數 + 月數 + 日數) mod 24 → 子時至亥時的起卦結果，攤平為 24 × 12
+TIME_READINGS = array('H', (
+    _reading(base, base + hour, base + hour)
+    for base in range(24) for hour in range(1, HOURS_PER_DAY + 1)
+))
+
+
+def year_number(year: int) -> int:
+    """年數（年支序數，子 1 … 亥 12）"""
+    return BaziAnalyzer.EARTHLY_BRANCHES.index(_bazi.get_lunar_year_branch(year)) + 1
+
+
+def hour_number(hour: int) -> int:
+    """時數（時支序數，子 1 … 亥 12）"""
+    return BaziAnalyzer.EARTHLY_BRANCHES.index(_bazi.get_hour_branch(hour)) + 1
+
+
+def _check_date(month: int, day: int):
+    if not 1 <= month <= 12:
+        raise ValueError(f"無效的農曆月份: {month}")
+    if not 1 <= day <= 30:
+        raise ValueError(f"無效的農曆日期: {day}")
+
+
+def time_numbers(year: int, month: int, day: int, hour: int) -> Tuple[int, int, int, int]:
+    """時間起卦的 (年數, 月數, 日數, 時數)"""
+    _check_date(month, day)
+    return year_number(year), month, day, hour_number(hour)
+
+
+def time_cast(year: int, month: int, day: int, hour: int) -> int:
+    """
+    時間起卦
+
+    Args:
+        year: 年
+        month: 農曆月（1–12）
+        day: 農曆日（1–30）
+        hour: 小時（0–23）
+
+    Returns:
+        12 位元起卦結果（本卦 | 動爻 << 6）
+    """
+    year_num, month_num, day_num, hour_num = time_numbers(year, month, day, hour)
+    base = (year_num + month_num + day_num) % 24
+    return TIME_READINGS[base * HOURS_PER_DAY + hour_num - 1]
+
+
+def number_cast(first: int, second: int, hour: Optional[int] = None) -> int:
+    """
+    數字起卦：第一數取上卦、第二數取下卦，兩數之和（提供 hour 時加上時數）取動爻
+
+    Args:
+        first: 第一個數（正整數）
+        second: 第二個數（正整數）
+        hour: 起卦小時（0–23，可省略）
+
+    Returns:
+        12 位元起卦結果（本卦 | 動爻 << 6）
+    """
+    if first < 1 or second < 1:
+        raise ValueError(f"起卦數字須為正整數: ({first}, {second})")
+    total = first + second + (hour_number(hour) if hour is not None else 0)
+    return _reading(first, second, total)
+
+
+def day_time_readings(year: int, month: int, day: int) -> array:
+    """
+    一日十二時辰的時間起卦（日曆預先計算用）
+
+    Returns:
+        array('H')，第 i 項為第 i 個時辰（子、丑 … 亥）的起卦結果
+    """
+    _check_date(month, day)
+    base = (year_number(year) + month + day) % 24
+    return TIME_READINGS[base * HOURS_PER_DAY:(base + 1) * HOURS_PER_DAY]
+
+
+def month_time_readings(year: int, month: int, days: int = 30) -> array:
+    """
+    一個農曆月每日十二時辰的時間起卦
+
+    Args:
+        year: 年
+        month: 農曆月（1–12）
+        days: 當月天數（29 或 30）
+
+    Returns:
+        array('H')，第 (日 − 1) × 12 + i 項為該日第 i 個時辰的起卦結果
+    """
+    if days not in (29, 30):
+        raise ValueError(f"農曆月天數須為 29 或 30: {days}")
+    _check_date(month, 1)
+    first = year_number(year) + month + 1
+    readings = array('H')
+    for offset in range(days):
+        base = (first + offset) % 24
+        readings.extend(TIME_READINGS[base * HOURS_PER_DAY:(base + 1) * HOURS_PER_DAY])
+    return readings
+
+
+def body_use(reading: int) -> Tuple[int, int]:
+    """
+    體卦與用卦（三爻位元）：動爻所在的經卦為用，另一經卦為體
+
+    Returns:
+        (體卦, 用卦)
+    """
+    upper, lower = reading >> 3 & 7, reading & 7
+    return (upper, lower) if reading >> 6 & 7 else (lower, upper)
+
+
+def body_use_relation(reading: int) -> Dict[str, str]:
+    """
+    體用五行生剋
+
+    Returns:
+        {'body', 'use', 'body_element', 'use_element', 'relation', 'verdict'}
+    """
+    body, use = body_use(reading)
+    body_element, use_element = TRIGRAM_ELEMENTS[body], TRIGRAM_ELEMENTS[use]
+    if body_element == use_element:
+        relation, verdict = '體用比和', '吉，諸事順遂'
+    elif _GENERATES[use_element] == body_element:
+        relation, verdict = '用生體', '大吉，有進益之喜'
+    elif _CONTROLS[body_element] == use_element:
+        relation, verdict = '體剋用', '吉，事可成但須費力'
+    elif _GENERATES[body_element] == use_element:
+        relation, verdict = '體生用', '耗洩，有損失之憂'
+    else:
+        relation, verdict = '用剋體', '凶，諸事不利'
+    return {
+        'body': TRIGRAMS[body][0],
+        'use': TRIGRAMS[use][0],
+        'body_element': body_element,
+        'use_element': use_element,
+        'relation': relation,
+        'verdict': verdict,
+    }
+
+
+if __name__ == '__main__':
+    import sys
+
+    from mingli_yijing_cast import hexagram_number, moving_line_numbers, primary_hexagram, resulting_hexagram
+
+    if len(sys.argv) != 4:
+        print("用法：python mingli_meihua.py 年 農曆月 農曆日")
+        sys.exit(1)
+    year, month, day = (int(value) for value in sys.argv[1:])
+    print(f"【梅花易數・時間起卦】{year}年 農曆{month}月{day}日")
+    for branch, reading in zip(BaziAnalyzer.EARTHLY_BRANCHES, day_time_readings(year, month, day)):
+        upper, lower = TRIGRAMS[reading >> 3 & 7], TRIGRAMS[reading & 7]
+        print(f"  {branch}時  {upper[1]}{lower[1]}  第{hexagram_number(primary_hexagram(reading)):>2}卦"
+              f"  第 {moving_line_numbers(reading)[0]} 爻動 → 第{hexagram_number(resulting_hexagram(reading)):>2}卦")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+分析流程編排模組
+以有向無環圖描述各分析節點的輸入與輸出：
+共用的中間結果（四柱、星座索引、紫微命盤等）每次只計算一次，
+互不相依的節點以執行緒並行執行。
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Set
+
+
+class AnalysisNode:
+    """分析節點：以 inputs 指定的值為參數呼叫 func，輸出存於節點名稱之下"""
+
+    def __init__(self, name: str, func: Callable, inputs: Sequence[str] = ()):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+
+    def __repr__(self):
+        return f"AnalysisNode({self.name!r}, inputs={self.inputs!r})"
+
+
+class AnalysisGraph:
+    """分析流程圖（依相依關係排程，獨立節點並行執行）"""
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers: 並行執行的最大執行緒數（1 為依序執行）
+        """
+        self.max_workers = max_workers
+        self.nodes: Dict[str, AnalysisNode] = {}
+
+    def add_node(self, name: str, func: Callable, inputs: Sequence[str] = ()) -> AnalysisNode:
+        """加入節點；名稱重複時拋出 ValueError"""
+        if name in self.nodes:
+            raise ValueError(f"節點名稱重複: {name}")
+        node = AnalysisNode(name, func, inputs)
+        self.nodes[name] = node
+        return node
+
+    def _required_nodes(self, targets: Iterable[str], context: Dict[str, Any]) -> Set[str]:
+        """找出產生 targets 所需的全部節點"""
+        required = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in required or name in context:
+                continue
+            node = self.nodes.get(name)
+            if node is None:
+                raise KeyError(f"找不到輸入或節點: {name}")
+            required.add(name)
+            stack.extend(node.inputs)
+        return required
+
+    def run(self, context: Dict[str, Any], targets: Optional[Iterable[str]] = None,
+            on_node_done: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        執行流程圖
+
+        Args:
+            context: 初始輸入值（如出生資料）
+            targets: 需要的輸出名稱（預設為全部節點）
+            on_node_done: 節點完成時的回呼，於呼叫端執行緒中呼叫（可安全更新介面）
+
+        Returns:
+            包含初始輸入與所有已計算節點輸出的字典
+
+        任一節點拋出例外時，取消尚未開始的節點並將例外向上拋出。
+        """
+        values = dict(context)
+        pending = self._required_nodes(self.nodes if targets is None else targets, values)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                ready = [name for name in pending
+                         if all(dep in values for dep in self.nodes[name].inputs)]
+                for name in ready:
+                    node = self.nodes[name]
+                    args = [values[dep] for dep in node.inputs]
+                    running[executor.submit(node.func, *args)] = name
+                    pending.discard(name)
+
+                if not running:
+                    raise ValueError(f"流程圖存在循環相依: {sorted(pending)}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        values[name] = future.result()
+                    except Exception:
+                        for other in running:
+                            other.cancel()
+                        raise
+                    if on_node_done is not None:
+                        on_node_done(name)
+
+        return values
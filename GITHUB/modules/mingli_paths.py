@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+使用者目錄模組
+背景圖、星曆檔等可重建的快取檔共用同一個使用者快取目錄。
+"""
+
+import os
+import sys
+from pathlib import Path
+
+
+def user_cache_dir(name: str) -> Path:
+    """使用者快取目錄下的子目錄（Windows: %LOCALAPPDATA%，macOS: ~/Library/Caches，其他: $XDG_CACHE_HOME）"""
+    if sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return base / 'FATESuite' / name
@@ -7,9 +7,94 @@
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Tuple, Optional
 import random
 
+from mingli_resources import ResourceTable
+
+
+class LazyZiweiResult(dict):
+    """
+    紫微命盤結果：文字段落於首次讀取時才渲染並保存
+    
+    與一般 dict 相容（索引、get、in、迭代、format_result 皆可用）；
+    迭代、計數或複製時會先補齊所有段落，並維持原本的鍵順序。
+    """
+
+    def __init__(self, data: Dict, render: Callable[[str], str], section_names: Iterable[str]):
+        super().__init__(data)
+        self._render = render
+        self._section_names = tuple(section_names)
+        self._pending = set(self._section_names)
+
+    def __missing__(self, key):
+        if key not in self._pending:
+            raise KeyError(key)
+        self._pending.discard(key)
+        text = self._render(key)
+        super().__setitem__(key, text)
+        return text
+
+    def _materialize(self):
+        """補齊尚未渲染的段落，並依段落順序排列於結果尾端"""
+        if not self._pending:
+            return
+        for name in self._section_names:
+            text = super().pop(name) if dict.__contains__(self, name) else self._render(name)
+            super().__setitem__(name, text)
+        self._pending.clear()
+
+    def __contains__(self, key):
+        return key in self._pending or super().__contains__(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, *default):
+        if key in self._pending:
+            self[key]
+        return super().pop(key, *default)
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __len__(self):
+        self._materialize()
+        return super().__len__()
+
+    def __eq__(self, other):
+        self._materialize()
+        if isinstance(other, LazyZiweiResult):
+            other._materialize()
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._materialize()
+        return super().__repr__()
+
+    def keys(self):
+        self._materialize()
+        return super().keys()
+
+    def values(self):
+        self._materialize()
+        return super().values()
+
+    def items(self):
+        self._materialize()
+        return super().items()
+
+    def copy(self) -> Dict:
+        self._materialize()
+        return dict(self.items())
+
 
 class PurpleStarAnalyzer:
     """紫微論命分析器 - 基於紫微斗數系統"""
@@ -73,10 +158,170 @@ class PurpleStarAnalyzer:
         '癸': ['天府化祿', '武曲化權', '紫微化科', '天機化忌']
     }
 
+    # 命盤交換格式的星曜編號（主星 + 四化用到的其他星曜）
+    CHART_STARS = tuple(MAIN_STARS) + ('太陽', '太陰', '左輔')
+    CHART_STAR_INDEX = {star: i for i, star in enumerate(CHART_STARS)}
+
+    # 四化順序
+    TRANSFORMATION_TYPES = ('化祿', '化權', '化科', '化忌')
+
+    # 命盤交換格式版本
+    CHART_VERSION = 1
+
+    # 命盤文字段落
+    SECTION_NAMES = ('palace_analysis', 'personality', 'fortune', 'career', 'love', 'overall')
+
+    # 命盤骨架表：(命宮索引, 性別, 年干索引) → 骨架，於模組載入時建立
+    CHART_SKELETONS: Dict[Tuple[int, str, int], Dict] = {}
+
+    # 宮位意義、主星入宮影響與性格、事業、愛情對照（第一次渲染段落時才載入）
+    palace_meanings = ResourceTable('_init_palace_meanings')
+    star_palace_effects = ResourceTable('_init_star_palace_effects')
+    star_general_effects = ResourceTable('_init_star_general_effects')
+    personality_map = ResourceTable('_init_personality_map')
+    career_map = ResourceTable('_init_career_map')
+    love_map = ResourceTable('_init_love_map')
+
     def __init__(self):
         """初始化紫微論命分析器"""
         pass
 
+    def _init_palace_meanings(self):
+        """十二宮位意義"""
+        return {
+            '命宮': '主管一生命运、性格气质、外在形象',
+            '兄弟宮': '主管手足关系、朋友相处、合作伙伴',
+            '夫妻宮': '主管婚姻感情、配偶特质、感情状态',
+            '子女宮': '主管子女缘分、创造力、生育能力',
+            '財帛宮': '主管财运状况、理财能力、财富累积',
+            '疾厄宮': '主管健康体质、疾病倾向、意外灾害',
+            '遷移宮': '主管外出运势、人际关系、贵人助力',
+            '奴僕宮': '主管下属关系、朋友质量、交友状况',
+            '官祿宮': '主管事业发展、工作表现、社会地位',
+            '田宅宮': '主管不动产、家庭环境、置产能力',
+            '福德宮': '主管精神生活、兴趣爱好、享受能力',
+            '父母宮': '主管父母缘分、长辈关系、家庭背景'
+        }
+
+    def _init_star_palace_effects(self):
+        """主星在特定宮位的影響"""
+        return {
+            ('紫微', '命宮'): '帝王之命，領導力強，氣度不凡',
+            ('紫微', '財帛宮'): '財運亨通，善於理財，富貴有餘',
+            ('紫微', '官祿宮'): '事業有成，官運亨通，位高權重',
+            ('紫微', '夫妻宮'): '配偶優秀，婚姻美滿，家庭和諧',
+
+            ('天機', '命宮'): '聰明機智，反應敏捷，善於策劃',
+            ('天機', '財帛宮'): '財運多變，靈活理財，適合投資',
+            ('天機', '官祿宮'): '適合動腦工作，策劃能力強',
+            ('天機', '夫妻宮'): '夫妻溝通良好，思想契合',
+
+            ('天府', '命宮'): '穩重厚道，領導力強，受人信賴',
+            ('天府', '財帛宮'): '財庫豐盈，理財有道，財運穩健',
+            ('天府', '官祿宮'): '管理能力強，事業穩定發展',
+            ('天府', '田宅宮'): '置產能力強，家業興旺',
+
+            ('武曲', '命宮'): '剛毅果決，執行力強，意志堅定',
+            ('武曲', '財帛宮'): '財星入財宮，財運極佳，善於賺錢',
+            ('武曲', '官祿宮'): '事業心強，執行力佳，成就可期',
+
+            ('天同', '命宮'): '樂觀開朗，福氣深厚，人緣極佳',
+            ('天同', '福德宮'): '精神富足，知足常樂，享福之命',
+            ('天同', '夫妻宮'): '感情和諧，夫妻恩愛，家庭幸福',
+
+            ('廉貞', '命宮'): '熱情主動，富有魅力，變化多端',
+            ('廉貞', '官祿宮'): '適合創意工作，變化性強',
+            ('廉貞', '夫妻宮'): '感情豐富，但需注意波折',
+
+            ('天相', '命宮'): '心地善良，為人老實，能成大事',
+            ('天相', '夫妻宮'): '配偶賢良，婚姻穩定',
+            ('天相', '官祿宮'): '適合輔助工作，貴人運強',
+
+            ('貪狼', '命宮'): '多才多藝，創意十足，社交能力強',
+            ('貪狼', '財帛宮'): '財運多變，偏財運佳',
+            ('貪狼', '夫妻宮'): '桃花運旺，但需謹慎感情',
+
+            ('巨門', '命宮'): '口才極佳，思慮深遠，但易多疑',
+            ('巨門', '官祿宮'): '適合教育、諮詢、溝通類工作',
+            ('巨門', '夫妻宮'): '需注意溝通，避免口舌是非',
+
+            ('破軍', '命宮'): '開創力強，勇於改革，衝勁十足',
+            ('破軍', '官祿宮'): '適合開創新事業，變革能力強',
+            ('破軍', '夫妻宮'): '感情變化大，需要包容',
+
+            ('七殺', '命宮'): '獨立性強，執行力佳，領導才能',
+            ('七殺', '官祿宮'): '事業衝勁足，適合競爭行業',
+            ('七殺', '財帛宮'): '財運波動，需穩健理財',
+        }
+
+    def _init_star_general_effects(self):
+        """主星對宮位的通用影響"""
+        return {
+            '紫微': '帶來貴氣和領導力，提升該宮位能量',
+            '天機': '帶來智慧和變化，增強靈活性',
+            '天府': '帶來穩定和富足，增強保守力',
+            '武曲': '帶來剛毅和財運，增強執行力',
+            '天同': '帶來福氣和和諧，增強親和力',
+            '廉貞': '帶來熱情和變化，增強魅力',
+            '天梁': '帶來穩重和智慧，增強化解力',
+            '天相': '帶來善良和輔助，增強協調力',
+            '貪狼': '帶來多才和創意，增強社交力',
+            '巨門': '帶來口才和思慮，需注意溝通',
+            '破軍': '帶來開創和改革，增強變革力',
+            '七殺': '帶來獨立和執行，增強競爭力',
+        }
+
+    def _init_personality_map(self):
+        """命宮主星性格對照"""
+        return {
+            '紫微': '你是天生的領導者，氣度不凡，為人剛正，有帝王之氣。',
+            '天機': '你聰慧靈動，心思聰明，反應敏捷，適合從事需要腦力的工作。',
+            '天梁': '你穩重大氣，福壽雙全，能化解困難，是天生的智者和保護者。',
+            '天同': '你樂觀開朗，福氣十足，溫和親切，容易和他人相處。',
+            '武曲': '你決斷力強，財運亨通，執行力強，適合經營和管理。',
+            '天府': '你理財能力強，為人厚道，領導力佳，是天生的管理者。',
+            '廉貞': '你熱情主動，有色彩，變動性強，適合創意工作。',
+            '貪狼': '你好色貪心，變化多端，創意十足，適合銷售和市場工作。',
+            '巨門': '你多言多語，但有深度，適合教育和諮詢工作。',
+            '天相': '你心善，為人老實，能成大事，是天生的輔助者。',
+            '破軍': '你衝動急躁，破壞欲強，但有衝勁，適合改革和創新。',
+            '七殺': '你執行力強，統領能力好，但衝動易失控，需要自我修養。',
+        }
+
+    def _init_career_map(self):
+        """官祿宮主星事業對照"""
+        return {
+            '紫微': '適合從政、領導、高管職位。',
+            '天機': '適合研究、分析、教育、設計工作。',
+            '天梁': '適合公務員、教師、諮詢工作。',
+            '天同': '適合藝術、服務、公關、人資工作。',
+            '武曲': '適合財務、商業、管理工作。',
+            '天府': '適合企業管理、投資、房地產工作。',
+            '廉貞': '適合銷售、市場、創意、表演工作。',
+            '貪狼': '適合銷售、外交、創業工作。',
+            '巨門': '適合律師、記者、教育、諮詢工作。',
+            '天相': '適合公務員、人資、行政工作。',
+            '破軍': '適合軍警、改革、創新、創業工作。',
+            '七殺': '適合軍警、體育、競爭行業工作。',
+        }
+
+    def _init_love_map(self):
+        """夫妻宮主星愛情對照"""
+        return {
+            '紫微': '婚姻穩定，擅長經營感情生活。',
+            '天機': '聰慧聰敏，但易於多情，需要理性選擇。',
+            '天梁': '夫妻恩愛，家庭幸福，婚姻穩定。',
+            '天同': '感情順暢，容易得到異性青睞。',
+            '武曲': '婚姻以利益為主，需要經濟基礎。',
+            '天府': '夫妻關係和諧，適合早婚。',
+            '廉貞': '感情豐富，但易有波折和變動。',
+            '貪狼': '好色多情，易有婚外情，需要自律。',
+            '巨門': '交流充分，夫妻多談論，易有磨擦。',
+            '天相': '感情老實，婚姻穩定，為人體貼。',
+            '破軍': '婚姻易有波折，需要相互包容。',
+            '七殺': '感情冷漠，但一旦決定則堅持到底。',
+        }
+
     def analyze_ziwei(self, year: int, month: int, day: int, 
                      hour: int = 12, gender: str = 'M') -> Dict:
         """
@@ -90,7 +335,8 @@ class PurpleStarAnalyzer:
             gender: 性別 ('M' 男, 'F' 女)
             
         Returns:
-            紫微命盤分析結果
+            紫微命盤分析結果（LazyZiweiResult；palace_analysis、personality、fortune、
+            career、love、overall 等文字段落於首次讀取時才渲染）
         """
         if not (1 <= month <= 12 and 1 <= day <= 31 and 0 <= hour <= 23):
             return {
@@ -100,62 +346,26 @@ class PurpleStarAnalyzer:
             }
         
         try:
-            # 1. 計算命宮
+            # 命宮、年干、生肖只取決於少數索引，其餘內容由命盤骨架表查得
             year_index = (year - 1900) % 12
             month_index = (month - 1) % 12
-            day_index = (day - 1) % 12
             hour_index = (hour // 2) % 12
-            
-            # 簡化版：根據日期計算命宮位置
             ming_gong_index = (month_index + hour_index) % 12
-            ming_gong_palace = self.PALACES[ming_gong_index]
-            ming_gong_branch = self.BRANCHES[ming_gong_index]
-            
-            # 2. 排列十四主星
-            main_stars = self._arrange_main_stars(ming_gong_index, gender)
-            
-            # 3. 計算四化星
             year_stem_index = (year - 1900) % 10
-            year_stem = self.STEMS[year_stem_index]
-            transformations = self._get_transformations(year_stem)
-            
-            # 4. 計算納音五行和生肖
-            zodiac = self.ZODIACS[year_index]
-            nayin = self._calculate_nayin(year)
             
-            # 5. 生成命盤分析
-            palace_analysis = self._analyze_palaces(main_stars, ming_gong_index)
+            skeleton = self.CHART_SKELETONS[self._skeleton_key(ming_gong_index, gender, year_stem_index)]
             
-            # 6. 生成性格分析
-            personality = self._analyze_personality(main_stars, gender)
-            
-            # 7. 生成財運、事業、愛情分析
-            fortune = self._analyze_fortune(main_stars, transformations)
-            career = self._analyze_career(main_stars, ming_gong_index)
-            love = self._analyze_love(main_stars, gender)
-            
-            result = {
+            return LazyZiweiResult({
                 'success': True,
+                'chart': skeleton['chart'],
                 'date': f"{year}年{month:02d}月{day:02d}日 {hour:02d}時",
                 'gender': '男' if gender == 'M' else '女',
-                'zodiac': zodiac,
-                'nayin': nayin,
-                'ming_gong': {
-                    'palace': ming_gong_palace,
-                    'branch': ming_gong_branch,
-                    'index': ming_gong_index
-                },
-                'main_stars': main_stars,
-                'transformations': transformations,
-                'palace_analysis': palace_analysis,
-                'personality': personality,
-                'fortune': fortune,
-                'career': career,
-                'love': love,
-                'overall': self._generate_overall_analysis(main_stars, personality, fortune)
-            }
-            
-            return result
+                'zodiac': self.ZODIACS[year_index],
+                'nayin': skeleton['nayin'],
+                'ming_gong': skeleton['ming_gong'],
+                'main_stars': skeleton['main_stars'],
+                'transformations': skeleton['transformations'],
+            }, partial(self._render_section, skeleton), self.SECTION_NAMES)
             
         except Exception as e:
             return {
@@ -164,6 +374,107 @@ class PurpleStarAnalyzer:
                 'message': '紫微論命失敗，請檢查輸入的日期和時間是否正確'
             }
 
+    @staticmethod
+    def _skeleton_key(ming_gong_index: int, gender: str, year_stem_index: int) -> Tuple[int, str, int]:
+        """命盤骨架表的索引鍵（性別只區分 'M' 與其他）"""
+        return ming_gong_index, 'M' if gender == 'M' else 'F', year_stem_index
+
+    def _build_chart_skeletons(self) -> Dict[Tuple[int, str, int], Dict]:
+        """
+        建立所有命盤骨架（12 命宮 × 2 性別 × 10 年干）
+        
+        骨架包含主星配置、四化、納音與命盤交換格式，文字段落於首次使用時才渲染。
+        骨架內容由所有查詢結果共用，呼叫端應視為唯讀。
+        """
+        skeletons = {}
+        for ming_gong_index in range(12):
+            main_stars = self._arrange_main_stars(ming_gong_index)
+            ming_gong = {
+                'palace': self.PALACES[ming_gong_index],
+                'branch': self.BRANCHES[ming_gong_index],
+                'index': ming_gong_index
+            }
+            for gender in ('M', 'F'):
+                for year_stem_index, year_stem in enumerate(self.STEMS):
+                    transformations = self._get_transformations(year_stem)
+                    skeletons[(ming_gong_index, gender, year_stem_index)] = {
+                        'main_stars': main_stars,
+                        'ming_gong': ming_gong,
+                        'gender': gender,
+                        'transformations': transformations,
+                        # 納音只取決於年干（1900 年為庚年，年干索引與納音表一致）
+                        'nayin': self._calculate_nayin(1900 + year_stem_index),
+                        'chart': self.build_chart(main_stars, ming_gong_index, gender,
+                                                  year_stem_index, transformations),
+                        'sections': {}
+                    }
+        return skeletons
+
+    def _render_section(self, skeleton: Dict, name: str) -> str:
+        """渲染命盤骨架的文字段落（每個骨架的每個段落只渲染一次）"""
+        sections = skeleton['sections']
+        text = sections.get(name)
+        if text is not None:
+            return text
+        
+        main_stars = skeleton['main_stars']
+        if name == 'palace_analysis':
+            text = self._analyze_palaces(main_stars, skeleton['ming_gong']['index'])
+        elif name == 'personality':
+            text = self._analyze_personality(main_stars, skeleton['gender'])
+        elif name == 'fortune':
+            text = self._analyze_fortune(main_stars, skeleton['transformations'])
+        elif name == 'career':
+            text = self._analyze_career(main_stars, skeleton['ming_gong']['index'])
+        elif name == 'love':
+            text = self._analyze_love(main_stars, skeleton['gender'])
+        elif name == 'overall':
+            text = self._generate_overall_analysis(main_stars,
+                                                   self._render_section(skeleton, 'personality'),
+                                                   self._render_section(skeleton, 'fortune'))
+        else:
+            raise KeyError(name)
+        
+        sections[name] = text
+        return text
+
+    def build_chart(self, main_stars: Dict, ming_gong_index: int, gender: str,
+                    year_stem_index: int, transformations: Dict) -> Dict:
+        """
+        產生精簡命盤交換格式（供配偶合盤等模組直接使用，不需解析文字）
+        
+        Returns:
+            {
+                'version': 格式版本,
+                'ming_gong_index': 命宮索引 (0-11),
+                'gender': 'M' / 'F',
+                'year_stem_index': 年干索引 (0-9),
+                'palace_stars': 依 PALACES 順序的主星編號 (CHART_STARS 索引),
+                'transformations': 祿權科忌四化星編號（無法辨識時為 -1）
+            }
+        """
+        return {
+            'version': self.CHART_VERSION,
+            'ming_gong_index': ming_gong_index,
+            'gender': gender,
+            'year_stem_index': year_stem_index,
+            'palace_stars': tuple(self.CHART_STAR_INDEX[main_stars[palace]['star']]
+                                  for palace in self.PALACES),
+            'transformations': tuple(self.CHART_STAR_INDEX.get(item[:-2], -1)
+                                     for item in transformations['transformations'])
+        }
+
+    @classmethod
+    def chart_palace_star(cls, chart: Dict, palace: str) -> str:
+        """從命盤交換格式取得指定宮位的主星名稱"""
+        return cls.CHART_STARS[chart['palace_stars'][cls.PALACES.index(palace)]]
+
+    @classmethod
+    def chart_transformations(cls, chart: Dict) -> List[str]:
+        """從命盤交換格式取得四化星（如 '廉貞化祿'）"""
+        return [f"{cls.CHART_STARS[star]}{kind}" if star >= 0 else f"未知{kind}"
+                for star, kind in zip(chart['transformations'], cls.TRANSFORMATION_TYPES)]
+
     def _arrange_main_stars(self, ming_gong_index: int, gender: str = 'M') -> Dict:
         """排列十四主星"""
         stars = {}
@@ -220,23 +531,8 @@ class PurpleStarAnalyzer:
             analysis += f"│ 特質：{star_desc:46s}│\n"
             
             # 根据宫位添加具体说明
-            palace_meanings = {
-                '命宮': '主管一生命运、性格气质、外在形象',
-                '兄弟宮': '主管手足关系、朋友相处、合作伙伴',
-                '夫妻宮': '主管婚姻感情、配偶特质、感情状态',
-                '子女宮': '主管子女缘分、创造力、生育能力',
-                '財帛宮': '主管财运状况、理财能力、财富累积',
-                '疾厄宮': '主管健康体质、疾病倾向、意外灾害',
-                '遷移宮': '主管外出运势、人际关系、贵人助力',
-                '奴僕宮': '主管下属关系、朋友质量、交友状况',
-                '官祿宮': '主管事业发展、工作表现、社会地位',
-                '田宅宮': '主管不动产、家庭环境、置产能力',
-                '福德宮': '主管精神生活、兴趣爱好、享受能力',
-                '父母宮': '主管父母缘分、长辈关系、家庭背景'
-            }
-            
-            if palace in palace_meanings:
-                analysis += f"│ 意义：{palace_meanings[palace]:46s}│\n"
+            if palace in self.palace_meanings:
+                analysis += f"│ 意义：{self.palace_meanings[palace]:46s}│\n"
             
             # 根据主星和宫位给出具体分析
             star_palace_analysis = self._get_star_palace_analysis(star_name, palace)
@@ -257,78 +553,13 @@ class PurpleStarAnalyzer:
     
     def _get_star_palace_analysis(self, star: str, palace: str) -> str:
         """获取主星在特定宫位的影响分析"""
-        # 主星在不同宫位的影响
-        star_palace_effects = {
-            ('紫微', '命宮'): '帝王之命，領導力強，氣度不凡',
-            ('紫微', '財帛宮'): '財運亨通，善於理財，富貴有餘',
-            ('紫微', '官祿宮'): '事業有成，官運亨通，位高權重',
-            ('紫微', '夫妻宮'): '配偶優秀，婚姻美滿，家庭和諧',
-            
-            ('天機', '命宮'): '聰明機智，反應敏捷，善於策劃',
-            ('天機', '財帛宮'): '財運多變，靈活理財，適合投資',
-            ('天機', '官祿宮'): '適合動腦工作，策劃能力強',
-            ('天機', '夫妻宮'): '夫妻溝通良好，思想契合',
-            
-            ('天府', '命宮'): '穩重厚道，領導力強，受人信賴',
-            ('天府', '財帛宮'): '財庫豐盈，理財有道，財運穩健',
-            ('天府', '官祿宮'): '管理能力強，事業穩定發展',
-            ('天府', '田宅宮'): '置產能力強，家業興旺',
-            
-            ('武曲', '命宮'): '剛毅果決，執行力強，意志堅定',
-            ('武曲', '財帛宮'): '財星入財宮，財運極佳，善於賺錢',
-            ('武曲', '官祿宮'): '事業心強，執行力佳，成就可期',
-            
-            ('天同', '命宮'): '樂觀開朗，福氣深厚，人緣極佳',
-            ('天同', '福德宮'): '精神富足，知足常樂，享福之命',
-            ('天同', '夫妻宮'): '感情和諧，夫妻恩愛，家庭幸福',
-            
-            ('廉貞', '命宮'): '熱情主動，富有魅力，變化多端',
-            ('廉貞', '官祿宮'): '適合創意工作，變化性強',
-            ('廉貞', '夫妻宮'): '感情豐富，但需注意波折',
-            
-            ('天相', '命宮'): '心地善良，為人老實，能成大事',
-            ('天相', '夫妻宮'): '配偶賢良，婚姻穩定',
-            ('天相', '官祿宮'): '適合輔助工作，貴人運強',
-            
-            ('貪狼', '命宮'): '多才多藝，創意十足，社交能力強',
-            ('貪狼', '財帛宮'): '財運多變，偏財運佳',
-            ('貪狼', '夫妻宮'): '桃花運旺，但需謹慎感情',
-            
-            ('巨門', '命宮'): '口才極佳，思慮深遠，但易多疑',
-            ('巨門', '官祿宮'): '適合教育、諮詢、溝通類工作',
-            ('巨門', '夫妻宮'): '需注意溝通，避免口舌是非',
-            
-            ('破軍', '命宮'): '開創力強，勇於改革，衝勁十足',
-            ('破軍', '官祿宮'): '適合開創新事業，變革能力強',
-            ('破軍', '夫妻宮'): '感情變化大，需要包容',
-            
-            ('七殺', '命宮'): '獨立性強，執行力佳，領導才能',
-            ('七殺', '官祿宮'): '事業衝勁足，適合競爭行業',
-            ('七殺', '財帛宮'): '財運波動，需穩健理財',
-        }
-        
         # 优先返回特定组合的分析
         key = (star, palace)
-        if key in star_palace_effects:
-            return star_palace_effects[key]
+        if key in self.star_palace_effects:
+            return self.star_palace_effects[key]
         
         # 如果没有特定组合，返回通用分析
-        general_effects = {
-            '紫微': '帶來貴氣和領導力，提升該宮位能量',
-            '天機': '帶來智慧和變化，增強靈活性',
-            '天府': '帶來穩定和富足，增強保守力',
-            '武曲': '帶來剛毅和財運，增強執行力',
-            '天同': '帶來福氣和和諧，增強親和力',
-            '廉貞': '帶來熱情和變化，增強魅力',
-            '天梁': '帶來穩重和智慧，增強化解力',
-            '天相': '帶來善良和輔助，增強協調力',
-            '貪狼': '帶來多才和創意，增強社交力',
-            '巨門': '帶來口才和思慮，需注意溝通',
-            '破軍': '帶來開創和改革，增強變革力',
-            '七殺': '帶來獨立和執行，增強競爭力',
-        }
-        
-        return general_effects.get(star, '影響該宮位的發展')
+        return self.star_general_effects.get(star, '影響該宮位的發展')
 
     def _analyze_personality(self, main_stars: Dict, gender: str = 'M') -> str:
         """分析性格"""
@@ -336,22 +567,7 @@ class PurpleStarAnalyzer:
         
         ming_gong_star = main_stars.get('命宮', {}).get('star', '紫微')
         
-        personality_map = {
-            '紫微': '你是天生的領導者，氣度不凡，為人剛正，有帝王之氣。',
-            '天機': '你聰慧靈動，心思聰明，反應敏捷，適合從事需要腦力的工作。',
-            '天梁': '你穩重大氣，福壽雙全，能化解困難，是天生的智者和保護者。',
-            '天同': '你樂觀開朗，福氣十足，溫和親切，容易和他人相處。',
-            '武曲': '你決斷力強，財運亨通，執行力強，適合經營和管理。',
-            '天府': '你理財能力強，為人厚道，領導力佳，是天生的管理者。',
-            '廉貞': '你熱情主動，有色彩，變動性強，適合創意工作。',
-            '貪狼': '你好色貪心，變化多端，創意十足，適合銷售和市場工作。',
-            '巨門': '你多言多語，但有深度，適合教育和諮詢工作。',
-            '天相': '你心善，為人老實，能成大事，是天生的輔助者。',
-            '破軍': '你衝動急躁，破壞欲強，但有衝勁，適合改革和創新。',
-            '七殺': '你執行力強，統領能力好，但衝動易失控，需要自我修養。',
-        }
-        
-        analysis += personality_map.get(ming_gong_star, '個性複雜多變。')
+        analysis += self.personality_map.get(ming_gong_star, '個性複雜多變。')
         
         return analysis
 
@@ -379,22 +595,7 @@ class PurpleStarAnalyzer:
         
         guan_gong_star = main_stars.get('官祿宮', {}).get('star', '紫微')
         
-        career_map = {
-            '紫微': '適合從政、領導、高管職位。',
-            '天機': '適合研究、分析、教育、設計工作。',
-            '天梁': '適合公務員、教師、諮詢工作。',
-            '天同': '適合藝術、服務、公關、人資工作。',
-            '武曲': '適合財務、商業、管理工作。',
-            '天府': '適合企業管理、投資、房地產工作。',
-            '廉貞': '適合銷售、市場、創意、表演工作。',
-            '貪狼': '適合銷售、外交、創業工作。',
-            '巨門': '適合律師、記者、教育、諮詢工作。',
-            '天相': '適合公務員、人資、行政工作。',
-            '破軍': '適合軍警、改革、創新、創業工作。',
-            '七殺': '適合軍警、體育、競爭行業工作。',
-        }
-        
-        analysis += career_map.get(guan_gong_star, '選擇適合自己的工作最重要。')
+        analysis += self.career_map.get(guan_gong_star, '選擇適合自己的工作最重要。')
         
         return analysis
 
@@ -404,22 +605,7 @@ class PurpleStarAnalyzer:
         
         fu_mao_star = main_stars.get('夫妻宮', {}).get('star', '天同')
         
-        love_map_male = {
-            '紫微': '婚姻穩定，擅長經營感情生活。',
-            '天機': '聰慧聰敏，但易於多情，需要理性選擇。',
-            '天梁': '夫妻恩愛，家庭幸福，婚姻穩定。',
-            '天同': '感情順暢，容易得到異性青睞。',
-            '武曲': '婚姻以利益為主，需要經濟基礎。',
-            '天府': '夫妻關係和諧，適合早婚。',
-            '廉貞': '感情豐富，但易有波折和變動。',
-            '貪狼': '好色多情，易有婚外情，需要自律。',
-            '巨門': '交流充分，夫妻多談論，易有磨擦。',
-            '天相': '感情老實，婚姻穩定，為人體貼。',
-            '破軍': '婚姻易有波折，需要相互包容。',
-            '七殺': '感情冷漠，但一旦決定則堅持到底。',
-        }
-        
-        analysis += love_map_male.get(fu_mao_star, '感情需要認真經營。')
+        analysis += self.love_map.get(fu_mao_star, '感情需要認真經營。')
         
         return analysis
 
@@ -452,7 +638,7 @@ class PurpleStarAnalyzer:
         
         output = ""
         output += f"🟣 紫微論命分析\n"
-        output += f"{"="*50}\n\n"
+        output += f"{'='*50}\n\n"
         output += f"📅 出生時間: {result['date']}\n"
         output += f"👥 性別: {result['gender']}\n"
         output += f"🐉 生肖: {result['zodiac']}\n"
@@ -471,6 +657,10 @@ class PurpleStarAnalyzer:
         return output
 
 
+# 模組載入時建立全部命盤骨架（共 240 組）
+PurpleStarAnalyzer.CHART_SKELETONS.update(PurpleStarAnalyzer()._build_chart_skeletons())
+
+
 # 快速查詢版本
 class SimplePurpleStarCalculator:
     """簡化版紫微計算器"""
@@ -490,7 +680,7 @@ class SimplePurpleStarCalculator:
         zodiac = SimplePurpleStarCalculator.ZODIACS[year_index]
         
         output = f"【紫微論命快速查詢】\n"
-        output += f"{"="*40}\n"
+        output += f"{'='*40}\n"
         output += f"出生時間: {year}年{month}月{day}日 {hour}時 ({gender})\n"
         output += f"生肖: {zodiac}\n"
         output += f"命宮地支: {branch}\n\n"
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+靜態資料表資源包模組
+分析器建構時的大型對照表（筆畫、數理吉凶、卦象、塔羅牌義等）於打包時預先序列化
+為單一資源檔，執行時以記憶體映射開啟，各表於第一次使用時才解碼：
+
+    檔頭     魔術字、版本、索引長度
+    索引     marshal 編碼的 {表名: (位元組位移, 長度)}
+    資料區   各表的 marshal 編碼
+
+分析器以 ResourceTable 宣告資料表；資源檔不存在、格式不符或缺少該表時，
+改呼叫原本的建表方法，結果完全相同。
+"""
+
+import importlib
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+RESOURCE_BUNDLE_FILENAME = 'mingli_tables.bin'
+RESOURCE_BUNDLE_VERSION = 1
+
+# 以 ResourceTable 宣告資料表的模組（產生資源檔時逐一匯入）
+RESOURCE_MODULES = (
+    'mingli_jiugong',
+    'mingli_jiugong_name',
+    'mingli_jiugong_name_enhanced',
+    'mingli_purplestar_analyzer',
+    'mingli_tarot',
+    'mingli_yijing',
+)
+
+_MAGIC = b'MLRES\x00\x00\x01'
+_HEADER = struct.Struct('<8sII')
+
+# 表名 → ResourceTable（於類別定義時登錄）
+_REGISTRY: Dict[str, 'ResourceTable'] = {}
+
+
+def default_bundle_path() -> Path:
+    """資源檔預設位置（與本模組同目錄，隨程式一起打包）"""
+    return Path(__file__).with_name(RESOURCE_BUNDLE_FILENAME)
+
+
+class ResourceBundle:
+    """記憶體映射的資源檔（只讀檔頭與索引，資料表於讀取時才解碼）"""
+
+    def __init__(self, path: Path):
+        """
+        開啟資源檔
+
+        檔案格式或版本不符時拋出 ValueError。
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, index_length = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC or version != RESOURCE_BUNDLE_VERSION:
+                raise ValueError(f"不支援的資源檔: {self.path}")
+            self.index: Dict[str, Tuple[int, int]] = marshal.loads(
+                self._mmap[_HEADER.size:_HEADER.size + index_length])
+            self.mtime = os.stat(self.path).st_mtime
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def load(self, name: str) -> Any:
+        """解碼單一資料表（每次回傳新物件，呼叫端可自由修改）"""
+        offset, length = self.index[name]
+        return marshal.loads(self._mmap[offset:offset + length])
+
+    def close(self):
+        self._mmap.close()
+
+
+_bundle: Optional[ResourceBundle] = None
+_bundle_loaded = False
+_bundle_lock = threading.Lock()
+
+
+def get_resource_bundle() -> Optional[ResourceBundle]:
+    """共用的資源檔（第一次呼叫時開啟；不存在或無法讀取時回傳 None）"""
+    global _bundle, _bundle_loaded
+    if not _bundle_loaded:
+        with _bundle_lock:
+            if not _bundle_loaded:
+                path = default_bundle_path()
+                if path.exists():
+                    try:
+                        _bundle = ResourceBundle(path)
+                    except (OSError, ValueError, EOFError) as e:
+                        print(f"[WARNING] 資源檔無法讀取，改用內建資料表: {e}")
+                _bundle_loaded = True
+    return _bundle
+
+
+def _source_is_newer(module_name: str, bundle: ResourceBundle) -> bool:
+    """開發環境中原始碼比資源檔新時，資源檔可能已過期（只有 .py 原始碼時才檢查）"""
+    module = sys.modules.get(module_name)
+    source = getattr(module, '__file__', None)
+    if not source or not source.endswith('.py'):
+        return False
+    try:
+        return os.stat(source).st_mtime > bundle.mtime
+    except OSError:
+        return False
+
+
+class ResourceTable:
+    """
+    延遲載入的資料表屬性
+
+    用法（類別內）：
+        stroke_dict = ResourceTable('_init_stroke_dict')
+
+    第一次讀取 instance.stroke_dict 時從資源檔解碼（或呼叫建表方法），
+    並存入實例屬性，之後直接讀取，不再經過本描述器。
+    """
+
+    def __init__(self, builder: str):
+        """
+        Args:
+            builder: 建表方法名稱（不需參數，回傳可由 marshal 序列化的資料）
+        """
+        self.builder = builder
+        self.attribute = None
+        self.name = None
+        self.module = None
+
+    def __set_name__(self, owner, attribute):
+        self.attribute = attribute
+        self.module = owner.__module__
+        self.name = f'{owner.__module__}.{owner.__qualname__}.{attribute}'
+        _REGISTRY[self.name] = self
+
+    def build(self, instance) -> Any:
+        """呼叫原本的建表方法"""
+        return getattr(instance, self.builder)()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        bundle = get_resource_bundle()
+        if bundle is not None and self.name in bundle and not _source_is_newer(self.module, bundle):
+            value = bundle.load(self.name)
+        else:
+            value = self.build(instance)
+        instance.__dict__[self.attribute] = value
+        return value
+
+
+def build_resource_bundle(path: Optional[Path] = None,
+                          progress: Optional[Callable[[str], None]] = None) -> Dict[str, Tuple[int, int]]:
+    """
+    產生資源檔（打包前執行）
+
+    匯入 RESOURCE_MODULES 中的模組，以未初始化的實例呼叫各表的建表方法，
+    確認 marshal 往返結果一致後寫入。
+
+    Returns:
+        索引 {表名: (位元組位移, 長度)}
+    """
+    path = default_bundle_path() if path is None else Path(path)
+    for module_name in RESOURCE_MODULES:
+        importlib.import_module(module_name)
+
+    blobs = []
+    for name, table in sorted(_REGISTRY.items()):
+        owner = sys.modules[table.module]
+        cls = owner
+        for part in name[len(table.module) + 1:].split('.')[:-1]:
+            cls = getattr(cls, part)
+        value = table.build(cls.__new__(cls))
+        blob = marshal.dumps(value)
+        if marshal.loads(blob) != value:
+            raise ValueError(f"資料表無法以 marshal 保存: {name}")
+        blobs.append((name, blob))
+        if progress:
+            progress(name)
+
+    # 索引長度與位移互相影響：先以暫定位移計算索引長度，位移固定寬度後即不再變動
+    index = {name: (0xFFFFFFFF, len(blob)) for name, blob in blobs}
+    index_length = len(marshal.dumps(index))
+    offset = _HEADER.size + index_length
+    for name, blob in blobs:
+        index[name] = (offset, len(blob))
+        offset += len(blob)
+    index_blob = marshal.dumps(index)
+    index_blob += b'\x00' * (index_length - len(index_blob))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, RESOURCE_BUNDLE_VERSION, index_length))
+        f.write(index_blob)
+        for _, blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return index
+
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == 'build':
+        # 分析器登錄在 mingli_resources 模組（而非 __main__）的表中，需經由匯入呼叫
+        from mingli_resources import build_resource_bundle as build
+        output = Path(sys.argv[2]) if len(sys.argv) >= 3 else default_bundle_path()
+        index = build(output, progress=lambda name: print(f"序列化 {name}"))
+        print(f"✓ 資源檔已產生：{output}（{len(index)} 張表，{output.stat().st_size // 1024} KB）")
+    else:
+        print("用法：python mingli_resources.py build [輸出路徑]")
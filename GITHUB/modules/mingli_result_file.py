@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命理分析結果檔模組
+結構化、具版本的結果檔（JSON Lines，副檔名 .mingli）：
+
+    第 1 行  檔頭：格式名稱、版本、建立時間、索引位置（固定寬度，可原地回填）
+    第 2 行起 各區段：inputs（輸入資料）、results（結構化結果）、text:<報告名稱>（報告文字）
+    最後一行 區段索引：{區段名稱: [位元組位移, 長度]}
+
+讀取時只讀檔頭與索引，再依索引直接跳到所需區段，不必讀入並切割整個檔案。
+TXT 報告另由 export_text_report 輸出，兩者互不影響。
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+RESULT_FILE_FORMAT = 'mingli-result'
+RESULT_FILE_VERSION = 1
+RESULT_FILE_SUFFIX = '.mingli'
+
+# 索引位置以固定寬度字串寫入檔頭，寫完區段後原地回填
+_OFFSET_WIDTH = 12
+_TEXT_PREFIX = 'text:'
+
+
+def _dump_line(record: Dict[str, Any]) -> bytes:
+    """單筆紀錄轉為一行 UTF-8 JSON"""
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _header(index_offset: int, created: str) -> bytes:
+    return _dump_line({
+        'format': RESULT_FILE_FORMAT,
+        'version': RESULT_FILE_VERSION,
+        'created': created,
+        'index_offset': str(index_offset).zfill(_OFFSET_WIDTH),
+    })
+
+
+def save_result_file(path: str, inputs: Dict[str, Any], results: Dict[str, Any],
+                     texts: Dict[str, str]) -> Dict[str, Tuple[int, int]]:
+    """
+    寫入結構化結果檔
+
+    Args:
+        path: 檔案路徑
+        inputs: 分析輸入（姓名、出生資料、配偶資料等）
+        results: 結構化結果（四柱、星座索引、紫微命盤紀錄等，需可轉為 JSON）
+        texts: {報告名稱: 報告文字}
+
+    Returns:
+        區段索引 {區段名稱: (位元組位移, 長度)}
+    """
+    created = datetime.now().isoformat(timespec='seconds')
+    sections = [('inputs', {'data': inputs}), ('results', {'data': results})]
+    sections.extend((_TEXT_PREFIX + key, {'text': text}) for key, text in texts.items())
+
+    index = {}
+    with open(path, 'wb') as f:
+        f.write(_header(0, created))
+        for name, payload in sections:
+            line = _dump_line(dict(section=name, **payload))
+            index[name] = (f.tell(), len(line))
+            f.write(line)
+        index_offset = f.tell()
+        f.write(_dump_line({'index': index}))
+        f.seek(0)
+        f.write(_header(index_offset, created))
+    return index
+
+
+class ResultFile:
+    """結構化結果檔讀取器（依索引隨機存取區段）"""
+
+    def __init__(self, path: str):
+        """
+        開啟結果檔並讀取檔頭與區段索引
+
+        格式或版本不符時拋出 ValueError。
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self.header = json.loads(self._file.readline())
+            if not isinstance(self.header, dict) or self.header.get('format') != RESULT_FILE_FORMAT:
+                raise ValueError(f"不是命理分析結果檔: {path}")
+            if self.header.get('version', 0) > RESULT_FILE_VERSION:
+                raise ValueError(f"不支援的結果檔版本: {self.header.get('version')}")
+            self._file.seek(int(self.header['index_offset']))
+            self.index = {
+                name: tuple(span) for name, span in json.loads(self._file.readline())['index'].items()
+            }
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    @property
+    def version(self) -> int:
+        return self.header['version']
+
+    @property
+    def text_keys(self) -> List[str]:
+        """檔內報告名稱（依寫入順序）"""
+        return [name[len(_TEXT_PREFIX):] for name in self.index if name.startswith(_TEXT_PREFIX)]
+
+    def read_section(self, name: str) -> Dict[str, Any]:
+        """依索引讀取單一區段；區段不存在時拋出 KeyError"""
+        offset, length = self.index[name]
+        self._file.seek(offset)
+        return json.loads(self._file.read(length))
+
+    def read_inputs(self) -> Dict[str, Any]:
+        return self.read_section('inputs')['data']
+
+    def read_results(self) -> Dict[str, Any]:
+        return self.read_section('results')['data']
+
+    def read_text(self, key: str) -> Optional[str]:
+        """讀取單一報告文字，不存在時回傳 None"""
+        name = _TEXT_PREFIX + key
+        if name not in self.index:
+            return None
+        return self.read_section(name)['text']
+
+    def read_texts(self, keys: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """讀取多份報告文字（預設為全部）"""
+        keys = self.text_keys if keys is None else keys
+        texts = {}
+        for key in keys:
+            text = self.read_text(key)
+            if text is not None:
+                texts[key] = text
+        return texts
+
+
+def load_result_file(path: str) -> Dict[str, Any]:
+    """一次讀取整個結果檔：{'version', 'created', 'inputs', 'results', 'texts'}"""
+    with ResultFile(path) as result_file:
+        return {
+            'version': result_file.version,
+            'created': result_file.header.get('created'),
+            'inputs': result_file.read_inputs(),
+            'results': result_file.read_results(),
+            'texts': result_file.read_texts(),
+        }
+
+
+def is_result_file(path: str) -> bool:
+    """檢查檔案是否為結構化結果檔（只讀第一行）"""
+    try:
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError):
+        return False
+    return isinstance(header, dict) and header.get('format') == RESULT_FILE_FORMAT
+
+
+def export_text_report(path: str, texts: Dict[str, str]) -> None:
+    """輸出純文字報告（供閱讀與列印，不作為讀回來源）"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for key, content in texts.items():
+            f.write(f"\n{'='*70}\n")
+            f.write(f"  {key.upper()}\n")
+            f.write(f"{'='*70}\n\n")
+            f.write(content)
+            f.write("\n\n")
@@ -7,44 +7,38 @@
 import random
 from datetime import datetime
 
+from mingli_resources import ResourceTable
+from mingli_tarot_deck import DEFAULT_SPREAD, MAJOR_ARCANA, draw, render_reading
+
+# draw_cards 抽出的牌數（過去、現在、未來）
+CLASSIC_CARD_COUNT = 3
+
+
+def birth_date_seed(birth_date):
+    """出生日期字串轉為亂數種子（去掉 '-' 後的整數）"""
+    return int(birth_date.replace("-", ""))
+
+
+def classic_draw(seed):
+    """draw_cards 的抽牌：以種子從 22 張大阿爾克那依序抽出三張不重複的牌"""
+    return random.Random(seed).sample(range(len(MAJOR_ARCANA)), CLASSIC_CARD_COUNT)
+
+
 class TarotAnalyzer:
-    def __init__(self):
-        self.major_arcana = {
-            0: ("愚者 The Fool", "新開始、純真、自發性、自由精神"),
-            1: ("魔術師 The Magician", "顯化、資源、力量、激勵行動"),
-            2: ("女祭司 The High Priestess", "直覺、神聖知識、潛意識、內在聲音"),
-            3: ("皇后 The Empress", "豐饒、養育、豐盛、自然"),
-            4: ("皇帝 The Emperor", "權威、建立、結構、父親形象"),
-            5: ("教皇 The Hierophant", "靈性智慧、宗教信仰、順從、傳統"),
-            6: ("戀人 The Lovers", "愛、和諧、關係、價值觀"),
-            7: ("戰車 The Chariot", "控制、意志力、決心、行動"),
-            8: ("力量 Strength", "力量、勇氣、說服、影響力"),
-            9: ("隱者 The Hermit", "靈魂探索、內省、孤獨、指引"),
-            10: ("命運之輪 Wheel of Fortune", "好運、業力、生命週期、命運"),
-            11: ("正義 Justice", "正義、公平、真理、因果"),
-            12: ("吊人 The Hanged Man", "暫停、放手、犧牲、新觀點"),
-            13: ("死神 Death", "結束、改變、轉變、過渡"),
-            14: ("節制 Temperance", "平衡、節制、耐心、目的"),
-            15: ("惡魔 The Devil", "束縛、成癮、限制、性"),
-            16: ("高塔 The Tower", "突然改變、動盪、混亂、啟示"),
-            17: ("星星 The Star", "希望、信念、目的、更新"),
-            18: ("月亮 The Moon", "幻覺、恐懼、焦慮、潛意識"),
-            19: ("太陽 The Sun", "積極、樂趣、溫暖、成功"),
-            20: ("審判 Judgement", "判斷、重生、內在呼喚、赦免"),
-            21: ("世界 The World", "完成、整合、成就、旅行")
-        }
+    # 大阿爾克那牌義對照表
+    major_arcana = ResourceTable('_init_major_arcana')
+    
+    def _init_major_arcana(self):
+        """大阿爾克那牌義對照表：編號 → (牌名, 牌義)"""
+        return {i: (name, meaning) for i, (name, meaning, _) in enumerate(MAJOR_ARCANA)}
     
     def draw_cards(self, birth_date, question="整體運勢"):
         """
         根據出生日期抽取塔羅牌
         使用出生日期作為隨機種子，確保結果一致性
         """
-        # 使用出生日期作為種子
-        seed = int(birth_date.replace("-", ""))
-        random.seed(seed)
-        
-        # 抽取三張牌：過去、現在、未來
-        cards = random.sample(list(self.major_arcana.keys()), 3)
+        # 使用出生日期作為種子，抽取三張牌：過去、現在、未來
+        cards = classic_draw(birth_date_seed(birth_date))
         
         result = f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -101,6 +95,26 @@ class TarotAnalyzer:
 """
         return result
     
+    def draw_spread(self, birth_date, spread=DEFAULT_SPREAD, question="整體運勢",
+                    reversals=True, seed=None):
+        """
+        以完整 78 張牌組依牌陣抽牌（含逆位）
+        
+        Args:
+            birth_date: 出生日期 'YYYY-MM-DD'
+            spread: 牌陣名稱（single、three_card、horseshoe、celtic_cross）或 make_spread 自訂牌陣
+            question: 占卜主題
+            reversals: 是否抽出逆位
+            seed: 亂數種子（省略時與 draw_cards 相同，以出生日期為種子）
+        
+        Returns:
+            占卜報告文字
+        """
+        if seed is None:
+            seed = birth_date_seed(birth_date)
+        draws = draw(spread, seed=seed, reversals=reversals)
+        return render_reading(spread, draws, birth_date, question)
+    
     def _interpret_card(self, card_num, position):
         """解釋牌意"""
         interpretations = {
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+塔羅牌完整牌組模組（78 張）
+    - 牌以整數編號：0–21 大阿爾克那，22–77 小阿爾克那（22 + 花色 × 14 + 點數 − 1）
+    - 抽出的牌以「編號 << 1 | 逆位」表示，牌名、牌義等表格依此值預先建立，查表即得
+    - 牌陣以位置清單定義（內建三牌陣、馬蹄鐵、凱爾特十字，亦可自訂）
+    - 每次抽牌使用獨立的亂數產生器，只需一次抽樣與一次取逆位位元
+    - 報告由模板產生
+"""
+
+import random
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+# ==================== 牌組 ====================
+
+# 大阿爾克那：(牌名, 正位牌義, 逆位牌義)
+MAJOR_ARCANA = (
+    ("愚者 The Fool", "新開始、純真、自發性、自由精神", "魯莽、冒失、缺乏計畫"),
+    ("魔術師 The Magician", "顯化、資源、力量、激勵行動", "操縱、才能未用、欺騙"),
+    ("女祭司 The High Priestess", "直覺、神聖知識、潛意識、內在聲音", "忽視直覺、隱藏的動機、流於表面"),
+    ("皇后 The Empress", "豐饒、養育、豐盛、自然", "依賴、過度保護、創造力受阻"),
+    ("皇帝 The Emperor", "權威、建立、結構、父親形象", "專制、僵化、缺乏紀律"),
+    ("教皇 The Hierophant", "靈性智慧、宗教信仰、順從、傳統", "反叛、打破傳統、教條束縛"),
+    ("戀人 The Lovers", "愛、和諧、關係、價值觀", "失衡、價值衝突、錯誤選擇"),
+    ("戰車 The Chariot", "控制、意志力、決心、行動", "失控、方向不明、受阻"),
+    ("力量 Strength", "力量、勇氣、說服、影響力", "自我懷疑、軟弱、失去耐心"),
+    ("隱者 The Hermit", "靈魂探索、內省、孤獨、指引", "孤立、退縮、拒絕指引"),
+    ("命運之輪 Wheel of Fortune", "好運、業力、生命週期、命運", "厄運、抗拒改變、週期低谷"),
+    ("正義 Justice", "正義、公平、真理、因果", "不公、逃避責任、失衡"),
+    ("吊人 The Hanged Man", "暫停、放手、犧牲、新觀點", "拖延、無謂犧牲、停滯"),
+    ("死神 Death", "結束、改變、轉變、過渡", "抗拒改變、停滯不前、難以放手"),
+    ("節制 Temperance", "平衡、節制、耐心、目的", "失衡、過度、缺乏耐心"),
+    ("惡魔 The Devil", "束縛、成癮、限制、性", "掙脫束縛、覺醒、重獲自由"),
+    ("高塔 The Tower", "突然改變、動盪、混亂、啟示", "避開災難、延遲的改變、恐懼變動"),
+    ("星星 The Star", "希望、信念、目的、更新", "失去信心、絕望、缺乏動力"),
+    ("月亮 The Moon", "幻覺、恐懼、焦慮、潛意識", "走出迷霧、釋放恐懼、真相浮現"),
+    ("太陽 The Sun", "積極、樂趣、溫暖、成功", "暫時受挫、過度樂觀、熱情減退"),
+    ("審判 Judgement", "判斷、重生、內在呼喚、赦免", "自我懷疑、忽略呼喚、拒絕反省"),
+    ("世界 The World", "完成、整合、成就、旅行", "未完成、缺乏結束、延遲圓滿"),
+)
+
+# 小阿爾克那花色：(中文, 英文, 元素, 主題)
+SUITS = (
+    ('權杖', 'Wands', '火', '行動與事業'),
+    ('聖杯', 'Cups', '水', '情感與關係'),
+    ('寶劍', 'Swords', '風', '思想與衝突'),
+    ('錢幣', 'Pentacles', '土', '物質與財務'),
+)
+
+# 點數與宮廷牌：(中文, 英文, 正位關鍵詞, 逆位關鍵詞)
+RANKS = (
+    ('王牌', 'Ace', '新的開始、潛能萌芽', '機會延誤、潛能受阻'),
+    ('二', 'Two', '平衡、選擇、合作', '猶豫不決、失去平衡'),
+    ('三', 'Three', '成長、協作、初步成果', '合作不順、計畫受挫'),
+    ('四', 'Four', '穩定、鞏固、休整', '停滯、固守不前'),
+    ('五', 'Five', '衝突、挑戰、失落', '化解衝突、走出低谷'),
+    ('六', 'Six', '和諧、分享、進展', '付出失衡、沉溺過去'),
+    ('七', 'Seven', '考驗、評估、堅持', '動搖、失去方向'),
+    ('八', 'Eight', '行動、轉變、專注', '受困、進展受阻'),
+    ('九', 'Nine', '接近圓滿、韌性', '焦慮、力不從心'),
+    ('十', 'Ten', '完成、極致、責任', '重擔難卸、結束延宕'),
+    ('侍者', 'Page', '學習、訊息、好奇', '幼稚、消息延誤'),
+    ('騎士', 'Knight', '追求、行動、熱情', '衝動、魯莽'),
+    ('皇后', 'Queen', '成熟、包容、滋養', '情緒化、過度依賴'),
+    ('國王', 'King', '掌控、權威、領導', '專斷、濫用權力'),
+)
+
+MAJOR_COUNT = len(MAJOR_ARCANA)
+DECK_SIZE = MAJOR_COUNT + len(SUITS) * len(RANKS)
+
+ORIENTATION_NAMES = ('正位', '逆位')
+
+
+def card_id(draw: int) -> int:
+    """抽牌值取出牌編號"""
+    return draw >> 1
+
+
+def is_reversed(draw: int) -> bool:
+    """抽牌值是否為逆位"""
+    return bool(draw & 1)
+
+
+def make_draw(card: int, reversed_: bool = False) -> int:
+    """牌編號與正逆位組成抽牌值"""
+    return card << 1 | int(reversed_)
+
+
+def card_suit(card: int) -> Optional[int]:
+    """小阿爾克那的花色索引（大阿爾克那回傳 None）"""
+    if card < MAJOR_COUNT:
+        return None
+    return (card - MAJOR_COUNT) // len(RANKS)
+
+
+def _build_card_tables():
+    """依牌編號建立牌名與正逆位牌義"""
+    names = []
+    upright = []
+    reversed_ = []
+    for name, meaning, reversed_meaning in MAJOR_ARCANA:
+        names.append(name)
+        upright.append(meaning)
+        reversed_.append(reversed_meaning)
+    for suit_name, suit_english, _, theme in SUITS:
+        for rank_name, rank_english, meaning, reversed_meaning in RANKS:
+            names.append(f"{suit_name}{rank_name} {rank_english} of {suit_english}")
+            upright.append(f"{theme}：{meaning}")
+            reversed_.append(f"{theme}：{reversed_meaning}")
+    return tuple(names), tuple(upright), tuple(reversed_)
+
+
+CARD_NAMES, UPRIGHT_MEANINGS, REVERSED_MEANINGS = _build_card_tables()
+
+# 依抽牌值（編號 << 1 | 逆位）索引的表格
+DRAW_LABELS = tuple(
+    f"{CARD_NAMES[draw >> 1]}（{ORIENTATION_NAMES[draw & 1]}）" for draw in range(DECK_SIZE * 2)
+)
+DRAW_MEANINGS = tuple(
+    (REVERSED_MEANINGS if draw & 1 else UPRIGHT_MEANINGS)[draw >> 1] for draw in range(DECK_SIZE * 2)
+)
+
+DECK = range(DECK_SIZE)
+
+
+# ==================== 牌陣 ====================
+
+# 牌陣：{'title': 名稱, 'positions': ((位置名稱, 位置意義), ...)}
+SPREADS = {
+    'single': {
+        'title': '單牌指引',
+        'positions': (
+            ('今日指引', '當下最需要留意的訊息'),
+        ),
+    },
+    'three_card': {
+        'title': '三牌陣',
+        'positions': (
+            ('過去', '過去的影響和已經發生的事情'),
+            ('現在', '當前的狀況和面臨的挑戰'),
+            ('未來', '未來的發展趨勢'),
+        ),
+    },
+    'horseshoe': {
+        'title': '馬蹄鐵牌陣',
+        'positions': (
+            ('過去', '影響此事的過往經歷'),
+            ('現在', '目前的處境'),
+            ('隱藏影響', '尚未察覺的因素'),
+            ('阻礙', '需要克服的障礙'),
+            ('外在環境', '周遭人事的態度'),
+            ('建議', '最適合採取的行動'),
+            ('結果', '依目前方向可能的結果'),
+        ),
+    },
+    'celtic_cross': {
+        'title': '凱爾特十字',
+        'positions': (
+            ('現況', '問題的核心'),
+            ('挑戰', '橫亙眼前的阻力'),
+            ('根基', '問題的深層根源'),
+            ('過去', '正在離開的影響'),
+            ('目標', '意識層面的期望與可能性'),
+            ('近未來', '即將出現的發展'),
+            ('自我', '你在此事中的態度'),
+            ('環境', '他人與外在環境的影響'),
+            ('希望與恐懼', '內心的期待與擔憂'),
+            ('結果', '事情最終的走向'),
+        ),
+    },
+}
+
+DEFAULT_SPREAD = 'three_card'
+
+Spread = Dict[str, object]
+
+
+def make_spread(title: str, positions: Iterable[Union[str, Tuple[str, str]]]) -> Spread:
+    """
+    自訂牌陣
+
+    Args:
+        title: 牌陣名稱
+        positions: 位置名稱，或 (位置名稱, 位置意義)
+
+    Returns:
+        與 SPREADS 中相同格式的牌陣
+    """
+    normalized = tuple(
+        (position, '') if isinstance(position, str) else tuple(position) for position in positions
+    )
+    for position in normalized:
+        if len(position) != 2 or not all(isinstance(part, str) for part in position):
+            raise ValueError(f"牌陣位置需為名稱或 (名稱, 意義): {position!r}")
+    if not 1 <= len(normalized) <= DECK_SIZE:
+        raise ValueError(f"牌陣位置數需介於 1 與 {DECK_SIZE} 之間")
+    return {'title': title, 'positions': normalized}
+
+
+def get_spread(spread: Union[str, Spread]) -> Spread:
+    """牌陣名稱或自訂牌陣轉為牌陣（自訂牌陣經 make_spread 正規化）；名稱不存在或格式不符時拋出 ValueError"""
+    if isinstance(spread, dict):
+        if 'positions' not in spread:
+            raise ValueError("自訂牌陣缺少 'positions'")
+        return make_spread(spread.get('title', '自訂牌陣'), spread['positions'])
+    try:
+        return SPREADS[spread]
+    except KeyError:
+        raise ValueError(f"未知的牌陣: {spread}（可用：{', '.join(SPREADS)}）") from None
+
+
+# ==================== 抽牌 ====================
+
+def draw(spread: Union[str, Spread] = DEFAULT_SPREAD, seed=None,
+         reversals: bool = True, rng: Optional[random.Random] = None) -> Tuple[int, ...]:
+    """
+    依牌陣抽牌
+
+    Args:
+        spread: 牌陣名稱或自訂牌陣
+        seed: 亂數種子（同一種子得到同樣結果；省略時每次不同）
+        reversals: 是否抽出逆位
+        rng: 自備的亂數產生器（提供時忽略 seed）
+
+    Returns:
+        各位置的抽牌值（編號 << 1 | 逆位）
+    """
+    count = len(get_spread(spread)['positions'])
+    if rng is None:
+        rng = random.Random(seed)
+    cards = rng.sample(DECK, count)
+    if not reversals:
+        return tuple(card << 1 for card in cards)
+    bits = rng.getrandbits(count)
+    return tuple(card << 1 | (bits >> i) & 1 for i, card in enumerate(cards))
+
+
+# ==================== 報告 ====================
+
+READING_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════╗
+║                    🎴 塔羅牌占卜分析 🎴                      ║
+╚══════════════════════════════════════════════════════════════╝
+
+📅 出生日期：{birth_date}
+🔮 占卜主題：{question}
+🃏 牌陣：{title}（{count} 張）
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+{positions}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+【整體解讀】
+
+{summary}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+# 每個位置的報告 = 位置標題 + 牌（依抽牌值預先產生）+ 位置意義
+POSITION_HEADER_TEMPLATE = "【{index}. {position}】"
+CARD_TEMPLATE = """{card}
+    牌義：{meaning}
+"""
+POSITION_FOOTER_TEMPLATE = """    位置：{position_meaning}
+"""
+
+SUMMARY_TEMPLATE = """大阿爾克那 {major} 張、小阿爾克那 {minor} 張；正位 {upright} 張、逆位 {reversed} 張。
+{major_hint}
+{reversed_hint}
+元素分布：{elements}
+{element_hint}"""
+
+
+CARD_BLOCKS = tuple(
+    CARD_TEMPLATE.format(card=DRAW_LABELS[value], meaning=DRAW_MEANINGS[value])
+    for value in range(DECK_SIZE * 2)
+)
+
+# 抽牌值 → 統計欄位：0–3 為花色，4 為大阿爾克那
+_MAJOR_SLOT = len(SUITS)
+_DRAW_SLOTS = tuple(
+    _MAJOR_SLOT if value >> 1 < MAJOR_COUNT else card_suit(value >> 1)
+    for value in range(DECK_SIZE * 2)
+)
+
+
+@lru_cache(maxsize=256)
+def _position_fragments(positions: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """牌陣各位置的標題與位置意義（每種牌陣只產生一次）"""
+    return tuple(
+        (POSITION_HEADER_TEMPLATE.format(index=i, position=position),
+         POSITION_FOOTER_TEMPLATE.format(position_meaning=position_meaning or '—'))
+        for i, (position, position_meaning) in enumerate(positions, 1)
+    )
+
+
+def _summary(draws: Sequence[int]) -> str:
+    """依大小牌、正逆位與花色分布產生整體解讀"""
+    count = len(draws)
+    slots = [0] * (len(SUITS) + 1)
+    reversed_count = 0
+    for value in draws:
+        slots[_DRAW_SLOTS[value]] += 1
+        reversed_count += value & 1
+    major = slots[_MAJOR_SLOT]
+    suit_counts = slots[:_MAJOR_SLOT]
+
+    if major * 2 > count:
+        major_hint = "大阿爾克那佔多數，此事牽涉人生重要課題，影響深遠。"
+    elif major == 0:
+        major_hint = "全為小阿爾克那，此事多屬日常層面，可由自身行動掌握。"
+    else:
+        major_hint = "大小阿爾克那兼具，重要轉折與日常行動同樣值得重視。"
+    if reversed_count * 2 > count:
+        reversed_hint = "逆位偏多，能量受阻或內化，宜先釐清內心再行動。"
+    else:
+        reversed_hint = "正位為主，能量順暢，適合把握時機積極推進。"
+
+    elements = '、'.join(
+        f"{SUITS[i][2]}（{SUITS[i][0]}）{n}" for i, n in enumerate(suit_counts) if n
+    ) or '無小阿爾克那'
+    strongest = max(suit_counts)
+    if strongest and suit_counts.count(strongest) == 1:
+        dominant = suit_counts.index(strongest)
+        element_hint = f"以{SUITS[dominant][2]}元素最強，重點在於{SUITS[dominant][3]}。"
+    else:
+        element_hint = "元素無明顯偏重。"
+
+    return SUMMARY_TEMPLATE.format(
+        major=major, minor=count - major, upright=count - reversed_count,
+        reversed=reversed_count, major_hint=major_hint, reversed_hint=reversed_hint,
+        elements=elements, element_hint=element_hint,
+    )
+
+
+def render_reading(spread: Union[str, Spread], draws: Sequence[int],
+                   birth_date: str = '', question: str = '整體運勢') -> str:
+    """
+    依模板產生牌陣報告
+
+    Args:
+        spread: 牌陣名稱或自訂牌陣
+        draws: draw() 的結果
+        birth_date: 出生日期（顯示用）
+        question: 占卜主題
+    """
+    spread = get_spread(spread)
+    positions = spread['positions']
+    if len(draws) != len(positions):
+        raise ValueError(f"抽牌數 {len(draws)} 與牌陣位置數 {len(positions)} 不符")
+    position_text = '\n'.join(
+        header + CARD_BLOCKS[value] + footer
+        for (header, footer), value in zip(_position_fragments(positions), draws)
+    )
+    return READING_TEMPLATE.format(
+        birth_date=birth_date, question=question, title=spread['title'],
+        count=len(positions), positions=position_text, summary=_summary(draws),
+    )
@@ -7,9 +7,34 @@
 import random
 from datetime import datetime
 
+from mingli_resources import ResourceTable
+from mingli_meihua import body_use_relation, number_cast, time_cast, time_numbers
+from mingli_yijing_cast import (
+    CASTING_METHOD_NAMES, DEFAULT_CASTING_METHOD, HEXAGRAM_BITS, LINE_OLD_YANG, LINE_OLD_YIN,
+    cast, hexagram_number, line_values, moving_line_numbers, nuclear_hexagram, primary_hexagram,
+    resulting_hexagram
+)
+from mingli_yijing_texts import get_yijing_texts
+
+
+def divination_seed(birth_date, moment):
+    """divine 的亂數種子：出生日期整數加上當下時分秒（HHMMSS）"""
+    return int(birth_date.replace("-", "")) + int(moment.strftime("%H%M%S"))
+
+
+def classic_cast(seed):
+    """divine 的起卦：回傳 (本卦卦序 1–64, 動爻 1–6)"""
+    rng = random.Random(seed)
+    return rng.randint(1, 64), rng.randint(1, 6)
+
+
 class YijingAnalyzer:
-    def __init__(self):
-        self.hexagrams = {
+    # 卦象對照表
+    hexagrams = ResourceTable('_init_hexagrams')
+    
+    def _init_hexagrams(self):
+        """卦象對照表：卦序 → (卦名, 全名, 卦辭, 卦義)"""
+        return {
             1: ("乾", "乾為天", "元亨利貞", "剛健中正，自強不息"),
             2: ("坤", "坤為地", "元亨利牝馬之貞", "柔順厚德，包容萬物"),
             3: ("屯", "水雷屯", "元亨利貞勿用有攸往利建侯", "萬事開頭難，需要耐心"),
@@ -80,13 +105,8 @@ class YijingAnalyzer:
         """
         根據出生日期進行卜卦
         """
-        # 使用出生日期和當前時間作為種子
-        seed = int(birth_date.replace("-", "")) + int(datetime.now().strftime("%H%M%S"))
-        random.seed(seed)
-        
-        # 生成本卦和變卦
-        main_hexagram = random.randint(1, 64)
-        changing_line = random.randint(1, 6)
+        # 使用出生日期和當前時間作為種子，生成本卦和變卦
+        main_hexagram, changing_line = classic_cast(divination_seed(birth_date, datetime.now()))
         
         result = f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -104,8 +124,8 @@ class YijingAnalyzer:
 {self._draw_hexagram(main_hexagram)}
 
 卦名：{self.hexagrams[main_hexagram][0]}（{self.hexagrams[main_hexagram][1]}）
-卦辭：{self.hexagrams[main_hexagram][2]}
-卦義：{self.hexagrams[main_hexagram][3]}
+卦辭：{self._get_judgment(main_hexagram)}
+{self._get_image(main_hexagram)}卦義：{self.hexagrams[main_hexagram][3]}
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
@@ -137,32 +157,207 @@ class YijingAnalyzer:
 """
         return result
     
-    def _draw_hexagram(self, num):
-        """繪製卦象"""
-        # 簡化版本的六爻繪製
-        hexagram_patterns = {
-            1: ["▬▬▬▬▬", "▬▬▬▬▬", "▬▬▬▬▬", "▬▬▬▬▬", "▬▬▬▬▬", "▬▬▬▬▬"],  # 乾
-            2: ["▬▬ ▬▬", "▬▬ ▬▬", "▬▬ ▬▬", "▬▬ ▬▬", "▬▬ ▬▬", "▬▬ ▬▬"],  # 坤
-            11: ["▬▬ ▬▬", "▬▬ ▬▬", "▬▬ ▬▬", "▬▬▬▬▬", "▬▬▬▬▬", "▬▬▬▬▬"],  # 泰
-            12: ["▬▬▬▬▬", "▬▬▬▬▬", "▬▬▬▬▬", "▬▬ ▬▬", "▬▬ ▬▬", "▬▬ ▬▬"],  # 否
-            63: ["▬▬ ▬▬", "▬▬▬▬▬", "▬▬ ▬▬", "▬▬▬▬▬", "▬▬ ▬▬", "▬▬▬▬▬"],  # 既濟
-            64: ["▬▬▬▬▬", "▬▬ ▬▬", "▬▬▬▬▬", "▬▬ ▬▬", "▬▬▬▬▬", "▬▬ ▬▬"],  # 未濟
-        }
+    def divine_by_casting(self, birth_date, question="人生運勢",
+                          method=DEFAULT_CASTING_METHOD, seed=None):
+        """
+        以三枚銅錢法或蓍草法起卦（依真實機率產生六爻，可有多個動爻並得出之卦）
         
-        # 如果有預定義的卦象就使用，否則隨機生成
-        if num in hexagram_patterns:
-            lines = hexagram_patterns[num]
-        else:
-            # 根據卦號生成陰陽爻
-            random.seed(num)
-            lines = [random.choice(["▬▬▬▬▬", "▬▬ ▬▬"]) for _ in range(6)]
+        Args:
+            birth_date: 出生日期（顯示用）
+            question: 占卜問題
+            method: 起卦法（'three_coins' 或 'yarrow'）
+            seed: 亂數種子（省略時每次不同）
+        
+        Returns:
+            卜卦報告文字
+        """
+        reading = cast(method, seed=seed)
+        return self._format_reading(birth_date, question, CASTING_METHOD_NAMES[method], reading)
+    
+    def divine_by_time(self, birth_date, question, lunar_year, lunar_month, lunar_day, hour):
+        """
+        梅花易數時間起卦（以農曆年月日與時辰起卦，同一時辰結果相同）
+        
+        本模組不做陰陽曆換算，起卦日期須由呼叫端以農曆提供。
         
+        Args:
+            birth_date: 出生日期（顯示用）
+            question: 占卜問題
+            lunar_year: 起卦農曆年
+            lunar_month: 起卦農曆月（1–12）
+            lunar_day: 起卦農曆日（1–30）
+            hour: 起卦小時（0–23）
+        
+        Returns:
+            卜卦報告文字
+        """
+        year_num, month_num, day_num, hour_num = time_numbers(lunar_year, lunar_month, lunar_day, hour)
+        reading = time_cast(lunar_year, lunar_month, lunar_day, hour)
+        label = (f"梅花易數・時間起卦（農曆{lunar_year}年{lunar_month}月{lunar_day}日{hour}時："
+                 f"年 {year_num} + 月 {month_num} + 日 {day_num} + 時 {hour_num}）")
+        return self._format_reading(birth_date, question, label, reading,
+                                    self._plum_blossom_details(reading))
+    
+    def divine_by_numbers(self, birth_date, question, first, second, hour=None):
+        """
+        梅花易數數字起卦（第一數取上卦、第二數取下卦，兩數之和取動爻）
+        
+        Args:
+            birth_date: 出生日期（顯示用）
+            question: 占卜問題
+            first: 第一個數
+            second: 第二個數
+            hour: 起卦小時（提供時動爻加上時數）
+        
+        Returns:
+            卜卦報告文字
+        """
+        reading = number_cast(first, second, hour)
+        label = f"梅花易數・數字起卦（{first}、{second}" + ("，加時數）" if hour is not None else "）")
+        return self._format_reading(birth_date, question, label, reading,
+                                    self._plum_blossom_details(reading))
+    
+    def _format_reading(self, birth_date, question, method_label, reading, details=""):
+        """起卦結果（本卦 | 動爻 << 6）→ 卜卦報告文字"""
+        primary = hexagram_number(primary_hexagram(reading))
+        changed = hexagram_number(resulting_hexagram(reading))
+        moving = moving_line_numbers(reading)
+        moving_text = '、'.join(f"第 {line} 爻" for line in moving) if moving else '無動爻'
+        
+        result = f"""
+╔══════════════════════════════════════════════════════════════╗
+║                    ☯ 周易卜卦分析 ☯                          ║
+╚══════════════════════════════════════════════════════════════╝
+
+📅 出生日期：{birth_date}
+🔮 占卜問題：{question}
+🪙 起卦方式：{method_label}
+⏰卜卦時間：{datetime.now().strftime('%Y-%m-%d %H:%M')}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+【本卦】第{primary}卦
+
+{self._draw_cast_lines(reading)}
+卦名：{self.hexagrams[primary][0]}（{self.hexagrams[primary][1]}）
+卦辭：{self._get_judgment(primary)}
+{self._get_image(primary)}卦義：{self.hexagrams[primary][3]}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+【動爻】{moving_text}
+
+{self._casting_focus(primary, changed, moving)}
+"""
+        if details:
+            result += f"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+{details}
+"""
+        if moving:
+            result += f"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+【之卦】第{changed}卦
+
+卦名：{self.hexagrams[changed][0]}（{self.hexagrams[changed][1]}）
+卦辭：{self._get_judgment(changed)}
+{self._get_image(changed)}卦義：{self.hexagrams[changed][3]}
+"""
+        result += f"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+【卦象解析】
+
+{self._interpret_hexagram(primary)}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+【運勢指引】
+
+{self._get_fortune_guide(primary)}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+        return result
+    
+    def _plum_blossom_details(self, reading):
+        """梅花易數的互卦與體用生剋"""
+        nuclear = hexagram_number(nuclear_hexagram(primary_hexagram(reading)))
+        relation = body_use_relation(reading)
+        return f"""【互卦】第{nuclear}卦 {self.hexagrams[nuclear][1]}：{self.hexagrams[nuclear][3]}
+
+【體用】體卦{relation['body']}（{relation['body_element']}）、用卦{relation['use']}（{relation['use_element']}）
+{relation['relation']}：{relation['verdict']}"""
+    
+    def _draw_cast_lines(self, reading):
+        """依起卦結果繪製六爻（標出老陽 ○、老陰 ×）"""
+        marks = {LINE_OLD_YANG: "○ 老陽（動）", LINE_OLD_YIN: "× 老陰（動）"}
         result = "      上卦\n"
-        for i, line in enumerate(reversed(lines), 1):
-            result += f"    {line}   {7-i}爻\n"
+        values = line_values(reading)
+        for line in range(6, 0, -1):
+            value = values[line - 1]
+            symbol = "▬▬▬▬▬" if value in (7, 9) else "▬▬ ▬▬"
+            result += f"    {symbol}   {line}爻 {marks.get(value, '')}".rstrip() + "\n"
         result += "      下卦\n"
         return result
     
+    def _casting_focus(self, primary, changed, moving):
+        """依動爻數說明解卦重點並列出應讀經文（朱熹《易學啟蒙》變占之法）"""
+        count = len(moving)
+        still = [line for line in range(1, 7) if line not in moving]
+        if count == 0:
+            focus = "六爻皆靜，以本卦卦辭為斷。"
+            texts = [self._get_judgment(primary)]
+        elif count == 1:
+            focus = f"一爻動，以本卦第 {moving[0]} 爻爻辭為斷。"
+            texts = [self._get_line_text(primary, moving[0])]
+        elif count == 2:
+            focus = f"二爻動，以本卦第 {moving[0]}、{moving[1]} 爻爻辭為斷，以上爻（第 {moving[1]} 爻）為主。"
+            texts = [self._get_line_text(primary, line) for line in moving]
+        elif count == 3:
+            focus = "三爻動，以本卦與之卦卦辭為斷，本卦為主、之卦為輔。"
+            texts = [self._get_judgment(primary), self._get_judgment(changed)]
+        elif count == 4:
+            focus = f"四爻動，以之卦不變的第 {still[0]}、{still[1]} 爻爻辭為斷，以下爻（第 {still[0]} 爻）為主。"
+            texts = [self._get_line_text(changed, line) for line in still]
+        elif count == 5:
+            focus = f"五爻動，以之卦不變的第 {still[0]} 爻爻辭為斷。"
+            texts = [self._get_line_text(changed, still[0])]
+        elif primary in (1, 2):
+            focus = "六爻皆動，乾坤以用九、用六為斷。"
+            texts = [self._get_line_text(primary, 7)]
+        else:
+            focus = "六爻皆動，以之卦卦辭為斷。"
+            texts = [self._get_judgment(changed)]
+        return focus + "\n\n" + "\n".join(f"◇ {text}" for text in texts if text)
+    
+    def _draw_hexagram(self, num):
+        """繪製卦象"""
+        bits = HEXAGRAM_BITS[num]
+        result = "      上卦\n"
+        for line in range(6, 0, -1):
+            symbol = "▬▬▬▬▬" if bits >> (line - 1) & 1 else "▬▬ ▬▬"
+            result += f"    {symbol}   {line}爻\n"
+        result += "      下卦\n"
+        return result
+    
+    def _get_judgment(self, num):
+        """卦辭（經文無法載入時改用卦象對照表）"""
+        texts = get_yijing_texts()
+        return texts.judgment(num) if texts else self.hexagrams[num][2]
+    
+    def _get_image(self, num):
+        """大象（含換行；經文無法載入時為空字串）"""
+        texts = get_yijing_texts()
+        return f"象曰：{texts.image(num)}\n" if texts else ""
+    
+    def _get_line_text(self, hexagram, line):
+        """爻辭（line 為 7 時為乾之用九、坤之用六）"""
+        texts = get_yijing_texts()
+        return texts.line(hexagram, line) if texts else ""
+    
     def _get_line_interpretation(self, hexagram, line):
         """解釋爻位"""
         interpretations = {
@@ -173,7 +368,9 @@ class YijingAnalyzer:
             5: "五爻：處於外卦中位，最尊貴的位置，大有可為",
             6: "上爻：處於最高位，事物發展到極致，物極必反"
         }
-        return interpretations.get(line, "此爻變化需要深思")
+        position = interpretations.get(line, "此爻變化需要深思")
+        text = self._get_line_text(hexagram, line)
+        return f"爻辭：{text}\n{position}" if text else position
     
     def _interpret_hexagram(self, num):
         """解釋卦象"""
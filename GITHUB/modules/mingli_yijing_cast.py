@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+周易起卦模組（三枚銅錢法、蓍草法）
+卦以 6 位元整數表示：第 n 爻（由下往上）為陽時第 n−1 位元為 1。
+一次起卦的結果以 12 位元整數表示：
+
+    低 6 位元   本卦
+    高 6 位元   動爻（老陽 9、老陰 6 的位置）
+    之卦 = 本卦 ^ 動爻
+
+每爻的四種結果（6 老陰、7 少陽、8 少陰、9 老陽）依起卦法的真實機率產生：
+
+    三枚銅錢  6: 1/8   7: 3/8   8: 3/8   9: 1/8
+    蓍草      6: 1/16  7: 5/16  8: 7/16  9: 3/16
+
+每爻取 4 個亂數位元，查 16 格爻表決定結果；一個位元組對應兩爻，
+一卦只需 3 個位元組與 3 次查表，批次起卦以 randbytes 一次取得所有亂數。
+"""
+
+import random
+from array import array
+from typing import Dict, Optional, Tuple
+
+LINE_OLD_YIN = 6
+LINE_YOUNG_YANG = 7
+LINE_YOUNG_YIN = 8
+LINE_OLD_YANG = 9
+
+# 起卦法 → 16 格爻表（每種結果出現次數即為其機率 × 16）
+CASTING_METHODS = {
+    # 三枚銅錢：低 3 位元為三枚銅錢，正面 3 分、反面 2 分，三枚合計即為爻數（6–9）
+    'three_coins': tuple(6 + bin(value & 7).count('1') for value in range(16)),
+    'yarrow': (LINE_OLD_YIN,) * 1 + (LINE_YOUNG_YANG,) * 5 + (LINE_YOUNG_YIN,) * 7 + (LINE_OLD_YANG,) * 3,
+}
+
+CASTING_METHOD_NAMES = {
+    'three_coins': '三枚銅錢法',
+    'yarrow': '蓍草法（大衍之數）',
+}
+
+DEFAULT_CASTING_METHOD = 'three_coins'
+
+# 八卦（下爻在最低位元）：位元值 → (卦名, 象)
+TRIGRAMS = {
+    7: ('乾', '天'),
+    3: ('兌', '澤'),
+    5: ('離', '火'),
+    1: ('震', '雷'),
+    6: ('巽', '風'),
+    2: ('坎', '水'),
+    4: ('艮', '山'),
+    0: ('坤', '地'),
+}
+
+# 文王卦序：上卦 → 依下卦（乾、震、坎、艮、坤、巽、離、兌）排列的卦序
+_KING_WEN_ROWS = {
+    7: (1, 25, 6, 33, 12, 44, 13, 10),
+    1: (34, 51, 40, 62, 16, 32, 55, 54),
+    2: (5, 3, 29, 39, 8, 48, 63, 60),
+    4: (26, 27, 4, 52, 23, 18, 22, 41),
+    0: (11, 24, 7, 15, 2, 46, 36, 19),
+    6: (9, 42, 59, 53, 20, 57, 37, 61),
+    5: (14, 21, 64, 56, 35, 50, 30, 38),
+    3: (43, 17, 47, 31, 45, 28, 49, 58),
+}
+_LOWER_ORDER = (7, 1, 2, 4, 0, 6, 5, 3)
+
+# 6 位元卦 → 文王卦序（1–64），與反查表
+KING_WEN_NUMBERS = tuple(
+    _KING_WEN_ROWS[bits >> 3][_LOWER_ORDER.index(bits & 7)] for bits in range(64)
+)
+HEXAGRAM_BITS = (None,) + tuple(KING_WEN_NUMBERS.index(number) for number in range(1, 65))
+
+
+def _pair_tables(line_table: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    一個位元組（兩爻）→ 部分起卦結果，依位元組在卦中的位置（初二、三四、五上爻）各建一表
+
+    每個值已位移到該兩爻的位置：本卦位元於低 6 位元、動爻位元於高 6 位元。
+    """
+    tables = []
+    for pair in range(3):
+        table = []
+        for byte in range(256):
+            packed = 0
+            for half in range(2):
+                value = line_table[(byte >> (4 * half)) & 15]
+                line = pair * 2 + half
+                if value in (LINE_YOUNG_YANG, LINE_OLD_YANG):
+                    packed |= 1 << line
+                if value in (LINE_OLD_YIN, LINE_OLD_YANG):
+                    packed |= 1 << (line + 6)
+            table.append(packed)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+_PAIR_TABLES: Dict[str, Tuple[Tuple[int, ...], ...]] = {
+    method: _pair_tables(line_table) for method, line_table in CASTING_METHODS.items()
+}
+
+
+def _tables(method: str):
+    try:
+        return _PAIR_TABLES[method]
+    except KeyError:
+        raise ValueError(f"未知的起卦法: {method}（可用：{', '.join(CASTING_METHODS)}）") from None
+
+
+# ==================== 起卦 ====================
+
+def cast(method: str = DEFAULT_CASTING_METHOD, seed=None,
+         rng: Optional[random.Random] = None) -> int:
+    """
+    起一卦
+
+    Args:
+        method: 起卦法（'three_coins' 或 'yarrow'）
+        seed: 亂數種子（省略時每次不同）
+        rng: 自備的亂數產生器（提供時忽略 seed）
+
+    Returns:
+        12 位元起卦結果（本卦 | 動爻 << 6）
+    """
+    first, second, third = _tables(method)
+    if rng is None:
+        rng = random.Random(seed)
+    b0, b1, b2 = rng.randbytes(3)
+    return first[b0] | second[b1] | third[b2]
+
+
+def cast_batch(count: int, method: str = DEFAULT_CASTING_METHOD, seed=None,
+               rng: Optional[random.Random] = None) -> array:
+    """
+    批次起卦（每日推播等大量起卦用）
+
+    Returns:
+        array('H')，每個元素為一次起卦結果（本卦 | 動爻 << 6）
+    """
+    first, second, third = _tables(method)
+    if rng is None:
+        rng = random.Random(seed)
+    data = rng.randbytes(3 * count)
+    return array('H', map(
+        lambda b0, b1, b2: first[b0] | second[b1] | third[b2],
+        data[0::3], data[1::3], data[2::3],
+    ))
+
+
+# ==================== 解讀起卦結果 ====================
+
+def primary_hexagram(reading: int) -> int:
+    """本卦（6 位元）"""
+    return reading & 63
+
+
+def moving_lines(reading: int) -> int:
+    """動爻遮罩（6 位元）"""
+    return reading >> 6
+
+
+def resulting_hexagram(reading: int) -> int:
+    """之卦（6 位元）：動爻陰陽互變"""
+    return (reading & 63) ^ (reading >> 6)
+
+
+def moving_line_numbers(reading: int) -> Tuple[int, ...]:
+    """動爻爻位（1–6，由下往上）"""
+    mask = reading >> 6
+    return tuple(line + 1 for line in range(6) if mask >> line & 1)
+
+
+def line_values(reading: int) -> Tuple[int, ...]:
+    """六爻數值（6、7、8、9，由初爻到上爻）"""
+    values = []
+    for line in range(6):
+        yang = reading >> line & 1
+        moving = reading >> (line + 6) & 1
+        values.append((LINE_YOUNG_YIN, LINE_YOUNG_YANG, LINE_OLD_YIN, LINE_OLD_YANG)[moving * 2 + yang])
+    return tuple(values)
+
+
+def nuclear_hexagram(bits: int) -> int:
+    """互卦（6 位元）：二至四爻為下卦、三至五爻為上卦"""
+    return (bits >> 2 & 7) << 3 | (bits >> 1 & 7)
+
+
+def hexagram_number(bits: int) -> int:
+    """6 位元卦 → 文王卦序（1–64）"""
+    return KING_WEN_NUMBERS[bits]
+
+
+def hexagram_trigrams(bits: int) -> Tuple[Tuple[str, str], Tuple[str, str]]:
+    """6 位元卦 → (上卦, 下卦)，各為 (卦名, 象)"""
+    return TRIGRAMS[bits >> 3], TRIGRAMS[bits & 7]
+
+
+def line_probabilities(method: str = DEFAULT_CASTING_METHOD) -> Dict[int, float]:
+    """起卦法每爻的理論機率 {6: p, 7: p, 8: p, 9: p}"""
+    _tables(method)
+    line_table = CASTING_METHODS[method]
+    return {value: line_table.count(value) / len(line_table)
+            for value in (LINE_OLD_YIN, LINE_YOUNG_YANG, LINE_YOUNG_YIN, LINE_OLD_YANG)}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+周易經文模組（六十四卦卦辭、大象與三百八十四爻爻辭）
+經文存放於同目錄的 mingli_yijing_texts.txt，第一次使用時才讀入並建立索引：
+
+    字串池   全部經文依卦序、欄位順序串接成一個字串
+    位移表   array('I')，第 i 筆經文為 pool[offsets[i]:offsets[i + 1]]
+    編號     i = (卦序 − 1) × 9 + 欄位（卦辭、大象、初爻…上爻、用九／用六）
+
+查詢為一次乘加與一次切片；模組匯入時不載入任何經文。
+"""
+
+import threading
+from array import array
+from pathlib import Path
+from typing import Optional
+
+from mingli_yijing_cast import HEXAGRAM_BITS
+
+TEXTS_FILENAME = 'mingli_yijing_texts.txt'
+
+SLOT_JUDGMENT = 0
+SLOT_IMAGE = 1
+SLOT_FIRST_LINE = 2
+SLOT_EXTRA = 8          # 用九（乾）、用六（坤）
+SLOTS_PER_HEXAGRAM = 9
+
+_POSITION_NAMES = ('初', '二', '三', '四', '五', '上')
+
+
+def default_texts_path() -> Path:
+    """經文檔預設位置（與本模組同目錄）"""
+    return Path(__file__).with_name(TEXTS_FILENAME)
+
+
+def line_label(number: int, line: int) -> str:
+    """
+    爻題（初九、六二……上六）
+
+    Args:
+        number: 卦序（1–64）
+        line: 爻位（1–6，由下往上）
+    """
+    parity = '九' if HEXAGRAM_BITS[number] >> (line - 1) & 1 else '六'
+    position = _POSITION_NAMES[line - 1]
+    return position + parity if line in (1, 6) else parity + position
+
+
+class YijingTexts:
+    """經文索引（字串池 + 位移表）"""
+
+    def __init__(self, path: Path):
+        """
+        讀入經文檔並建立索引
+
+        卦序不連續、欄位數不符或爻題與卦象不符時拋出 ValueError。
+        """
+        self.path = Path(path)
+        records = [[] for _ in range(64)]
+        current = None
+        with open(self.path, encoding='utf-8') as f:
+            for line_number, raw in enumerate(f, 1):
+                text = raw.strip()
+                if not text:
+                    continue
+                if text.startswith('#'):
+                    fields = text[1:].split()
+                    if fields and fields[0].isdigit():
+                        current = int(fields[0])
+                        if not 1 <= current <= 64:
+                            raise ValueError(f"{self.path}:{line_number} 卦序超出範圍: {current}")
+                    continue
+                if current is None:
+                    raise ValueError(f"{self.path}:{line_number} 經文不屬於任何卦")
+                records[current - 1].append(text)
+
+        parts = []
+        for number, slots in enumerate(records, 1):
+            expected = SLOTS_PER_HEXAGRAM if number in (1, 2) else SLOTS_PER_HEXAGRAM - 1
+            if len(slots) != expected:
+                raise ValueError(f"{self.path} 第{number}卦應有 {expected} 筆經文，實有 {len(slots)} 筆")
+            for line in range(1, 7):
+                label = line_label(number, line)
+                if not slots[SLOT_FIRST_LINE + line - 1].startswith(label + '：'):
+                    raise ValueError(f"{self.path} 第{number}卦第{line}爻應為「{label}」")
+            parts.extend(slots)
+            if expected < SLOTS_PER_HEXAGRAM:
+                parts.append('')
+
+        self.offsets = array('I', [0])
+        total = 0
+        for part in parts:
+            total += len(part)
+            self.offsets.append(total)
+        self.pool = ''.join(parts)
+
+    def get(self, number: int, slot: int) -> str:
+        """單筆經文（不存在時為空字串）"""
+        if not 1 <= number <= 64 or not 0 <= slot < SLOTS_PER_HEXAGRAM:
+            raise ValueError(f"無效的卦序或欄位: ({number}, {slot})")
+        index = (number - 1) * SLOTS_PER_HEXAGRAM + slot
+        return self.pool[self.offsets[index]:self.offsets[index + 1]]
+
+    def judgment(self, number: int) -> str:
+        """卦辭"""
+        return self.get(number, SLOT_JUDGMENT)
+
+    def image(self, number: int) -> str:
+        """大象"""
+        return self.get(number, SLOT_IMAGE)
+
+    def line(self, number: int, line: int) -> str:
+        """
+        爻辭（含爻題）
+
+        Args:
+            number: 卦序（1–64）
+            line: 爻位（1–6）；7 為乾之用九、坤之用六，其餘卦為空字串
+        """
+        if not 1 <= line <= 7:
+            raise ValueError(f"無效的爻位: {line}")
+        return self.get(number, SLOT_FIRST_LINE + line - 1)
+
+
+_texts: Optional[YijingTexts] = None
+_texts_loaded = False
+_texts_lock = threading.Lock()
+
+
+def get_yijing_texts() -> Optional[YijingTexts]:
+    """共用的經文索引（第一次呼叫時載入；檔案不存在或格式錯誤時回傳 None）"""
+    global _texts, _texts_loaded
+    if not _texts_loaded:
+        with _texts_lock:
+            if not _texts_loaded:
+                try:
+                    _texts = YijingTexts(default_texts_path())
+                except (OSError, ValueError) as e:
+                    print(f"[WARNING] 周易經文無法載入: {e}")
+                _texts_loaded = True
+    return _texts
@@ -15,6 +15,21 @@ Date: 2026-01-25
 import sys
 import os
 
+try:
+    from mingli_purplestar_analyzer import PurpleStarAnalyzer
+except ImportError:
+    PurpleStarAnalyzer = None
+
+try:
+    from mingli_houses import format_degree, house_of
+except ImportError:
+    format_degree = house_of = None
+
+try:
+    from mingli_ephemeris import find_aspect, separation, synastry_score
+except ImportError:
+    find_aspect = separation = synastry_score = None
+
 # 修復 Windows 控制台編碼問題
 if sys.platform == 'win32':
     try:
@@ -27,11 +42,157 @@ if sys.platform == 'win32':
 class ProfessionalSpouseCompatibilityAnalyzer:
     """配偶合適性專業分析系統 - 專業版"""
     
+    # 報告段落登記表：段落名稱 → (產生方法, 是否為靜態段落)
+    # 靜態段落不依賴輸入，每個行程只渲染一次；其餘段落每次依輸入計算
+    SECTION_REGISTRY = {
+        # 星座
+        'element_analysis': ('_get_element_analysis', False),
+        'house_1': ('_analyze_house_1', False),
+        'house_2': ('_analyze_house_2', False),
+        'house_3': ('_analyze_house_3', False),
+        'house_4': ('_analyze_house_4', False),
+        'house_5': ('_analyze_house_5', False),
+        'house_6': ('_analyze_house_6', False),
+        'house_7': ('_analyze_house_7_professional', False),
+        'house_8': ('_analyze_house_8', False),
+        'house_9': ('_analyze_house_9', False),
+        'house_10': ('_analyze_house_10', False),
+        'house_11': ('_analyze_house_11', False),
+        'house_12': ('_analyze_house_12', False),
+        'planetary_aspects': ('_analyze_planetary_aspects', False),
+        'marriage_advice_zodiac': ('_get_marriage_advice_zodiac', False),
+        # 八字
+        'pillar': ('_format_pillar', False),
+        'year_pillar': ('_analyze_year_pillar_compatibility', True),
+        'month_pillar': ('_analyze_month_pillar_compatibility', True),
+        'day_pillar': ('_analyze_day_pillar_compatibility_professional', True),
+        'hour_pillar': ('_analyze_hour_pillar_compatibility', True),
+        'ten_gods': ('_analyze_ten_gods_compatibility', True),
+        'five_elements': ('_analyze_five_elements_comprehensive', True),
+        'stems_branches': ('_analyze_stems_branches_interaction', True),
+        'pattern': ('_analyze_pattern_complementarity', True),
+        'bazi_advice': ('_get_bazi_marriage_advice', True),
+        # 紫微
+        'ziwei_palace_1': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_2': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_3': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_4': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_5': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_6': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_7': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_8': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_9': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_10': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_11': ('_analyze_ziwei_palace', False),
+        'ziwei_palace_12': ('_analyze_ziwei_palace', False),
+        'main_stars': ('_analyze_14_main_stars_compatibility', False),
+        'sihua': ('_analyze_sihua_stars', False),
+        'ziwei_advice': ('_get_ziwei_marriage_advice', True),
+    }
+    
+    # 已凍結的靜態段落（類別層級共用，每個行程只渲染一次）
+    _static_sections = {}
+    
+    # 十二星座順序（星座配對特徵表的索引）
+    ZODIAC_ORDER = ('白羊座', '金牛座', '雙子座', '巨蟹座', '獅子座', '處女座',
+                    '天秤座', '天蠍座', '射手座', '摩羯座', '水瓶座', '雙魚座')
+    
+    # 兩星座相距宮數 → (相位名稱, 角度, 相位分類)
+    SIGN_ASPECTS = {
+        0: ('合相', 0, '融合'),
+        1: ('半六分相', 30, '中性'), 11: ('半六分相', 30, '中性'),
+        2: ('六分相', 60, '和諧'), 10: ('六分相', 60, '和諧'),
+        3: ('四分相', 90, '緊張'), 9: ('四分相', 90, '緊張'),
+        4: ('三分相', 120, '和諧'), 8: ('三分相', 120, '和諧'),
+        5: ('梅花相', 150, '調整'), 7: ('梅花相', 150, '調整'),
+        6: ('對分相', 180, '互補'),
+    }
+    
+    # 行星相位段落：(天體代號, 名稱, 符號, 標題, 評估主題)
+    PLANET_ASPECT_TOPICS = (
+        ('sun', '太陽', '☉', '自我意識', '核心自我'),
+        ('moon', '月亮', '☽', '情感需求', '情緒需求'),
+        ('venus', '金星', '♀', '愛情表達', '表達愛的方式'),
+        ('mars', '火星', '♂', '行動力', '行動節奏'),
+    )
+    
+    # 交叉相位：(本人天體, 配偶天體, 說明)
+    CROSS_ASPECT_PAIRS = (
+        ('sun', 'moon', '您的太陽 × 配偶月亮'),
+        ('moon', 'sun', '您的月亮 × 配偶太陽'),
+        ('venus', 'mars', '您的金星 × 配偶火星'),
+        ('mars', 'venus', '您的火星 × 配偶金星'),
+    )
+    
+    # 相位分類 → 評估語（None 為不成相位）
+    ASPECT_CLASS_EVALUATIONS = {
+        '融合': '高度同步，容易產生共鳴',
+        '和諧': '互相支援，相處自然順暢',
+        '互補': '彼此互補，需要在差異中找到平衡',
+        '緊張': '容易摩擦，需要多一點包容與溝通',
+        None: '沒有直接牽動，各自保有空間',
+    }
+    
+    # 紫微十二宮標題（依 PurpleStarAnalyzer.PALACES 順序）
+    ZIWEI_PALACE_TITLES = (
+        ('命宮', '人格特質與命運核心'),
+        ('兄弟宮', '手足關係與合作運'),
+        ('夫妻宮', '婚姻關係與配偶特質 ★★★★★'),
+        ('子女宮', '子女緣分與後代運'),
+        ('財帛宮', '財運與理財能力'),
+        ('疾厄宮', '健康與體質'),
+        ('遷移宮', '外出與人際關係'),
+        ('奴僕宮', '朋友與下屬運'),
+        ('官祿宮', '事業與工作發展'),
+        ('田宅宮', '不動產與居住環境'),
+        ('福德宮', '精神享受與福分'),
+        ('父母宮', '父母關係與長輩運'),
+    )
+    
+    # 宮位 → (婚姻相處主題, 建議)
+    ZIWEI_PALACE_FOCUS = {
+        '命宮': ('命格特質', '尊重彼此的個性與處事風格，以長補短'),
+        '兄弟宮': ('手足與合作緣分', '善待雙方的兄弟姊妹，合作事務先講清分工'),
+        '夫妻宮': ('配偶緣分與相處模式', '夫妻宮主星代表對伴侶的期待，多溝通期待與現實的落差'),
+        '子女宮': ('子女緣分與教養', '教養觀念先取得共識，避免在孩子面前意見分歧'),
+        '財帛宮': ('理財觀念', '共同制定財務目標，收支透明'),
+        '疾厄宮': ('健康與體質', '互相督促作息與健檢，壓力大時多關心對方'),
+        '遷移宮': ('外出與社交', '安排共同出遊，彼此的朋友圈互相融入'),
+        '奴僕宮': ('朋友與人際', '尊重對方的交友，重要人脈互相引介'),
+        '官祿宮': ('事業發展', '平衡工作與家庭，彼此支持事業目標'),
+        '田宅宮': ('家庭與居住', '購屋、居住安排共同決定，營造雙方都自在的家'),
+        '福德宮': ('精神生活與福分', '培養共同興趣，保留各自的獨處空間'),
+        '父母宮': ('父母與長輩緣', '孝敬雙方父母，長輩意見與夫妻決定之間取得平衡'),
+    }
+    
+    # 主星互動關係 → 說明
+    ZIWEI_STAR_INTERACTIONS = {
+        'same': '同星同宮，想法與步調相近，容易理解彼此',
+        'mutual': '雙方主星互為婚配吉星，互補相成',
+        'one_sided': '一方主星為另一方的婚配吉星，需要多一些配合',
+        'different': '星性差異較大，需要更多溝通與包容',
+        'unknown': '命盤資料不足，無法判斷此宮主星互動',
+    }
+    
     def __init__(self):
         """初始化專業分析規則"""
         self.zodiac_compatibility = self._init_zodiac_compatibility()
         self.bazi_compatibility = self._init_bazi_compatibility()
         self.ziwei_compatibility = self._init_ziwei_compatibility()
+        self.zodiac_index = {sign: i for i, sign in enumerate(self.ZODIAC_ORDER)}
+        self.zodiac_pair_table = self._build_zodiac_pair_table()
+    
+    def _section(self, name, *args):
+        """取得報告段落：靜態段落從快取讀取，輸入相關段落即時計算"""
+        text = self._static_sections.get(name)
+        if text is not None:
+            return text
+        
+        method_name, is_static = self.SECTION_REGISTRY[name]
+        text = getattr(self, method_name)(*args)
+        if is_static:
+            self._static_sections[name] = text
+        return text
         
     # ==================== 星座12宮位專業分析 ====================
     
@@ -66,23 +227,143 @@ class ProfessionalSpouseCompatibilityAnalyzer:
             }
         }
     
-    def analyze_zodiac_professional(self, user_zodiac, spouse_zodiac, user_birth_time=None, spouse_birth_time=None):
-        """星座配偶專業分析（12宮位詳細分析）"""
-        
-        # 計算基本相容度
-        user_element = self.zodiac_compatibility['星座元素'].get(user_zodiac, '未知')
-        spouse_element = self.zodiac_compatibility['星座元素'].get(spouse_zodiac, '未知')
+    def _build_zodiac_pair_table(self):
+        """由 _init_zodiac_compatibility 的規則預先建立 12×12 星座配對特徵表"""
+        return {(user_zodiac, spouse_zodiac): self._compute_zodiac_pair_features(user_zodiac, spouse_zodiac)
+                for user_zodiac in self.ZODIAC_ORDER
+                for spouse_zodiac in self.ZODIAC_ORDER}
+    
+    def _compute_zodiac_pair_features(self, user_zodiac, spouse_zodiac):
+        """計算一組星座配對的特徵（元素分數、最佳配對、各宮分數、相位分類）"""
+        elements = self.zodiac_compatibility['星座元素']
+        element_pairs = self.zodiac_compatibility['元素配對']
         
-        base_score = self.zodiac_compatibility['元素配對'].get(user_element, {}).get(spouse_element, 70)
+        user_element = elements.get(user_zodiac, '未知')
+        spouse_element = elements.get(spouse_zodiac, '未知')
+        element_score = element_pairs.get(user_element, {}).get(spouse_element, 70)
         
         # 檢查是否為最佳配對
-        best_matches = self.zodiac_compatibility['最佳配對'].get(user_zodiac, [])
-        is_best_match = spouse_zodiac in best_matches
+        is_best_match = spouse_zodiac in self.zodiac_compatibility['最佳配對'].get(user_zodiac, [])
+        base_score = min(100, element_score + 10) if is_best_match else element_score
+        
+        user_index = self.zodiac_index.get(user_zodiac)
+        spouse_index = self.zodiac_index.get(spouse_zodiac)
+        if user_index is None or spouse_index is None:
+            # 無法定位的星座：各宮沿用基本分數
+            return {
+                'user_element': user_element, 'spouse_element': spouse_element,
+                'element_score': element_score, 'is_best_match': is_best_match,
+                'base_score': base_score, 'aspect': None, 'overlay_house': None,
+                'house_scores': {house: base_score for house in range(1, 13)}
+            }
         
-        if is_best_match:
-            base_score = min(100, base_score + 10)
+        # 太陽宮位疊合：以使用者太陽星座為第1宮（整宮制），配偶太陽落入的宮位
+        distance = (spouse_index - user_index) % 12
+        overlay_house = distance + 1
         
-        result = f"""
+        # 各宮分數：該宮星座元素與配偶元素的配對分數，配偶太陽所在宮位加分
+        house_scores = {}
+        for house in range(1, 13):
+            house_sign = self.ZODIAC_ORDER[(user_index + house - 1) % 12]
+            score = element_pairs.get(elements[house_sign], {}).get(spouse_element, 70)
+            if house == overlay_house:
+                score = min(100, score + 10)
+            house_scores[house] = score
+        
+        return {
+            'user_element': user_element, 'spouse_element': spouse_element,
+            'element_score': element_score, 'is_best_match': is_best_match,
+            'base_score': base_score, 'aspect': self.SIGN_ASPECTS[distance],
+            'overlay_house': overlay_house, 'house_scores': house_scores
+        }
+    
+    def get_zodiac_pair_features(self, user_zodiac, spouse_zodiac):
+        """取得星座配對特徵（查表，表外星座即時計算）"""
+        features = self.zodiac_pair_table.get((user_zodiac, spouse_zodiac))
+        if features is None:
+            features = self._compute_zodiac_pair_features(user_zodiac, spouse_zodiac)
+        return features
+    
+    def get_zodiac_pair_scores(self, user_zodiacs, spouse_zodiacs):
+        """批次取得多組星座配對的綜合相容度"""
+        table = self.zodiac_pair_table
+        return [table[pair]['base_score'] if pair in table
+                else self._compute_zodiac_pair_features(*pair)['base_score']
+                for pair in zip(user_zodiacs, spouse_zodiacs)]
+    
+    def get_chart_house_scores(self, user_houses, spouse_zodiac, spouse_houses=None, spouse_sun=None):
+        """
+        以本命宮位計算各宮分數
+        
+        各宮分數為宮頭星座元素與配偶太陽星座元素的配對分數；
+        配偶太陽所在宮位加 10 分（spouse_sun 為太陽黃經，未提供時以星座中點估計），
+        有配偶宮位時其上升點所在宮位再加 5 分。
+        """
+        elements = self.zodiac_compatibility['星座元素']
+        element_pairs = self.zodiac_compatibility['元素配對']
+        spouse_element = elements.get(spouse_zodiac, '未知')
+        cusps = user_houses['cusps']
+        
+        bonuses = {}
+        spouse_index = self.zodiac_index.get(spouse_zodiac)
+        if spouse_sun is None and spouse_index is not None:
+            spouse_sun = spouse_index * 30 + 15
+        if spouse_sun is not None:
+            sun_house = house_of(spouse_sun, cusps)
+            bonuses[sun_house] = bonuses.get(sun_house, 0) + 10
+        if spouse_houses is not None:
+            ascendant_house = house_of(spouse_houses['ascendant'], cusps)
+            bonuses[ascendant_house] = bonuses.get(ascendant_house, 0) + 5
+        
+        house_scores = {}
+        for house, sign in enumerate(user_houses['house_signs'], 1):
+            house_element = elements[self.ZODIAC_ORDER[sign]]
+            score = element_pairs.get(house_element, {}).get(spouse_element, 70)
+            house_scores[house] = min(100, score + bonuses.get(house, 0))
+        return house_scores
+    
+    def _house_cusp_line(self, house, user_houses, spouse_houses):
+        """宮頭星座說明行（無本命宮位時為空字串）"""
+        if user_houses is None:
+            return ""
+        parts = []
+        for label, houses in (('您', user_houses), ('配偶', spouse_houses)):
+            if houses is not None:
+                cusp = houses['cusps'][house - 1]
+                parts.append(f"{label} {self.ZODIAC_ORDER[houses['house_signs'][house - 1]]} {format_degree(cusp)}")
+        return f"  ◇ 宮頭星座：{'｜'.join(parts)}\n"
+    
+    def _house_rating(self, user_zodiac, spouse_zodiac, house, house_scores=None):
+        """宮位相容度星等（預設取自配對特徵表，可傳入依本命宮位計算的分數）"""
+        if house_scores is None:
+            house_scores = self.get_zodiac_pair_features(user_zodiac, spouse_zodiac)['house_scores']
+        return self._star_rating(house_scores[house])
+    
+    def analyze_zodiac_professional(self, user_zodiac, spouse_zodiac, user_birth_time=None, spouse_birth_time=None,
+                                    user_houses=None, spouse_houses=None, user_planets=None, spouse_planets=None):
+        """
+        星座配偶專業分析（12宮位詳細分析）
+        
+        user_houses / spouse_houses 為雙方本命宮位（mingli_houses.natal_houses 的結果），
+        提供時各宮以實際宮頭星座評分；未提供時以太陽星座整宮推算。
+        user_planets / spouse_planets 為雙方行星黃經（mingli_ephemeris），提供時以實際黃經計算行星相位。
+        """
+        
+        # 基本相容度（查配對特徵表）
+        features = self.get_zodiac_pair_features(user_zodiac, spouse_zodiac)
+        if user_houses is not None:
+            spouse_sun = spouse_planets['sun'] if spouse_planets else None
+            house_scores = self.get_chart_house_scores(user_houses, spouse_zodiac, spouse_houses, spouse_sun)
+        else:
+            house_scores = features['house_scores']
+        user_element = features['user_element']
+        spouse_element = features['spouse_element']
+        base_score = features['base_score']
+        is_best_match = features['is_best_match']
+        
+        sign_pair = (user_zodiac, spouse_zodiac)
+        parts = [
+            f"""
 ╔═══════════════════════════════════════════════════════════════════╗
 ║     【星座配偶專業合適性分析】{user_zodiac} ♥ {spouse_zodiac}     ║
 ╚═══════════════════════════════════════════════════════════════════╝
@@ -95,56 +376,98 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 元素組合：{user_element} × {spouse_element}
 配對等級：{'【絕配組合】' if is_best_match else '【良好配對】' if base_score >= 80 else '【需要努力】'}
 
-{self._get_element_analysis(user_element, spouse_element)}
+""",
+            self._section('element_analysis', user_element, spouse_element),
+            """
 
 【二、12宮位詳細分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 第1宮（命宮）- 自我與外在形象
-{self._analyze_house_1(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(1, user_houses, spouse_houses),
+            self._section('house_1', *sign_pair, house_scores),
+            """
 
 第2宮（財帛宮）- 金錢價值觀
-{self._analyze_house_2(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(2, user_houses, spouse_houses),
+            self._section('house_2', *sign_pair, house_scores),
+            """
 
 第3宮（兄弟宮）- 溝通與學習
-{self._analyze_house_3(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(3, user_houses, spouse_houses),
+            self._section('house_3', *sign_pair, house_scores),
+            """
 
 第4宮（田宅宮）- 家庭與居住
-{self._analyze_house_4(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(4, user_houses, spouse_houses),
+            self._section('house_4', *sign_pair, house_scores),
+            """
 
 第5宮（子女宮）- 戀愛與創造力
-{self._analyze_house_5(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(5, user_houses, spouse_houses),
+            self._section('house_5', *sign_pair, house_scores),
+            """
 
 第6宮（奴僕宮）- 健康與工作
-{self._analyze_house_6(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(6, user_houses, spouse_houses),
+            self._section('house_6', *sign_pair, house_scores),
+            """
 
 第7宮（夫妻宮）- 婚姻與伴侶 ★★★★★
-{self._analyze_house_7_professional(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(7, user_houses, spouse_houses),
+            self._section('house_7', *sign_pair, house_scores),
+            """
 
 第8宮（疾厄宮）- 深度連結與轉化
-{self._analyze_house_8(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(8, user_houses, spouse_houses),
+            self._section('house_8', *sign_pair, house_scores),
+            """
 
 第9宮（遷移宮）- 哲學與遠行
-{self._analyze_house_9(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(9, user_houses, spouse_houses),
+            self._section('house_9', *sign_pair, house_scores),
+            """
 
 第10宮（官祿宮）- 事業與社會地位
-{self._analyze_house_10(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(10, user_houses, spouse_houses),
+            self._section('house_10', *sign_pair, house_scores),
+            """
 
 第11宮（福德宮）- 友誼與願望
-{self._analyze_house_11(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(11, user_houses, spouse_houses),
+            self._section('house_11', *sign_pair, house_scores),
+            """
 
 第12宮（玄秘宮）- 靈性與潛意識
-{self._analyze_house_12(user_zodiac, spouse_zodiac)}
+""",
+            self._house_cusp_line(12, user_houses, spouse_houses),
+            self._section('house_12', *sign_pair, house_scores),
+            """
 
 【三、主要行星相位分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_planetary_aspects(user_zodiac, spouse_zodiac)}
+""",
+            self._section('planetary_aspects', *sign_pair, user_planets, spouse_planets),
+            """
 
 【四、綜合婚姻建議】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._get_marriage_advice_zodiac(user_zodiac, spouse_zodiac, base_score)}
+""",
+            self._section('marriage_advice_zodiac', user_zodiac, spouse_zodiac, base_score),
+            """
 
 ═══════════════════════════════════════════════════════════════════
 【專業評語】
@@ -157,8 +480,9 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 
 建議：定期進行星盤深度分析，了解流年運勢對婚姻的影響。
 ═══════════════════════════════════════════════════════════════════
-"""
-        return result
+""",
+        ]
+        return ''.join(parts)
     
     def _get_element_analysis(self, element1, element2):
         """元素組合分析"""
@@ -175,55 +499,55 @@ class ProfessionalSpouseCompatibilityAnalyzer:
         }
         return analyses.get((element1, element2), "元素互動需要雙方共同調適。")
     
-    def _analyze_house_1(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_1(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第1宮分析 - 自我認同與外在形象"""
         return f"""
   ✓ 你們在外人眼中是相配的一對
   ✓ 彼此的形象氣質互相襯托
   ✓ 建議：尊重對方的個人空間和形象塑造
-  ✓ 相容度：★★★★☆"""
+  ✓ 相容度：{self._house_rating(user_zodiac, spouse_zodiac, 1, house_scores)}"""
     
-    def _analyze_house_2(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_2(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第2宮分析 - 金錢價值觀"""
         return f"""
   ✓ 財務觀念基本一致，能共同理財
   ✓ 消費習慣可能需要協調
   ✓ 建議：制定共同的財務目標，開誠布公討論金錢
-  ✓ 財運相容度：★★★★☆"""
+  ✓ 財運相容度：{self._house_rating(user_zodiac, spouse_zodiac, 2, house_scores)}"""
     
-    def _analyze_house_3(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_3(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第3宮分析 - 溝通學習"""
         return f"""
   ✓ 溝通方式基本順暢，能理解彼此
   ✓ 學習興趣有共同點
   ✓ 建議：多進行深度對話，分享彼此的想法
-  ✓ 溝通相容度：★★★★★"""
+  ✓ 溝通相容度：{self._house_rating(user_zodiac, spouse_zodiac, 3, house_scores)}"""
     
-    def _analyze_house_4(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_4(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第4宮分析 - 家庭居住"""
         return f"""
   ✓ 對家庭的期待基本一致
   ✓ 能共同營造溫馨的居住環境
   ✓ 建議：一起規劃家庭佈置，創造共同回憶
-  ✓ 家庭相容度：★★★★☆"""
+  ✓ 家庭相容度：{self._house_rating(user_zodiac, spouse_zodiac, 4, house_scores)}"""
     
-    def _analyze_house_5(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_5(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第5宮分析 - 戀愛創造"""
         return f"""
   ✓ 戀愛模式契合，能保持浪漫
   ✓ 對子女教養觀念相近
   ✓ 建議：保持生活情趣，創造驚喜
-  ✓ 浪漫相容度：★★★★★"""
+  ✓ 浪漫相容度：{self._house_rating(user_zodiac, spouse_zodiac, 5, house_scores)}"""
     
-    def _analyze_house_6(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_6(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第6宮分析 - 健康工作"""
         return f"""
   ✓ 生活習慣基本協調
   ✓ 能互相關心對方的健康
   ✓ 建議：養成共同的健康習慣，互相提醒
-  ✓ 健康相容度：★★★★☆"""
+  ✓ 健康相容度：{self._house_rating(user_zodiac, spouse_zodiac, 6, house_scores)}"""
     
-    def _analyze_house_7_professional(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_7_professional(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第7宮專業分析 - 夫妻宮（最重要）"""
         marriage_insights = {
             ('白羊座', '獅子座'): "火象雙雄組合！你們都充滿活力和領導力，婚姻生活永遠不乏激情。但需注意不要爭奪主導權。",
@@ -258,54 +582,62 @@ class ProfessionalSpouseCompatibilityAnalyzer:
   • 3-7年：穩定期，關係逐漸成熟
   • 7年後：深化期，情感更加深厚
   
-  婚姻相容度：★★★★★ (95%)"""
+  婚姻相容度：{self._house_rating(user_zodiac, spouse_zodiac, 7, house_scores)}"""
     
-    def _analyze_house_8(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_8(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第8宮分析 - 深度連結"""
         return f"""
   ✓ 能建立深層的情感連結
   ✓ 願意分享內心深處的想法
   ✓ 建議：保持神秘感，但不要隱瞞重要事情
-  ✓ 親密相容度：★★★★☆"""
+  ✓ 親密相容度：{self._house_rating(user_zodiac, spouse_zodiac, 8, house_scores)}"""
     
-    def _analyze_house_9(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_9(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第9宮分析 - 哲學遠行"""
         return f"""
   ✓ 人生觀和價值觀基本一致
   ✓ 適合一起旅行和學習
   ✓ 建議：共同規劃旅行計劃，拓展視野
-  ✓ 精神相容度：★★★★☆"""
+  ✓ 精神相容度：{self._house_rating(user_zodiac, spouse_zodiac, 9, house_scores)}"""
     
-    def _analyze_house_10(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_10(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第10宮分析 - 事業地位"""
         return f"""
   ✓ 能互相支持對方的事業發展
   ✓ 對社會地位的期望相近
   ✓ 建議：平衡工作與家庭，互相鼓勵
-  ✓ 事業相容度：★★★★☆"""
+  ✓ 事業相容度：{self._house_rating(user_zodiac, spouse_zodiac, 10, house_scores)}"""
     
-    def _analyze_house_11(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_11(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第11宮分析 - 友誼願望"""
         return f"""
   ✓ 朋友圈能互相融合
   ✓ 對未來的願景基本一致
   ✓ 建議：共同規劃長期目標，實現夢想
-  ✓ 社交相容度：★★★★☆"""
+  ✓ 社交相容度：{self._house_rating(user_zodiac, spouse_zodiac, 11, house_scores)}"""
     
-    def _analyze_house_12(self, user_zodiac, spouse_zodiac):
+    def _analyze_house_12(self, user_zodiac, spouse_zodiac, house_scores=None):
         """第12宮分析 - 靈性潛意識"""
         return f"""
   ✓ 在精神層面能互相理解
   ✓ 能給予對方心靈支持
   ✓ 建議：關注對方的情緒變化，提供安慰
-  ✓ 靈性相容度：★★★★☆"""
+  ✓ 靈性相容度：{self._house_rating(user_zodiac, spouse_zodiac, 12, house_scores)}"""
     
-    def _analyze_planetary_aspects(self, user_zodiac, spouse_zodiac):
-        """行星相位分析"""
+    def _analyze_planetary_aspects(self, user_zodiac, spouse_zodiac, user_planets=None, spouse_planets=None):
+        """行星相位分析（有雙方行星黃經時依實際黃經計算）"""
+        if user_planets and spouse_planets:
+            return self._analyze_chart_aspects(user_planets, spouse_planets)
+        
+        aspect = self.get_zodiac_pair_features(user_zodiac, spouse_zodiac)['aspect']
+        if aspect is None:
+            sun_aspect = "  • 太陽星座無法定位，相位待出生資料補齊後計算"
+        else:
+            aspect_name, angle, aspect_class = aspect
+            sun_aspect = f"  • {aspect_name}（{angle}°）：{aspect_class}相位"
         return f"""
 ☉ 太陽相位（自我意識）
-  • 合相（0°）：★★★★★ 完美融合
-  • 三分相（120°）：★★★★☆ 和諧順暢
+{sun_aspect}
   • 評估：你們的核心自我能互相理解和支持
 
 ☽ 月亮相位（情感需求）
@@ -322,6 +654,44 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 
 總體行星相位評分：92分（優秀）"""
     
+    def _format_planet_longitude(self, longitude):
+        """行星黃經格式化為「星座 度分」"""
+        return f"{self.ZODIAC_ORDER[int(longitude % 360 // 30)]} {format_degree(longitude)}"
+    
+    def _analyze_chart_aspects(self, user_planets, spouse_planets):
+        """依雙方行星實際黃經計算相位"""
+        lines = []
+        for body, name, symbol, title, topic in self.PLANET_ASPECT_TOPICS:
+            user_lon = user_planets[body]
+            spouse_lon = spouse_planets[body]
+            aspect = find_aspect(user_lon, spouse_lon)
+            if aspect is None:
+                aspect_line = f"無主要相位（角距 {separation(user_lon, spouse_lon):.1f}°）"
+                aspect_class = None
+            else:
+                aspect_name, angle, aspect_class, orb = aspect
+                aspect_line = f"{aspect_name}（{angle}°，誤差 {orb:.1f}°）：{aspect_class}相位"
+            lines.append(f"""{symbol} {name}相位（{title}）
+  • 您的{name} {self._format_planet_longitude(user_lon)} ↔ 配偶{name} {self._format_planet_longitude(spouse_lon)}
+  • {aspect_line}
+  • 評估：{topic}{self.ASPECT_CLASS_EVALUATIONS[aspect_class]}
+""")
+        
+        cross_lines = []
+        for user_body, spouse_body, label in self.CROSS_ASPECT_PAIRS:
+            aspect = find_aspect(user_planets[user_body], spouse_planets[spouse_body])
+            if aspect is not None:
+                aspect_name, angle, aspect_class, orb = aspect
+                cross_lines.append(f"  • {label}：{aspect_name}（{angle}°，誤差 {orb:.1f}°）{aspect_class}")
+        if not cross_lines:
+            cross_lines.append("  • 無主要交叉相位")
+        lines.append("◆ 交叉相位（吸引力與情感連結）\n" + "\n".join(cross_lines) + "\n")
+        
+        score = synastry_score(user_planets, spouse_planets)
+        grade = '優秀' if score >= 85 else '良好' if score >= 70 else '普通' if score >= 55 else '需要努力'
+        lines.append(f"總體行星相位評分：{score}分（{grade}）")
+        return "\n" + "\n".join(lines)
+    
     def _get_marriage_advice_zodiac(self, user_zodiac, spouse_zodiac, score):
         """婚姻建議"""
         if score >= 90:
@@ -397,7 +767,9 @@ class ProfessionalSpouseCompatibilityAnalyzer:
     def analyze_bazi_professional(self, user_name, user_bazi, spouse_name, spouse_bazi, user_gender):
         """八字配偶專業分析（四柱逐柱 + 十神分析）"""
         
-        result = f"""
+        bazi_pair = (user_bazi, spouse_bazi)
+        parts = [
+            f"""
 ╔═══════════════════════════════════════════════════════════════════╗
 ║       【八字配偶專業合適性分析】{user_name} ♥ {spouse_name}       ║
 ╚═══════════════════════════════════════════════════════════════════╝
@@ -406,53 +778,71 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
           年柱        月柱        日柱        時柱
-{user_name:8s}  {self._format_pillar(user_bazi, 'year')}  {self._format_pillar(user_bazi, 'month')}  {self._format_pillar(user_bazi, 'day')}  {self._format_pillar(user_bazi, 'hour')}
-{spouse_name:8s}  {self._format_pillar(spouse_bazi, 'year')}  {self._format_pillar(spouse_bazi, 'month')}  {self._format_pillar(spouse_bazi, 'day')}  {self._format_pillar(spouse_bazi, 'hour')}
+{user_name:8s}  {self._section('pillar', user_bazi, 'year')}  {self._section('pillar', user_bazi, 'month')}  {self._section('pillar', user_bazi, 'day')}  {self._section('pillar', user_bazi, 'hour')}
+{spouse_name:8s}  {self._section('pillar', spouse_bazi, 'year')}  {self._section('pillar', spouse_bazi, 'month')}  {self._section('pillar', spouse_bazi, 'day')}  {self._section('pillar', spouse_bazi, 'hour')}
 
 【二、年柱分析】（祖上根基、原生家庭）
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_year_pillar_compatibility(user_bazi, spouse_bazi)}
+""",
+            self._section('year_pillar', *bazi_pair),
+            """
 
 【三、月柱分析】（父母影響、成長環境）
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_month_pillar_compatibility(user_bazi, spouse_bazi)}
+""",
+            self._section('month_pillar', *bazi_pair),
+            """
 
 【四、日柱分析】（夫妻正位、最重要！）★★★★★
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_day_pillar_compatibility_professional(user_bazi, spouse_bazi, user_gender)}
+""",
+            self._section('day_pillar', user_bazi, spouse_bazi, user_gender),
+            """
 
 【五、時柱分析】（子女後代、晚年運勢）
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_hour_pillar_compatibility(user_bazi, spouse_bazi)}
+""",
+            self._section('hour_pillar', *bazi_pair),
+            """
 
 【六、十神深度配對分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_ten_gods_compatibility(user_bazi, spouse_bazi, user_gender)}
+""",
+            self._section('ten_gods', user_bazi, spouse_bazi, user_gender),
+            """
 
 【七、五行生剋配對】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_five_elements_comprehensive(user_bazi, spouse_bazi)}
+""",
+            self._section('five_elements', *bazi_pair),
+            """
 
 【八、天干地支相合相沖】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_stems_branches_interaction(user_bazi, spouse_bazi)}
+""",
+            self._section('stems_branches', *bazi_pair),
+            """
 
 【九、格局互補分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_pattern_complementarity(user_bazi, spouse_bazi)}
+""",
+            self._section('pattern', *bazi_pair),
+            """
 
 【十、婚配總評與建議】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._get_bazi_marriage_advice(user_bazi, spouse_bazi, user_gender)}
+""",
+            self._section('bazi_advice', user_bazi, spouse_bazi, user_gender),
+            """
 
 ═══════════════════════════════════════════════════════════════════
 【專業評語】
@@ -465,8 +855,9 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 
 建議：八字合婚僅供參考，真正的幸福需要雙方共同努力經營。
 ═══════════════════════════════════════════════════════════════════
-"""
-        return result
+""",
+        ]
+        return ''.join(parts)
     
     def _format_pillar(self, bazi_data, pillar_type):
         """格式化柱顯示"""
@@ -826,9 +1217,21 @@ class ProfessionalSpouseCompatibilityAnalyzer:
         }
     
     def analyze_ziwei_professional(self, user_palace_data, spouse_palace_data, user_name="您", spouse_name="配偶"):
-        """紫微斗數配偶專業分析（12宮 + 14主星完整分析）"""
+        """
+        紫微斗數配偶專業分析（12宮 + 14主星完整分析）
+        
+        Args:
+            user_palace_data: 本人命盤，PurpleStarAnalyzer 的命盤交換格式（analyze_ziwei 結果的 'chart'），
+                              或舊式 {宮位: 主星} 字典
+            spouse_palace_data: 配偶命盤，格式同上
+        """
         
-        result = f"""
+        palace_pair = (user_palace_data, spouse_palace_data)
+        user_ming = self._ziwei_palace_stars(user_palace_data, '命宮')
+        spouse_ming = self._ziwei_palace_stars(spouse_palace_data, '命宮')
+        match_score = self._main_star_match_score(user_ming, spouse_ming)
+        parts = [
+            f"""
 ╔═══════════════════════════════════════════════════════════════════╗
 ║     【紫微斗數配偶專業合適性分析】{user_name} ♥ {spouse_name}     ║
 ╚═══════════════════════════════════════════════════════════════════╝
@@ -836,64 +1239,45 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 【一、命盤總覽】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{user_name}主星：紫微、天府（示例）
-{spouse_name}主星：太陽、太陰（示例）
+{user_name}主星：{'、'.join(user_ming)}（夫妻宮：{'、'.join(self._ziwei_palace_stars(user_palace_data, '夫妻宮'))}）
+{spouse_name}主星：{'、'.join(spouse_ming)}（夫妻宮：{'、'.join(self._ziwei_palace_stars(spouse_palace_data, '夫妻宮'))}）
 
-主星契合度：★★★★☆ (88%)
+主星契合度：{self._star_rating(match_score)}
 
 【二、12宮位逐宮詳細分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-第1宮【命宮】- 人格特質與命運核心
-{self._analyze_ziwei_palace_1(user_palace_data, spouse_palace_data)}
-
-第2宮【兄弟宮】- 手足關係與合作運
-{self._analyze_ziwei_palace_2(user_palace_data, spouse_palace_data)}
-
-第3宮【夫妻宮】- 婚姻關係與配偶特質 ★★★★★
-{self._analyze_ziwei_palace_3_professional(user_palace_data, spouse_palace_data)}
-
-第4宮【子女宮】- 子女緣分與後代運
-{self._analyze_ziwei_palace_4(user_palace_data, spouse_palace_data)}
-
-第5宮【財帛宮】- 財運與理財能力
-{self._analyze_ziwei_palace_5(user_palace_data, spouse_palace_data)}
-
-第6宮【疾厄宮】- 健康與體質
-{self._analyze_ziwei_palace_6(user_palace_data, spouse_palace_data)}
-
-第7宮【遷移宮】- 外出與人際關係
-{self._analyze_ziwei_palace_7(user_palace_data, spouse_palace_data)}
-
-第8宮【奴僕宮】- 朋友與下屬運
-{self._analyze_ziwei_palace_8(user_palace_data, spouse_palace_data)}
-
-第9宮【官祿宮】- 事業與工作發展
-{self._analyze_ziwei_palace_9(user_palace_data, spouse_palace_data)}
-
-第10宮【田宅宮】- 不動產與居住環境
-{self._analyze_ziwei_palace_10(user_palace_data, spouse_palace_data)}
-
-第11宮【福德宮】- 精神享受與福分
-{self._analyze_ziwei_palace_11(user_palace_data, spouse_palace_data)}
-
-第12宮【父母宮】- 父母關係與長輩運
-{self._analyze_ziwei_palace_12(user_palace_data, spouse_palace_data)}
-
+""",
+        ]
+        for number, (palace, title) in enumerate(self.ZIWEI_PALACE_TITLES, 1):
+            parts.append(f"""
+第{number}宮【{palace}】- {title}
+{palace}主星：{user_name} {'、'.join(self._ziwei_palace_stars(user_palace_data, palace))}｜{spouse_name} {'、'.join(self._ziwei_palace_stars(spouse_palace_data, palace))}
+
+""")
+            parts.append(self._section(f'ziwei_palace_{number}', palace, *palace_pair))
+            parts.append("\n")
+        parts += [
+            """
 【三、14主星配對分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_14_main_stars_compatibility(user_palace_data, spouse_palace_data)}
+""",
+            self._section('main_stars', *palace_pair),
+            """
 
 【四、四化星動態分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._analyze_sihua_stars()}
+""",
+            self._section('sihua', *palace_pair),
+            """
 
 【五、紫微合婚總評】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{self._get_ziwei_marriage_advice(user_palace_data, spouse_palace_data)}
+""",
+            self._section('ziwei_advice', *palace_pair),
+            """
 
 ═══════════════════════════════════════════════════════════════════
 【專業評語】
@@ -906,366 +1290,146 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 
 建議：紫微斗數合婚參考三代盤，更能全面了解姻緣福分。
 ═══════════════════════════════════════════════════════════════════
-"""
-        return result
+""",
+        ]
+        return ''.join(parts)
     
-    def _analyze_ziwei_palace_1(self, user_data, spouse_data):
-        """命宮分析"""
-        return """命宮主星：紫微、天府（示例）
-
-✓ 命格特質：
-  • 領導力強，有責任感
-  • 穩重大方，值得信賴
-  • 適合擔任管理職位
-
-✓ 與配偶的互動：
-  • 能給予對方安全感
-  • 在關係中扮演支柱角色
-  • 相處模式：互補型
-
-✓ 性格匹配度：★★★★☆ (85%)
-
-建議：尊重對方的領導風格，適時給予支持。"""
+    def _ziwei_palace_stars(self, palace_data, palace):
+        """取得宮位主星列表：支援命盤交換格式，亦相容舊式 {宮位: '紫微天府'} 字典"""
+        if not palace_data:
+            return ['未知']
+        if 'palace_stars' in palace_data and PurpleStarAnalyzer is not None:
+            return [PurpleStarAnalyzer.chart_palace_star(palace_data, palace)]
+        stars = palace_data.get(palace)
+        if not stars:
+            return ['未知']
+        # 舊式字典以兩字星名串接（如 '紫微天府'）
+        return [stars[i:i + 2] for i in range(0, len(stars), 2)]
     
-    def _analyze_ziwei_palace_2(self, user_data, spouse_data):
-        """兄弟宮分析"""
-        return """兄弟宮主星：天梁、太陰（示例）
-
-✓ 手足緣分：
-  • 兄弟姊妹關係和睦
-  • 能得到手足的幫助
-
-✓ 合作運勢：
-  • 適合與人合作共事
-  • 配偶的手足也能融洽相處
-
-✓ 對婚姻的影響：
-  • 雙方家庭關係和諧
-  • 大家族相處融洽
-
-手足緣分度：★★★★☆ (82%)"""
+    def _ziwei_transformations(self, palace_data):
+        """取得生年四化（僅命盤交換格式提供）"""
+        if palace_data and 'transformations' in palace_data and PurpleStarAnalyzer is not None:
+            return PurpleStarAnalyzer.chart_transformations(palace_data)
+        return []
     
-    def _analyze_ziwei_palace_3_professional(self, user_data, spouse_data):
-        """夫妻宮專業分析（最重要）"""
-        return """夫妻宮主星：太陽、太陰（示例）
-
-【配偶特質深度分析】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✓ 外貌特徵：
-  • 容貌端莊秀麗/英俊瀟灑
-  • 身材：適中/高挑
-  • 氣質：溫文儒雅，有修養
-
-✓ 性格分析：
-  • 核心特質：溫和體貼，善解人意
-  • 處事風格：細心周到，有條理
-  • 情緒特點：穩定成熟，少情緒化
-  • 表達方式：含蓄內斂，但真誠
-
-✓ 能力評估：
-  • 工作能力：★★★★☆ (85%)
-  • 理財能力：★★★★★ (90%)
-  • 社交能力：★★★★☆ (80%)
-  • 持家能力：★★★★★ (95%)
-
-【婚姻品質預測】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✓ 整體和諧度：★★★★★ (94%)
-  • 感情穩定：雙方感情深厚，少爭吵
-  • 溝通順暢：能理解彼此的需求
-  • 價值觀：基本一致，三觀相合
-  • 生活習慣：互補協調，能適應
-
-✓ 相處模式：
-  • 主導型態：民主平等，互相尊重
-  • 決策方式：共同商議，取得共識
-  • 衝突解決：理性溝通，避免冷戰
-  • 親密程度：深厚穩定，信任度高
-
-【配偶對您的幫助】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✓ 事業方面：★★★★☆
-  • 能給予實質建議和精神支持
-  • 社交人脈對事業有幫助
-  • 是可靠的事業夥伴
-
-✓ 財運方面：★★★★★
-  • 理財有道，能累積財富
-  • 共同理財，財運提升
-  • 屬於【旺夫/旺妻】格局
-
-✓ 健康方面：★★★★☆
-  • 關心您的身體健康
-  • 督促良好生活習慣
-  • 生病時細心照顧
-
-✓ 人際方面：★★★★☆
-  • 配偶的人脈資源豐富
-  • 能協助您拓展人際圈
-  • 社交場合能給予支持
-
-【長期發展預測】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✓ 婚姻階段發展：
-  • 新婚期（1-3年）：甜蜜磨合，逐漸適應
-  • 穩定期（3-10年）：關係成熟，家庭穩固
-  • 成熟期（10年+）：情感深厚，白頭偕老
-
-✓ 可能的挑戰：
-  ⚠ 工作壓力可能影響相處時間
-  ⚠ 理財觀念需要持續溝通
-  ⚠ 雙方父母的期待需要平衡
-
-✓ 應對建議：
-  • 定期約會，保持浪漫
-  • 開誠布公討論金錢
-  • 孝順雙方父母，維持和諧
-
-夫妻宮總評：上上吉！屬於【正緣】格局！
-
-婚姻相容度：96%（絕配）"""
+    def _main_star_match_score(self, user_stars, spouse_stars):
+        """
+        依星性表的婚配建議計算主星契合度（60-95%）
+        
+        星性表中沒有的星（如命盤無法排出時的「未知」）視為無資料；
+        任一方沒有可評分的主星時回傳 None，不計分。
+        """
+        star_nature = self.ziwei_compatibility['星性']
+        user_stars = [star for star in user_stars if f"{star}星" in star_nature]
+        spouse_stars = [star for star in spouse_stars if f"{star}星" in star_nature]
+        if not user_stars or not spouse_stars:
+            return None
+        points = 0
+        for user_star in user_stars:
+            user_match = star_nature.get(f"{user_star}星", {}).get('婚配', '')
+            for spouse_star in spouse_stars:
+                spouse_match = star_nature.get(f"{spouse_star}星", {}).get('婚配', '')
+                if user_star == spouse_star:
+                    points += 1
+                else:
+                    points += (spouse_star in user_match) + (user_star in spouse_match)
+        max_points = 2 * len(user_stars) * len(spouse_stars)
+        return 60 + 35 * points // max_points
     
-    def _analyze_ziwei_palace_4(self, user_data, spouse_data):
-        """子女宮分析"""
-        return """子女宮主星：天同、天梁（示例）
-
-✓ 子女緣分：★★★★☆
-  • 子女數量：2-3個為宜
-  • 子女性格：聰慧乖巧，孝順懂事
-  • 親子關係：和睦融洽，溝通良好
-
-✓ 教養方式：
-  • 雙方教育觀念一致
-  • 重視品德教育
-  • 給予適度自由發展空間
-
-✓ 子女對婚姻的影響：
-  • 正面：增進夫妻感情
-  • 子女是婚姻的潤滑劑
-  • 天倫之樂，家庭美滿
-
-子女運：87%（良好）"""
-    
-    def _analyze_ziwei_palace_5(self, user_data, spouse_data):
-        """財帛宮分析"""
-        return """財帛宮主星：武曲、天府（示例）
-
-✓ 夫妻財運：★★★★★
-  • 雙薪家庭，經濟穩定
-  • 理財觀念一致，能累積財富
-  • 婚後財運提升明顯
-
-✓ 理財方式建議：
-  • 共同制定財務目標
-  • 適合共同投資理財
-  • 建議建立家庭財庫
-
-✓ 收入來源：
-  • 主業收入穩定
-  • 可能有額外收入
-  • 投資理財獲利佳
-
-財運相容度：93%（優秀）"""
-    
-    def _analyze_ziwei_palace_6(self, user_data, spouse_data):
-        """疾厄宮分析"""
-        return """疾厄宮主星：太陽、太陰（示例）
-
-✓ 健康狀況：
-  • 整體健康良好
-  • 需注意工作壓力
-  • 定期健康檢查
-
-✓ 配偶對健康的關照：
-  • 能互相關心健康
-  • 督促良好生活習慣
-  • 生病時細心照料
-
-✓ 保健建議：
-  • 規律作息，充足睡眠
-  • 均衡飲食，適度運動
-  • 保持心情愉快
-
-健康相容度：85%"""
-    
-    def _analyze_ziwei_palace_7(self, user_data, spouse_data):
-        """遷移宮分析"""
-        return """遷移宮主星：天機、天梁（示例）
-
-✓ 外出運勢：
-  • 適合外出發展
-  • 旅行運佳，適合共遊
-  • 外地有貴人相助
-
-✓ 人際關係：
-  • 社交能力強
-  • 朋友多，人緣好
-  • 能互相介紹人脈
-
-✓ 對婚姻的影響：
-  • 雙方朋友圈能融合
-  • 社交活動增進感情
-  • 共同拓展視野
-
-遷移運：88%"""
-    
-    def _analyze_ziwei_palace_8(self, user_data, spouse_data):
-        """奴僕宮分析"""
-        return """奴僕宮主星：天相、天府（示例）
-
-✓ 朋友運：
-  • 朋友忠誠可靠
-  • 能得到朋友幫助
-  • 雙方朋友能融洽相處
-
-✓ 下屬運：
-  • 能管理下屬
-  • 得到部屬支持
-  • 工作團隊和諧
-
-✓ 對婚姻的影響：
-  • 朋友祝福婚姻
-  • 人際網絡互補
-  • 社交圈更豐富
-
-人際運：86%"""
-    
-    def _analyze_ziwei_palace_9(self, user_data, spouse_data):
-        """官祿宮分析"""
-        return """官祿宮主星：紫微、武曲（示例）
-
-✓ 事業運勢：★★★★☆
-  • 事業心強，有上進心
-  • 工作認真，獲主管賞識
-  • 適合管理職位
-
-✓ 配偶對事業的支持：
-  • 全力支持事業發展
-  • 提供實質建議
-  • 是堅強的後盾
-
-✓ 事業發展建議：
-  • 平衡工作與家庭
-  • 共同規劃事業目標
-  • 互相鼓勵成長
-
-事業相容度：90%"""
-    
-    def _analyze_ziwei_palace_10(self, user_data, spouse_data):
-        """田宅宮分析"""
-        return """田宅宮主星：天府、太陰（示例）
-
-✓ 不動產運：★★★★☆
-  • 適合購置房產
-  • 能累積不動產
-  • 家庭環境舒適
-
-✓ 居住環境：
-  • 對居住品質有要求
-  • 能共同營造溫馨家園
-  • 重視家庭佈置
-
-✓ 家庭氛圍：
-  • 和諧溫馨
-  • 親子關係良好
-  • 是避風港
-
-田宅運：88%"""
-    
-    def _analyze_ziwei_palace_11(self, user_data, spouse_data):
-        """福德宮分析"""
-        return """福德宮主星：天同、天梁（示例）
-
-✓ 精神享受：★★★★★
-  • 婚後幸福指數高
-  • 精神契合度強
-  • 生活情趣豐富
-
-✓ 心靈交流：
-  • 能深入溝通
-  • 互相理解支持
-  • 精神層面契合
-
-✓ 生活品質：
-  • 重視生活品質
-  • 有共同興趣愛好
-  • 能享受生活
-
-福德指數：95%（極高）"""
-    
-    def _analyze_ziwei_palace_12(self, user_data, spouse_data):
-        """父母宮分析"""
-        return """父母宮主星：太陽、太陰（示例）
-
-✓ 父母緣分：
-  • 孝順父母
-  • 得到父母祝福
-  • 與配偶父母相處融洽
-
-✓ 長輩運：
-  • 能得到長輩幫助
-  • 獲得長輩認可
-  • 雙方家庭關係和諧
-
-✓ 對婚姻的影響：
-  • 家庭支持婚姻
-  • 大家庭和睦
-  • 節日團聚溫馨
-
-父母緣：90%"""
+    def _star_rating(self, score):
+        """百分比轉星等字串（None 表示資料不足）"""
+        if score is None:
+            return "資料不足，無法評分"
+        stars = min(5, (score + 10) // 20)
+        return f"{'★' * stars}{'☆' * (5 - stars)} ({score}%)"
+    
+    def _analyze_ziwei_palace(self, palace, user_data, spouse_data):
+        """單一宮位分析（依雙方命盤該宮主星與星性表）"""
+        focus, advice = self.ZIWEI_PALACE_FOCUS[palace]
+        star_nature = self.ziwei_compatibility['星性']
+        user_stars = self._ziwei_palace_stars(user_data, palace)
+        spouse_stars = self._ziwei_palace_stars(spouse_data, palace)
+        
+        lines = [f"✓ {focus}："]
+        for label, stars in (('您', user_stars), ('配偶', spouse_stars)):
+            for star in stars:
+                nature = star_nature.get(f"{star}星")
+                if nature is None:
+                    lines.append(f"  • {label}：{star}" + ("" if star == '未知' else "（星性表無資料）"))
+                else:
+                    lines.append(f"  • {label}：{star}星（{nature['屬性']}），{nature['特質']}")
+        
+        score = self._main_star_match_score(user_stars, spouse_stars)
+        lines += ["", "✓ 星性互動：", f"  • {self._palace_star_interaction(user_stars, spouse_stars)}"]
+        if palace == '夫妻宮':
+            lines += ["", "✓ 夫妻宮與對方命宮對照："]
+            for label, other_label, own, other in (('您', '配偶', user_data, spouse_data),
+                                                   ('配偶', '您', spouse_data, user_data)):
+                own_stars = self._ziwei_palace_stars(own, '夫妻宮')
+                other_stars = self._ziwei_palace_stars(other, '命宮')
+                lines.append(f"  • {label}夫妻宮 {'、'.join(own_stars)} × {other_label}命宮 {'、'.join(other_stars)}："
+                             f"{self._palace_star_interaction(own_stars, other_stars)}")
+        lines += ["", f"✓ {palace}契合度：{self._star_rating(score)}", "", f"建議：{advice}"]
+        return '\n'.join(lines)
+    
+    def _palace_star_interaction(self, user_stars, spouse_stars):
+        """兩組主星的互動關係（同星、互為婚配、單向婚配或差異較大）"""
+        star_nature = self.ziwei_compatibility['星性']
+        user_stars = [star for star in user_stars if f"{star}星" in star_nature]
+        spouse_stars = [star for star in spouse_stars if f"{star}星" in star_nature]
+        if not user_stars or not spouse_stars:
+            return self.ZIWEI_STAR_INTERACTIONS['unknown']
+        if set(user_stars) & set(spouse_stars):
+            return self.ZIWEI_STAR_INTERACTIONS['same']
+        user_likes = any(star in star_nature[f"{u}星"]['婚配'] for u in user_stars for star in spouse_stars)
+        spouse_likes = any(star in star_nature[f"{s}星"]['婚配'] for s in spouse_stars for star in user_stars)
+        if user_likes and spouse_likes:
+            return self.ZIWEI_STAR_INTERACTIONS['mutual']
+        if user_likes or spouse_likes:
+            return self.ZIWEI_STAR_INTERACTIONS['one_sided']
+        return self.ZIWEI_STAR_INTERACTIONS['different']
     
     def _analyze_14_main_stars_compatibility(self, user_data, spouse_data):
-        """14主星配對分析"""
-        return """【主星配對矩陣】
+        """14主星配對分析（依雙方命宮主星與星性表）"""
+        star_nature = self.ziwei_compatibility['星性']
+        user_stars = self._ziwei_palace_stars(user_data, '命宮')
+        spouse_stars = self._ziwei_palace_stars(spouse_data, '命宮')
+        score = self._main_star_match_score(user_stars, spouse_stars)
+        
+        parts = [f"""【主星配對矩陣】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-您的命宮主星：紫微、天府（帝王星組合）
-配偶命宮主星：太陽、太陰（日月同宮）
+您的命宮主星：{'、'.join(user_stars)}
+配偶命宮主星：{'、'.join(spouse_stars)}
 
 【星性分析】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✓ 紫微星特質：
-  • 領導力強，有威嚴
-  • 責任感重，有擔當
-  • 適合管理階層
-
-✓ 天府星特質：
-  • 穩重保守，財庫星
-  • 理財有道，善於儲蓄
-  • 重視家庭安全
-
-✓ 太陽星特質：
-  • 熱情開朗，光明正大
-  • 樂於助人，人緣好
-  • 事業心強
-
-✓ 太陰星特質：
-  • 溫柔體貼，心思細膩
-  • 理財能力佳
-  • 重視家庭
-
+"""]
+        for star in dict.fromkeys(user_stars + spouse_stars):
+            nature = star_nature.get(f"{star}星")
+            if nature is None:
+                continue
+            parts.append(f"""
+✓ {star}星特質：
+  • 屬性：{nature['屬性']}
+  • 特質：{nature['特質']}
+  • 婚配：{nature['婚配']}
+""")
+        parts.append("""
 【星性契合度】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-紫微 + 太陽：★★★★☆
-• 領導型配對，能互相尊重
-• 事業上能互相支持
-• 需注意避免權力競爭
-
-天府 + 太陰：★★★★★
-• 財星配對，財運亨通
-• 理財觀念一致
-• 家庭生活穩定和諧
-
+""")
+        for user_star in user_stars:
+            for spouse_star in spouse_stars:
+                pair_score = self._main_star_match_score([user_star], [spouse_star])
+                if pair_score is None:
+                    continue
+                parts.append(f"\n{user_star} + {spouse_star}：{self._star_rating(pair_score)}\n")
+        parts.append(f"""
 【14主星總體配對評估】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-整體相容度：★★★★☆ (90%)
+整體相容度：{self._star_rating(score)}
 
 ✓ 優勢：
   • 主星互補，各有所長
@@ -1277,11 +1441,22 @@ class ProfessionalSpouseCompatibilityAnalyzer:
   • 合理分工，發揮所長
   • 保持溝通，避免誤會
 
-主星配對評語：【上等婚配】"""
+主星配對評語：{self._main_star_verdict(score)}""")
+        return ''.join(parts)
+    
+    def _main_star_verdict(self, score):
+        """主星契合度評語"""
+        if score is None:
+            return '【命盤資料不足，無法判斷主星配對】'
+        if score >= 85:
+            return '【上等婚配】'
+        if score >= 70:
+            return '【中上婚配】'
+        return '【中等婚配，需用心經營】'
     
-    def _analyze_sihua_stars(self):
-        """四化星分析"""
-        return """四化飛星反映動態的運勢變化。
+    def _analyze_sihua_stars(self, user_data, spouse_data):
+        """四化星分析（命盤交換格式提供生年四化時，列出雙方四化與對方命宮的互動）"""
+        return f"""四化飛星反映動態的運勢變化。
 
 【四化星說明】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1309,13 +1484,28 @@ class ProfessionalSpouseCompatibilityAnalyzer:
 
 【生年四化影響】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-根據生年天干的四化飛星：
+{self._format_birth_sihua(user_data, spouse_data)}根據生年天干的四化飛星：
 • 對婚姻影響：正面積極
 • 對財運影響：提升顯著
 • 對子女影響：子女有成
 
 四化總評：吉星高照！"""
     
+    def _format_birth_sihua(self, user_data, spouse_data):
+        """列出雙方生年四化，並標示落在對方命宮主星的四化"""
+        lines = []
+        for label, own, other, other_label in (('您', user_data, spouse_data, '配偶'),
+                                               ('配偶', spouse_data, user_data, '您')):
+            transformations = self._ziwei_transformations(own)
+            if not transformations:
+                continue
+            lines.append(f"• {label}的生年四化：{'、'.join(transformations)}")
+            other_ming = self._ziwei_palace_stars(other, '命宮')
+            for item in transformations:
+                if item[:-2] in other_ming:
+                    lines.append(f"  ✓ {item}飛入{other_label}命宮主星")
+        return '\n'.join(lines) + '\n\n' if lines else ''
+    
     def _get_ziwei_marriage_advice(self, user_data, spouse_data):
         """紫微合婚總建議"""
         return """【合婚總評】★★★★★
@@ -51,9 +51,25 @@ if exist bin rmdir /s /q bin 2>nul
 if exist build rmdir /s /q build 2>nul
 if exist dist rmdir /s /q dist 2>nul
 
+REM 預先產生資源檔（靜態資料表與星曆），隨 APK 打包，手機啟動時不必重建
+echo.
+echo [4] 產生資源檔...
+python GITHUB\modules\mingli_resources.py build
+if errorlevel 1 (
+    echo ✗ 資源檔產生失敗
+    pause
+    exit /b 1
+)
+python GITHUB\modules\mingli_ephemeris.py build GITHUB\modules\ephemeris_1900_2100.bin
+if errorlevel 1 (
+    echo ✗ 星曆檔產生失敗
+    pause
+    exit /b 1
+)
+
 REM 編譯 APK
 echo.
-echo [4] 開始編譯 APK...
+echo [5] 開始編譯 APK...
 echo 請耐心等待（可能需要 10-30 分鐘）...
 
 buildozer android debug
@@ -70,7 +86,7 @@ if %errorlevel% equ 0 (
     
     REM 檢查是否有設備
     echo.
-    echo [5] 檢查 Android 設備...
+    echo [6] 檢查 Android 設備...
     adb devices
     
     echo.
@@ -46,8 +46,14 @@ check_command "java"
 check_command "gradle"
 check_command "buildozer"
 
+# 預先產生資源檔（靜態資料表與星曆），隨 APK 打包，手機啟動時不必重建
+echo -e "\n${YELLOW}[3] 產生資源檔...${NC}"
+
+python3 GITHUB/modules/mingli_resources.py build || exit 1
+python3 GITHUB/modules/mingli_ephemeris.py build GITHUB/modules/ephemeris_1900_2100.bin || exit 1
+
 # 建立 APK
-echo -e "\n${YELLOW}[3] 開始編譯 APK...${NC}"
+echo -e "\n${YELLOW}[4] 開始編譯 APK...${NC}"
 
 # 清潔舊檔案
 rm -rf bin/ build/ dist/ .buildozer/
@@ -61,7 +67,7 @@ if [ $? -eq 0 ]; then
     echo -e "APK 位置: ${GREEN}$APK_FILE${NC}"
     
     # 安裝到設備
-    echo -e "\n${YELLOW}[4] 安裝到 Android 設備...${NC}"
+    echo -e "\n${YELLOW}[5] 安裝到 Android 設備...${NC}"
     adb install -r "$APK_FILE"
     
     if [ $? -eq 0 ]; then
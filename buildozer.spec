@@ -13,7 +13,7 @@ package.domain = org.jiuyin
 source.dir = .
 
 # 原始檔後綴名（Python 檔案）
-source.include_exts = py,png,jpg,kv,atlas
+source.include_exts = py,png,jpg,kv,atlas,bin,txt
 
 # 要排除的目錄
 source.exclude_dirs = tests, bin
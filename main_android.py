@@ -7,6 +7,7 @@ Jeff命理世界 - Kivy Android App (增強版)
 
 import os
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 from functools import partial
@@ -46,6 +47,8 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.uix.button import Button
 from kivy.uix.spinner import Spinner
 from kivy.uix.textinput import TextInput
@@ -56,12 +59,125 @@ from kivy.core.window import Window
 from kivy.uix.image import Image as KivyImage
 from kivy.garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
 from kivy.metrics import dp
+from kivy.clock import Clock
+from kivy.utils import escape_markup
 
 # 設定視窗大小（適配手機螢幕）
 Window.size = (1080, 1920)
 
 
-class JiuGongScreen(Screen):
+def report_items(text, title=None):
+    """
+    將報告切成逐行的 RecycleView 資料
+
+    報告內容會跳脫 markup 符號，只有標題保留粗體等格式；
+    空行以空白字元代替，避免高度為 0。
+    """
+    items = []
+    if title:
+        items.append({'text': title})
+        items.append({'text': ' '})
+    for line in str(text).split('\n'):
+        items.append({'text': escape_markup(line) if line.strip() else ' '})
+    return items
+
+
+def message_items(message):
+    """提示訊息（含 markup）轉為 RecycleView 資料"""
+    return [{'text': line or ' '} for line in message.split('\n')]
+
+
+class ReportLine(Label):
+    """報告中的一行（依寬度自動換行並調整高度）"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.markup = True
+        self.size_hint_y = None
+        self.halign = 'left'
+        self.valign = 'top'
+        self.bind(width=self._update_text_size, texture_size=self._update_height)
+
+    def _update_text_size(self, instance, width):
+        self.text_size = (width, None)
+
+    def _update_height(self, instance, texture_size):
+        self.height = texture_size[1]
+
+
+class ReportView(RecycleView):
+    """報告顯示區：只建立畫面上看得到的行，長報告不必產生整張大貼圖"""
+    def __init__(self, text='', **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = ReportLine
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, dp(24)),
+            default_size_hint=(1, None),
+            padding=dp(5),
+            spacing=dp(2)
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+        if text:
+            self.show_message(text)
+
+    def show_items(self, items):
+        self.data = items
+        self.scroll_y = 1
+
+    def show_report(self, text, title=None):
+        self.show_items(report_items(text, title))
+
+    def show_message(self, message):
+        self.show_items(message_items(message))
+
+
+class AnalysisScreen(Screen):
+    """
+    分析螢幕共用基底
+
+    分析在背景執行緒進行，完成後以 Clock.schedule_once 回到 UI 執行緒更新報告，
+    長報告（如配偶合盤）不會讓介面停頓。
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.analyze_btn = None
+        self.result_view = None
+        self._busy = False
+
+    def run_analysis(self, task, title):
+        """
+        在背景執行分析
+
+        Args:
+            task: 不帶參數、回傳報告文字的函式
+            title: 報告標題（markup）
+        """
+        if self._busy:
+            return
+        self._busy = True
+        if self.analyze_btn is not None:
+            self.analyze_btn.disabled = True
+        self.result_view.show_message('[b]分析中，請稍候...[/b]')
+        threading.Thread(target=self._analysis_worker, args=(task, title), daemon=True).start()
+
+    def _analysis_worker(self, task, title):
+        # 報告切行也在背景完成，UI 執行緒只需替換資料
+        try:
+            items = report_items(task(), title)
+        except Exception as e:
+            items = message_items(f'[b]分析錯誤[/b]\n\n{escape_markup(str(e))}')
+        Clock.schedule_once(partial(self._show_result, items))
+
+    def _show_result(self, items, dt):
+        self._busy = False
+        if self.analyze_btn is not None:
+            self.analyze_btn.disabled = False
+        self.result_view.show_items(items)
+
+
+class JiuGongScreen(AnalysisScreen):
     """九宮分析螢幕"""
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -86,31 +202,28 @@ class JiuGongScreen(Screen):
         analyze_btn = Button(text='開始分析', size_hint_y=0.1)
         analyze_btn.bind(on_press=self.analyze)
         layout.add_widget(analyze_btn)
+        self.analyze_btn = analyze_btn
         
         # 結果區
-        self.result_scroll = ScrollView(size_hint_y=0.6)
-        self.result_label = Label(text='輸入姓名後點擊分析...', markup=True, size_hint_y=None)
-        self.result_label.bind(texture_size=self.result_label.setter('size'))
-        self.result_scroll.add_widget(self.result_label)
-        layout.add_widget(self.result_scroll)
+        self.result_view = ReportView(text='輸入姓名後點擊分析...', size_hint_y=0.6)
+        layout.add_widget(self.result_view)
         
         self.add_widget(layout)
     
     def analyze(self, instance):
         name = self.name_input.text.strip()
         if name:
-            try:
-                # 使用 analyze_jiugong 方法（需要名字、年、月、日）
-                # 如果沒有出生日期，使用預設值
-                result = self.analyzer.analyze_jiugong(name, 1990, 1, 1)
-                self.result_label.text = f'[b]九宮分析結果 - {name}[/b]\n\n{result}'
-            except Exception as e:
-                self.result_label.text = f'[b]分析錯誤[/b]\n\n{str(e)}'
+            # 使用 analyze_jiugong 方法（需要名字、年、月、日）
+            # 如果沒有出生日期，使用預設值
+            self.run_analysis(
+                partial(self.analyzer.analyze_jiugong, name, 1990, 1, 1),
+                f'[b]九宮分析結果 - {escape_markup(name)}[/b]'
+            )
         else:
-            self.result_label.text = '[color=ff0000]請輸入有效的姓名[/color]'
+            self.result_view.show_message('[color=ff0000]請輸入有效的姓名[/color]')
 
 
-class AstrologyScreen(Screen):
+class AstrologyScreen(AnalysisScreen):
     """星座分析螢幕"""
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -150,13 +263,11 @@ class AstrologyScreen(Screen):
         analyze_btn = Button(text='開始分析', size_hint_y=0.08)
         analyze_btn.bind(on_press=self.analyze)
         layout.add_widget(analyze_btn)
+        self.analyze_btn = analyze_btn
         
         # 結果區
-        self.result_scroll = ScrollView(size_hint_y=0.59)
-        self.result_label = Label(text='輸入資訊後點擊分析...', markup=True, size_hint_y=None)
-        self.result_label.bind(texture_size=self.result_label.setter('size'))
-        self.result_scroll.add_widget(self.result_label)
-        layout.add_widget(self.result_scroll)
+        self.result_view = ReportView(text='輸入資訊後點擊分析...', size_hint_y=0.59)
+        layout.add_widget(self.result_view)
         
         self.add_widget(layout)
     
@@ -166,24 +277,26 @@ class AstrologyScreen(Screen):
         blood = self.blood_spinner.text
         
         if name and date:
+            # 解析日期（格式: YYYY-MM-DD）
+            parts = date.split('-')
             try:
-                # 解析日期（格式: YYYY-MM-DD）
-                parts = date.split('-')
-                if len(parts) == 3:
-                    month = int(parts[1])
-                    day = int(parts[2])
-                    result = self.analyzer.analyze_zodiac(month, day)
-                    blood_info = f'\n血型: {blood}' if blood else ''
-                    self.result_label.text = f'[b]星座分析結果 - {name}[/b]{blood_info}\n\n{result}'
-                else:
-                    self.result_label.text = '[color=ff0000]日期格式錯誤，請使用 YYYY-MM-DD[/color]'
-            except Exception as e:
-                self.result_label.text = f'[b]分析錯誤[/b]\n\n{str(e)}'
+                month = int(parts[1])
+                day = int(parts[2])
+            except (IndexError, ValueError):
+                parts = None
+            if parts is not None and len(parts) == 3:
+                blood_info = f'\n血型: {blood}' if blood else ''
+                self.run_analysis(
+                    partial(self.analyzer.analyze_zodiac, month, day),
+                    f'[b]星座分析結果 - {escape_markup(name)}[/b]{blood_info}'
+                )
+            else:
+                self.result_view.show_message('[color=ff0000]日期格式錯誤，請使用 YYYY-MM-DD[/color]')
         else:
-            self.result_label.text = '[color=ff0000]請輸入完整資訊[/color]'
+            self.result_view.show_message('[color=ff0000]請輸入完整資訊[/color]')
 
 
-class BaziScreen(Screen):
+class BaziScreen(AnalysisScreen):
     """八字分析螢幕"""
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -219,13 +332,11 @@ class BaziScreen(Screen):
         analyze_btn = Button(text='開始分析', size_hint_y=0.08)
         analyze_btn.bind(on_press=self.analyze)
         layout.add_widget(analyze_btn)
+        self.analyze_btn = analyze_btn
         
         # 結果區
-        self.result_scroll = ScrollView(size_hint_y=0.56)
-        self.result_label = Label(text='輸入出生時間後點擊分析...', markup=True, size_hint_y=None)
-        self.result_label.bind(texture_size=self.result_label.setter('size'))
-        self.result_scroll.add_widget(self.result_label)
-        layout.add_widget(self.result_scroll)
+        self.result_view = ReportView(text='輸入出生時間後點擊分析...', size_hint_y=0.56)
+        layout.add_widget(self.result_view)
         
         self.add_widget(layout)
     
@@ -235,16 +346,21 @@ class BaziScreen(Screen):
             month = int(self.month_input.text)
             day = int(self.day_input.text)
             hour = int(self.hour_input.text)
-            
-            result = self.analyzer.analyze_bazi(year, month, day, hour)
-            # 結果可能是字典或字符串
-            if isinstance(result, dict):
-                result_text = '\n'.join([f'{k}: {v}' for k, v in result.items()])
-            else:
-                result_text = str(result)
-            self.result_label.text = f'[b]八字分析結果[/b]\n{year}年{month}月{day}日 {hour}時\n\n{result_text}'
-        except Exception as e:
-            self.result_label.text = f'[b]分析錯誤[/b]\n\n{str(e)}'
+        except ValueError as e:
+            self.result_view.show_message(f'[b]分析錯誤[/b]\n\n{escape_markup(str(e))}')
+            return
+        
+        self.run_analysis(
+            partial(self._bazi_report, year, month, day, hour),
+            f'[b]八字分析結果[/b]\n{year}年{month}月{day}日 {hour}時'
+        )
+    
+    def _bazi_report(self, year, month, day, hour):
+        result = self.analyzer.analyze_bazi(year, month, day, hour)
+        # 結果可能是字典或字符串
+        if isinstance(result, dict):
+            return '\n'.join([f'{k}: {v}' for k, v in result.items()])
+        return str(result)
 
 
 class MainScreen(Screen):
@@ -28,6 +28,7 @@ try:
     from mingli_purplestar_analyzer import PurpleStarAnalyzer
     from mingli_tarot import TarotAnalyzer
     from mingli_yijing import YijingAnalyzer
+    from mingli_engine import MingliAnalysisEngine
     print("[OK] 命理模組載入成功\n")
 except Exception as e:
     print(f"[ERROR] 模組載入失敗: {e}\n")
@@ -46,6 +47,7 @@ def print_menu():
     print("  4. 紫微分析（紫微斗數）")
     print("  5. 塔羅牌（隨機卜卦）")
     print("  6. 周易卜卦（六爻分析）")
+    print("  7. 完整分析（星座、血型、八字、紫微、九宮、流年、總結）")
     print("  0. 離開程式")
     print("\n" + "=" * 60)
 
@@ -163,11 +165,37 @@ def analyze_yijing():
         print(f"\n❌ 分析錯誤: {e}\n")
 
 
+def analyze_full():
+    """完整分析（透過分析引擎的流程圖執行）"""
+    try:
+        engine = MingliAnalysisEngine()
+        name = input("請輸入姓名: ").strip()
+        year = int(input("請輸入出生年份: "))
+        month = int(input("請輸入出生月份 (1-12): "))
+        day = int(input("請輸入出生日期 (1-31): "))
+        hour = int(input("請輸入出生時辰 (0-23, 預設 12): ") or "12")
+        gender = input("請輸入性別 (男/女, 預設 男): ").strip() or "男"
+        blood_type = input("請輸入血型 (A/B/AB/O, 預設 A): ").strip().upper() or "A"
+        birth_place = input("請輸入出生地 (如 台北、高雄、香港, 預設 台北): ").strip() or None
+        
+        results = engine.run_full_analysis({
+            'name': name, 'year': year, 'month': month, 'day': day,
+            'hour': hour, 'gender': gender, 'blood_type': blood_type,
+            'birth_place': birth_place,
+        })
+        for key in engine.REPORT_KEYS:
+            print("\n" + "=" * 60)
+            print(results[key])
+        print("=" * 60 + "\n")
+    except Exception as e:
+        print(f"\n❌ 分析錯誤: {e}\n")
+
+
 def main():
     """主程式"""
     while True:
         print_menu()
-        choice = input("請選擇 (0-6): ").strip()
+        choice = input("請選擇 (0-7): ").strip()
         
         if choice == "0":
             print("\n謝謝使用 Jeff命理世界！")
@@ -184,6 +212,8 @@ def main():
             analyze_tarot()
         elif choice == "6":
             analyze_yijing()
+        elif choice == "7":
+            analyze_full()
         else:
             print("\n❌ 無效選擇，請重新輸入！\n")
 